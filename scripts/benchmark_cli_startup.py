@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Cold-start import-time benchmark for the ``devsynth`` CLI.
+
+Each scenario runs the console entry point in a fresh interpreter with
+``python -X importtime`` and records the cumulative import time of everything
+the CLI pulled in (interpreter start-up modules such as ``site`` are excluded).
+The run fails when a scenario exceeds its import-time budget or imports a
+module that must stay off its start-up path (for example, ``devsynth --help``
+must never import command implementations).
+
+Use:
+  poetry run python scripts/benchmark_cli_startup.py
+  poetry run python scripts/benchmark_cli_startup.py --output test_reports/cli_startup.json
+  poetry run python scripts/benchmark_cli_startup.py --budget-scale 1.5   # slower CI hosts
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+ENTRY = "from devsynth.adapters.cli.lazy_app import run_cli; run_cli()"
+
+# Modules that belong to interpreter start-up rather than to the CLI.
+STARTUP_MODULES = frozenset({"site", "sitecustomize", "usercustomize", "encodings"})
+
+# Modules whose presence signals that the lazy manifest path was bypassed.
+HEAVY_MODULES = (
+    "devsynth.application.cli.commands",
+    "devsynth.adapters.cli.typer_adapter",
+    "devsynth.interface",
+    "devsynth.core",
+    "langgraph",
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    args: tuple[str, ...]
+    budget_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+# Modules a single command must not drag in: other command implementations, the
+# full Typer adapter, the WebUI and the orchestration stack behind them.
+COMMAND_HEAVY_MODULES = (
+    "devsynth.adapters.cli.typer_adapter",
+    "devsynth.application.cli.commands.config_cmds",
+    "devsynth.application.cli.commands.edrr_cycle_cmd",
+    "devsynth.interface.webui",
+    "devsynth.interface.webui_module",
+    "devsynth.core",
+    "langgraph",
+)
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("help", ("--help",), budget_ms=400.0, forbidden=HEAVY_MODULES),
+    Scenario("version", ("--version",), budget_ms=250.0, forbidden=HEAVY_MODULES),
+    Scenario(
+        "run-tests-help",
+        ("run-tests", "--help"),
+        budget_ms=1200.0,
+        forbidden=COMMAND_HEAVY_MODULES,
+    ),
+    Scenario(
+        "doctor-help",
+        ("doctor", "--help"),
+        budget_ms=400.0,
+        forbidden=COMMAND_HEAVY_MODULES,
+    ),
+)
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    args: list[str]
+    exit_code: int
+    import_ms: float
+    budget_ms: float
+    modules: int
+    forbidden_imported: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return (
+            self.exit_code == 0
+            and self.import_ms <= self.budget_ms
+            and not self.forbidden_imported
+        )
+
+
+def parse_importtime(stderr: str) -> tuple[float, list[str]]:
+    """Return total CLI import time in ms and the imported module names.
+
+    ``-X importtime`` prints ``import time: self | cumulative | name`` where
+    nested imports are indented; only top-level lines are summed so nothing is
+    counted twice.
+    """
+
+    total_us = 0
+    modules: list[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        raw_name = parts[2].rstrip()
+        name = raw_name.strip()
+        modules.append(name)
+        top_level = len(raw_name) - len(raw_name.lstrip()) <= 1
+        if top_level and name.split(".")[0] not in STARTUP_MODULES:
+            total_us += int(parts[1])
+    return total_us / 1000.0, modules
+
+
+def run_scenario(scenario: Scenario, budget_scale: float = 1.0) -> ScenarioResult:
+    env = dict(os.environ)
+    env.setdefault("DEVSYNTH_NO_FILE_LOGGING", "1")
+    env.pop("DEVSYNTH_CLI_MINIMAL", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY, *scenario.args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=300,
+    )
+    import_ms, modules = parse_importtime(proc.stderr)
+    imported = set(modules)
+    forbidden = sorted(
+        name
+        for name in scenario.forbidden
+        if name in imported or any(m.startswith(f"{name}.") for m in imported)
+    )
+    return ScenarioResult(
+        name=scenario.name,
+        args=list(scenario.args),
+        exit_code=proc.returncode,
+        import_ms=round(import_ms, 1),
+        budget_ms=scenario.budget_ms * budget_scale,
+        modules=len(modules),
+        forbidden_imported=forbidden,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", type=Path, help="Write a JSON report here")
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=float(os.environ.get("DEVSYNTH_CLI_STARTUP_BUDGET_SCALE", "1.0")),
+        help="Multiply every import-time budget (for slow CI runners)",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Run only the named scenario(s)",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.scenario or scenario.name in args.scenario
+    ]
+    results = [run_scenario(scenario, args.budget_scale) for scenario in selected]
+
+    for result in results:
+        status = "ok" if result.passed else "FAIL"
+        print(
+            f"[benchmark_cli_startup] {status:4} {result.name:16} "
+            f"{result.import_ms:8.1f} ms (budget {result.budget_ms:.0f} ms, "
+            f"{result.modules} modules, exit {result.exit_code})"
+        )
+        for name in result.forbidden_imported:
+            print(
+                f"[benchmark_cli_startup]      unexpected import: {name}",
+                file=sys.stderr,
+            )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps([asdict(result) for result in results], indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
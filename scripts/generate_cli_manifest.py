@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Generate the static CLI command manifest used by the lazy ``devsynth`` entry point.
+
+The manifest (``src/devsynth/application/cli/command_manifest.json``) lists every
+top-level command with its help text, options, and import path so that
+``devsynth --help`` and command dispatch avoid importing all command modules.
+
+Use:
+  poetry run python scripts/generate_cli_manifest.py          # rewrite manifest
+  poetry run python scripts/generate_cli_manifest.py --check  # fail if stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from devsynth.application.cli.command_manifest import (  # noqa: E402
+    MANIFEST_PATH,
+    generate_command_manifest,
+    write_command_manifest,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero when the committed manifest differs from the CLI",
+    )
+    parser.add_argument("--output", type=Path, default=MANIFEST_PATH)
+    args = parser.parse_args(argv)
+
+    # Generation must see the full command set, never the minimal shim.
+    os.environ.pop("DEVSYNTH_CLI_MINIMAL", None)
+    manifest = generate_command_manifest()
+
+    if args.check:
+        try:
+            current = json.loads(args.output.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            current = None
+        if current != manifest.to_dict():
+            print(
+                f"[generate_cli_manifest] {args.output} is out of date; "
+                "run scripts/generate_cli_manifest.py",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"[generate_cli_manifest] {args.output} is up to date")
+        return 0
+
+    write_command_manifest(manifest, args.output)
+    print(
+        f"[generate_cli_manifest] wrote {len(manifest.entries)} commands to "
+        f"{args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
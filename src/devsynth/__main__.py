@@ -1,7 +1,7 @@
 # Defer heavy CLI imports; avoid importing optional deps at module import time
 
 if __name__ == "__main__":
-    from devsynth.adapters.cli.typer_adapter import run_cli
+    from devsynth.adapters.cli.lazy_app import run_cli
     from devsynth.logging_setup import DevSynthLogger
 
     logger = DevSynthLogger(__name__)
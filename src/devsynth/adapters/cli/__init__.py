@@ -1,7 +1,22 @@
-"""CLI adapter exports."""
+"""CLI adapter exports.
 
-from devsynth.logging_setup import DevSynthLogger
+``app`` and ``run_cli`` are resolved lazily so that importing
+:mod:`devsynth.adapters.cli.lazy_app` (the console entry point) does not pull
+in the eagerly built Typer application.
+"""
+
+from typing import Any
 
-from .typer_adapter import app, run_cli  # noqa: F401
+from devsynth.logging_setup import DevSynthLogger
 
 logger = DevSynthLogger(__name__)
+
+__all__ = ["app", "run_cli"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import typer_adapter
+
+        return getattr(typer_adapter, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,471 @@
+"""Fast-starting DevSynth CLI entry point backed by the static command manifest.
+
+:func:`devsynth.adapters.cli.typer_adapter.build_app` imports every command
+module to assemble the Typer application. This module instead builds a Typer
+app whose command group reads names, help text, and options from
+:mod:`devsynth.application.cli.command_manifest` and imports a command's module
+only when that command is actually invoked. ``devsynth --help``,
+``devsynth --version`` and shell completion therefore never import command
+implementations.
+
+Keep this module's imports light: it is on the critical path of every CLI
+invocation and is tracked by ``scripts/benchmark_cli_startup.py``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import click
+import typer
+from typer.core import TyperGroup
+
+from devsynth.application.cli.command_manifest import (
+    CommandManifest,
+    CommandManifestEntry,
+    CommandManifestError,
+    ManifestParameter,
+    load_command_manifest,
+    resolve_target,
+)
+from devsynth.logging_setup import DevSynthLogger
+
+logger = DevSynthLogger(__name__)
+
+HELP_OPTION_NAMES = ("--help", "-h")
+_HELP_REQUESTED = "devsynth.help_requested"
+
+
+@dataclass(slots=True)
+class CLIThemeOptions:
+    """Shared theme configuration propagated from Typer callbacks."""
+
+    colorblind_mode: bool = False
+    overrides: dict[str, str] = field(default_factory=dict)
+
+
+def _ensure_ctx_state(ctx: typer.Context) -> dict[str, Any]:
+    if ctx.obj is None:
+        ctx.obj = {}
+    return ctx.obj
+
+
+def _set_theme_options(ctx: typer.Context, theme: CLIThemeOptions) -> None:
+    state = _ensure_ctx_state(ctx)
+    state["theme"] = theme
+
+
+def _get_theme_options(ctx: typer.Context | None) -> CLIThemeOptions:
+    if ctx is None or ctx.obj is None:
+        return CLIThemeOptions()
+    theme = ctx.obj.get("theme")  # type: ignore[assignment]
+    if isinstance(theme, CLIThemeOptions):
+        return theme
+    return CLIThemeOptions()
+
+
+def _patch_typer_types() -> None:
+    """Allow Typer to handle custom parameter annotations used in the CLI."""
+
+    if getattr(typer.main.get_click_type, "_devsynth_patched", False):
+        return
+
+    orig = typer.main.get_click_type
+
+    def _passthrough_annotations() -> set[Any]:
+        # ``UXBridge`` is only looked up once its module has been imported so
+        # that patching Typer never drags the interface layer into startup.
+        annotations: set[Any] = {typer.models.Context, Any}
+        ux_bridge = sys.modules.get("devsynth.interface.ux_bridge")
+        if ux_bridge is not None:
+            annotations.add(ux_bridge.UXBridge)
+        return annotations
+
+    def patched_get_click_type(
+        annotation: Any, parameter_info: typer.models.ParameterInfo
+    ) -> click.types.ParamType:
+        passthrough = _passthrough_annotations()
+        if annotation in passthrough:
+            return click.STRING
+        origin = getattr(annotation, "__origin__", None)
+        if origin in passthrough:
+            return click.STRING
+        try:
+            return orig(annotation=annotation, parameter_info=parameter_info)
+        except RuntimeError:
+            return click.STRING
+
+    patched_get_click_type._devsynth_patched = True  # type: ignore[attr-defined]
+    typer.main.get_click_type = patched_get_click_type
+
+    orig_get_click_param = typer.main.get_click_param
+
+    def _is_optional_union(annotation: Any) -> tuple[bool, tuple[Any, ...]]:
+        try:
+            origin = typer.main.get_origin(annotation)
+        except Exception:  # pragma: no cover - defensive
+            return False, ()
+        if origin is None:
+            return False, ()
+        if not typer.main.is_union(origin):
+            return False, ()
+        try:
+            args = tuple(typer.main.get_args(annotation))
+        except Exception:  # pragma: no cover - defensive
+            return False, ()
+        non_none = tuple(arg for arg in args if arg is not typer.main.NoneType)
+        return True, non_none
+
+    def patched_get_click_param(
+        param: typer.models.ParamMeta,
+    ) -> tuple[click.Parameter, Any]:
+        original_annotation = getattr(param, "annotation", typer.main.ParamMeta.empty)
+        should_restore = False
+        if original_annotation is not typer.main.ParamMeta.empty:
+            is_union, non_none_args = _is_optional_union(original_annotation)
+            if is_union and len(non_none_args) > 1:
+                logger.info(
+                    "Typer union fallback for parameter '%s' with annotation %r",
+                    getattr(param, "name", "<unknown>"),
+                    original_annotation,
+                )
+                param.annotation = non_none_args[0]
+                should_restore = True
+        try:
+            logger.debug(
+                "Building click parameter '%s' with annotation %r and default %r",
+                getattr(param, "name", "<unknown>"),
+                getattr(param, "annotation", None),
+                getattr(param, "default", None),
+            )
+            return orig_get_click_param(param)
+        except Exception as exc:  # pragma: no cover - diagnostic aid
+            logger.error(
+                "Failed to build click parameter '%s' with annotation %r: %s",
+                getattr(param, "name", "<unknown>"),
+                getattr(param, "annotation", None),
+                exc,
+            )
+            raise
+        finally:
+            if should_restore:
+                param.annotation = original_annotation
+
+    typer.main.get_click_param = patched_get_click_param
+
+
+def _warn_if_features_disabled() -> None:
+    """Emit a notice when all feature flags are disabled."""
+    try:
+        from devsynth.core.config_loader import load_config
+
+        cfg = load_config()
+        features = cfg.features or {}
+        if features and not any(features.values()):
+            typer.echo(
+                "All optional features are disabled. Enable with 'devsynth config enable-feature <name>'."
+            )
+    except Exception:
+        # Don't fail the CLI if the config can't be read
+        logger.debug("Failed to read feature flags for warning message")
+
+
+def apply_global_options(
+    ctx: typer.Context,
+    *,
+    dashboard_hook: str | None,
+    version: bool,
+    debug: bool,
+    log_level: str | None,
+    colorblind: bool,
+    register_hook: Callable[[Callable[..., Any]], None] | None = None,
+) -> None:
+    """Apply the root ``devsynth`` options shared by the eager and lazy apps.
+
+    ``register_hook`` defaults to :func:`devsynth.metrics.register_dashboard_hook`
+    and is only imported when ``--dashboard-hook`` is supplied.
+    """
+
+    # Configure logging as early as possible using flags/env
+    import logging as _logging
+
+    from devsynth.logging_setup import configure_logging
+
+    # If DEVSYNTH_DEBUG is set and log_level not provided, treat as debug
+    env_debug = os.environ.get("DEVSYNTH_DEBUG", "").lower() in {"1", "true", "yes"}
+    chosen_level = None
+    if log_level:
+        chosen_level = log_level.strip().upper()
+    elif debug or env_debug:
+        chosen_level = "DEBUG"
+    else:
+        # fall back to env DEVSYNTH_LOG_LEVEL or default inside configure_logging
+        chosen_level = os.environ.get("DEVSYNTH_LOG_LEVEL")
+
+    if chosen_level:
+        # Persist to env for child processes and consistency
+        os.environ["DEVSYNTH_LOG_LEVEL"] = chosen_level
+        try:
+            configure_logging(log_level=getattr(_logging, chosen_level, _logging.INFO))
+        except Exception:
+            # Do not crash CLI due to logging issues
+            pass
+
+    # Handle --version eagerly after logging configured
+    if version:
+        try:
+            from devsynth import __version__
+        except Exception:  # pragma: no cover - defensive fallback
+            __version__ = "unknown"
+        typer.echo(__version__)
+        raise typer.Exit(0)
+
+    if dashboard_hook:
+        try:
+            if register_hook is None:
+                from devsynth.metrics import register_dashboard_hook as register_hook
+
+            module_name, func_name = dashboard_hook.split(":", 1)
+            hook = getattr(importlib.import_module(module_name), func_name)
+            register_hook(hook)
+        except Exception:
+            typer.echo(f"Failed to load dashboard hook '{dashboard_hook}'", err=True)
+
+    theme = CLIThemeOptions(colorblind_mode=colorblind)
+    _set_theme_options(ctx, theme)
+    os.environ["DEVSYNTH_CLI_COLORBLIND"] = "1" if colorblind else "0"
+
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+
+def _stub_param(param: ManifestParameter) -> click.Parameter:
+    if param.kind == "argument":
+        return click.Argument([param.name], required=param.required, nargs=param.nargs)
+    decls = list(param.opts)
+    if param.is_flag and param.secondary_opts:
+        decls = [f"{param.opts[0]}/{param.secondary_opts[0]}", *param.opts[1:]]
+    return click.Option(
+        [param.name, *decls],
+        help=param.help,
+        is_flag=param.is_flag or None,
+        multiple=param.multiple,
+        required=False,
+    )
+
+
+def _stub_command(entry: CommandManifestEntry) -> click.Command:
+    """Return a placeholder command used for help listings and completion."""
+
+    if entry.kind == "group":
+        group = click.Group(
+            name=entry.name,
+            help=entry.help,
+            short_help=entry.short_help,
+            hidden=entry.hidden,
+        )
+        for sub_name, sub_help in entry.subcommands:
+            group.add_command(click.Command(name=sub_name, short_help=sub_help))
+        return group
+    return click.Command(
+        name=entry.name,
+        help=entry.help,
+        short_help=entry.short_help,
+        hidden=entry.hidden,
+        params=[_stub_param(param) for param in entry.params],
+    )
+
+
+def load_command(entry: CommandManifestEntry) -> click.Command:
+    """Import the module behind ``entry`` and build its Click command."""
+
+    _patch_typer_types()
+    if entry.registered is not None:
+        from devsynth.application.cli.registry import COMMAND_REGISTRY, register
+
+        if entry.name not in COMMAND_REGISTRY:
+            register(entry.name, resolve_target(entry.registered))
+
+    target = resolve_target(entry.target)
+    if entry.kind == "group":
+        command: click.Command = typer.main.get_group(target)
+        command.name = entry.name
+        if entry.help:
+            command.help = entry.help
+        return command
+
+    single = typer.Typer(add_completion=False)
+    single.command(entry.name, help=entry.help or None)(target)
+    return typer.main.get_command(single)
+
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group that resolves commands from the static manifest on demand."""
+
+    manifest_loader = staticmethod(load_command_manifest)
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._describing = False
+
+    @property
+    def manifest(self) -> CommandManifest:
+        return self.manifest_loader()
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = list(self.commands)
+        names.extend(name for name in self.manifest.names() if name not in names)
+        return names
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        entry = self.manifest.get(cmd_name)
+        if entry is None:
+            return None
+        if self._describing or ctx.resilient_parsing:
+            return _stub_command(entry)
+        command = load_command(entry)
+        self.commands[cmd_name] = command
+        return command
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        ctx.meta[_HELP_REQUESTED] = any(arg in HELP_OPTION_NAMES for arg in args)
+        return super().parse_args(ctx, args)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._describing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._describing = False
+
+
+def _lazy_main(
+    ctx: typer.Context,
+    dashboard_hook: str | None = typer.Option(
+        None,
+        "--dashboard-hook",
+        help="Python path to function receiving dashboard metric events",
+    ),
+    version: bool = typer.Option(  # global eager flag
+        False,
+        "--version",
+        help="Show DevSynth version and exit",
+        is_eager=True,
+        callback=None,
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Enable debug logging (equivalent to --log-level DEBUG)",
+        is_eager=True,
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Set log level: DEBUG, INFO, WARNING, ERROR, CRITICAL",
+        is_eager=True,
+    ),
+    colorblind: bool = typer.Option(
+        False,
+        "--colorblind/--no-colorblind",
+        help="Use the colorblind-friendly theme across CLI and TUI output.",
+        envvar="DEVSYNTH_CLI_COLORBLIND",
+    ),
+) -> None:
+    if (
+        ctx.invoked_subcommand is not None
+        and not ctx.resilient_parsing
+        and not ctx.meta.get(_HELP_REQUESTED, False)
+    ):
+        _warn_if_features_disabled()
+    apply_global_options(
+        ctx,
+        dashboard_hook=dashboard_hook,
+        version=version,
+        debug=debug,
+        log_level=log_level,
+        colorblind=colorblind,
+    )
+
+
+def build_lazy_app(manifest: CommandManifest | None = None) -> typer.Typer:
+    """Create the manifest-backed Typer application.
+
+    Args:
+        manifest: Manifest to serve instead of the packaged one (for tests).
+    """
+
+    manifest = manifest or load_command_manifest()
+
+    class _Group(LazyCommandGroup):
+        manifest_loader = staticmethod(lambda: manifest)
+
+    app = typer.Typer(
+        cls=_Group,
+        help=manifest.help,
+        context_settings={"help_option_names": list(HELP_OPTION_NAMES)},
+    )
+    app.callback(invoke_without_command=True)(_lazy_main)
+    return app
+
+
+def _build_entry_app() -> typer.Typer:
+    """Return the lazy app, falling back to the eager app when unavailable."""
+
+    if os.environ.get("DEVSYNTH_CLI_MINIMAL") != "1":
+        try:
+            return build_lazy_app()
+        except CommandManifestError as exc:
+            logger.debug("Falling back to eager CLI construction: %s", exc)
+
+    from devsynth.adapters.cli.typer_adapter import (
+        _warn_if_features_disabled as warn_eager,
+    )
+    from devsynth.adapters.cli.typer_adapter import build_app
+
+    warn_eager()
+    return build_app()
+
+
+def run_cli() -> None:
+    """Entry point for the ``devsynth`` console script.
+
+    Exit codes:
+    - 0: Success
+    - 1: Runtime or unexpected error
+    - 2: Usage or argument error
+    """
+    try:
+        _build_entry_app()(prog_name="devsynth")
+    except (click.UsageError, click.BadParameter) as e:
+        from devsynth.adapters.cli.typer_adapter import _format_cli_error
+
+        typer.echo(_format_cli_error(str(e), kind="usage"), err=True)
+        raise typer.Exit(2)
+    except SystemExit:
+        # Let explicit exits propagate (e.g., --help)
+        raise
+    except Exception as e:  # pragma: no cover - generic safety net
+        from devsynth.adapters.cli.typer_adapter import _format_cli_error
+
+        typer.echo(_format_cli_error(str(e), kind="runtime"), err=True)
+        raise typer.Exit(1)
+
+
+__all__ = [
+    "CLIThemeOptions",
+    "LazyCommandGroup",
+    "apply_global_options",
+    "build_lazy_app",
+    "load_command",
+    "run_cli",
+]
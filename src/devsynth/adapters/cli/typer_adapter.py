@@ -1,7 +1,6 @@
 import importlib
 import os
 from collections.abc import Iterable
-from dataclasses import dataclass, field
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
@@ -26,6 +25,14 @@ from devsynth.application.cli.registry import COMMAND_REGISTRY
 
 # Trigger command registration by accessing a command that will call __getattr__
 _ = devsynth.application.cli.run_tests_cmd
+from devsynth.adapters.cli.lazy_app import (
+    CLIThemeOptions,
+    _get_theme_options,
+    _patch_typer_types,
+    _set_theme_options,
+    apply_global_options,
+)
+
 # config_app will be imported just before use
 from devsynth.core.config_loader import load_config
 from devsynth.interface.cli import COLORBLIND_THEME, DEVSYNTH_THEME, CLIUXBridge
@@ -45,34 +52,6 @@ else:
     from devsynth.application.cli.vcs_commands import vcs_app
 
 
-@dataclass(slots=True)
-class CLIThemeOptions:
-    """Shared theme configuration propagated from Typer callbacks."""
-
-    colorblind_mode: bool = False
-    overrides: dict[str, str] = field(default_factory=dict)
-
-
-def _ensure_ctx_state(ctx: typer.Context) -> dict[str, Any]:
-    if ctx.obj is None:
-        ctx.obj = {}
-    return ctx.obj
-
-
-def _set_theme_options(ctx: typer.Context, theme: CLIThemeOptions) -> None:
-    state = _ensure_ctx_state(ctx)
-    state["theme"] = theme
-
-
-def _get_theme_options(ctx: typer.Context | None) -> CLIThemeOptions:
-    if ctx is None or ctx.obj is None:
-        return CLIThemeOptions()
-    theme = ctx.obj.get("theme")  # type: ignore[assignment]
-    if isinstance(theme, CLIThemeOptions):
-        return theme
-    return CLIThemeOptions()
-
-
 def _create_textual_bridge(
     theme: CLIThemeOptions,
     *,
@@ -169,80 +148,72 @@ def inspect_config_cmd(
     COMMAND_REGISTRY["inspect-config"](path=path, update=update, prune=prune)
 
 
-def _patch_typer_types() -> None:
-    """Allow Typer to handle custom parameter annotations used in the CLI."""
+def completion_cmd(
+    shell: str | None = None,
+    install: bool = False,
+    path: Path | None = None,
+    *,
+    bridge: UXBridge | None = None,
+) -> None:
+    _registered("completion")(
+        shell=shell, install=install, path=path, bridge=bridge
+    )  # nosec B604: shell arg selects completion target
 
-    orig = typer.main.get_click_type
 
-    def patched_get_click_type(
-        annotation: Any, parameter_info: typer.models.ParameterInfo
-    ) -> click.types.ParamType:
-        if annotation in {UXBridge, typer.models.Context, Any}:
-            return click.STRING
-        origin = getattr(annotation, "__origin__", None)
-        if origin in {UXBridge, typer.models.Context, Any}:
-            return click.STRING
-        try:
-            return orig(annotation=annotation, parameter_info=parameter_info)
-        except RuntimeError:
-            return click.STRING
+def _registered(slug: str) -> Any:
+    """Return the registry entry for ``slug``, loading command modules if needed."""
 
-    typer.main.get_click_type = patched_get_click_type
+    if slug not in COMMAND_REGISTRY:
+        devsynth.application.cli._register_commands()
+    return COMMAND_REGISTRY[slug]
 
-    orig_get_click_param = typer.main.get_click_param
 
-    def _is_optional_union(annotation: Any) -> tuple[bool, tuple[Any, ...]]:
-        try:
-            origin = typer.main.get_origin(annotation)
-        except Exception:  # pragma: no cover - defensive
-            return False, ()
-        if origin is None:
-            return False, ()
-        if not typer.main.is_union(origin):
-            return False, ()
-        try:
-            args = tuple(typer.main.get_args(annotation))
-        except Exception:  # pragma: no cover - defensive
-            return False, ()
-        non_none = tuple(arg for arg in args if arg is not typer.main.NoneType)
-        return True, non_none
-
-    def patched_get_click_param(
-        param: typer.models.ParamMeta,
-    ) -> tuple[click.Parameter, Any]:
-        original_annotation = getattr(param, "annotation", typer.main.ParamMeta.empty)
-        should_restore = False
-        if original_annotation is not typer.main.ParamMeta.empty:
-            is_union, non_none_args = _is_optional_union(original_annotation)
-            if is_union and len(non_none_args) > 1:
-                logger.info(
-                    "Typer union fallback for parameter '%s' with annotation %r",
-                    getattr(param, "name", "<unknown>"),
-                    original_annotation,
-                )
-                param.annotation = non_none_args[0]
-                should_restore = True
-        try:
-            logger.debug(
-                "Building click parameter '%s' with annotation %r and default %r",
-                getattr(param, "name", "<unknown>"),
-                getattr(param, "annotation", None),
-                getattr(param, "default", None),
-            )
-            return orig_get_click_param(param)
-        except Exception as exc:  # pragma: no cover - diagnostic aid
-            logger.error(
-                "Failed to build click parameter '%s' with annotation %r: %s",
-                getattr(param, "name", "<unknown>"),
-                getattr(param, "annotation", None),
-                exc,
-            )
-            raise
-        finally:
-            if should_restore:
-                param.annotation = original_annotation
+def completion_command(
+    shell: str | None = typer.Option(None, "--shell", help="Shell type"),
+    install: bool = typer.Option(False, "--install", help="Install completion script"),
+    path: Path | None = typer.Option(None, "--path", help="Installation path"),
+) -> None:
+    completion_cmd(
+        shell=shell, install=install, path=path
+    )  # nosec B604: shell arg selects completion target
 
-    typer.main.get_click_param = patched_get_click_param
+
+def tui_command(
+    ctx: typer.Context,
+    wizard: str = typer.Option(
+        "init",
+        "--wizard",
+        "-w",
+        help="Wizard to launch (init or requirements).",
+        show_default=True,
+    ),
+    requirements_output: Path = typer.Option(
+        Path("requirements_wizard.json"),
+        "--requirements-output",
+        help="Output file when running the requirements wizard.",
+    ),
+) -> None:
+    """Start the Textual UI with the configured theme settings."""
+
+    theme = _get_theme_options(ctx)
+    bridge = _create_textual_bridge(theme, require_textual=True)
+    wizard_name = wizard.strip().lower()
+
+    if wizard_name == "init":
+        _registered("init")(wizard=True, bridge=bridge)
+    elif wizard_name in {"requirements", "requirement"}:
+        from devsynth.application.cli.config import CLIConfig
+        from devsynth.application.requirements.wizard import requirements_wizard
+
+        requirements_wizard(
+            bridge,
+            output_file=str(requirements_output),
+            config=CLIConfig(non_interactive=False),
+        )
+    else:
+        raise typer.BadParameter("Wizard must be 'init' or 'requirements'.")
+
+    _run_bridge_event_loop(bridge)
 
 
 logger = DevSynthLogger(__name__)
@@ -474,61 +445,14 @@ def build_app() -> typer.Typer:
 
     app.add_typer(config_app, name="config", help="Manage configuration settings")
 
-    @app.command(
+    app.command(
         "completion",
         help="Show or install shell completion scripts (see scripts/completions).",
-    )
-    def completion(
-        shell: str | None = typer.Option(None, "--shell", help="Shell type"),
-        install: bool = typer.Option(
-            False, "--install", help="Install completion script"
-        ),
-        path: Path | None = typer.Option(None, "--path", help="Installation path"),
-    ) -> None:
-        completion_cmd(
-            shell=shell, install=install, path=path
-        )  # nosec B604: shell arg selects completion target
-
-    @app.command(
+    )(completion_command)
+    app.command(
         "tui",
         help="Launch the Textual interface for DevSynth wizards.",
-    )
-    def tui_command(
-        ctx: typer.Context,
-        wizard: str = typer.Option(
-            "init",
-            "--wizard",
-            "-w",
-            help="Wizard to launch (init or requirements).",
-            show_default=True,
-        ),
-        requirements_output: Path = typer.Option(
-            Path("requirements_wizard.json"),
-            "--requirements-output",
-            help="Output file when running the requirements wizard.",
-        ),
-    ) -> None:
-        """Start the Textual UI with the configured theme settings."""
-
-        theme = _get_theme_options(ctx)
-        bridge = _create_textual_bridge(theme, require_textual=True)
-        wizard_name = wizard.strip().lower()
-
-        if wizard_name == "init":
-            COMMAND_REGISTRY["init"](wizard=True, bridge=bridge)
-        elif wizard_name in {"requirements", "requirement"}:
-            from devsynth.application.cli.config import CLIConfig
-            from devsynth.application.requirements.wizard import requirements_wizard
-
-            requirements_wizard(
-                bridge,
-                output_file=str(requirements_output),
-                config=CLIConfig(non_interactive=False),
-            )
-        else:
-            raise typer.BadParameter("Wizard must be 'init' or 'requirements'.")
-
-        _run_bridge_event_loop(bridge)
+    )(tui_command)
 
     @app.callback(invoke_without_command=True)
     def main(
@@ -564,61 +488,15 @@ def build_app() -> typer.Typer:
             envvar="DEVSYNTH_CLI_COLORBLIND",
         ),
     ) -> None:
-        # Handle --version eagerly
-        # Configure logging as early as possible using flags/env
-        import logging as _logging
-        import os
-
-        from devsynth.logging_setup import configure_logging
-
-        # If DEVSYNTH_DEBUG is set and log_level not provided, treat as debug
-        env_debug = os.environ.get("DEVSYNTH_DEBUG", "").lower() in {"1", "true", "yes"}
-        chosen_level = None
-        if log_level:
-            chosen_level = log_level.strip().upper()
-        elif debug or env_debug:
-            chosen_level = "DEBUG"
-        else:
-            # fall back to env DEVSYNTH_LOG_LEVEL or default inside configure_logging
-            chosen_level = os.environ.get("DEVSYNTH_LOG_LEVEL")
-
-        if chosen_level:
-            # Persist to env for child processes and consistency
-            os.environ["DEVSYNTH_LOG_LEVEL"] = chosen_level
-            try:
-                configure_logging(
-                    log_level=getattr(_logging, chosen_level, _logging.INFO)
-                )
-            except Exception:
-                # Do not crash CLI due to logging issues
-                pass
-
-        # Handle --version eagerly after logging configured
-        if version:
-            try:
-                from devsynth import __version__
-            except Exception:  # pragma: no cover - defensive fallback
-                __version__ = "unknown"
-            typer.echo(__version__)
-            raise typer.Exit(0)
-
-        if dashboard_hook:
-            try:
-                module_name, func_name = dashboard_hook.split(":", 1)
-                hook = getattr(importlib.import_module(module_name), func_name)
-                register_dashboard_hook(hook)
-            except Exception:
-                typer.echo(
-                    f"Failed to load dashboard hook '{dashboard_hook}'", err=True
-                )
-
-        theme = CLIThemeOptions(colorblind_mode=colorblind)
-        _set_theme_options(ctx, theme)
-        os.environ["DEVSYNTH_CLI_COLORBLIND"] = "1" if colorblind else "0"
-
-        if ctx.invoked_subcommand is None:
-            typer.echo(ctx.get_help())
-            raise typer.Exit()
+        apply_global_options(
+            ctx,
+            dashboard_hook=dashboard_hook,
+            version=version,
+            debug=debug,
+            log_level=log_level,
+            colorblind=colorblind,
+            register_hook=register_dashboard_hook,
+        )
 
     # Enable Typer's built-in completion if available
     if hasattr(app, "add_completion"):
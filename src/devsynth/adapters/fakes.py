@@ -15,6 +15,7 @@ This module aligns with docs/plan.md Phase 2 and docs/tasks.md §4.1.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any
 
 from devsynth.application.memory.dto import VectorStoreStats
@@ -48,9 +49,7 @@ class FakeMemoryStore(MemoryStore):
                 ("store", (item_id, item))
             )
             return item_id
-        self._store[item_id] = MemoryItem(
-            id=item_id, **{k: v for k, v in item.__dict__.items() if k != "id"}
-        )
+        self._store[item_id] = replace(item, id=item_id)
         return item_id
 
     def retrieve(self, item_id: str) -> MemoryItem | None:
@@ -89,9 +88,7 @@ class FakeMemoryStore(MemoryStore):
         for op, payload in ops:
             if op == "store":
                 item_id, item = payload
-                self._store[item_id] = MemoryItem(
-                    id=item_id, **{k: v for k, v in item.__dict__.items() if k != "id"}
-                )
+                self._store[item_id] = replace(item, id=item_id)
             elif op == "delete":
                 item_id = payload
                 self._store.pop(item_id, None)
@@ -125,7 +122,7 @@ class FakeVectorStore(VectorStore[MemoryVector]):
         self._vectors[vid] = MemoryVector(
             id=vid,
             content=vector.content,
-            embedding=vector.embedding,
+            embedding=vector.embedding_buffer,
             metadata=vector.metadata,
         )
         return vid
@@ -130,7 +130,9 @@ class KuzuAdapter(VectorStore[MemoryVector]):
             for vec in self._store.values():
                 try:
                     dist = float(
-                        np.linalg.norm(q - np.array(vec.embedding, dtype=float))
+                        np.linalg.norm(
+                            q - np.frombuffer(vec.embedding_buffer, dtype=np.float32)
+                        )
                     )
                 except ValueError:
                     # Skip vectors with mismatched dimensions
@@ -163,7 +165,7 @@ class KuzuAdapter(VectorStore[MemoryVector]):
     def get_collection_stats(self) -> VectorStoreStats:
         dim = 0
         if self._store:
-            dim = len(next(iter(self._store.values())).embedding)
+            dim = next(iter(self._store.values())).dimension
         return {
             "collection_name": self.collection_name,
             "vector_count": len(self._store),
@@ -33,6 +33,7 @@ from devsynth.exceptions import (
 
 from ...domain.interfaces.orchestration import WorkflowEngine, WorkflowRepository
 from ...domain.models.workflow import Workflow, WorkflowStatus, WorkflowStep
+from .sqlite_store import SQLiteCheckpointSaver, SQLiteWorkflowRepository
 
 
 # Add Pregel class for testing compatibility
@@ -149,9 +150,14 @@ class FileSystemCheckpointSaver:
 class LangGraphWorkflowEngine(WorkflowEngine):
     """LangGraph implementation of the WorkflowEngine interface."""
 
-    def __init__(self, human_intervention_callback: Callable | None = None):
+    def __init__(
+        self,
+        human_intervention_callback: Callable | None = None,
+        checkpoint_saver: SQLiteCheckpointSaver | None = None,
+    ):
         self.graphs = {}  # Store workflow graphs by ID
-        self.checkpoint_saver = FileSystemCheckpointSaver()
+        # Imports FileSystemCheckpointSaver pickles from the same directory.
+        self.checkpoint_saver = checkpoint_saver or SQLiteCheckpointSaver()
         self.human_intervention_callback = human_intervention_callback
 
     def create_workflow(self, name: str, description: str) -> Workflow:
@@ -0,0 +1,611 @@
+"""
+SQLite storage for orchestration checkpoints and workflows.
+
+:class:`SQLiteCheckpointSaver` replaces rewriting a whole pickled checkpoint on
+every ``put``. Checkpoints are flattened into leaf values keyed by their path
+through nested dictionaries; each ``put`` stores only the leaves that changed
+since the previous checkpoint of the thread, and a full snapshot is written
+every ``snapshot_interval`` checkpoints (or when a delta would be about as
+large as a snapshot), pruning the chain it supersedes.
+
+:class:`SQLiteWorkflowRepository` keeps ``status``, ``name`` and timestamp
+columns beside each pickled workflow, so ``list(filters)`` selects matching
+rows through indexes and only deserializes the workflows it returns.
+
+Both stores use a write-ahead-logged database and import the ``*.pkl`` files
+written by the file-system implementations in
+:mod:`devsynth.adapters.orchestration.langgraph_adapter` the first time they
+are opened on a directory that contains them.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from devsynth.logging_setup import DevSynthLogger
+
+from ...domain.interfaces.orchestration import WorkflowRepository
+from ...domain.models.workflow import Workflow, WorkflowStatus
+
+logger = DevSynthLogger(__name__)
+
+CHECKPOINT_DB_NAME = "checkpoints.sqlite3"
+WORKFLOW_DB_NAME = "workflows.sqlite3"
+DEFAULT_SNAPSHOT_INTERVAL = 20
+DEFAULT_MAX_CACHED_THREADS = 64
+
+LeafPath = tuple[Any, ...]
+FlatState = dict[LeafPath, bytes]
+
+_MIGRATIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS legacy_migrations (
+    source TEXT PRIMARY KEY,
+    migrated_at TEXT NOT NULL,
+    items INTEGER NOT NULL
+);
+"""
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('full', 'delta')),
+    payload BLOB NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (thread_id, seq)
+);
+"""
+
+_WORKFLOW_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    status TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workflows_status ON workflows (status, updated_at);
+CREATE INDEX IF NOT EXISTS workflows_name ON workflows (name);
+CREATE INDEX IF NOT EXISTS workflows_created_at ON workflows (created_at);
+CREATE INDEX IF NOT EXISTS workflows_updated_at ON workflows (updated_at);
+"""
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data: bytes) -> Any:
+    return pickle.loads(data)  # nosec B301: stored and loaded locally only
+
+
+def flatten_state(state: Mapping[Any, Any], prefix: LeafPath = ()) -> FlatState:
+    """Pickle the leaves of ``state``, keyed by their path of dict keys.
+
+    Only plain, non-empty ``dict`` values are descended into; everything else
+    (including dict subclasses and empty dicts) is a leaf.
+    """
+
+    flat: FlatState = {}
+    for key, value in state.items():
+        path = (*prefix, key)
+        if type(value) is dict and value:
+            flat.update(flatten_state(value, path))
+        else:
+            flat[path] = _dumps(value)
+    return flat
+
+
+def unflatten_state(flat: Mapping[LeafPath, bytes]) -> dict[Any, Any]:
+    """Rebuild the nested dictionary described by :func:`flatten_state`."""
+
+    root: dict[Any, Any] = {}
+    for path, data in flat.items():
+        node = root
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = _loads(data)
+    return root
+
+
+class _SQLiteDatabase:
+    """Lazily opened, lock-protected WAL connection."""
+
+    def __init__(self, path: str | os.PathLike[str], schema: str) -> None:
+        self.path = os.fspath(path)
+        self._schema = schema + _MIGRATIONS_SCHEMA
+        self._connection: sqlite3.Connection | None = None
+        self.lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self._schema)
+            self._connection = connection
+        return self._connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection inside a transaction, committing on success."""
+
+        with self.lock:
+            connection = self._connect()
+            with connection:
+                yield connection
+
+    def is_migrated(self, source: str) -> bool:
+        with self.transaction() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM legacy_migrations WHERE source = ?", (source,)
+            ).fetchone()
+        return row is not None
+
+    def mark_migrated(
+        self, connection: sqlite3.Connection, source: str, items: int
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO legacy_migrations VALUES (?, ?, ?)",
+            (source, datetime.now().isoformat(), items),
+        )
+
+    def close(self) -> None:
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _legacy_files(directory: str | os.PathLike[str] | None) -> list[Path]:
+    if directory is None or not os.path.isdir(directory):
+        return []
+    return sorted(path for path in Path(directory).glob("*.pkl") if path.is_file())
+
+
+def _needs_migration(
+    database: _SQLiteDatabase, directory: str | os.PathLike[str]
+) -> bool:
+    return bool(_legacy_files(directory)) and not database.is_migrated(
+        os.path.abspath(directory)
+    )
+
+
+def _migrate_directory(
+    database: _SQLiteDatabase,
+    directory: str | os.PathLike[str],
+    import_one: Callable[[sqlite3.Connection, Path, Any], bool],
+    *,
+    remove: bool,
+) -> int:
+    """Import every readable ``*.pkl`` file in ``directory`` once."""
+
+    files = _legacy_files(directory)
+    imported: list[Path] = []
+    with database.transaction() as connection:
+        for path in files:
+            try:
+                with open(path, "rb") as handle:
+                    value = _loads(handle.read())
+            except Exception as exc:
+                logger.warning("Skipping unreadable legacy file %s: %s", path, exc)
+                continue
+            if import_one(connection, path, value):
+                imported.append(path)
+        source = os.path.abspath(directory)
+        database.mark_migrated(connection, source, len(imported))
+    if remove:
+        for path in imported:
+            path.unlink(missing_ok=True)
+    if imported:
+        logger.info("Migrated %d pickle files from %s", len(imported), directory)
+    return len(imported)
+
+
+@dataclass(slots=True)
+class _CheckpointHead:
+    """Cached latest checkpoint of a thread."""
+
+    seq: int
+    flat: FlatState
+    deltas: int
+
+
+class SQLiteCheckpointSaver:
+    """Checkpoint saver storing per-step deltas with periodic snapshots.
+
+    Args:
+        database_path: SQLite file. Defaults to ``checkpoints.sqlite3`` inside
+            ``DEVSYNTH_CHECKPOINTS_PATH`` (or ``.devsynth/checkpoints``).
+        snapshot_interval: Write a full snapshot after this many deltas.
+        legacy_directory: Directory of ``FileSystemCheckpointSaver`` pickles
+            to import on first use. Defaults to the checkpoint directory when
+            ``database_path`` is not given.
+        max_cached_threads: Latest checkpoints kept in memory for computing
+            deltas without reading them back.
+    """
+
+    def __init__(
+        self,
+        database_path: str | os.PathLike[str] | None = None,
+        *,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        legacy_directory: str | os.PathLike[str] | None = None,
+        max_cached_threads: int = DEFAULT_MAX_CACHED_THREADS,
+    ) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be positive")
+        if database_path is None:
+            directory = os.environ.get(
+                "DEVSYNTH_CHECKPOINTS_PATH", ".devsynth/checkpoints"
+            )
+            database_path = os.path.join(directory, CHECKPOINT_DB_NAME)
+            if legacy_directory is None:
+                legacy_directory = directory
+        self._db = _SQLiteDatabase(database_path, _CHECKPOINT_SCHEMA)
+        self.snapshot_interval = snapshot_interval
+        self.max_cached_threads = max_cached_threads
+        self._legacy_directory = legacy_directory
+        self._heads: OrderedDict[str, _CheckpointHead] = OrderedDict()
+
+    @property
+    def database_path(self) -> str:
+        return self._db.path
+
+    @staticmethod
+    def _thread_id(config: dict[str, Any]) -> str | None:
+        return config.get("configurable", {}).get("thread_id")
+
+    def get(self, config: dict[str, Any]) -> dict[str, Any] | None:
+        """Get the latest checkpoint for a thread."""
+
+        thread_id = self._thread_id(config)
+        if not thread_id:
+            return None
+        with self._db.lock:
+            head = self._head(thread_id)
+            return None if head is None else unflatten_state(head.flat)
+
+    def put(
+        self, config: dict[str, Any], checkpoint: dict[str, Any], *args, **kwargs
+    ) -> None:
+        """Save a checkpoint for a thread as a delta or a full snapshot."""
+
+        thread_id = self._thread_id(config)
+        if not thread_id:
+            return
+        flat = flatten_state(checkpoint)
+        with self._db.lock:
+            head = self._head(thread_id)
+            if head is None or head.deltas + 1 >= self.snapshot_interval:
+                self._write_full(thread_id, head, flat)
+                return
+            changed = {
+                path: data for path, data in flat.items() if head.flat.get(path) != data
+            }
+            removed = [path for path in head.flat if path not in flat]
+            if not changed and not removed:
+                return
+            payload = _dumps((changed, removed))
+            if len(payload) * 2 >= sum(map(len, flat.values())):
+                self._write_full(thread_id, head, flat)
+                return
+            seq = head.seq + 1
+            with self._db.transaction() as connection:
+                connection.execute(
+                    "INSERT INTO checkpoints VALUES (?, ?, 'delta', ?, ?)",
+                    (thread_id, seq, payload, datetime.now().isoformat()),
+                )
+            self._remember(thread_id, _CheckpointHead(seq, flat, head.deltas + 1))
+
+    def delete(self, thread_id: str) -> None:
+        """Remove every stored checkpoint of ``thread_id``."""
+
+        with self._db.transaction() as connection:
+            connection.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,)
+            )
+            self._heads.pop(thread_id, None)
+
+    def migrate_directory(
+        self, directory: str | os.PathLike[str], *, remove: bool = False
+    ) -> int:
+        """Import ``FileSystemCheckpointSaver`` pickles from ``directory``.
+
+        Threads that already have checkpoints are left untouched. Returns the
+        number of files imported; with ``remove`` they are deleted afterwards.
+        """
+
+        def import_one(connection: sqlite3.Connection, path: Path, value: Any) -> bool:
+            if not isinstance(value, Mapping):
+                logger.warning("Skipping non-mapping checkpoint %s", path)
+                return False
+            exists = connection.execute(
+                "SELECT 1 FROM checkpoints WHERE thread_id = ? LIMIT 1", (path.stem,)
+            ).fetchone()
+            if exists is not None:
+                return False
+            connection.execute(
+                "INSERT INTO checkpoints VALUES (?, 1, 'full', ?, ?)",
+                (
+                    path.stem,
+                    _dumps(flatten_state(value)),
+                    datetime.now().isoformat(),
+                ),
+            )
+            return True
+
+        with self._db.lock:
+            self._heads.clear()
+            return _migrate_directory(self._db, directory, import_one, remove=remove)
+
+    def close(self) -> None:
+        self._heads.clear()
+        self._db.close()
+
+    def _ensure_migrated(self) -> None:
+        if self._legacy_directory is None:
+            return
+        with self._db.lock:
+            directory, self._legacy_directory = self._legacy_directory, None
+            if directory is not None and _needs_migration(self._db, directory):
+                self.migrate_directory(directory)
+
+    def _head(self, thread_id: str) -> _CheckpointHead | None:
+        self._ensure_migrated()
+        head = self._heads.get(thread_id)
+        if head is not None:
+            self._heads.move_to_end(thread_id)
+            return head
+        with self._db.transaction() as connection:
+            rows = connection.execute(
+                """
+                SELECT seq, kind, payload FROM checkpoints
+                WHERE thread_id = ? AND seq >= (
+                    SELECT COALESCE(MAX(seq), 0) FROM checkpoints
+                    WHERE thread_id = ? AND kind = 'full'
+                )
+                ORDER BY seq
+                """,
+                (thread_id, thread_id),
+            ).fetchall()
+        if not rows:
+            return None
+        flat: FlatState = {}
+        deltas = 0
+        for _seq, kind, payload in rows:
+            if kind == "full":
+                flat = _loads(payload)
+                continue
+            changed, removed = _loads(payload)
+            for path in removed:
+                flat.pop(path, None)
+            flat.update(changed)
+            deltas += 1
+        head = _CheckpointHead(rows[-1][0], flat, deltas)
+        self._remember(thread_id, head)
+        return head
+
+    def _write_full(
+        self, thread_id: str, head: _CheckpointHead | None, flat: FlatState
+    ) -> None:
+        seq = 1 if head is None else head.seq + 1
+        with self._db.transaction() as connection:
+            connection.execute(
+                "INSERT INTO checkpoints VALUES (?, ?, 'full', ?, ?)",
+                (thread_id, seq, _dumps(flat), datetime.now().isoformat()),
+            )
+            # The snapshot supersedes the previous chain.
+            connection.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ? AND seq < ?",
+                (thread_id, seq),
+            )
+        self._remember(thread_id, _CheckpointHead(seq, flat, 0))
+
+    def _remember(self, thread_id: str, head: _CheckpointHead) -> None:
+        self._heads[thread_id] = head
+        self._heads.move_to_end(thread_id)
+        while len(self._heads) > self.max_cached_threads:
+            self._heads.popitem(last=False)
+
+
+def _timestamp_key(value: Any) -> str | None:
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+def _status_key(value: Any) -> str | None:
+    return value.value if isinstance(value, WorkflowStatus) else None
+
+
+def _text_key(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+# Filter keys answered by indexed columns, with the function mapping an
+# attribute value to its column value. Values a function maps to ``None``
+# cannot be compared in SQL and are matched after deserialization instead.
+_INDEXED_COLUMNS: dict[str, Callable[[Any], str | None]] = {
+    "id": _text_key,
+    "name": _text_key,
+    "status": _status_key,
+    "created_at": _timestamp_key,
+    "updated_at": _timestamp_key,
+}
+
+
+class SQLiteWorkflowRepository(WorkflowRepository):
+    """Workflow repository with indexed status, name and timestamp columns.
+
+    Args:
+        database_path: SQLite file. Defaults to ``workflows.sqlite3`` inside
+            ``DEVSYNTH_WORKFLOWS_PATH`` (or ``.devsynth/workflows``).
+        legacy_directory: Directory of ``FileSystemWorkflowRepository``
+            pickles to import on first use. Defaults to the workflow
+            directory when ``database_path`` is not given.
+    """
+
+    def __init__(
+        self,
+        database_path: str | os.PathLike[str] | None = None,
+        *,
+        legacy_directory: str | os.PathLike[str] | None = None,
+    ) -> None:
+        if database_path is None:
+            directory = os.environ.get("DEVSYNTH_WORKFLOWS_PATH", ".devsynth/workflows")
+            database_path = os.path.join(directory, WORKFLOW_DB_NAME)
+            if legacy_directory is None:
+                legacy_directory = directory
+        self._db = _SQLiteDatabase(database_path, _WORKFLOW_SCHEMA)
+        self._legacy_directory = legacy_directory
+
+    @property
+    def database_path(self) -> str:
+        return self._db.path
+
+    def save(self, workflow: Workflow) -> None:
+        """Save a workflow."""
+
+        self._ensure_migrated()
+        with self._db.transaction() as connection:
+            self._upsert(connection, workflow)
+
+    def get(self, workflow_id: str) -> Workflow | None:
+        """Get a workflow by ID."""
+
+        self._ensure_migrated()
+        with self._db.transaction() as connection:
+            row = connection.execute(
+                "SELECT payload FROM workflows WHERE id = ?", (workflow_id,)
+            ).fetchone()
+        return None if row is None else _loads(row[0])
+
+    def list(self, filters: dict[str, Any] | None = None) -> list[Workflow]:
+        """List workflows matching the filters.
+
+        Filters on ``id``, ``name``, ``status``, ``created_at`` and
+        ``updated_at`` are answered by indexed columns; any other filter is
+        checked only on the workflows those columns selected.
+        """
+
+        self._ensure_migrated()
+        clauses: list[str] = []
+        params: list[Any] = []
+        remaining: dict[str, Any] = {}
+        for key, value in (filters or {}).items():
+            to_column = _INDEXED_COLUMNS.get(key)
+            column_value = None if to_column is None else to_column(value)
+            if column_value is None:
+                remaining[key] = value
+            else:
+                clauses.append(f"{key} = ?")
+                params.append(column_value)
+        query = "SELECT payload FROM workflows"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at, id"
+        with self._db.transaction() as connection:
+            payloads = [row[0] for row in connection.execute(query, params)]
+
+        workflows = []
+        for payload in payloads:
+            try:
+                workflow = _loads(payload)
+            except Exception as exc:
+                logger.info(f"Error deserializing workflow: {exc}")
+                continue
+            if not remaining or self._matches_filters(workflow, remaining):
+                workflows.append(workflow)
+        return workflows
+
+    def delete(self, workflow_id: str) -> bool:
+        """Delete a workflow, returning whether it existed."""
+
+        with self._db.transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM workflows WHERE id = ?", (workflow_id,)
+            )
+        return cursor.rowcount > 0
+
+    def migrate_directory(
+        self, directory: str | os.PathLike[str], *, remove: bool = False
+    ) -> int:
+        """Import ``FileSystemWorkflowRepository`` pickles from ``directory``.
+
+        Workflows already stored are left untouched. Returns the number of
+        files imported; with ``remove`` they are deleted afterwards.
+        """
+
+        def import_one(connection: sqlite3.Connection, path: Path, value: Any) -> bool:
+            if not isinstance(value, Workflow):
+                logger.warning("Skipping non-workflow pickle %s", path)
+                return False
+            exists = connection.execute(
+                "SELECT 1 FROM workflows WHERE id = ?", (value.id,)
+            ).fetchone()
+            if exists is not None:
+                return False
+            self._upsert(connection, value)
+            return True
+
+        return _migrate_directory(self._db, directory, import_one, remove=remove)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _ensure_migrated(self) -> None:
+        if self._legacy_directory is None:
+            return
+        with self._db.lock:
+            directory, self._legacy_directory = self._legacy_directory, None
+            if directory is not None and _needs_migration(self._db, directory):
+                self.migrate_directory(directory)
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, workflow: Workflow) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO workflows VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                workflow.id,
+                _text_key(workflow.name),
+                _status_key(workflow.status),
+                _timestamp_key(workflow.created_at),
+                _timestamp_key(workflow.updated_at),
+                _dumps(workflow),
+            ),
+        )
+
+    @staticmethod
+    def _matches_filters(workflow: Workflow, filters: dict[str, Any]) -> bool:
+        """Check if a workflow matches the given filters."""
+
+        return all(
+            getattr(workflow, key, None) == value for key, value in filters.items()
+        )
+
+
+__all__ = [
+    "CHECKPOINT_DB_NAME",
+    "DEFAULT_SNAPSHOT_INTERVAL",
+    "SQLiteCheckpointSaver",
+    "SQLiteWorkflowRepository",
+    "WORKFLOW_DB_NAME",
+    "flatten_state",
+    "unflatten_state",
+]
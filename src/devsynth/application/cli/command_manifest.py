@@ -0,0 +1,350 @@
+"""Static manifest describing the top-level DevSynth CLI commands.
+
+The manifest records, for every command exposed by
+:func:`devsynth.adapters.cli.typer_adapter.build_app`, the command name, its help
+text, its options, and the dotted path of the callable implementing it. The
+lazy entry point in :mod:`devsynth.adapters.cli.lazy_app` uses this data to
+render ``devsynth --help`` and shell completion without importing any command
+module, and imports a command's module only when that command is invoked.
+
+The JSON file shipped next to this module is generated; regenerate it with
+``python scripts/generate_cli_manifest.py`` whenever commands change.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = Path(__file__).with_name("command_manifest.json")
+
+# Typer sub-applications mounted by ``build_app``. Typer instances do not
+# remember where they were defined, so their import paths are listed here.
+GROUP_TARGETS: Mapping[str, str] = {
+    "requirements": "devsynth.application.cli.requirements_commands:requirements_app",
+    "mvu": "devsynth.application.cli.mvu_commands:mvu_app",
+    "vcs": "devsynth.application.cli.vcs_commands:vcs_app",
+    "config": "devsynth.application.cli.commands.config_cmds:config_app",
+}
+
+
+class CommandManifestError(RuntimeError):
+    """Raised when the command manifest is missing, stale, or malformed."""
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestParameter:
+    """A single Click parameter captured from a command signature."""
+
+    name: str
+    kind: str = "option"
+    opts: tuple[str, ...] = ()
+    secondary_opts: tuple[str, ...] = ()
+    help: str = ""
+    is_flag: bool = False
+    multiple: bool = False
+    required: bool = False
+    nargs: int = 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "opts": list(self.opts),
+            "secondary_opts": list(self.secondary_opts),
+            "help": self.help,
+            "is_flag": self.is_flag,
+            "multiple": self.multiple,
+            "required": self.required,
+            "nargs": self.nargs,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ManifestParameter:
+        return cls(
+            name=str(data["name"]),
+            kind=str(data.get("kind", "option")),
+            opts=tuple(data.get("opts", ())),
+            secondary_opts=tuple(data.get("secondary_opts", ())),
+            help=str(data.get("help", "")),
+            is_flag=bool(data.get("is_flag", False)),
+            multiple=bool(data.get("multiple", False)),
+            required=bool(data.get("required", False)),
+            nargs=int(data.get("nargs", 1)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CommandManifestEntry:
+    """Metadata needed to list, complete, and lazily load one CLI command.
+
+    Attributes:
+        name: Command name as typed on the command line.
+        target: ``module:attribute`` path of the Typer callback or sub-app.
+        kind: ``"command"`` for callbacks or ``"group"`` for Typer sub-apps.
+        help: Full help text shown by ``devsynth <name> --help``.
+        short_help: One-line summary used in ``devsynth --help`` listings.
+        registered: ``module:attribute`` path of the callable stored in
+            :data:`~devsynth.application.cli.registry.COMMAND_REGISTRY` when
+            ``target`` is an adapter wrapper that dispatches through it.
+        hidden: Whether the command is hidden from help listings.
+        params: Parameters accepted by the command (used for completion).
+        subcommands: Names and short help of sub-commands for groups.
+    """
+
+    name: str
+    target: str
+    kind: str = "command"
+    help: str = ""
+    short_help: str = ""
+    registered: str | None = None
+    hidden: bool = False
+    params: tuple[ManifestParameter, ...] = ()
+    subcommands: tuple[tuple[str, str], ...] = field(default_factory=tuple)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "target": self.target,
+            "registered": self.registered,
+            "help": self.help,
+            "short_help": self.short_help,
+            "hidden": self.hidden,
+            "params": [param.to_dict() for param in self.params],
+            "subcommands": [list(item) for item in self.subcommands],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> CommandManifestEntry:
+        return cls(
+            name=str(data["name"]),
+            target=str(data["target"]),
+            kind=str(data.get("kind", "command")),
+            help=str(data.get("help", "")),
+            short_help=str(data.get("short_help", "")),
+            registered=data.get("registered"),
+            hidden=bool(data.get("hidden", False)),
+            params=tuple(
+                ManifestParameter.from_dict(item) for item in data.get("params", ())
+            ),
+            subcommands=tuple(
+                (str(name), str(text)) for name, text in data.get("subcommands", ())
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CommandManifest:
+    """Ordered collection of :class:`CommandManifestEntry` objects."""
+
+    help: str
+    entries: tuple[CommandManifestEntry, ...]
+
+    def names(self) -> list[str]:
+        return [entry.name for entry in self.entries]
+
+    def get(self, name: str) -> CommandManifestEntry | None:
+        for entry in self.entries:
+            if entry.name == name:
+                return entry
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "help": self.help,
+            "commands": [entry.to_dict() for entry in self.entries],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> CommandManifest:
+        if data.get("version") != MANIFEST_VERSION:
+            raise CommandManifestError(
+                f"Unsupported command manifest version: {data.get('version')!r}"
+            )
+        return cls(
+            help=str(data.get("help", "")),
+            entries=tuple(
+                CommandManifestEntry.from_dict(item) for item in data["commands"]
+            ),
+        )
+
+
+def resolve_target(path: str) -> Any:
+    """Import and return the object referenced by a ``module:attribute`` path."""
+
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise CommandManifestError(f"Invalid command target: {path!r}")
+    obj: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def load_command_manifest(path: Path | None = None) -> CommandManifest:
+    """Load the command manifest shipped with the package.
+
+    Raises:
+        CommandManifestError: If the file is missing or cannot be parsed.
+    """
+
+    manifest_path = path or MANIFEST_PATH
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        return CommandManifest.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise CommandManifestError(
+            f"Unable to load CLI command manifest from {manifest_path}: {exc}"
+        ) from exc
+
+
+def _callable_path(fn: Any) -> str:
+    """Return the ``module:qualname`` path for ``fn`` and verify it resolves."""
+
+    module_name = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if not module_name or not qualname or "<locals>" in qualname:
+        raise CommandManifestError(
+            f"Command callable {fn!r} is not importable by module path"
+        )
+    path = f"{module_name}:{qualname}"
+    if resolve_target(path) is not fn:
+        raise CommandManifestError(f"{path} does not resolve to {fn!r}")
+    return path
+
+
+def _describe_params(params: Sequence[Any]) -> tuple[ManifestParameter, ...]:
+    import click
+
+    described: list[ManifestParameter] = []
+    for param in params:
+        if not getattr(param, "name", None):
+            continue
+        is_option = isinstance(param, click.Option)
+        described.append(
+            ManifestParameter(
+                name=str(param.name),
+                kind="option" if is_option else "argument",
+                opts=tuple(param.opts),
+                secondary_opts=tuple(param.secondary_opts),
+                help=str(getattr(param, "help", "") or ""),
+                is_flag=bool(getattr(param, "is_flag", False)),
+                multiple=bool(param.multiple),
+                required=bool(param.required),
+                nargs=int(param.nargs),
+            )
+        )
+    return tuple(described)
+
+
+def generate_command_manifest() -> CommandManifest:
+    """Build the manifest by introspecting the fully loaded Typer application."""
+
+    import click
+    import typer
+
+    from devsynth.adapters.cli import typer_adapter
+    from devsynth.application.cli.registry import COMMAND_REGISTRY
+
+    app = typer_adapter.build_app()
+    root = typer.main.get_command(app)
+    if not isinstance(root, click.Group):  # pragma: no cover - defensive
+        raise CommandManifestError("The DevSynth CLI root is not a command group")
+
+    # Later registrations replace earlier ones, mirroring Click's behaviour.
+    callbacks: dict[str, Any] = {}
+    for info in app.registered_commands:
+        if info.name and info.callback is not None:
+            callbacks[info.name] = info.callback
+    groups = {str(info.name) for info in app.registered_groups if info.name}
+
+    ctx = click.Context(root, info_name="devsynth")
+    entries: list[CommandManifestEntry] = []
+    for name in root.list_commands(ctx):
+        command = root.get_command(ctx, name)
+        if command is None:  # pragma: no cover - defensive
+            continue
+        if name in groups:
+            if name not in GROUP_TARGETS:
+                raise CommandManifestError(
+                    f"Command group '{name}' has no entry in GROUP_TARGETS"
+                )
+            sub_ctx = click.Context(command, info_name=name, parent=ctx)
+            subcommands = tuple(
+                (
+                    sub_name,
+                    sub.get_short_help_str(limit=120),
+                )
+                for sub_name in command.list_commands(sub_ctx)  # type: ignore[attr-defined]
+                if (sub := command.get_command(sub_ctx, sub_name)) is not None  # type: ignore[attr-defined]
+            )
+            entries.append(
+                CommandManifestEntry(
+                    name=name,
+                    target=GROUP_TARGETS[name],
+                    kind="group",
+                    help=command.help or "",
+                    short_help=command.get_short_help_str(limit=120),
+                    hidden=command.hidden,
+                    subcommands=subcommands,
+                )
+            )
+            continue
+
+        callback = callbacks[name]
+        target = _callable_path(callback)
+        registered_fn = COMMAND_REGISTRY.get(name)
+        registered = (
+            _callable_path(registered_fn)
+            if registered_fn is not None and registered_fn is not callback
+            else None
+        )
+        entries.append(
+            CommandManifestEntry(
+                name=name,
+                target=target,
+                help=command.help or "",
+                short_help=command.get_short_help_str(limit=120),
+                registered=registered,
+                hidden=command.hidden,
+                params=_describe_params(command.params),
+            )
+        )
+
+    return CommandManifest(help=root.help or "", entries=tuple(entries))
+
+
+def write_command_manifest(manifest: CommandManifest, path: Path | None = None) -> Path:
+    """Serialize ``manifest`` to ``path`` (defaults to the packaged location)."""
+
+    target = path or MANIFEST_PATH
+    target.write_text(
+        json.dumps(manifest.to_dict(), indent=2, sort_keys=False) + "\n",
+        encoding="utf-8",
+    )
+    load_command_manifest.cache_clear()
+    return target
+
+
+__all__ = [
+    "GROUP_TARGETS",
+    "MANIFEST_PATH",
+    "MANIFEST_VERSION",
+    "CommandManifest",
+    "CommandManifestEntry",
+    "CommandManifestError",
+    "ManifestParameter",
+    "generate_command_manifest",
+    "load_command_manifest",
+    "resolve_target",
+    "write_command_manifest",
+]
@@ -1,38 +1,56 @@
-"""Command modules for the CLI application."""
+"""Command modules for the CLI application.
+
+Command callables are exported lazily: ``from ...commands import doctor_cmd``
+imports only :mod:`.doctor_cmd`, so resolving one command from the CLI
+manifest does not load every other command module and its dependencies.
+
+Once a command submodule has been imported, Python binds the submodule itself
+to the package attribute of the same name; import callables from their
+submodule (``from ...commands.doctor_cmd import doctor_cmd``) when the
+submodule may already be loaded.
+"""
 
 from __future__ import annotations
 
+import importlib
 import os
+from typing import Any
 
-from .run_tests_cmd import run_tests_cmd
-
-__all__ = ["run_tests_cmd"]
+# Exported callable name -> submodule defining it.
+_EXPORTS: dict[str, str] = {"run_tests_cmd": "run_tests_cmd"}
 
 if os.environ.get("DEVSYNTH_CLI_MINIMAL") != "1":
-    from .align_cmd import align_cmd
-    from .alignment_metrics_cmd import alignment_metrics_cmd
-    from .analyze_manifest_cmd import analyze_manifest_cmd
-    from .doctor_cmd import doctor_cmd
-    from .edrr_cycle_cmd import edrr_cycle_cmd
-    from .generate_docs_cmd import generate_docs_cmd
-    from .ingest_cmd import ingest_cmd
-    from .inspect_code_cmd import inspect_code_cmd
-    from .inspect_config_cmd import inspect_config_cmd
-    from .test_metrics_cmd import test_metrics_cmd
-    from .validate_manifest_cmd import validate_manifest_cmd
-    from .validate_metadata_cmd import validate_metadata_cmd
-
-    __all__ += [
-        "inspect_code_cmd",
-        "inspect_config_cmd",
-        "doctor_cmd",
-        "edrr_cycle_cmd",
-        "align_cmd",
-        "validate_manifest_cmd",
-        "validate_metadata_cmd",
-        "alignment_metrics_cmd",
-        "test_metrics_cmd",
-        "generate_docs_cmd",
-        "analyze_manifest_cmd",
-        "ingest_cmd",
-    ]
+    _EXPORTS.update(
+        {
+            name: name
+            for name in (
+                "inspect_code_cmd",
+                "inspect_config_cmd",
+                "doctor_cmd",
+                "edrr_cycle_cmd",
+                "align_cmd",
+                "validate_manifest_cmd",
+                "validate_metadata_cmd",
+                "alignment_metrics_cmd",
+                "test_metrics_cmd",
+                "generate_docs_cmd",
+                "analyze_manifest_cmd",
+                "ingest_cmd",
+            )
+        }
+    )
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
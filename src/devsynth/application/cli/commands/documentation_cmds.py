@@ -2,7 +2,9 @@
 
 from ..registry import register
 from .generate_docs_cmd import generate_docs_cmd
+from .ingest_cmd import ingest_cmd
 
 register("generate-docs", generate_docs_cmd)
+register("ingest", ingest_cmd)
 
-__all__ = ["generate_docs_cmd"]
+__all__ = ["generate_docs_cmd", "ingest_cmd"]
@@ -19,7 +19,6 @@ from devsynth.interface.ux_bridge import UXBridge
 from devsynth.logging_setup import DevSynthLogger
 
 from ..ingest_cmd import ingest_cmd as _ingest_cmd
-from ..registry import register
 from ..utils import _env_flag, _resolve_bridge
 
 logger = DevSynthLogger(__name__)
@@ -238,6 +237,4 @@ def ingest_cmd(
     _ingest_cmd(**options.to_kwargs())
 
 
-register("ingest", ingest_cmd)
-
 __all__ = ["ingest_cmd"]
@@ -220,7 +220,7 @@ class AstVisitor(ast.NodeVisitor):
         self.docstring = ast.get_docstring(node) or ""
 
         # Debug logging for docstring extraction
-        logger.debug(f"Extracted module docstring: {self.docstring}")
+        logger.debug("Extracted module docstring: %s", self.docstring)
 
         self.generic_visit(node)
 
@@ -312,7 +312,7 @@ class CodeAnalyzer(CodeAnalysisProvider):
                 code = f.read()
 
             # Log the file content for debugging
-            logger.debug(f"File content for {file_path}:\n{code}")
+            logger.debug("File content for %s:\n%s", file_path, code)
 
             # Use analyze_code to analyze the file content
             return self.analyze_code(code, file_path)
@@ -404,7 +404,7 @@ class CodeAnalyzer(CodeAnalysisProvider):
                 visitor.docstring = module_docstring
 
             # Log the docstring for debugging
-            logger.debug(f"Final docstring: {visitor.docstring}")
+            logger.debug("Final docstring: %s", visitor.docstring)
 
             # Calculate metrics
             metrics = {
@@ -12,11 +12,16 @@ from __future__ import annotations
 
 import re
 import uuid
+from collections.abc import Mapping
 from collections.abc import Mapping as MappingABC
-from dataclasses import replace
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
-from collections.abc import Mapping, Sequence
+
+import numpy as np
 
 from devsynth.application.edrr.edrr_phase_transitions import (
     MetricType,
@@ -36,10 +41,127 @@ from .dto import (
     SynthesisArtifact,
 )
 
+_WORD_RE = re.compile(r"\b\w+\b")
+_APPROACH_RE = re.compile(r"use ([a-zA-Z0-9_]+)")
+
+# Contradiction lexicon: substring markers checked once per opinion. Pairs of
+# opposing markers below mark a direct contradiction between two opinions.
+_MARKERS = ("yes", "no", "should", "should not")
+_YES, _NO, _SHOULD, _SHOULD_NOT = range(len(_MARKERS))
+_TOPIC_WORDS = frozenset({"approach", "method", "solution", "implementation", "design"})
+
+# Severity assigned to each conflict kind; word-overlap conflicts use
+# ``1 - overlap`` instead.
+_CONTRADICTION_SEVERITY = 0.9
+_OPPOSING_RECOMMENDATION_SEVERITY = 0.8
+_DIFFERENT_APPROACH_SEVERITY = 0.6
+_LOW_OVERLAP_THRESHOLD = 0.3
+
+
+@dataclass(frozen=True, slots=True)
+class _OpinionProfile:
+    """Tokenized view of an opinion, computed once per distinct text."""
+
+    words: frozenset[str]
+    markers: tuple[bool, ...]
+    approach: str | None
+    on_topic: bool
+
+
+@lru_cache(maxsize=4096)
+def _opinion_profile(opinion: str) -> _OpinionProfile:
+    lowered = opinion.lower()
+    words = frozenset(_WORD_RE.findall(lowered))
+    approach = _APPROACH_RE.search(lowered)
+    return _OpinionProfile(
+        words=words,
+        markers=tuple(marker in lowered for marker in _MARKERS),
+        approach=approach.group(1) if approach else None,
+        on_topic=not _TOPIC_WORDS.isdisjoint(words),
+    )
+
+
+def _conflict_matrix(
+    profiles: Sequence[_OpinionProfile],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Score every pair of opinions at once.
+
+    Returns a boolean ``conflict`` matrix and a ``severity`` matrix, both
+    ``n x n``. Word overlap is the shared-word count divided by the larger
+    vocabulary of the pair, computed as a single binary bag-of-words product.
+    """
+
+    n = len(profiles)
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for row, profile in enumerate(profiles):
+        for word in profile.words:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(word, len(vocabulary)))
+    bag = np.zeros((n, max(len(vocabulary), 1)), dtype=np.float64)
+    bag[rows, cols] = 1.0
+    shared = bag @ bag.T
+    sizes = bag.sum(axis=1)
+    larger = np.maximum(sizes[:, None], sizes[None, :])
+    # Two empty opinions share nothing to disagree about.
+    overlap = np.divide(shared, larger, out=np.ones_like(shared), where=larger > 0)
+
+    markers = np.array([profile.markers for profile in profiles], dtype=bool)
+    markers = markers.reshape(n, len(_MARKERS))
+
+    def opposed(first: int, second: int) -> np.ndarray:
+        a, b = markers[:, first], markers[:, second]
+        return (a[:, None] & b[None, :]) | (b[:, None] & a[None, :])
+
+    contradiction = opposed(_YES, _NO)
+    opposing = opposed(_SHOULD, _SHOULD_NOT)
+
+    approach_ids: dict[str, int] = {}
+    approaches = np.array(
+        [
+            (
+                -1
+                if profile.approach is None
+                else approach_ids.setdefault(profile.approach, len(approach_ids))
+            )
+            for profile in profiles
+        ],
+        dtype=np.int64,
+    )
+    has_approach = approaches >= 0
+    different_approach = (
+        has_approach[:, None]
+        & has_approach[None, :]
+        & (approaches[:, None] != approaches[None, :])
+    )
+
+    on_topic = np.array([profile.on_topic for profile in profiles], dtype=bool)
+    off_track = (
+        (overlap < _LOW_OVERLAP_THRESHOLD) & on_topic[:, None] & on_topic[None, :]
+    )
+
+    conflict = contradiction | opposing | different_approach | off_track
+    severity = np.select(
+        [contradiction, opposing, different_approach],
+        [
+            _CONTRADICTION_SEVERITY,
+            _OPPOSING_RECOMMENDATION_SEVERITY,
+            _DIFFERENT_APPROACH_SEVERITY,
+        ],
+        default=1.0 - overlap,
+    )
+    return conflict, severity
+
 
 class ConsensusBuildingMixin:
     """Mixin class providing consensus building functionality."""
 
+    #: Seconds to wait for all agents to return an opinion.
+    opinion_timeout: float = 30.0
+    #: Upper bound on concurrent opinion requests.
+    opinion_max_workers: int = 8
+
     def build_consensus(
         self, task: dict[str, Any], phase: Phase | None = None
     ) -> ConsensusOutcome:
@@ -237,35 +359,34 @@ class ConsensusBuildingMixin:
         opinion_map = {
             record.agent_id: record for record in opinions if record.agent_id
         }
+        if len(opinion_map) < 2:
+            return conflicts
 
         agent_names = list(opinion_map.keys())
-        for i in range(len(agent_names)):
-            for j in range(i + 1, len(agent_names)):
-                agent1 = agent_names[i]
-                agent2 = agent_names[j]
-
-                opinion1 = opinion_map[agent1].opinion or ""
-                opinion2 = opinion_map[agent2].opinion or ""
+        texts = [opinion_map[name].opinion or "" for name in agent_names]
+        conflict, severity = _conflict_matrix(
+            [_opinion_profile(text) for text in texts]
+        )
 
-                if self._opinions_conflict(opinion1, opinion2):
-                    severity_score = self._calculate_conflict_severity(
-                        opinion1, opinion2
-                    )
-                    severity_label = "high" if severity_score > 0.7 else "medium"
-                    conflicts.append(
-                        ConflictRecord(
-                            conflict_id=f"conflict_{len(conflicts)}_{task['id']}",
-                            task_id=task.get("id"),
-                            agent_a=agent1,
-                            agent_b=agent2,
-                            opinion_a=opinion1,
-                            opinion_b=opinion2,
-                            rationale_a=opinion_map[agent1].rationale,
-                            rationale_b=opinion_map[agent2].rationale,
-                            severity_label=severity_label,
-                            severity_score=severity_score,
-                        )
-                    )
+        # Row-major upper-triangle order matches the pairwise agent ordering.
+        for i, j in zip(*np.nonzero(np.triu(conflict, k=1))):
+            agent1, agent2 = agent_names[i], agent_names[j]
+            severity_score = float(severity[i, j])
+            severity_label = "high" if severity_score > 0.7 else "medium"
+            conflicts.append(
+                ConflictRecord(
+                    conflict_id=f"conflict_{len(conflicts)}_{task['id']}",
+                    task_id=task.get("id"),
+                    agent_a=agent1,
+                    agent_b=agent2,
+                    opinion_a=texts[i],
+                    opinion_b=texts[j],
+                    rationale_a=opinion_map[agent1].rationale,
+                    rationale_b=opinion_map[agent2].rationale,
+                    severity_label=severity_label,
+                    severity_score=severity_score,
+                )
+            )
 
         return conflicts
 
@@ -273,6 +394,11 @@ class ConsensusBuildingMixin:
         """
         Determine if two opinions conflict with each other.
 
+        Opinions conflict when they directly contradict (yes/no), give
+        opposing recommendations (should/should not), name different
+        approaches ("use X"), or share under 30% of their words while both
+        discussing an approach or design.
+
         Args:
             opinion1: First opinion
             opinion2: Second opinion
@@ -280,40 +406,10 @@ class ConsensusBuildingMixin:
         Returns:
             True if opinions conflict, False otherwise
         """
-        # Check for direct contradictions
-        if "yes" in opinion1.lower() and "no" in opinion2.lower():
-            return True
-        if "no" in opinion1.lower() and "yes" in opinion2.lower():
-            return True
-
-        # Check for opposing recommendations
-        if "should" in opinion1.lower() and "should not" in opinion2.lower():
-            return True
-        if "should not" in opinion1.lower() and "should" in opinion2.lower():
-            return True
-
-        # Check for different approaches
-        approach1 = re.search(r"use ([a-zA-Z0-9_]+)", opinion1.lower())
-        approach2 = re.search(r"use ([a-zA-Z0-9_]+)", opinion2.lower())
-
-        if approach1 and approach2 and approach1.group(1) != approach2.group(1):
-            return True
-
-        # Check for semantic similarity (simplified)
-        # In a real implementation, this would use embeddings or more sophisticated NLP
-        words1 = set(re.findall(r"\b\w+\b", opinion1.lower()))
-        words2 = set(re.findall(r"\b\w+\b", opinion2.lower()))
-
-        # If opinions share less than 30% of words, they might conflict
-        if len(words1.intersection(words2)) / max(len(words1), len(words2)) < 0.3:
-            # Check if they're discussing the same topic
-            topic_words = {"approach", "method", "solution", "implementation", "design"}
-            if any(word in words1 for word in topic_words) and any(
-                word in words2 for word in topic_words
-            ):
-                return True
-
-        return False
+        conflict, _ = _conflict_matrix(
+            [_opinion_profile(opinion1), _opinion_profile(opinion2)]
+        )
+        return bool(conflict[0, 1])
 
     def _calculate_conflict_severity(self, opinion1: str, opinion2: str) -> float:
         """
@@ -326,33 +422,10 @@ class ConsensusBuildingMixin:
         Returns:
             Severity score between 0 and 1
         """
-        # Direct contradictions are high severity
-        if "yes" in opinion1.lower() and "no" in opinion2.lower():
-            return 0.9
-        if "no" in opinion1.lower() and "yes" in opinion2.lower():
-            return 0.9
-
-        # Opposing recommendations are high severity
-        if "should" in opinion1.lower() and "should not" in opinion2.lower():
-            return 0.8
-        if "should not" in opinion1.lower() and "should" in opinion2.lower():
-            return 0.8
-
-        # Different approaches are medium severity
-        approach1 = re.search(r"use ([a-zA-Z0-9_]+)", opinion1.lower())
-        approach2 = re.search(r"use ([a-zA-Z0-9_]+)", opinion2.lower())
-
-        if approach1 and approach2 and approach1.group(1) != approach2.group(1):
-            return 0.6
-
-        # Calculate word overlap as a measure of agreement
-        words1 = set(re.findall(r"\b\w+\b", opinion1.lower()))
-        words2 = set(re.findall(r"\b\w+\b", opinion2.lower()))
-
-        overlap = len(words1.intersection(words2)) / max(len(words1), len(words2))
-
-        # Convert overlap to severity (less overlap = higher severity)
-        return 1.0 - overlap
+        _, severity = _conflict_matrix(
+            [_opinion_profile(opinion1), _opinion_profile(opinion2)]
+        )
+        return float(severity[0, 1])
 
     def _generate_conflict_resolution_synthesis(
         self,
@@ -737,12 +810,19 @@ class ConsensusBuildingMixin:
         """
         Generate opinions from agents for a task.
 
+        Opinions are requested from all agents concurrently. Agents that have
+        not answered within :attr:`opinion_timeout` seconds are skipped so a
+        slow agent cannot stall consensus for the whole team. Messages are
+        recorded on the calling thread in agent order.
+
         Args:
             task: The task to generate opinions for
         """
-        # For each agent, request an opinion
-        for agent in self.agents:
-            # Send a message to the agent requesting an opinion
+        agents = list(self.agents)
+        if not agents:
+            return
+
+        for agent in agents:
             self.send_message(
                 sender="system",
                 recipients=[agent.name],
@@ -752,14 +832,35 @@ class ConsensusBuildingMixin:
                 metadata={"task_id": task["id"]},
             )
 
-            # In a real implementation, we would wait for the agent to respond
-            # For this example, we'll simulate a response
-
-            # Generate a simulated opinion
-            opinion = f"I think we should {['implement', 'consider', 'analyze', 'design'][hash(agent.name) % 4]} the {task.get('title', 'task')}."
-            rationale = f"Based on my expertise in {agent.metadata.get('expertise', ['general'])[0]}, this approach would be most effective."
+        workers = max(1, min(self.opinion_max_workers, len(agents)))
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="wsde-opinion"
+        )
+        try:
+            futures = [
+                executor.submit(self._request_agent_opinion, agent, task)
+                for agent in agents
+            ]
+            wait(futures, timeout=self.opinion_timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for agent, future in zip(agents, futures):
+            if not future.done() or future.cancelled():
+                self.logger.warning(
+                    f"Agent {agent.name} did not provide an opinion on task "
+                    f"{task['id']} within {self.opinion_timeout}s"
+                )
+                continue
+            try:
+                opinion, rationale = future.result()
+            except Exception as exc:
+                self.logger.warning(
+                    f"Agent {agent.name} failed to provide an opinion on task "
+                    f"{task['id']}: {exc}"
+                )
+                continue
 
-            # Send the opinion as a message
             self.send_message(
                 sender=agent.name,
                 recipients=["system"],
@@ -769,6 +870,27 @@ class ConsensusBuildingMixin:
                 metadata={"task_id": task["id"]},
             )
 
+    def _request_agent_opinion(
+        self, agent: Any, task: Mapping[str, Any]
+    ) -> tuple[str, str]:
+        """
+        Obtain a single agent's opinion and rationale for a task.
+
+        Runs on a worker thread, so it must not mutate shared team state.
+
+        Args:
+            agent: The agent being asked
+            task: The task under discussion
+
+        Returns:
+            Tuple of ``(opinion, rationale)``
+        """
+        # In a real implementation, we would wait for the agent to respond
+        # For this example, we'll simulate a response
+        opinion = f"I think we should {['implement', 'consider', 'analyze', 'design'][hash(agent.name) % 4]} the {task.get('title', 'task')}."
+        rationale = f"Based on my expertise in {agent.metadata.get('expertise', ['general'])[0]}, this approach would be most effective."
+        return opinion, rationale
+
     def _calculate_readability_score(self, text: str) -> dict[str, float]:
         """
         Calculate readability metrics for text.
@@ -7,17 +7,23 @@ from various sources, including official documentation sites, PyPI, and GitHub.
 
 from __future__ import annotations
 
+import glob
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
+import sys
 import tempfile
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping
-
-import requests
+from collections.abc import Callable, Mapping, Sequence
+from importlib import metadata as importlib_metadata
 
+from devsynth.application.documentation.http_client import (
+    CachedHTTPClient,
+    get_default_http_client,
+)
 from devsynth.application.documentation.models import (
     DocumentationChunk,
     DownloadManifest,
@@ -28,6 +34,108 @@ from devsynth.logging_setup import DevSynthLogger
 # Create a logger for this module
 logger = DevSynthLogger(__name__)
 
+Prober = Callable[[Sequence[str]], "DownloadManifest | None"]
+"""Callable returning the first successful download among candidate URLs."""
+
+
+def distribution_digest(
+    library: str, version: str | None = None, *, path: Sequence[str] | None = None
+) -> str | None:
+    """Hash the files of an installed distribution.
+
+    The digest covers the ``RECORD`` entries outside ``.dist-info`` so that two
+    releases shipping identical files share the same digest.
+
+    Args:
+        library: Distribution name.
+        version: Required version; other installed versions yield ``None``.
+        path: Directories to search instead of :data:`sys.path`.
+
+    Returns:
+        A hex digest, or ``None`` when the distribution is not installed or has
+        no ``RECORD``.
+    """
+    try:
+        if path is None:
+            dist = importlib_metadata.distribution(library)
+        else:
+            dist = next(
+                iter(importlib_metadata.distributions(name=library, path=list(path))),
+                None,
+            )
+    except importlib_metadata.PackageNotFoundError:
+        return None
+    if dist is None or (version is not None and dist.version != version):
+        return None
+    record = dist.read_text("RECORD")
+    if not record:
+        return None
+    entries = sorted(
+        line
+        for line in record.splitlines()
+        if line and ".dist-info/" not in line and "__pycache__" not in line
+    )
+    if not entries:
+        return None
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+class DocstringCache:
+    """Docstring extraction results keyed by distribution digest.
+
+    An index maps ``library==version`` to the digest seen when that version
+    was installed, so later lookups can skip building a virtualenv.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, "index.json")
+
+    def get(self, digest: str) -> Mapping[str, object] | None:
+        """Return cached docstrings for ``digest``."""
+        try:
+            with open(self._entry_path(digest), encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, Mapping) else None
+
+    def put(self, digest: str, docstrings: Mapping[str, object]) -> None:
+        """Store extracted docstrings for ``digest``."""
+        self._write(self._entry_path(digest), docstrings)
+
+    def lookup(self, library: str, version: str) -> str | None:
+        """Return the digest recorded for ``library`` at ``version``."""
+        digest = self._read_index().get(f"{library}=={version}")
+        return digest if isinstance(digest, str) else None
+
+    def remember(self, library: str, version: str, digest: str) -> None:
+        """Record the digest observed for ``library`` at ``version``."""
+        index = self._read_index()
+        index[f"{library}=={version}"] = digest
+        self._write(self._index_path, index)
+
+    def _entry_path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _read_index(self) -> dict[str, object]:
+        try:
+            with open(self._index_path, encoding="utf-8") as handle:
+                index = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write(self, path: str, payload: Mapping[str, object]) -> None:
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError as exc:  # pragma: no cover - caching is best effort
+            logger.debug("Failed to write docstring cache %s: %s", path, exc)
+
 
 class DocumentationSource(ABC):
     """Abstract base class for documentation sources."""
@@ -85,11 +193,26 @@ class DocumentationSource(ABC):
 class PyPIDocumentationSource(DocumentationSource):
     """Fetches documentation from PyPI and ReadTheDocs."""
 
-    def __init__(self, downloader: Callable[[str], DownloadManifest]) -> None:
-        """Initialize the PyPI documentation source."""
+    def __init__(
+        self,
+        downloader: Callable[[str], DownloadManifest],
+        *,
+        prober: Prober | None = None,
+    ) -> None:
+        """Initialize the PyPI documentation source.
+
+        Args:
+            downloader: Fetches a single URL.
+            prober: Fetches the first successful URL among candidates; defaults
+                to trying ``downloader`` on each candidate in turn.
+        """
         super().__init__(downloader)
+        self._prober = prober or self._probe_serially
         self.cache_dir = os.path.join(tempfile.gettempdir(), "devsynth_docs_cache")
         os.makedirs(self.cache_dir, exist_ok=True)
+        self.docstring_cache = DocstringCache(
+            os.path.join(self.cache_dir, "docstrings")
+        )
 
     def fetch_documentation(
         self, library: str, version: str, offline: bool = False
@@ -155,19 +278,21 @@ class PyPIDocumentationSource(DocumentationSource):
             f"https://readthedocs.org/projects/{library}/versions/{version}/",
         ]
 
+        manifest = self._prober(urls)
+        if manifest is None:
+            return []
+        return self._parse_html_documentation(
+            manifest.content, manifest.url, library, version
+        )
+
+    def _probe_serially(self, urls: Sequence[str]) -> DownloadManifest | None:
         for url in urls:
             manifest = self._downloader(url)
             if manifest:
-                return self._parse_html_documentation(
-                    manifest.content, url, library, version
-                )
+                return manifest
             if manifest.error:
-                logger.debug(
-                    "Error fetching from ReadTheDocs URL %s: %s",
-                    url,
-                    manifest.error,
-                )
-        return []
+                logger.debug("Error fetching %s: %s", url, manifest.error)
+        return None
 
     def _fetch_from_pypi(self, library: str, version: str) -> list[DocumentationChunk]:
         """Fetch documentation from PyPI."""
@@ -215,14 +340,45 @@ class PyPIDocumentationSource(DocumentationSource):
     def _extract_docstrings(
         self, library: str, version: str
     ) -> list[DocumentationChunk]:
-        """Extract docstrings from a Python package."""
+        """Extract docstrings from a Python package.
+
+        Results are cached by :func:`distribution_digest`, so an unchanged
+        distribution is never imported twice, whichever version it was
+        requested as.  A matching local installation is used directly instead
+        of a throwaway virtualenv.
+        """
         logger.info("Attempting to extract docstrings from %s %s", library, version)
 
-        venv_dir = os.path.join(self.cache_dir, f"{library}_{version}_venv")
-        script_path = os.path.join(
-            self.cache_dir, f"extract_docstrings_{library}_{version}.py"
-        )
+        digest = distribution_digest(library, version)
+        if digest is not None:
+            docstrings = self.docstring_cache.get(digest)
+            if docstrings is None:
+                location = importlib_metadata.distribution(library).locate_file("")
+                try:
+                    docstrings = self._run_extraction_script(
+                        sys.executable, library, version, extra_path=str(location)
+                    )
+                except OSError as exc:  # pragma: no cover - defensive logging
+                    logger.error(
+                        "Error extracting docstrings for %s %s: %s",
+                        library,
+                        version,
+                        exc,
+                    )
+                    return []
+                if docstrings is None:
+                    return []
+                self.docstring_cache.put(digest, docstrings)
+            self.docstring_cache.remember(library, version, digest)
+            return self._convert_docstrings_to_chunks(docstrings, library, version)
+
+        known = self.docstring_cache.lookup(library, version)
+        if known is not None:
+            docstrings = self.docstring_cache.get(known)
+            if docstrings is not None:
+                return self._convert_docstrings_to_chunks(docstrings, library, version)
 
+        venv_dir = os.path.join(self.cache_dir, f"{library}_{version}_venv")
         if os.path.exists(venv_dir):
             shutil.rmtree(venv_dir)
 
@@ -242,25 +398,20 @@ class PyPIDocumentationSource(DocumentationSource):
                 else os.path.join(venv_dir, "Scripts", "python.exe")
             )
 
-            with open(script_path, "w", encoding="utf-8") as script_file:
-                script_file.write(self._get_docstring_extraction_script(library))
-
-            result = subprocess.run(
-                [python_path, script_path], capture_output=True, text=True, check=False
-            )
-
-            if result.returncode == 0 and result.stdout:
-                try:
-                    docstrings = json.loads(result.stdout)
-                    return self._convert_docstrings_to_chunks(
-                        docstrings, library, version
-                    )
-                except json.JSONDecodeError:
-                    logger.error(
-                        "Error parsing docstring output for %s %s", library, version
-                    )
-
-            return []
+            site_packages = glob.glob(
+                os.path.join(venv_dir, "lib", "python*", "site-packages")
+            ) + glob.glob(os.path.join(venv_dir, "Lib", "site-packages"))
+            digest = distribution_digest(library, version, path=site_packages)
+            docstrings = self.docstring_cache.get(digest) if digest else None
+            if docstrings is None:
+                docstrings = self._run_extraction_script(python_path, library, version)
+                if docstrings is None:
+                    return []
+                if digest:
+                    self.docstring_cache.put(digest, docstrings)
+            if digest:
+                self.docstring_cache.remember(library, version, digest)
+            return self._convert_docstrings_to_chunks(docstrings, library, version)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error(
                 "Error extracting docstrings for %s %s: %s", library, version, exc
@@ -269,9 +420,52 @@ class PyPIDocumentationSource(DocumentationSource):
         finally:
             if os.path.exists(venv_dir):
                 shutil.rmtree(venv_dir)
+
+    def _run_extraction_script(
+        self,
+        python_path: str,
+        library: str,
+        version: str,
+        *,
+        extra_path: str | None = None,
+    ) -> Mapping[str, object] | None:
+        """Run the extraction script with ``python_path`` and parse its output."""
+        script_path = os.path.join(
+            self.cache_dir, f"extract_docstrings_{library}_{version}.py"
+        )
+        env = None
+        if extra_path:
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(
+                filter(None, [extra_path, env.get("PYTHONPATH")])
+            )
+        try:
+            with open(script_path, "w", encoding="utf-8") as script_file:
+                script_file.write(self._get_docstring_extraction_script(library))
+
+            result = subprocess.run(
+                [python_path, script_path],
+                capture_output=True,
+                text=True,
+                check=False,
+                env=env,
+            )
+        finally:
             if os.path.exists(script_path):
                 os.remove(script_path)
 
+        if result.returncode == 0 and result.stdout:
+            try:
+                docstrings = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                logger.error(
+                    "Error parsing docstring output for %s %s", library, version
+                )
+                return None
+            if isinstance(docstrings, Mapping):
+                return docstrings
+        return None
+
     def _parse_html_documentation(
         self, html: str, base_url: str, library: str, version: str
     ) -> list[DocumentationChunk]:
@@ -569,13 +763,19 @@ class DocumentationFetcher:
     documentation sites, package repositories, and GitHub.
     """
 
-    def __init__(self) -> None:
-        """Initialize the documentation fetcher."""
+    def __init__(self, http_client: CachedHTTPClient | None = None) -> None:
+        """Initialize the documentation fetcher.
+
+        Args:
+            http_client: Client used for every request; defaults to the shared
+                pooled client from :func:`get_default_http_client`.
+        """
         self.cache_dir = os.path.join(tempfile.gettempdir(), "devsynth_docs_cache")
         os.makedirs(self.cache_dir, exist_ok=True)
+        self.http_client = http_client or get_default_http_client()
 
         self.sources: list[DocumentationSource] = [
-            PyPIDocumentationSource(self._download)
+            PyPIDocumentationSource(self._download, prober=self._probe)
         ]
 
         logger.info("Documentation fetcher initialized")
@@ -659,26 +859,8 @@ class DocumentationFetcher:
 
     def _download(self, url: str, *, timeout: float = 10) -> DownloadManifest:
         """Download a URL and return a :class:`DownloadManifest`."""
-        try:
-            response = requests.get(url, timeout=timeout)
-        except requests.RequestException as exc:
-            logger.debug("Network error when fetching %s: %s", url, exc)
-            return DownloadManifest(url=url, success=False, error=str(exc))
-
-        if response.status_code != 200:
-            logger.debug(
-                "Unexpected status %s when fetching %s", response.status_code, url
-            )
-            return DownloadManifest(
-                url=url,
-                success=False,
-                status_code=response.status_code,
-                error=f"status_code={response.status_code}",
-            )
+        return self.http_client.get(url, timeout=timeout)
 
-        return DownloadManifest(
-            url=url,
-            success=True,
-            status_code=response.status_code,
-            content=response.text,
-        )
+    def _probe(self, urls: Sequence[str]) -> DownloadManifest | None:
+        """Return the first successful download among candidate ``urls``."""
+        return self.http_client.get_first(urls)
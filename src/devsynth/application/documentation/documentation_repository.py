@@ -5,9 +5,11 @@ This module defines the DocumentationRepository class for storing and retrieving
 documentation in a version-aware manner, integrating with the memory system.
 """
 
+import hashlib
 import json
 import os
 import re
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from typing import Any
 
@@ -19,6 +21,14 @@ from devsynth.logging_setup import DevSynthLogger
 # Create a logger for this module
 logger = DevSynthLogger(__name__)
 
+# Simple regex-based extraction of definitions; could be enhanced
+_DEFINITION_PATTERNS = (
+    ("class", re.compile(r"class\s+(\w+)")),
+    ("function", re.compile(r"def\s+(\w+)")),
+)
+
+Triple = tuple[str, str, str]
+
 
 class DocumentationRepository:
     """
@@ -27,9 +37,21 @@ class DocumentationRepository:
     This class integrates with the memory system to store documentation chunks
     in vector memory, metadata in structured memory, and relationships in the
     knowledge graph.
+
+    Chunks are written in batches of ``batch_size``. After each batch the
+    number of stored chunks is checkpointed, so an interrupted ingest of the
+    same chunks resumes after the last completed batch.
     """
 
-    def __init__(self, memory_manager: MemoryManager, storage_path: str | None = None):
+    #: Number of chunks written per batch by :meth:`store_documentation`.
+    batch_size = 256
+
+    def __init__(
+        self,
+        memory_manager: MemoryManager,
+        storage_path: str | None = None,
+        batch_size: int | None = None,
+    ):
         """
         Initialize the documentation repository.
 
@@ -37,12 +59,17 @@ class DocumentationRepository:
             memory_manager: The memory manager to use for storage
             storage_path: Path for documentation metadata
                 (default: .devsynth/documentation)
+            batch_size: Chunks written per batch (default: ``batch_size``)
         """
         self.memory_manager: Any = memory_manager
         self.storage_path = storage_path or os.path.join(
             os.getcwd(), ".devsynth", "documentation"
         )
         self.metadata: dict[str, dict[str, Any]] = {}
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError("batch_size must be positive")
+            self.batch_size = batch_size
 
         # Create the storage directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
@@ -56,11 +83,16 @@ class DocumentationRepository:
         )
 
     def store_documentation(
-        self, library: str, version: str, chunks: list[DocumentationChunk]
+        self, library: str, version: str, chunks: Sequence[DocumentationChunk]
     ) -> str:
         """
         Store documentation for a library version.
 
+        Chunks are stored in batches through the memory manager's batch API,
+        together with their knowledge graph relationships. Progress is
+        checkpointed after every batch; calling this again with the same
+        chunks after an interruption skips the batches already stored.
+
         Args:
             library: The name of the library
             version: The version of the library
@@ -70,55 +102,82 @@ class DocumentationRepository:
             A unique ID for this documentation set
         """
         doc_id = f"{library}-{version}"
+        total = len(chunks)
+        fingerprint = self._fingerprint(chunks)
+        start = self._load_progress(doc_id, fingerprint, total)
+        if start:
+            logger.info(
+                "Resuming documentation ingest for %s %s at chunk %d of %d",
+                library,
+                version,
+                start,
+                total,
+            )
+
+        store_graph = hasattr(self.memory_manager, "add_graph_triple")
+        added_triples: set[Triple] = set()
+        for batch_start in range(start, total, self.batch_size):
+            batch = chunks[batch_start : batch_start + self.batch_size]
+            self._store_items(
+                [
+                    self._chunk_item(doc_id, library, version, index, chunk)
+                    for index, chunk in enumerate(batch, batch_start)
+                ]
+            )
+            if store_graph:
+                triples: list[Triple] = []
+                for chunk in batch:
+                    for triple in self._relationship_triples(library, version, chunk):
+                        if triple not in added_triples:
+                            added_triples.add(triple)
+                            triples.append(triple)
+                self._add_graph_triples(triples)
+            self._save_progress(doc_id, fingerprint, batch_start + len(batch), total)
 
-        # Store metadata
         self.metadata[doc_id] = {
             "library": library,
             "version": version,
-            "chunk_count": len(chunks),
+            "chunk_count": total,
             "stored_at": datetime.now().isoformat(),
             "status": "active",
+            "chunk_ids": [f"{doc_id}-chunk-{i}" for i in range(total)],
         }
-
-        # Store each chunk in memory
-        chunk_ids = []
-        for i, chunk in enumerate(chunks):
-            chunk_metadata = dict(chunk.metadata)
-            # Create a memory item for the chunk
-            memory_item = MemoryItem(
-                id=f"{doc_id}-chunk-{i}",
-                content=chunk.content,
-                metadata={
-                    "library": library,
-                    "version": version,
-                    "title": chunk.title,
-                    "source_url": chunk_metadata.get("source_url", ""),
-                    "section": chunk_metadata.get("section", ""),
-                    "type": "documentation",
-                    "chunk_index": i,
-                },
-                # Using KNOWLEDGE_GRAPH since DOCUMENTATION is not in MemoryType
-                memory_type=MemoryType.KNOWLEDGE_GRAPH,
-            )
-
-            # Store in vector memory for semantic search
-            self.memory_manager.store_item(memory_item)
-
-            # Store relationships in knowledge graph if available
-            if hasattr(self.memory_manager, "add_graph_triple"):
-                self._store_relationships(library, version, chunk)
-
-            chunk_ids.append(memory_item.id)
-
-        # Update metadata with chunk IDs
-        self.metadata[doc_id]["chunk_ids"] = chunk_ids
         self._save_metadata()
+        self._clear_progress(doc_id)
 
-        logger.info(
-            f"Stored {len(chunks)} documentation chunks for {library} {version}"
-        )
+        logger.info(f"Stored {total} documentation chunks for {library} {version}")
         return doc_id
 
+    @staticmethod
+    def _chunk_item(
+        doc_id: str, library: str, version: str, index: int, chunk: DocumentationChunk
+    ) -> MemoryItem:
+        """Create the memory item stored for one documentation chunk."""
+        chunk_metadata = chunk.metadata
+        return MemoryItem(
+            id=f"{doc_id}-chunk-{index}",
+            content=chunk.content,
+            metadata={
+                "library": library,
+                "version": version,
+                "title": chunk.title,
+                "source_url": chunk_metadata.get("source_url", ""),
+                "section": chunk_metadata.get("section", ""),
+                "type": "documentation",
+                "chunk_index": index,
+            },
+            # Using KNOWLEDGE_GRAPH since DOCUMENTATION is not in MemoryType
+            memory_type=MemoryType.KNOWLEDGE_GRAPH,
+        )
+
+    def _store_items(self, items: list[MemoryItem]) -> None:
+        """Store a batch of chunk items, embedding them for semantic search."""
+        if hasattr(self.memory_manager, "store_items"):
+            self.memory_manager.store_items(items, embed=True)
+            return
+        for item in items:
+            self.memory_manager.store_item(item)
+
     def get_documentation(
         self, library: str, version: str, *, function: str | None = None
     ) -> dict[str, Any] | None:
@@ -299,57 +358,33 @@ class DocumentationRepository:
         self, library: str, version: str, chunk: DocumentationChunk
     ) -> None:
         """Store relationships in the knowledge graph."""
-        # Extract entities and relationships from the chunk
-        content = chunk.content
-        metadata = dict(chunk.metadata)
-
-        # Add library-version relationship
-        self.memory_manager.add_graph_triple(
-            subject=f"library:{library}",
-            predicate="hasVersion",
-            object=f"version:{library}:{version}",
-        )
-
-        # Add document-library relationship
-        doc_id = f"doc:{library}:{version}:{metadata.get('section', 'unknown')}"
-        self.memory_manager.add_graph_triple(
-            subject=doc_id, predicate="describesLibrary", object=f"library:{library}"
-        )
-
-        self.memory_manager.add_graph_triple(
-            subject=doc_id,
-            predicate="describesVersion",
-            object=f"version:{library}:{version}",
-        )
-
-        # Extract and add function/class relationships if possible
-        # This is a simple regex-based extraction and could be enhanced
-        class_matches = re.findall(r"class\s+(\w+)", content)
-        for class_name in class_matches:
-            self.memory_manager.add_graph_triple(
-                subject=f"class:{library}:{class_name}",
-                predicate="definedIn",
-                object=f"library:{library}",
-            )
-
-            self.memory_manager.add_graph_triple(
-                subject=f"class:{library}:{class_name}",
-                predicate="availableInVersion",
-                object=f"version:{library}:{version}",
-            )
-
-        function_matches = re.findall(r"def\s+(\w+)", content)
-        for function_name in function_matches:
-            self.memory_manager.add_graph_triple(
-                subject=f"function:{library}:{function_name}",
-                predicate="definedIn",
-                object=f"library:{library}",
-            )
-
+        self._add_graph_triples(self._relationship_triples(library, version, chunk))
+
+    @staticmethod
+    def _relationship_triples(
+        library: str, version: str, chunk: DocumentationChunk
+    ) -> list[Triple]:
+        """Extract knowledge graph triples describing ``chunk``."""
+        library_node = f"library:{library}"
+        version_node = f"version:{library}:{version}"
+        doc_id = f"doc:{library}:{version}:{chunk.metadata.get('section', 'unknown')}"
+        triples: list[Triple] = [
+            (library_node, "hasVersion", version_node),
+            (doc_id, "describesLibrary", library_node),
+            (doc_id, "describesVersion", version_node),
+        ]
+        for kind, pattern in _DEFINITION_PATTERNS:
+            for name in pattern.findall(chunk.content):
+                node = f"{kind}:{library}:{name}"
+                triples.append((node, "definedIn", library_node))
+                triples.append((node, "availableInVersion", version_node))
+        return triples
+
+    def _add_graph_triples(self, triples: Iterable[Triple]) -> None:
+        """Add ``triples`` to the memory manager's graph."""
+        for subject, predicate, obj in triples:
             self.memory_manager.add_graph_triple(
-                subject=f"function:{library}:{function_name}",
-                predicate="availableInVersion",
-                object=f"version:{library}:{version}",
+                subject=subject, predicate=predicate, object=obj
             )
 
     def _version_satisfies_constraint(self, version: str, constraint: str) -> bool:
@@ -420,8 +455,64 @@ class DocumentationRepository:
         """Save documentation metadata to the storage path."""
         metadata_file = os.path.join(self.storage_path, "metadata.json")
         try:
-            with open(metadata_file, "w") as f:
-                json.dump(self.metadata, f, indent=2)
+            self._write_json(metadata_file, self.metadata)
             logger.debug("Saved documentation metadata")
         except Exception as e:
             logger.error(f"Error saving documentation metadata: {str(e)}")
+
+    @staticmethod
+    def _write_json(path: str, data: Any) -> None:
+        """Atomically replace ``path`` with compact JSON for ``data``."""
+        staging = f"{path}.tmp"
+        with open(staging, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(staging, path)
+
+    @staticmethod
+    def _fingerprint(chunks: Sequence[DocumentationChunk]) -> str:
+        """Identify a chunk sequence so progress is only reused for it."""
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            for part in (
+                chunk.title,
+                chunk.content,
+                str(chunk.metadata.get("source_url", "")),
+                str(chunk.metadata.get("section", "")),
+            ):
+                digest.update(part.encode("utf-8", "surrogatepass"))
+                digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _progress_path(self, doc_id: str) -> str:
+        safe_id = re.sub(r"[^\w.-]", "_", doc_id)
+        return os.path.join(self.storage_path, f"ingest-{safe_id}.json")
+
+    def _load_progress(self, doc_id: str, fingerprint: str, total: int) -> int:
+        """Return how many chunks of this ingest were already stored."""
+        path = self._progress_path(doc_id)
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path) as f:
+                progress = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ingest progress {path}: {e}")
+            return 0
+        if progress.get("fingerprint") != fingerprint:
+            return 0
+        completed = progress.get("completed", 0)
+        return completed if isinstance(completed, int) and completed <= total else 0
+
+    def _save_progress(
+        self, doc_id: str, fingerprint: str, completed: int, total: int
+    ) -> None:
+        """Checkpoint that the first ``completed`` chunks are stored."""
+        self._write_json(
+            self._progress_path(doc_id),
+            {"fingerprint": fingerprint, "completed": completed, "total": total},
+        )
+
+    def _clear_progress(self, doc_id: str) -> None:
+        path = self._progress_path(doc_id)
+        if os.path.exists(path):
+            os.remove(path)
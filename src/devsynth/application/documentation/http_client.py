@@ -0,0 +1,238 @@
+"""Pooled, cached HTTP access for documentation fetching.
+
+The documentation fetcher and version monitor issue many small requests
+against a handful of hosts (PyPI, ReadTheDocs, project sites).  This module
+keeps one pooled :class:`requests.Session` for all of them, revalidates
+responses with ``ETag``/``Last-Modified`` against an on-disk cache and probes
+alternative URLs concurrently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from devsynth.application.documentation.models import DownloadManifest
+from devsynth.logging_setup import DevSynthLogger
+
+logger = DevSynthLogger(__name__)
+
+__all__ = ["CachedHTTPClient", "HTTPCache", "get_default_http_client"]
+
+
+class HTTPCache:
+    """On-disk store of validated responses keyed by URL.
+
+    Only responses carrying an ``ETag`` or ``Last-Modified`` header are kept,
+    because nothing else can be revalidated cheaply.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Return the cached entry for ``url`` or ``None``."""
+        try:
+            with open(self._path(url), encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        return entry
+
+    def put(
+        self, url: str, content: str, *, etag: str | None, last_modified: str | None
+    ) -> None:
+        """Store ``content`` together with its validators."""
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content": content,
+        }
+        path = self._path(url)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError as exc:  # pragma: no cover - caching is best effort
+            logger.debug("Failed to cache response for %s: %s", url, exc)
+
+    @staticmethod
+    def conditional_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+        """Build revalidation headers for a cached entry."""
+        headers: dict[str, str] = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+
+class CachedHTTPClient:
+    """HTTP client with a shared connection pool and conditional caching.
+
+    Args:
+        cache_dir: Directory for revalidatable responses. ``None`` disables the
+            on-disk cache.
+        session: Session to use instead of a freshly pooled one.
+        pool_size: Connections kept per host.
+        max_workers: Threads used when probing candidate URLs.
+        timeout: Default request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        *,
+        session: requests.Session | None = None,
+        pool_size: int = 16,
+        max_workers: int = 8,
+        timeout: float = 10.0,
+    ) -> None:
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.cache = HTTPCache(cache_dir) if cache_dir else None
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def get(self, url: str, *, timeout: float | None = None) -> DownloadManifest:
+        """Fetch ``url``, revalidating any cached copy.
+
+        A ``304 Not Modified`` answer yields a successful manifest holding the
+        cached body.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        try:
+            response = self.session.get(
+                url,
+                timeout=self.timeout if timeout is None else timeout,
+                headers=HTTPCache.conditional_headers(entry),
+            )
+        except requests.RequestException as exc:
+            logger.debug("Network error when fetching %s: %s", url, exc)
+            return DownloadManifest(url=url, success=False, error=str(exc))
+
+        if response.status_code == 304 and entry is not None:
+            return DownloadManifest(
+                url=url, success=True, status_code=304, content=entry["content"]
+            )
+
+        if response.status_code != 200:
+            logger.debug(
+                "Unexpected status %s when fetching %s", response.status_code, url
+            )
+            return DownloadManifest(
+                url=url,
+                success=False,
+                status_code=response.status_code,
+                error=f"status_code={response.status_code}",
+            )
+
+        content = response.text
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is not None and (etag or last_modified):
+            self.cache.put(url, content, etag=etag, last_modified=last_modified)
+        return DownloadManifest(
+            url=url, success=True, status_code=response.status_code, content=content
+        )
+
+    def get_first(
+        self, urls: Sequence[str], *, timeout: float | None = None
+    ) -> DownloadManifest | None:
+        """Probe ``urls`` concurrently and return the preferred success.
+
+        Candidates keep their priority: a later URL only wins once every
+        earlier one has failed.  Outstanding requests are cancelled as soon as
+        the winner is known.  Returns ``None`` when every candidate fails.
+        """
+        if not urls:
+            return None
+        if len(urls) == 1:
+            manifest = self.get(urls[0], timeout=timeout)
+            return manifest if manifest else None
+
+        executor = self._get_executor()
+        futures: list[Future[DownloadManifest]] = [
+            executor.submit(self.get, url, timeout=timeout) for url in urls
+        ]
+        pending = set(futures)
+        try:
+            while pending:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in futures:
+                    if not future.done():
+                        break
+                    manifest = future.result()
+                    if manifest:
+                        return manifest
+                    if manifest.error:
+                        logger.debug(
+                            "Candidate %s failed: %s", manifest.url, manifest.error
+                        )
+            return None
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        """Release pooled connections and probe threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="devsynth-docs-http",
+                )
+            return self._executor
+
+
+_default_client: CachedHTTPClient | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_http_client() -> CachedHTTPClient:
+    """Return the process-wide client shared by documentation components.
+
+    The cache lives under ``DEVSYNTH_DOCS_HTTP_CACHE`` when set, otherwise in
+    the temporary documentation cache directory.
+    """
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            cache_dir = os.environ.get("DEVSYNTH_DOCS_HTTP_CACHE") or os.path.join(
+                tempfile.gettempdir(), "devsynth_docs_cache", "http"
+            )
+            _default_client = CachedHTTPClient(cache_dir)
+        return _default_client
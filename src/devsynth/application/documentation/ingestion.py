@@ -8,7 +8,9 @@ import hashlib
 import json
 import os
 import re
+import threading
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import cast
@@ -35,22 +37,120 @@ class DocumentationIngestionError(DevSynthError):
     pass
 
 
+class IngestionManifest:
+    """Record of the files already ingested into memory.
+
+    Each entry maps a resolved file path to the digest of its raw bytes, the
+    ``stat`` values it was read with and the ID it was stored under, so a
+    directory can be re-ingested without reading unchanged files.
+    """
+
+    version = 1
+
+    def __init__(self, path: str | Path | None = None):
+        self.path: Path | None = None
+        self.entries: dict[str, dict[str, object]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self.bind(path)
+
+    def bind(self, path: str | Path) -> None:
+        """Persist to ``path`` from now on, merging the entries stored there."""
+        self.path = Path(path)
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != self.version:
+                return
+            stored = dict(data.get("files", {}))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable ingestion manifest: {e}")
+            return
+        with self._lock:
+            self.entries = {**stored, **self.entries}
+
+    def get(self, key: str) -> dict[str, object] | None:
+        with self._lock:
+            return self.entries.get(key)
+
+    def put(self, key: str, entry: dict[str, object]) -> None:
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty = True
+
+    def pop(self, key: str) -> dict[str, object] | None:
+        with self._lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self._dirty = True
+            return entry
+
+    def keys_in(self, directory: str) -> list[str]:
+        """Return the entries recorded for ``directory``."""
+        with self._lock:
+            return [
+                key
+                for key, entry in self.entries.items()
+                if entry.get("directory") == directory
+            ]
+
+    def save(self) -> None:
+        """Write the manifest atomically if it changed."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            payload = {"version": self.version, "files": self.entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.tmp")
+            temp_path.write_text(
+                json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+            )
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+
 class DocumentationIngestionManager:
     """
     Manager for ingesting and processing documentation from various sources.
 
     This class provides methods for ingesting documentation from files, directories,
     URLs, and other sources, processing it, and storing it in the memory system.
+
+    Directory ingestion is incremental when a memory manager is configured:
+    files whose content has not changed since they were stored are skipped,
+    and entries of files removed from the directory are pruned from memory.
     """
 
-    def __init__(self, memory_manager: MemoryManager | None = None):
+    def __init__(
+        self,
+        memory_manager: MemoryManager | None = None,
+        *,
+        manifest_path: str | Path | None = None,
+        max_workers: int | None = None,
+        batch_size: int = 64,
+    ):
         """
         Initialize the Documentation Ingestion Manager.
 
         Args:
             memory_manager: Optional memory manager to use for storing documentation
+            manifest_path: Optional file persisting the ingestion manifest, so
+                unchanged files are also skipped across processes
+            max_workers: Threads used to read and process files; defaults to
+                ``DEVSYNTH_DOCS_INGEST_WORKERS`` or a CPU-based value
+            batch_size: Number of documents stored per memory write
         """
         self.memory_manager: MemoryManager | None = memory_manager
+        self.manifest = IngestionManifest(manifest_path)
+        self.max_workers = max(
+            1,
+            max_workers
+            or int(os.environ.get("DEVSYNTH_DOCS_INGEST_WORKERS", "0"))
+            or min(8, (os.cpu_count() or 1) + 4),
+        )
+        self.batch_size = max(1, batch_size)
         self.supported_file_types: dict[str, Callable[[str], str]] = {
             ".md": self._process_markdown,
             ".txt": self._process_text,
@@ -80,44 +180,7 @@ class DocumentationIngestionManager:
             DocumentationIngestionError: If the file cannot be read or processed
         """
         try:
-            file_path = Path(file_path)
-
-            # Check if the file exists
-            if not file_path.exists():
-                raise DocumentationIngestionError(f"File not found: {file_path}")
-
-            # Check if the file type is supported
-            file_ext = file_path.suffix.lower()
-            if file_ext not in self.supported_file_types:
-                raise DocumentationIngestionError(f"Unsupported file type: {file_ext}")
-
-            # Read the file content
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Process the file based on its type
-            processor = self.supported_file_types[file_ext]
-            processed_content = processor(content)
-
-            # Create metadata if not provided
-            metadata = dict(metadata) if metadata else {}
-
-            # Add file metadata
-            metadata.update(
-                {
-                    "source": str(file_path),
-                    "file_type": file_ext,
-                    "file_name": file_path.name,
-                    "ingestion_time": datetime.now().isoformat(),
-                    "file_size": os.path.getsize(file_path),
-                }
-            )
-
-            # Create the documentation item
-            manifest = DocumentationManifest(
-                content=processed_content,
-                metadata=metadata,
-            )
+            manifest, _, _ = self._read_file(Path(file_path), metadata)
 
             if self.memory_manager:
                 doc_id = self._store_in_memory(manifest)
@@ -131,25 +194,95 @@ class DocumentationIngestionManager:
                 f"Failed to ingest documentation from file: {e}"
             )
 
+    def _read_file(
+        self,
+        file_path: Path,
+        metadata: Metadata | None,
+        known_digest: str | None = None,
+    ) -> tuple[DocumentationManifest | None, str, os.stat_result]:
+        """Read, hash and process one file.
+
+        Returns:
+            The processed manifest, the SHA-256 digest of the raw file and its
+            ``stat`` result. The manifest is ``None`` when the digest equals
+            ``known_digest``, in which case the file is not processed.
+
+        Raises:
+            DocumentationIngestionError: If the file is missing or unsupported
+        """
+        # Check if the file exists
+        if not file_path.exists():
+            raise DocumentationIngestionError(f"File not found: {file_path}")
+
+        # Check if the file type is supported
+        file_ext = file_path.suffix.lower()
+        if file_ext not in self.supported_file_types:
+            raise DocumentationIngestionError(f"Unsupported file type: {file_ext}")
+
+        # Read the file content
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if known_digest is not None and digest == known_digest:
+            return None, digest, stat
+        # Match the newline translation of text-mode reads
+        content = raw.decode("utf-8").replace("\r\n", "\n")
+
+        # Process the file based on its type
+        processor = self.supported_file_types[file_ext]
+        processed_content = processor(content)
+
+        # Create metadata if not provided
+        metadata = dict(metadata) if metadata else {}
+
+        # Add file metadata
+        metadata.update(
+            {
+                "source": str(file_path),
+                "file_type": file_ext,
+                "file_name": file_path.name,
+                "ingestion_time": datetime.now().isoformat(),
+                "file_size": stat.st_size,
+            }
+        )
+
+        # Create the documentation item
+        manifest = DocumentationManifest(
+            content=processed_content,
+            metadata=metadata,
+        )
+        return manifest, digest, stat
+
     def ingest_directory(
         self,
         dir_path: str | Path,
         recursive: bool = True,
         file_types: Iterable[str] | None = None,
         metadata: Metadata | None = None,
+        incremental: bool = True,
     ) -> Sequence[DocumentationManifest]:
         """
         Ingest documentation from all supported files in a directory.
 
+        Files are read and processed on a worker pool and stored in batches.
+        With a memory manager and ``incremental`` enabled, files unchanged
+        since their last ingestion are skipped as long as their document is
+        still in memory, and documents of files that no longer exist are
+        deleted from memory. Files that fail to read or store are logged and
+        left out of the manifest, so the next call retries them.
+
         Args:
             dir_path: The path to the directory to ingest
             recursive: Whether to recursively ingest files in subdirectories
             file_types: Optional iterable of file extensions to ingest
                 (e.g., [".md", ".txt"])
             metadata: Optional metadata to associate with all documentation
+            incremental: Skip files recorded as unchanged in the manifest
 
         Returns:
-            A sequence of dictionaries containing the ingested documentation
+            A sequence of manifests for the files ingested by this call;
+            skipped files are not included
 
         Raises:
             DocumentationIngestionError: If the directory cannot be read
@@ -167,35 +300,79 @@ class DocumentationIngestionManager:
             if file_types is not None:
                 supported_types = supported_types.intersection(set(file_types))
 
-            # Find all supported files in the directory
-            files = []
-            if recursive:
-                for root, _, filenames in os.walk(dir_path):
-                    for filename in filenames:
-                        file_path = Path(root) / filename
-                        if file_path.suffix.lower() in supported_types:
-                            files.append(file_path)
-            else:
-                for file_path in dir_path.iterdir():
-                    if (
-                        file_path.is_file()
-                        and file_path.suffix.lower() in supported_types
-                    ):
-                        files.append(file_path)
+            files = self._find_files(dir_path, recursive, supported_types)
 
-            # Ingest each file
-            results: list[DocumentationManifest] = []
-            for file_path in files:
-                try:
-                    # Create file-specific metadata
-                    file_metadata = dict(metadata) if metadata else {}
-                    file_metadata["directory"] = str(dir_path)
+            # Create file-specific metadata
+            file_metadata = dict(metadata) if metadata else {}
+            file_metadata["directory"] = str(dir_path)
+            metadata_digest = hashlib.sha256(
+                json.dumps(file_metadata, sort_keys=True, default=str).encode()
+            ).hexdigest()
 
-                    # Ingest the file
-                    doc_item = self.ingest_file(file_path, file_metadata)
-                    results.append(doc_item)
-                except Exception as e:
-                    logger.warning(f"Failed to ingest file {file_path}: {e}")
+            track = incremental and self.memory_manager is not None
+            directory_key = str(dir_path.resolve())
+
+            # (path, manifest key, previous entry, digest known to be current)
+            pending: list[tuple[Path, str, dict[str, object] | None, str | None]] = []
+            for file_path in files:
+                key = str(file_path.resolve())
+                entry = self.manifest.get(key) if track else None
+                if entry is not None and not self._stored_in_memory(
+                    entry.get("doc_id")
+                ):
+                    # The store lost the document, e.g. it was wiped or replaced
+                    entry = None
+                known_digest = None
+                if entry is not None and entry.get("metadata") == metadata_digest:
+                    try:
+                        stat = file_path.stat()
+                    except OSError:
+                        stat = None
+                    if (
+                        stat is not None
+                        and entry.get("size") == stat.st_size
+                        and entry.get("mtime_ns") == stat.st_mtime_ns
+                    ):
+                        continue
+                    known_digest = cast(str, entry.get("sha256"))
+                pending.append((file_path, key, entry, known_digest))
+
+            prepared: list[tuple[str, dict[str, object], DocumentationManifest]] = []
+            workers = min(self.max_workers, len(pending)) or 1
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="devsynth-docs-ingest"
+            ) as executor:
+                futures = [
+                    executor.submit(self._read_file, path, file_metadata, known)
+                    for path, _, _, known in pending
+                ]
+                for (file_path, key, entry, _), future in zip(pending, futures):
+                    try:
+                        manifest, digest, stat = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to ingest file {file_path}: {e}")
+                        continue
+                    recorded = {
+                        "directory": directory_key,
+                        "sha256": digest,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "metadata": metadata_digest,
+                        "doc_id": entry.get("doc_id") if entry else None,
+                    }
+                    if manifest is None:
+                        # Touched but unchanged: only the recorded stat moves on
+                        self.manifest.put(key, recorded)
+                        continue
+                    prepared.append((key, recorded, manifest))
+
+            results = self._store_prepared(prepared, track)
+
+            if track:
+                self._prune_removed(
+                    directory_key, dir_path, files, recursive, supported_types
+                )
+                self.manifest.save()
 
             logger.info(
                 f"Ingested {len(results)} documentation files from directory:"
@@ -208,6 +385,112 @@ class DocumentationIngestionManager:
                 f"Failed to ingest documentation from directory: {e}"
             )
 
+    def _store_prepared(
+        self,
+        prepared: Sequence[tuple[str, dict[str, object], DocumentationManifest]],
+        track: bool,
+    ) -> list[DocumentationManifest]:
+        """Store processed files in batches and record them in the manifest.
+
+        Documents replaced by a new version of their file are deleted.
+        """
+        if not self.memory_manager:
+            return [manifest for _, _, manifest in prepared]
+
+        results: list[DocumentationManifest] = []
+        stale: list[str] = []
+        for start in range(0, len(prepared), self.batch_size):
+            batch = prepared[start : start + self.batch_size]
+            try:
+                stored = list(
+                    zip(batch, self._store_many_in_memory([m for _, _, m in batch]))
+                )
+            except Exception as e:
+                logger.warning(f"Batched documentation store failed: {e}")
+                stored = self._store_each_in_memory(batch)
+            for (key, recorded, manifest), doc_id in stored:
+                results.append(manifest.with_identifier(doc_id))
+                if not track:
+                    continue
+                previous = recorded.get("doc_id")
+                if previous and previous != doc_id:
+                    stale.append(cast(str, previous))
+                self.manifest.put(key, {**recorded, "doc_id": doc_id})
+        if stale:
+            self._delete_from_memory(stale)
+        return results
+
+    def _store_each_in_memory(
+        self,
+        batch: Sequence[tuple[str, dict[str, object], DocumentationManifest]],
+    ) -> list[tuple[tuple[str, dict[str, object], DocumentationManifest], str]]:
+        """Store a failed batch file by file, skipping files that still fail."""
+        stored = []
+        for prepared in batch:
+            key, _, manifest = prepared
+            try:
+                stored.append((prepared, self._store_in_memory(manifest)))
+            except Exception as e:
+                logger.warning(f"Failed to store documentation from {key}: {e}")
+        return stored
+
+    def _stored_in_memory(self, doc_id: object) -> bool:
+        """Whether the document recorded in the manifest is still stored."""
+        if not doc_id or self.memory_manager is None:
+            return False
+        try:
+            return self.memory_manager.retrieve(str(doc_id)) is not None
+        except Exception as e:
+            logger.warning(f"Could not look up documentation {doc_id}: {e}")
+            return False
+
+    def _prune_removed(
+        self,
+        directory_key: str,
+        dir_path: Path,
+        files: Sequence[Path],
+        recursive: bool,
+        supported_types: set[str],
+    ) -> None:
+        """Delete documents of files that disappeared from ``dir_path``.
+
+        Only entries this call could have found are considered, so narrower
+        ``file_types`` or non-recursive runs leave other entries untouched.
+        """
+        present = {str(path.resolve()) for path in files}
+        resolved_dir = dir_path.resolve()
+        stale: list[str] = []
+        for key in self.manifest.keys_in(directory_key):
+            path = Path(key)
+            if key in present or path.suffix.lower() not in supported_types:
+                continue
+            if not recursive and path.parent != resolved_dir:
+                continue
+            entry = self.manifest.pop(key)
+            if entry and entry.get("doc_id"):
+                stale.append(cast(str, entry["doc_id"]))
+        if stale:
+            logger.info(f"Pruning {len(stale)} removed documentation files")
+            self._delete_from_memory(stale)
+
+    @staticmethod
+    def _find_files(
+        dir_path: Path, recursive: bool, supported_types: set[str]
+    ) -> list[Path]:
+        """Find all supported files in the directory."""
+        files = []
+        if recursive:
+            for root, _, filenames in os.walk(dir_path):
+                for filename in filenames:
+                    file_path = Path(root) / filename
+                    if file_path.suffix.lower() in supported_types:
+                        files.append(file_path)
+        else:
+            for file_path in dir_path.iterdir():
+                if file_path.is_file() and file_path.suffix.lower() in supported_types:
+                    files.append(file_path)
+        return files
+
     def ingest_url(
         self, url: str, metadata: Metadata | None = None
     ) -> DocumentationManifest:
@@ -417,23 +700,9 @@ class DocumentationIngestionManager:
 
         return content.strip()
 
-    def _store_in_memory(self, manifest: DocumentationManifest) -> str:
-        """
-        Store documentation in memory.
-
-        Args:
-            content: The documentation content to store
-            metadata: The metadata to associate with the documentation
-
-        Returns:
-            The ID of the stored documentation
-        """
-        if not self.memory_manager:
-            raise DocumentationIngestionError(
-                "No memory manager provided for storing documentation"
-            )
-        assert self.memory_manager is not None
-
+    @staticmethod
+    def _memory_item(manifest: DocumentationManifest) -> MemoryItem:
+        """Build the memory item stored for a documentation manifest."""
         # Create a unique ID based on content and source
         metadata = dict(manifest.metadata)
         source = metadata.get("source", "unknown")
@@ -446,19 +715,64 @@ class DocumentationIngestionManager:
         metadata.setdefault("type", MemoryType.DOCUMENTATION.value)
 
         # Create a memory item using the DOCUMENTATION memory type.
-        memory_item = MemoryItem(
+        return MemoryItem(
             id=doc_id,
             content=manifest.content,
             memory_type=MemoryType.DOCUMENTATION,
             metadata=metadata,
         )
 
+    def _store_in_memory(self, manifest: DocumentationManifest) -> str:
+        """
+        Store documentation in memory.
+
+        Args:
+            content: The documentation content to store
+            metadata: The metadata to associate with the documentation
+
+        Returns:
+            The ID of the stored documentation
+        """
+        if not self.memory_manager:
+            raise DocumentationIngestionError(
+                "No memory manager provided for storing documentation"
+            )
+        assert self.memory_manager is not None
+
+        memory_item = self._memory_item(manifest)
+
         # Store the memory item
         stored_id = cast(str, self.memory_manager.store(memory_item))
 
         logger.info(f"Stored documentation in memory with ID: {stored_id}")
         return stored_id
 
+    def _store_many_in_memory(
+        self, manifests: Sequence[DocumentationManifest]
+    ) -> list[str]:
+        """Store several documents with a single batched memory write.
+
+        Memory managers without a batch API store the documents one by one.
+        """
+        if not isinstance(self.memory_manager, MemoryManager):
+            return [self._store_in_memory(manifest) for manifest in manifests]
+        items = [self._memory_item(manifest) for manifest in manifests]
+        stored_ids = [
+            str(item_id) for item_id in self.memory_manager.store_items(items)
+        ]
+        logger.info(f"Stored {len(stored_ids)} documentation items in memory")
+        return stored_ids
+
+    def _delete_from_memory(self, doc_ids: Sequence[str]) -> None:
+        """Remove stored documents, e.g. for files that no longer exist."""
+        if isinstance(self.memory_manager, MemoryManager):
+            self.memory_manager.delete_items(doc_ids)
+            return
+        delete = getattr(self.memory_manager, "delete", None)
+        if callable(delete):
+            for doc_id in doc_ids:
+                delete(doc_id)
+
     def search_documentation(
         self,
         query: str,
@@ -522,6 +836,11 @@ class DocumentationIngestionManager:
             non_interactive: When ``True`` disables interactive prompts for
                 automation and sets the ``DEVSYNTH_NONINTERACTIVE`` environment
                 variable.
+
+        Unless the manager was created with its own ``manifest_path``, the
+        ingestion manifest is kept in ``.devsynth/docs_ingestion_manifest.json``
+        under the project root so unchanged documentation is skipped on the
+        next run.
         """
 
         from devsynth.config import load_project_config
@@ -539,6 +858,9 @@ class DocumentationIngestionManager:
         docs_dirs = tuple(docs_dirs or config.config.directories.get("docs", ["docs"]))
         results: list[DocumentationManifest] = []
 
+        if self.manifest.path is None and self.memory_manager is not None:
+            self.manifest.bind(root / ".devsynth" / "docs_ingestion_manifest.json")
+
         for rel in docs_dirs:
             doc_dir = root / rel
             if doc_dir.exists():
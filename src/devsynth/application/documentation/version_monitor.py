@@ -7,11 +7,14 @@ and detecting updates.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
-import requests
-
+from devsynth.application.documentation.http_client import (
+    CachedHTTPClient,
+    get_default_http_client,
+)
 from devsynth.logging_setup import DevSynthLogger
 
 # Create a logger for this module
@@ -26,18 +29,29 @@ class VersionMonitor:
     and maintaining version history.
     """
 
-    def __init__(self, storage_path: str | None = None):
+    def __init__(
+        self,
+        storage_path: str | None = None,
+        *,
+        http_client: CachedHTTPClient | None = None,
+        max_workers: int = 8,
+    ):
         """
         Initialize the version monitor.
 
         Args:
             storage_path: Path to store version data
                 (default: .devsynth/documentation)
+            http_client: Client for PyPI requests; defaults to the shared
+                pooled client, whose cache revalidates unchanged releases
+            max_workers: Concurrent PyPI lookups in :meth:`check_all_libraries`
         """
         self.storage_path = storage_path or os.path.join(
             os.getcwd(), ".devsynth", "documentation"
         )
         self.libraries: dict[str, dict[str, Any]] = {}
+        self.http_client = http_client or get_default_http_client()
+        self.max_workers = max(1, max_workers)
 
         # Create the storage directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
@@ -78,71 +92,92 @@ class VersionMonitor:
         Returns:
             A dictionary with update information
         """
-        if library not in self.libraries:
-            return {"error": f"Library {library} is not registered"}
-
-        # Get the latest registered version
-        registered_versions = self.libraries[library]["versions"]
-        if not registered_versions:
-            return {"error": f"No versions registered for library {library}"}
-
-        latest_registered = max(registered_versions, key=self._version_key)
-
-        # Check for newer versions on PyPI
-        try:
-            response = requests.get(f"https://pypi.org/pypi/{library}/json", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                available_versions = list(data.get("releases", {}).keys())
-
-                # Find newer versions
-                newer_versions = [
-                    v
-                    for v in available_versions
-                    if self._version_key(v) > self._version_key(latest_registered)
-                ]
-
-                # Update last checked timestamp
-                self.libraries[library]["last_checked"] = datetime.now().isoformat()
-                self._save_data()
-
-                if newer_versions:
-                    latest_available = max(newer_versions, key=self._version_key)
-                    return {
-                        "library": library,
-                        "latest_registered": latest_registered,
-                        "latest_available": latest_available,
-                        "newer_versions": newer_versions,
-                        "update_available": True,
-                    }
-                else:
-                    return {
-                        "library": library,
-                        "latest_registered": latest_registered,
-                        "update_available": False,
-                    }
-
-            return {"error": f"Failed to check for updates to {library}"}
-        except Exception as e:
-            logger.warning(f"Error checking for updates to {library}: {str(e)}")
-            return {"error": str(e)}
+        result, checked = self._check_library(library)
+        if checked:
+            self.libraries[library]["last_checked"] = datetime.now().isoformat()
+            self._save_data()
+        return result
 
     def check_all_libraries(self) -> list[dict[str, Any]]:
         """
         Check for updates to all registered libraries.
 
+        Libraries are checked concurrently and version data is saved once.
+
         Returns:
             A list of update information dictionaries
         """
-        results = []
+        libraries = list(self.libraries)
+        if not libraries:
+            return []
 
-        for library in self.libraries:
-            result = self.check_for_updates(library)
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(libraries))
+        ) as executor:
+            outcomes = list(executor.map(self._check_library, libraries))
+
+        timestamp = datetime.now().isoformat()
+        results = []
+        for library, (result, checked) in zip(libraries, outcomes):
+            if checked:
+                self.libraries[library]["last_checked"] = timestamp
             if "error" not in result:
                 results.append(result)
+        if any(checked for _, checked in outcomes):
+            self._save_data()
 
         return results
 
+    def _check_library(self, library: str) -> tuple[dict[str, Any], bool]:
+        """Compare a library against PyPI without touching stored data.
+
+        Returns:
+            The update information and whether PyPI answered.
+        """
+        if library not in self.libraries:
+            return {"error": f"Library {library} is not registered"}, False
+
+        # Get the latest registered version
+        registered_versions = self.libraries[library]["versions"]
+        if not registered_versions:
+            return {"error": f"No versions registered for library {library}"}, False
+
+        latest_registered = max(registered_versions, key=self._version_key)
+
+        # Check for newer versions on PyPI
+        try:
+            manifest = self.http_client.get(f"https://pypi.org/pypi/{library}/json")
+            if not manifest:
+                return {"error": f"Failed to check for updates to {library}"}, False
+
+            data = json.loads(manifest.content)
+            available_versions = list(data.get("releases", {}).keys())
+
+            # Find newer versions
+            newer_versions = [
+                v
+                for v in available_versions
+                if self._version_key(v) > self._version_key(latest_registered)
+            ]
+
+            if newer_versions:
+                latest_available = max(newer_versions, key=self._version_key)
+                return {
+                    "library": library,
+                    "latest_registered": latest_registered,
+                    "latest_available": latest_available,
+                    "newer_versions": newer_versions,
+                    "update_available": True,
+                }, True
+            return {
+                "library": library,
+                "latest_registered": latest_registered,
+                "update_available": False,
+            }, True
+        except Exception as e:
+            logger.warning(f"Error checking for updates to {library}: {str(e)}")
+            return {"error": str(e)}, False
+
     def get_library_info(self, library: str) -> dict[str, Any] | None:
         """
         Get information about a registered library.
@@ -21,8 +21,9 @@ Kùzu database so rehearsals can be inspected outside of agent execution.
 from __future__ import annotations
 
 import json
+import os
 import uuid
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
@@ -109,16 +110,36 @@ class ReleaseGraphAdapter:
 
 
 class NetworkXReleaseGraphAdapter(ReleaseGraphAdapter):
-    """Store release graph information in a NetworkX ``MultiDiGraph``."""
+    """Store release graph information in a NetworkX ``MultiDiGraph``.
+
+    Nodes are looked up through an index over the attributes that identify
+    them, and every node or edge touched since the last :meth:`finalize` is
+    tracked so persistence only happens when something actually changed.
+    """
 
     backend_name = "networkx"
 
+    #: Attributes identifying an existing node of each type during upserts.
+    _IDENTITY_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+        "ReleaseEvidence": ("artifact_type", "checksum", "release_tag"),
+        "TestRun": ("run_checksum",),
+        "QualityGate": ("gate_name",),
+    }
+
     def __init__(self, graph_path: str | Path | None = None) -> None:
         self._graph_path = Path(
             graph_path or Path(".devsynth") / "knowledge_graph" / "release_graph.json"
         )
         self._graph_path.parent.mkdir(parents=True, exist_ok=True)
         self._graph = self._load()
+        self._node_index: dict[tuple[str, tuple[object, ...]], str] = {}
+        for node_id, attrs in self._graph.nodes(data=True):
+            # node-link JSON stores the ``id`` attribute as the node key only
+            attrs.setdefault("id", str(node_id))
+            self._index_node(str(node_id), attrs)
+        # node id -> node type, and (edge type, source, target)
+        self._dirty_nodes: dict[str, str] = {}
+        self._dirty_edges: set[tuple[str, str, str]] = set()
 
     # ------------------------------------------------------------------
     # internal helpers
@@ -136,9 +157,43 @@ class NetworkXReleaseGraphAdapter(ReleaseGraphAdapter):
 
     def _save(self) -> None:
         serialised = json_graph.node_link_data(self._graph)
-        self._graph_path.write_text(json.dumps(serialised, indent=2))
+        temp_path = self._graph_path.with_name(f"{self._graph_path.name}.tmp")
+        try:
+            temp_path.write_text(json.dumps(serialised, separators=(",", ":")))
+            os.replace(temp_path, self._graph_path)
+        except OSError as exc:  # pragma: no cover - defensive guard
+            raise ReleaseGraphError(
+                f"Failed to persist release graph to {self._graph_path}: {exc}"
+            ) from exc
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Whether nodes or edges changed since the last :meth:`finalize`."""
+        return bool(self._dirty_nodes or self._dirty_edges)
+
+    def _identity(
+        self, type_: str, attrs: Mapping[str, object]
+    ) -> tuple[str, tuple[object, ...]] | None:
+        keys = self._IDENTITY_ATTRIBUTES.get(type_)
+        if keys is None:
+            return None
+        return type_, tuple(attrs.get(key) for key in keys)
+
+    def _index_node(self, node_id: str, attrs: Mapping[str, object]) -> None:
+        identity = self._identity(str(attrs.get("type")), attrs)
+        if identity is not None:
+            # Keep the first matching node, mirroring insertion-order lookups
+            self._node_index.setdefault(identity, node_id)
+
+    def _unindex_node(self, node_id: str, attrs: Mapping[str, object]) -> None:
+        identity = self._identity(str(attrs.get("type")), attrs)
+        if identity is not None and self._node_index.get(identity) == node_id:
+            del self._node_index[identity]
 
     def _find_node(self, *, type_: str, **criteria: object) -> str | None:
+        keys = self._IDENTITY_ATTRIBUTES.get(type_)
+        if keys is not None and set(criteria) == set(keys):
+            return self._node_index.get(self._identity(type_, criteria))
         for node_id, attrs in self._graph.nodes(data=True):
             if attrs.get("type") != type_:
                 continue
@@ -150,12 +205,51 @@ class NetworkXReleaseGraphAdapter(ReleaseGraphAdapter):
         self, node_id: str, payload: Mapping[str, object]
     ) -> tuple[str, bool]:
         created = node_id not in self._graph
+        if not created:
+            nx_attrs = self._graph.nodes[node_id]
+            if nx_attrs == payload:
+                return node_id, created
+            self._unindex_node(node_id, nx_attrs)
         self._graph.add_node(node_id)
         nx_attrs = self._graph.nodes[node_id]
         nx_attrs.clear()
         nx_attrs.update(payload)
+        self._index_node(node_id, nx_attrs)
+        self._dirty_nodes[node_id] = str(payload.get("type"))
         return node_id, created
 
+    def _replace_out_edges(
+        self,
+        source: str,
+        edge_types: Iterable[str],
+        targets: Iterable[tuple[str, str]],
+    ) -> None:
+        """Make ``targets`` (edge type, target) the outgoing edges of ``source``.
+
+        Only edges of ``edge_types`` are considered; unchanged edges are kept so
+        they are not reported as dirty.
+        """
+        edge_types = set(edge_types)
+        desired = {
+            (edge_type, target, f"{edge_type}::{source}->{target}")
+            for edge_type, target in targets
+        }
+        current = {
+            (attrs.get("type"), v, key)
+            for _, v, key, attrs in self._graph.out_edges(source, keys=True, data=True)
+            if attrs.get("type") in edge_types
+        }
+        for edge_type, target, key in current - desired:
+            self._graph.remove_edge(source, target, key)
+            self._dirty_edges.add((str(edge_type), source, str(target)))
+        for edge_type, target, key in desired - current:
+            self._graph.add_edge(source, target, key=key, type=edge_type)
+            self._dirty_edges.add((edge_type, source, target))
+
+    def _has_edge(self, edge_type: str, source: str, target: str) -> bool:
+        edges = self._graph.get_edge_data(source, target) or {}
+        return any(attrs.get("type") == edge_type for attrs in edges.values())
+
     # ------------------------------------------------------------------
     # adapter API
     # ------------------------------------------------------------------
@@ -187,15 +281,19 @@ class NetworkXReleaseGraphAdapter(ReleaseGraphAdapter):
         return stored, created
 
     def link_test_run_to_evidence(self, test_run_id: str, evidence_id: str) -> None:
-        existing_edges = [
-            (u, v, key)
-            for u, v, key, attrs in self._graph.edges(data=True, keys=True)
-            if u == test_run_id and v == evidence_id and attrs.get("type") == "EMITS"
-        ]
-        for edge in existing_edges:
-            self._graph.remove_edge(*edge)
         edge_key = f"EMITS::{test_run_id}->{evidence_id}"
+        edges = self._graph.get_edge_data(test_run_id, evidence_id) or {}
+        stale = [
+            key
+            for key, attrs in edges.items()
+            if attrs.get("type") == "EMITS" and key != edge_key
+        ]
+        if not stale and edge_key in edges:
+            return
+        for key in stale:
+            self._graph.remove_edge(test_run_id, evidence_id, key)
         self._graph.add_edge(test_run_id, evidence_id, key=edge_key, type="EMITS")
+        self._dirty_edges.add(("EMITS", test_run_id, evidence_id))
 
     def record_quality_gate(
         self,
@@ -211,33 +309,77 @@ class NetworkXReleaseGraphAdapter(ReleaseGraphAdapter):
         node_id, created = self._ensure_node(node_id, graph_payload)
 
         # Refresh relationships: HAS_EVIDENCE and EVALUATED_FROM
-        for u, v, key, attrs in list(self._graph.edges(data=True, keys=True)):
-            if u != node_id:
-                continue
-            if attrs.get("type") in {"HAS_EVIDENCE", "EVALUATED_FROM"}:
-                self._graph.remove_edge(u, v, key)
-
-        for evidence_id in evidence_ids:
-            edge_key = f"HAS_EVIDENCE::{node_id}->{evidence_id}"
-            self._graph.add_edge(
-                node_id, evidence_id, key=edge_key, type="HAS_EVIDENCE"
-            )
-
-        eval_key = f"EVALUATED_FROM::{node_id}->{test_run_id}"
-        self._graph.add_edge(node_id, test_run_id, key=eval_key, type="EVALUATED_FROM")
+        targets = [("HAS_EVIDENCE", evidence_id) for evidence_id in evidence_ids]
+        targets.append(("EVALUATED_FROM", test_run_id))
+        self._replace_out_edges(node_id, ("HAS_EVIDENCE", "EVALUATED_FROM"), targets)
 
         stored = QualityGateNode(**payload)
         return stored, created
 
     def finalize(self) -> None:
+        if not self.has_pending_changes and self._graph_path.exists():
+            return
         self._save()
+        self._dirty_nodes.clear()
+        self._dirty_edges.clear()
 
 
 class KuzuReleaseGraphAdapter(NetworkXReleaseGraphAdapter):
-    """Persist the graph to Kùzu when the dependency is available."""
+    """Persist the graph to Kùzu when the dependency is available.
+
+    Only nodes and edges changed since the previous sync are written, grouped
+    into one multi-row statement per table and batch.  Pending changes are
+    recorded next to the database before the JSON graph is saved and the
+    record is removed once Kùzu has them, so a failed sync or an exit before
+    syncing is replayed by the next adapter opened on the same database.
+    """
 
     backend_name = "kuzu"
 
+    #: Kùzu table and columns mirroring each node type.
+    _NODE_TABLES: dict[str, tuple[str, tuple[str, ...]]] = {
+        "ReleaseEvidence": (
+            "release_evidence",
+            (
+                "id",
+                "release_tag",
+                "artifact_path",
+                "artifact_type",
+                "collected_at",
+                "checksum",
+                "source_command",
+            ),
+        ),
+        "TestRun": (
+            "test_run",
+            (
+                "id",
+                "profile",
+                "coverage_percent",
+                "tests_collected",
+                "exit_code",
+                "started_at",
+                "completed_at",
+                "run_checksum",
+                "metadata",
+            ),
+        ),
+        "QualityGate": (
+            "quality_gate",
+            ("id", "gate_name", "threshold", "status", "evaluated_at", "metadata"),
+        ),
+    }
+
+    #: Kùzu table and (source, target) columns mirroring each edge type.
+    _EDGE_TABLES: dict[str, tuple[str, tuple[str, str]]] = {
+        "EMITS": ("test_run_emits_evidence", ("test_run_id", "evidence_id")),
+        "HAS_EVIDENCE": ("gate_has_evidence", ("gate_id", "evidence_id")),
+        "EVALUATED_FROM": ("gate_evaluated_from", ("gate_id", "test_run_id")),
+    }
+
+    #: Maximum number of rows written by a single statement.
+    sync_batch_size = 256
+
     def __init__(
         self,
         graph_path: str | Path | None = None,
@@ -247,14 +389,23 @@ class KuzuReleaseGraphAdapter(NetworkXReleaseGraphAdapter):
         self._db_path = Path(db_path or Path(".devsynth") / "knowledge_graph" / "kuzu")
         self._conn = None
         self._kuzu_available = False
+        # Changes not yet mirrored into Kùzu; kept until a sync succeeds
+        self._kuzu_pending_nodes: dict[str, str] = {}
+        self._kuzu_pending_edges: set[tuple[str, str, str]] = set()
+        self._pending_sync_path = self._db_path / "pending_sync.json"
+        self._load_pending_sync()
         try:  # pragma: no cover - optional dependency
             import kuzu  # type: ignore
 
             self._db_path.mkdir(parents=True, exist_ok=True)
-            database = kuzu.Database(str(self._db_path / "release_graph.db"))
+            database_file = self._db_path / "release_graph.db"
+            fresh_database = not database_file.exists()
+            database = kuzu.Database(str(database_file))
             self._conn = kuzu.Connection(database)
             self._kuzu_available = True
             self._initialise_schema()
+            if fresh_database:
+                self._queue_full_sync()
         except Exception as exc:  # pragma: no cover - graceful fallback
             logger.warning(
                 "Kuzu backend unavailable for release graph ingestion: %s", exc
@@ -326,103 +477,163 @@ class KuzuReleaseGraphAdapter(NetworkXReleaseGraphAdapter):
         for stmt in statements:
             self._conn.execute(stmt)  # pragma: no cover - requires kuzu
 
-    def _clear_tables(self) -> None:
-        if not self._conn:
+    def _queue_full_sync(self) -> None:
+        """Mark every node and edge as pending, e.g. for a new database."""
+        for node_id, attrs in self._graph.nodes(data=True):
+            self._kuzu_pending_nodes[str(node_id)] = str(attrs.get("type"))
+        for u, v, attrs in self._graph.edges(data=True):
+            self._kuzu_pending_edges.add((str(attrs.get("type")), str(u), str(v)))
+
+    def _load_pending_sync(self) -> None:
+        """Restore changes a previous adapter did not get into Kùzu."""
+        if not self._pending_sync_path.exists():
             return
-        for table in (
-            "release_evidence",
-            "test_run",
-            "quality_gate",
-            "test_run_emits_evidence",
-            "gate_has_evidence",
-            "gate_evaluated_from",
-        ):
-            self._conn.execute(f"DELETE FROM {table};")  # pragma: no cover
+        try:
+            data = json.loads(self._pending_sync_path.read_text())
+            nodes = {str(key): str(value) for key, value in data["nodes"].items()}
+            edges = {
+                (str(type_), str(source), str(target))
+                for type_, source, target in data["edges"]
+            }
+        except Exception as exc:
+            logger.warning(
+                "Unreadable pending Kuzu sync record %s, resyncing everything: %s",
+                self._pending_sync_path,
+                exc,
+            )
+            self._queue_full_sync()
+            return
+        self._kuzu_pending_nodes.update(nodes)
+        self._kuzu_pending_edges.update(edges)
+
+    def _write_pending_sync(self) -> None:
+        """Record the changes Kùzu has not received yet."""
+        payload = {
+            "nodes": self._kuzu_pending_nodes,
+            "edges": sorted(self._kuzu_pending_edges),
+        }
+        temp_path = self._pending_sync_path.with_name(
+            f"{self._pending_sync_path.name}.tmp"
+        )
+        try:
+            self._pending_sync_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(payload, separators=(",", ":")))
+            os.replace(temp_path, self._pending_sync_path)
+        except OSError as exc:  # pragma: no cover - defensive guard
+            raise ReleaseGraphError(
+                f"Failed to record pending Kuzu sync in "
+                f"{self._pending_sync_path}: {exc}"
+            ) from exc
 
-    def _sync_to_kuzu(self) -> None:
-        if not self._conn:
+    @staticmethod
+    def _node_row(
+        node_id: str, attrs: Mapping[str, object], columns: Sequence[str]
+    ) -> list[object]:
+        row: list[object] = []
+        for column in columns:
+            if column == "id":
+                row.append(node_id)
+            elif column == "metadata":
+                row.append(json.dumps(attrs.get("metadata", {})))
+            else:
+                row.append(attrs.get(column))
+        return row
+
+    def _execute_batched(
+        self,
+        template: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[object]],
+    ) -> None:
+        """Run ``template`` once per batch of ``rows``.
+
+        ``template`` receives the column list as ``{columns}`` and the row
+        placeholders as ``{rows}``; single-column rows use bare ``?``
+        placeholders.
+        """
+        if not self._conn or not rows:
             return
-        self._clear_tables()
+        column_list = ", ".join(columns)
+        placeholder = ", ".join("?" for _ in columns)
+        if len(columns) > 1:
+            placeholder = f"({placeholder})"
+        batch_size = max(1, self.sync_batch_size)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            statement = template.format(
+                columns=column_list,
+                rows=", ".join(placeholder for _ in batch),
+            )
+            parameters = [value for row in batch for value in row]
+            self._conn.execute(statement, parameters)
 
-        for node_id, attrs in self._graph.nodes(data=True):
-            type_ = attrs.get("type")
-            if type_ == "ReleaseEvidence":
-                self._conn.execute(
-                    "MERGE INTO release_evidence(id, release_tag, artifact_path, "
-                    "artifact_type, collected_at, checksum, source_command) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?);",
-                    [
-                        node_id,
-                        attrs.get("release_tag"),
-                        attrs.get("artifact_path"),
-                        attrs.get("artifact_type"),
-                        attrs.get("collected_at"),
-                        attrs.get("checksum"),
-                        attrs.get("source_command"),
-                    ],
-                )
-            elif type_ == "TestRun":
-                metadata_json = json.dumps(attrs.get("metadata", {}))
-                self._conn.execute(
-                    "MERGE INTO test_run(id, profile, coverage_percent, "
-                    "tests_collected, exit_code, started_at, completed_at, "
-                    "run_checksum, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);",
-                    [
-                        node_id,
-                        attrs.get("profile"),
-                        attrs.get("coverage_percent"),
-                        attrs.get("tests_collected"),
-                        attrs.get("exit_code"),
-                        attrs.get("started_at"),
-                        attrs.get("completed_at"),
-                        attrs.get("run_checksum"),
-                        metadata_json,
-                    ],
-                )
-            elif type_ == "QualityGate":
-                metadata_json = json.dumps(attrs.get("metadata", {}))
-                self._conn.execute(
-                    "MERGE INTO quality_gate(id, gate_name, threshold, status, "
-                    "evaluated_at, metadata) VALUES (?, ?, ?, ?, ?, ?);",
-                    [
-                        node_id,
-                        attrs.get("gate_name"),
-                        attrs.get("threshold"),
-                        attrs.get("status"),
-                        attrs.get("evaluated_at"),
-                        metadata_json,
-                    ],
-                )
+    def _sync_to_kuzu(
+        self,
+        nodes: Mapping[str, str],
+        edges: Iterable[tuple[str, str, str]],
+    ) -> None:
+        """Upsert or delete the given nodes and edges in Kùzu.
 
-        for u, v, attrs in self._graph.edges(data=True):
-            type_ = attrs.get("type")
-            if type_ == "EMITS":
-                self._conn.execute(
-                    "MERGE INTO test_run_emits_evidence(test_run_id, evidence_id) "
-                    "VALUES (?, ?);",
-                    [u, v],
-                )
-            elif type_ == "HAS_EVIDENCE":
-                self._conn.execute(
-                    "MERGE INTO gate_has_evidence(gate_id, evidence_id) "
-                    "VALUES (?, ?);",
-                    [u, v],
-                )
-            elif type_ == "EVALUATED_FROM":
-                self._conn.execute(
-                    "MERGE INTO gate_evaluated_from(gate_id, test_run_id) "
-                    "VALUES (?, ?);",
-                    [u, v],
-                )
+        Args:
+            nodes: Changed node ids mapped to their node type.
+            edges: Changed ``(edge type, source, target)`` triples.
+        """
+        if not self._conn:
+            return
+        upserts: dict[str, tuple[Sequence[str], list[list[object]]]] = {}
+        deletes: dict[str, tuple[Sequence[str], list[list[object]]]] = {}
+
+        for node_id, type_ in nodes.items():
+            table = self._NODE_TABLES.get(type_)
+            if table is None:
+                continue
+            name, columns = table
+            attrs = self._graph.nodes[node_id] if node_id in self._graph else None
+            if attrs is None or attrs.get("type") != type_:
+                deletes.setdefault(name, (("id",), []))[1].append([node_id])
+            else:
+                row = self._node_row(node_id, attrs, columns)
+                upserts.setdefault(name, (columns, []))[1].append(row)
+
+        for type_, source, target in edges:
+            table = self._EDGE_TABLES.get(type_)
+            if table is None:
+                continue
+            name, columns = table
+            bucket = upserts if self._has_edge(type_, source, target) else deletes
+            bucket.setdefault(name, (columns, []))[1].append([source, target])
+
+        for name, (columns, rows) in deletes.items():
+            if len(columns) == 1:
+                template = f"DELETE FROM {name} WHERE {{columns}} IN ({{rows}});"
+            else:
+                template = f"DELETE FROM {name} WHERE ({{columns}}) IN ({{rows}});"
+            self._execute_batched(template, columns, rows)
+        for name, (columns, rows) in upserts.items():
+            self._execute_batched(
+                f"MERGE INTO {name}({{columns}}) VALUES {{rows}};", columns, rows
+            )
 
     def finalize(self) -> None:
+        if self._kuzu_available:
+            self._kuzu_pending_nodes.update(self._dirty_nodes)
+            self._kuzu_pending_edges.update(self._dirty_edges)
+            if self._kuzu_pending_nodes or self._kuzu_pending_edges:
+                # Written before the JSON graph so Kùzu can never silently lag it
+                self._write_pending_sync()
         super().finalize()
         if not self._kuzu_available:
             return
+        if not (self._kuzu_pending_nodes or self._kuzu_pending_edges):
+            return
         try:  # pragma: no cover - requires kuzu
-            self._sync_to_kuzu()
+            self._sync_to_kuzu(self._kuzu_pending_nodes, self._kuzu_pending_edges)
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.error("Failed to synchronise release graph to Kuzu: %s", exc)
+            return
+        self._kuzu_pending_nodes.clear()
+        self._kuzu_pending_edges.clear()
+        self._pending_sync_path.unlink(missing_ok=True)
 
 
 __all__ = [
@@ -6,7 +6,8 @@ from collections.abc import Iterable, Mapping, Sequence
 from typing import Protocol, TypeAlias, runtime_checkable
 
 from ...domain.interfaces.memory import MemoryStore
-from ...domain.models.memory import MemoryItem, MemoryType
+from ...domain.models.memory import MemoryItem, MemoryType, MemoryVector
+from .change_journal import ChangeJournal
 from .dto import (
     MemoryMetadata,
     MemoryMetadataValue,
@@ -72,6 +73,29 @@ class SupportsSearch(Protocol):
         """Return search results for ``query``."""
 
 
+@runtime_checkable
+class SupportsChangeJournal(Protocol):
+    """Protocol for adapters that journal their writes for delta syncs."""
+
+    change_journal: ChangeJournal
+
+
+@runtime_checkable
+class SupportsBulkStore(Protocol):
+    """Protocol for adapters that can persist many items in one operation."""
+
+    def store_many(self, items: Sequence[MemoryItem]) -> list[str]:
+        """Store ``items`` and return their identifiers."""
+
+
+@runtime_checkable
+class SupportsBulkVectorStore(Protocol):
+    """Protocol for vector adapters that can persist many vectors at once."""
+
+    def store_vectors(self, vectors: Sequence[MemoryVector]) -> list[str]:
+        """Store ``vectors`` and return their identifiers."""
+
+
 MemoryAdapter: TypeAlias = MemoryStore | VectorStoreProtocol
 """Union of supported adapter surfaces managed by :class:`MemoryManager`."""
 
@@ -84,6 +108,9 @@ __all__ = [
     "AdapterRegistry",
     "MemoryAdapter",
     "StructuredQueryRow",
+    "SupportsBulkStore",
+    "SupportsBulkVectorStore",
+    "SupportsChangeJournal",
     "SupportsStructuredQuery",
     "SupportsEdrrRetrieval",
     "SupportsGraphQueries",
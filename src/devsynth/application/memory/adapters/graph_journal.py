@@ -0,0 +1,246 @@
+"""Append-only persistence for RDF graphs held in rdflib's memory store.
+
+Rewriting a whole Turtle document after every write makes each write cost
+O(graph). :class:`JournalingMemoryStore` reports every concrete triple that is
+added to or removed from a graph, and :class:`GraphJournal` appends those
+changes to a line-oriented journal beside the Turtle snapshot::
+
+    A <http://devsynth.ai/memory/a> <http://devsynth.ai/ontology/id> "a" .
+    D <http://devsynth.ai/memory/b> <http://devsynth.ai/ontology/id> "b" .
+
+Each line is an ``A`` (add) or ``D`` (delete) marker followed by an N-Triples
+statement, in the spirit of RDF Patch. Loading parses the snapshot and replays
+the journal in order. Replaying is idempotent, so a crash between rewriting the
+snapshot and truncating the journal is harmless. Once the journal outgrows the
+graph it is folded back into the snapshot (compaction).
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Literal
+
+from ....logging_setup import DevSynthLogger
+
+try:  # pragma: no cover - optional dependency
+    from rdflib import BNode, Graph
+    from rdflib.plugins.stores.memory import Memory as _MemoryBase
+except Exception:  # pragma: no cover - rdflib unavailable
+    BNode = Graph = None  # type: ignore[assignment,misc]
+    _MemoryBase = object  # type: ignore[assignment,misc]
+
+logger = DevSynthLogger(__name__)
+
+ChangeOp = Literal["A", "D"]
+Triple = tuple[Any, Any, Any]
+ChangeListener = Callable[["JournalingMemoryStore", ChangeOp, Triple], None]
+
+JOURNAL_SUFFIX = ".journal"
+DEFAULT_MIN_COMPACTION_ENTRIES = 1_000
+
+
+def journal_path_for(snapshot_path: str | os.PathLike[str]) -> Path:
+    """Return the journal file that accompanies ``snapshot_path``."""
+
+    snapshot = Path(snapshot_path)
+    return snapshot.with_name(snapshot.name + JOURNAL_SUFFIX)
+
+
+class JournalingMemoryStore(_MemoryBase):  # type: ignore[misc,valid-type]
+    """rdflib ``Memory`` store that reports concrete triple changes.
+
+    ``listener`` is called after each triple that was actually added or
+    removed; no-op writes (re-adding an existing triple, removing a missing
+    one) are not reported. Removal patterns are expanded into the triples they
+    matched.
+    """
+
+    def __init__(
+        self, *args: Any, listener: ChangeListener | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.listener = listener
+
+    def add(self, triple: Triple, context: Any, quoted: bool = False) -> None:
+        listener = self.listener
+        if listener is None or quoted:
+            super().add(triple, context, quoted)
+            return
+        is_new = next(iter(super().triples(triple, context)), None) is None
+        super().add(triple, context, quoted)
+        if is_new:
+            listener(self, "A", triple)
+
+    def remove(self, triple_pattern: Triple, context: Any = None) -> None:
+        listener = self.listener
+        if listener is None:
+            super().remove(triple_pattern, context)
+            return
+        removed = [triple for triple, _ in super().triples(triple_pattern, context)]
+        super().remove(triple_pattern, context)
+        for triple in removed:
+            listener(self, "D", triple)
+
+
+def _encode(changes: Iterable[tuple[ChangeOp, Triple]]) -> list[str]:
+    lines: list[str] = []
+    for op, run in groupby(changes, key=lambda change: change[0]):
+        batch = Graph()
+        for _, triple in run:
+            batch.add(triple)
+        text = batch.serialize(format="nt")
+        lines.extend(f"{op} {line}\n" for line in text.splitlines() if line.strip())
+    return lines
+
+
+def _parse_run(op: str, lines: list[str], source: Path) -> Any:
+    batch = Graph()
+    try:
+        batch.parse(data="".join(line[2:] for line in lines), format="nt")
+        return batch
+    except Exception:
+        # A torn final write only loses that line; keep everything else.
+        batch = Graph()
+        for line in lines:
+            try:
+                batch.parse(data=line[2:], format="nt")
+            except Exception:
+                logger.warning("Skipping unreadable %s entry in %s", op, source)
+        return batch
+
+
+def replay_journal(graph: Any, snapshot_path: str | os.PathLike[str]) -> int:
+    """Apply the journal of ``snapshot_path`` to ``graph``.
+
+    Returns:
+        The number of journal entries read.
+    """
+
+    path = journal_path_for(snapshot_path)
+    if not path.exists():
+        return 0
+    with open(path, encoding="utf-8") as handle:
+        lines = [line for line in handle if line[:2] in ("A ", "D ")]
+    for op, run in groupby(lines, key=lambda line: line[0]):
+        batch = _parse_run(op, list(run), path)
+        if op == "A":
+            graph += batch
+        else:
+            graph -= batch
+    return len(lines)
+
+
+def load_journaled_graph(graph: Any, snapshot_path: str | os.PathLike[str]) -> Any:
+    """Parse the Turtle snapshot at ``snapshot_path`` and replay its journal."""
+
+    if os.path.exists(snapshot_path):
+        graph.parse(str(snapshot_path), format="turtle")
+    replay_journal(graph, snapshot_path)
+    return graph
+
+
+class GraphJournal:
+    """Buffers graph changes and persists them beside a Turtle snapshot.
+
+    Args:
+        snapshot_path: Turtle file holding the last compacted graph.
+        graph: Graph whose state the snapshot plus journal currently describe.
+        entries: Journal entries already on disk (as returned by
+            :func:`replay_journal`).
+        min_compaction_entries: Never compact below this many entries.
+        compaction_ratio: Compact once the journal holds more entries than
+            ``compaction_ratio`` times the number of triples in the graph.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str | os.PathLike[str],
+        *,
+        graph: Any = None,
+        entries: int = 0,
+        min_compaction_entries: int = DEFAULT_MIN_COMPACTION_ENTRIES,
+        compaction_ratio: float = 1.0,
+    ) -> None:
+        self.snapshot_path = Path(snapshot_path)
+        self.path = journal_path_for(snapshot_path)
+        self.min_compaction_entries = min_compaction_entries
+        self.compaction_ratio = compaction_ratio
+        self._entries = entries
+        self._pending: list[tuple[ChangeOp, Triple]] = []
+        self._graph: Any = graph
+        self._needs_snapshot = not self.snapshot_path.exists()
+
+    @property
+    def entries(self) -> int:
+        """Number of entries written since the last compaction."""
+
+        return self._entries
+
+    @property
+    def pending(self) -> int:
+        """Number of recorded changes not yet written."""
+
+        return len(self._pending)
+
+    def record(self, op: ChangeOp, triple: Triple) -> None:
+        """Buffer one change until the next :meth:`flush`."""
+
+        if any(isinstance(term, BNode) for term in triple):
+            # Blank node labels do not survive a round trip through N-Triples.
+            self._needs_snapshot = True
+        self._pending.append((op, triple))
+
+    def flush(self, graph: Any) -> None:
+        """Append buffered changes, compacting when the journal is too long.
+
+        A graph other than the one previously flushed (for example after a
+        rollback replaced it) is always written as a fresh snapshot.
+        """
+
+        if graph is not self._graph:
+            self._graph = graph
+            self._needs_snapshot = True
+        if self._needs_snapshot:
+            self.compact(graph)
+            return
+        if not self._pending:
+            return
+        lines = _encode(self._pending)
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.writelines(lines)
+        self._entries += len(lines)
+        self._pending.clear()
+        if self._entries > max(
+            self.min_compaction_entries, self.compaction_ratio * len(graph)
+        ):
+            self.compact(graph)
+
+    def compact(self, graph: Any) -> None:
+        """Rewrite the snapshot from ``graph`` and truncate the journal."""
+
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        graph.serialize(destination=str(staging), format="turtle")
+        os.replace(staging, self.snapshot_path)
+        if self.path.exists():
+            self.path.unlink()
+        logger.debug("Compacted %s entries into %s", self._entries, self.snapshot_path)
+        self._entries = 0
+        self._pending.clear()
+        self._graph = graph
+        self._needs_snapshot = False
+
+
+__all__ = [
+    "ChangeListener",
+    "ChangeOp",
+    "DEFAULT_MIN_COMPACTION_ENTRIES",
+    "GraphJournal",
+    "JournalingMemoryStore",
+    "journal_path_for",
+    "load_journaled_graph",
+    "replay_journal",
+]
@@ -13,7 +13,7 @@ import json
 import os
 import uuid
 from collections import deque
-from collections.abc import Iterator, Mapping
+from collections.abc import Hashable, Iterator, Mapping
 from contextlib import contextmanager
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, cast
@@ -26,6 +26,14 @@ from ....exceptions import MemoryTransactionError
 from ....logging_setup import DevSynthLogger
 from ..dto import MemoryRecord, build_memory_record
 from ..rdflib_store import RDFLibStore
+from .graph_journal import (
+    DEFAULT_MIN_COMPACTION_ENTRIES,
+    ChangeOp,
+    GraphJournal,
+    JournalingMemoryStore,
+    Triple,
+    replay_journal,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - imported for static analysis only
     import rdflib as rdflib_module
@@ -83,6 +91,136 @@ class _GraphTransactionState(TypedDict):
     prepared: bool
 
 
+class _MemoryItemIndex:
+    """Secondary indexes over the memory items of a graph.
+
+    The index is kept current from the graph's change notifications: a change
+    only marks its subject dirty, and the next lookup re-reads just the dirty
+    subjects. Lookups return a superset of the matching subjects (in the order
+    the graph itself yields them), which callers confirm on the materialized
+    items.
+    """
+
+    def __init__(self) -> None:
+        self.store: object | None = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._order: dict[Any, int] = {}
+        self._sequence = 0
+        self._dirty: set[Any] = set()
+        self._entries: dict[Any, tuple[str, dict[str, object]]] = {}
+        self._by_type: dict[str, set[Any]] = {}
+        self._by_key: dict[str, set[Any]] = {}
+        self._by_value: dict[str, dict[Hashable, set[Any]]] = {}
+        self._unhashable: dict[str, set[Any]] = {}
+
+    def observe(self, op: ChangeOp, triple: Triple) -> None:
+        if self.store is None:
+            return
+        subject, predicate, obj = triple
+        self._dirty.add(subject)
+        if predicate == RDF.type and obj == DEVSYNTH.MemoryItem:
+            # Mirror the store: a re-added item moves to the end.
+            self._order.pop(subject, None)
+            if op == "A":
+                self._order[subject] = self._sequence
+                self._sequence += 1
+
+    def rebuild(self, adapter: GraphMemoryAdapter, store: object) -> None:
+        self.store = None
+        self._clear()
+        try:
+            for subject in adapter.graph.subjects(RDF.type, DEVSYNTH.MemoryItem):
+                self._order[subject] = self._sequence
+                self._sequence += 1
+                self._index(subject, adapter._triples_to_memory_item(subject))
+        except Exception:
+            self.store = None
+            raise
+        self.store = store
+
+    def refresh(self, adapter: GraphMemoryAdapter) -> None:
+        dirty, self._dirty = self._dirty, set()
+        try:
+            for subject in dirty:
+                self._unindex(subject)
+                if subject in self._order:
+                    self._index(subject, adapter._triples_to_memory_item(subject))
+        except Exception:
+            self.store = None  # rebuild from scratch on the next lookup
+            raise
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def with_type(self, memory_type: str) -> set[Any]:
+        return self._by_type.get(memory_type, set())
+
+    def with_value(self, key: str, value: object) -> set[Any]:
+        try:
+            bucket = self._by_value.get(key, {}).get(cast(Hashable, value), set())
+        except TypeError:
+            return self._by_key.get(key, set())
+        return bucket | self._unhashable.get(key, set())
+
+    def select(self, criteria: list[set[Any]]) -> list[Any]:
+        """Return subjects present in every set of ``criteria``, in graph order."""
+
+        if not criteria:
+            return list(self._order)
+        criteria = sorted(criteria, key=len)
+        selected = set(criteria[0])
+        for candidates in criteria[1:]:
+            if not selected:
+                break
+            selected &= candidates
+        return sorted(selected, key=self._order.__getitem__)
+
+    def _index(self, subject: Any, item: MemoryItem | None) -> None:
+        if item is None:
+            return
+        memory_type = (
+            item.memory_type.value
+            if hasattr(item.memory_type, "value")
+            else str(item.memory_type)
+        )
+        metadata = dict(item.metadata)
+        self._entries[subject] = (memory_type, metadata)
+        self._by_type.setdefault(memory_type, set()).add(subject)
+        for key, value in metadata.items():
+            self._by_key.setdefault(key, set()).add(subject)
+            try:
+                values = self._by_value.setdefault(key, {})
+                values.setdefault(cast(Hashable, value), set()).add(subject)
+            except TypeError:
+                self._unhashable.setdefault(key, set()).add(subject)
+
+    def _unindex(self, subject: Any) -> None:
+        entry = self._entries.pop(subject, None)
+        if entry is None:
+            return
+        memory_type, metadata = entry
+        _discard(self._by_type, memory_type, subject)
+        for key, value in metadata.items():
+            _discard(self._by_key, key, subject)
+            try:
+                values = self._by_value.get(key, {})
+                _discard(values, cast(Hashable, value), subject)
+                if not values:
+                    self._by_value.pop(key, None)
+            except TypeError:
+                _discard(self._unhashable, key, subject)
+
+
+def _discard(buckets: dict[Any, set[Any]], key: Hashable, subject: Any) -> None:
+    bucket = buckets.get(key)
+    if bucket is not None:
+        bucket.discard(subject)
+        if not bucket:
+            del buckets[key]
+
+
 class GraphMemoryAdapter(MemoryStore):
     """
     Graph Memory Adapter handles relationships between memory items using a graph-based approach.
@@ -97,6 +235,11 @@ class GraphMemoryAdapter(MemoryStore):
 
     backend_type = "graph"
 
+    # Fold the change journal into the Turtle snapshot once it holds more
+    # than ``max(min_entries, ratio * len(graph))`` entries.
+    journal_min_compaction_entries = DEFAULT_MIN_COMPACTION_ENTRIES
+    journal_compaction_ratio = 1.0
+
     @staticmethod
     def _ensure_core_dependencies() -> None:
         if Graph is None or URIRef is None or Literal is None or RDF is None:
@@ -121,7 +264,25 @@ class GraphMemoryAdapter(MemoryStore):
 
     def _create_graph_instance(self) -> GraphType:
         graph_cls = self._require_graph_class()
-        return graph_cls()
+        return graph_cls(store=JournalingMemoryStore(listener=self._on_graph_change))
+
+    def _track_graph(self, graph: GraphType) -> GraphType:
+        """Copy ``graph`` into a graph whose changes this adapter observes."""
+
+        tracked = self._create_graph_instance()
+        for prefix, namespace in graph.namespaces():
+            tracked.bind(prefix, namespace, override=True)
+        tracked += graph
+        return tracked
+
+    def _on_graph_change(
+        self, store: JournalingMemoryStore, op: ChangeOp, triple: Triple
+    ) -> None:
+        if store is not getattr(getattr(self, "graph", None), "store", None):
+            return
+        if self._graph_journal is not None:
+            self._graph_journal.record(op, triple)
+        self._item_index.observe(op, triple)
 
     def _bind_default_namespaces(self) -> None:
         self.graph.bind("devsynth", DEVSYNTH)
@@ -152,10 +313,14 @@ class GraphMemoryAdapter(MemoryStore):
         self.use_rdflib_store = use_rdflib_store
         self._active_transactions: dict[str, _GraphTransactionState] = {}
         self._transaction_stack: list[str] = []
+        self._graph_journal: GraphJournal | None = None
+        self._item_index = _MemoryItemIndex()
 
         if use_rdflib_store and base_path:
             # Use RDFLibStore for enhanced functionality
             self.rdflib_store = RDFLibStore(base_path)
+            # Observe changes made through either object to keep indexes fresh
+            self.rdflib_store.graph = self._track_graph(self.rdflib_store.graph)
             # Align the graph file name with the adapter expectations
             self.graph_file = os.path.join(base_path, "graph_memory.ttl")
             self.rdflib_store.graph_file = self.graph_file
@@ -174,16 +339,29 @@ class GraphMemoryAdapter(MemoryStore):
             self.graph = self._create_graph_instance()
             self._bind_default_namespaces()
 
-            # Load existing graph if base_path is provided
+            # Load existing graph (snapshot plus change journal) if base_path
+            # is provided
             if base_path:
                 os.makedirs(base_path, exist_ok=True)
                 self.graph_file = os.path.join(base_path, "graph_memory.ttl")
-                if os.path.exists(self.graph_file):
-                    try:
+                loaded = True
+                entries = 0
+                try:
+                    if os.path.exists(self.graph_file):
                         self.graph.parse(self.graph_file, format="turtle")
                         logger.info(f"Loaded RDF graph from {self.graph_file}")
-                    except Exception as e:
-                        logger.error(f"Failed to load RDF graph: {e}")
+                    entries = replay_journal(self.graph, self.graph_file)
+                except Exception as e:
+                    loaded = False
+                    logger.error(f"Failed to load RDF graph: {e}")
+                self._graph_journal = GraphJournal(
+                    self.graph_file,
+                    # An unreadable snapshot is rewritten on the first save.
+                    graph=self.graph if loaded else None,
+                    entries=entries,
+                    min_compaction_entries=self.journal_min_compaction_entries,
+                    compaction_ratio=self.journal_compaction_ratio,
+                )
 
             logger.info("Graph Memory Adapter initialized with basic RDFLib")
 
@@ -201,12 +379,70 @@ class GraphMemoryAdapter(MemoryStore):
             return
         elif self.base_path:
             try:
-                self.graph.serialize(destination=self.graph_file, format="turtle")
-                logger.info(f"Saved RDF graph to {self.graph_file}")
+                if self._graph_journal is None:  # pragma: no cover - defensive
+                    self.graph.serialize(destination=self.graph_file, format="turtle")
+                else:
+                    self._graph_journal.flush(self.graph)
+                logger.debug(f"Saved RDF graph to {self.graph_file}")
             except Exception as e:
                 logger.error(f"Failed to save RDF graph: {e}")
                 raise MemoryStoreError(f"Failed to save RDF graph: {e}")
 
+    def compact_graph(self) -> None:
+        """Fold the change journal into the Turtle snapshot right away."""
+
+        if self._graph_journal is not None and not self.use_rdflib_store:
+            try:
+                self._graph_journal.compact(self.graph)
+            except Exception as e:
+                logger.error(f"Failed to compact RDF graph: {e}")
+                raise MemoryStoreError(f"Failed to compact RDF graph: {e}")
+        else:
+            self._save_graph()
+
+    # indexed lookups -------------------------------------------------------
+    def _indexed_items(self) -> _MemoryItemIndex | None:
+        """Return the up-to-date item index, or ``None`` if it cannot be used.
+
+        Graphs assigned from outside (not created by this adapter) do not
+        report their changes, so callers fall back to a full scan for them.
+        """
+
+        store = getattr(self.graph, "store", None)
+        if (
+            not isinstance(store, JournalingMemoryStore)
+            or store.listener != self._on_graph_change
+        ):
+            return None
+        index = self._item_index
+        if index.store is not store:
+            index.rebuild(self, store)
+        else:
+            index.refresh(self)
+        return index
+
+    def _memory_item_subjects(self) -> list[URIRef]:
+        return list(self.graph.subjects(RDF.type, DEVSYNTH.MemoryItem))
+
+    @staticmethod
+    def _matches_query(item: MemoryItem, query: Mapping[str, object]) -> bool:
+        memory_type_value = (
+            item.memory_type.value
+            if hasattr(item.memory_type, "value")
+            else str(item.memory_type)
+        )
+        for key, value in query.items():
+            if key == "type":
+                # Match either the memory type or a "type" metadata entry
+                value_str = value.value if hasattr(value, "value") else str(value)
+                if memory_type_value != value_str and not (
+                    key in item.metadata and item.metadata[key] == value_str
+                ):
+                    return False
+            elif key not in item.metadata or item.metadata[key] != value:
+                return False
+        return True
+
     # transactional support -------------------------------------------------
     @contextmanager
     def transaction(self) -> Iterator[None]:
@@ -519,7 +755,7 @@ class GraphMemoryAdapter(MemoryStore):
             try:
                 # Deserialize JSON content
                 content = json.loads(content_str)
-                logger.debug(f"Deserialized JSON content for item {item_id}")
+                logger.debug("Deserialized JSON content for item %s", item_id)
             except json.JSONDecodeError as e:
                 # If deserialization fails, use the string content
                 logger.warning(
@@ -563,7 +799,7 @@ class GraphMemoryAdapter(MemoryStore):
                     # Deserialize JSON metadata
                     metadata[key] = json.loads(value)
                     logger.debug(
-                        f"Deserialized JSON metadata for key {key} in item {item_id}"
+                        "Deserialized JSON metadata for key %s in item %s", key, item_id
                     )
                 except json.JSONDecodeError as e:
                     # If deserialization fails, keep the string value
@@ -666,62 +902,30 @@ class GraphMemoryAdapter(MemoryStore):
         """
         try:
             results: list[MemoryRecord] = []
-            logger.debug(f"Searching with query: {query}")
-
-            # Get all memory items
-            all_items = []
-            for s, p, o in self.graph.triples((None, RDF.type, DEVSYNTH.MemoryItem)):
-                item = self._triples_to_memory_item(s)
-                if item:
-                    all_items.append(item)
-
-            logger.debug(f"Found {len(all_items)} total memory items")
-
-            # Check each item against the query
-            for item in all_items:
-                match = True
-                memory_type_value = (
-                    item.memory_type.value
-                    if hasattr(item.memory_type, "value")
-                    else str(item.memory_type)
-                )
-                logger.debug(
-                    f"Checking item with ID: {item.id}, memory_type: {memory_type_value}, metadata: {item.metadata}"
-                )
-
+            logger.debug("Searching with query: %s", query)
+
+            # Narrow the candidates with the secondary indexes and only
+            # materialize those; the full predicate is still applied.
+            index = self._indexed_items()
+            if index is None:
+                subjects = self._memory_item_subjects()
+            elif not index:
+                subjects = []
+            else:
+                criteria = []
                 for key, value in query.items():
                     if key == "type":
-                        # Check if the memory_type matches the value
-                        # Convert both memory_type and value to string for comparison
-                        value_str = (
-                            value.value if hasattr(value, "value") else str(value)
+                        wanted = value.value if hasattr(value, "value") else str(value)
+                        criteria.append(
+                            index.with_type(wanted) | index.with_value("type", wanted)
                         )
-                        if memory_type_value != value_str:
-                            # Also check if the type is in metadata
-                            if key in item.metadata and item.metadata[key] == value_str:
-                                logger.debug(
-                                    f"Item {item.id} matches type in metadata: {item.metadata[key]} == {value_str}"
-                                )
-                            else:
-                                logger.debug(
-                                    f"Item {item.id} doesn't match type: {memory_type_value} != {value_str}"
-                                )
-                                match = False
-                                break
-                    elif key in item.metadata:
-                        if item.metadata[key] != value:
-                            logger.debug(
-                                f"Item {item.id} doesn't match metadata {key}: {item.metadata[key]} != {value}"
-                            )
-                            match = False
-                            break
                     else:
-                        logger.debug(f"Item {item.id} doesn't have metadata key: {key}")
-                        match = False
-                        break
+                        criteria.append(index.with_value(key, value))
+                subjects = index.select(criteria)
 
-                if match:
-                    logger.debug(f"Item {item.id} matches the query")
+            for subject in subjects:
+                item = self._triples_to_memory_item(subject)
+                if item is not None and self._matches_query(item, query):
                     results.append(build_memory_record(item, source=self.backend_type))
 
             logger.info(
@@ -1224,18 +1428,31 @@ class GraphMemoryAdapter(MemoryStore):
             The retrieved item or an empty dictionary if not found.
         """
         try:
-            # Get all items from the graph
-            all_items = []
-            for s, p, o in self.graph.triples((None, RDF.type, DEVSYNTH.MemoryItem)):
-                item = self._triples_to_memory_item(s)
-                if item:
-                    all_items.append(item)
-
-            logger.debug(f"Found {len(all_items)} total memory items")
+            index = self._indexed_items()
+            if index is None:
+                subjects = self._memory_item_subjects()
+            else:
+                type_values = {item_type} | {
+                    member.value for member in MemoryType if str(member) == item_type
+                }
+                criteria = [set().union(*(index.with_type(v) for v in type_values))]
+                # ``metadata.get(key) != value`` lets ``None`` match a missing
+                # key, which the value index cannot express.
+                wanted = {"edrr_phase": edrr_phase, **dict(metadata or {})}
+                criteria.extend(
+                    index.with_value(key, value)
+                    for key, value in wanted.items()
+                    if value is not None
+                )
+                subjects = index.select(criteria)
 
             # Filter items by memory type, EDRR phase, and additional metadata
             matching_items = []
-            for item in all_items:
+            for subject in subjects:
+                item = self._triples_to_memory_item(subject)
+                if item is None:
+                    continue
+
                 # Convert memory_type to string for comparison
                 item_memory_type = (
                     item.memory_type.value
@@ -1252,18 +1469,14 @@ class GraphMemoryAdapter(MemoryStore):
                     continue
 
                 # Check if the item matches additional metadata
-                match = True
-                if metadata:
-                    for key, value in metadata.items():
-                        if item.metadata.get(key) != value:
-                            match = False
-                            break
-
-                if match:
-                    matching_items.append(item)
-                    logger.debug(
-                        f"Found matching item: {item.id}, Type: {item.memory_type}, Metadata: {item.metadata}"
-                    )
+                if metadata and any(
+                    item.metadata.get(key) != value for key, value in metadata.items()
+                ):
+                    continue
+
+                # Only the first match (in graph order) is returned
+                matching_items.append(item)
+                break
 
             if matching_items:
                 # Return the content of the first matching item
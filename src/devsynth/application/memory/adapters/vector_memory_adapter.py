@@ -85,13 +85,38 @@ class VectorMemoryAdapter(VectorStoreProtocol):
         self.vectors[vector.id] = vector
 
         # Store the embedding for fast lookup
-        self.embeddings[vector.id] = np.array(vector.embedding)
+        self.embeddings[vector.id] = np.frombuffer(
+            vector.embedding_buffer, dtype=np.float32
+        )
 
         logger.info(
             f"Stored memory vector with ID {vector.id} in Vector Memory Adapter"
         )
         return str(vector.id)
 
+    def store_vectors(self, vectors: Sequence[MemoryVector]) -> list[str]:
+        """
+        Store several vectors in the vector store.
+
+        Args:
+            vectors: The memory vectors to store
+
+        Returns:
+            The IDs of the stored vectors, in order
+        """
+        vector_ids: list[str] = []
+        for vector in vectors:
+            if not vector.id:
+                vector.id = f"vector_{len(self.vectors) + 1}"
+            self.vectors[vector.id] = vector
+            self.embeddings[vector.id] = np.frombuffer(
+                vector.embedding_buffer, dtype=np.float32
+            )
+            vector_ids.append(str(vector.id))
+
+        logger.info(f"Stored {len(vector_ids)} memory vectors in Vector Memory Adapter")
+        return vector_ids
+
     def retrieve_vector(self, vector_id: str) -> MemoryVector | None:
         """
         Retrieve a vector from the vector store.
@@ -318,7 +343,8 @@ class VectorMemoryAdapter(VectorStoreProtocol):
         # Restore from the snapshot
         self.vectors = snapshot
         self.embeddings = {
-            vid: np.array(vec.embedding) for vid, vec in snapshot.items()
+            vid: np.frombuffer(vec.embedding_buffer, dtype=np.float32)
+            for vid, vec in snapshot.items()
         }
 
         # Remove the transaction from the active transactions
@@ -351,7 +377,8 @@ class VectorMemoryAdapter(VectorStoreProtocol):
         try:
             self.vectors = deepcopy(dict(snapshot))
             self.embeddings = {
-                vid: np.array(vec.embedding) for vid, vec in self.vectors.items()
+                vid: np.frombuffer(vec.embedding_buffer, dtype=np.float32)
+                for vid, vec in self.vectors.items()
             }
             return True
         except Exception as e:
@@ -0,0 +1,142 @@
+"""Append-only change journals used for delta synchronization.
+
+Adapters that own a :class:`ChangeJournal` append ``(sequence, op, id)``
+entries whenever they write. :class:`~devsynth.application.memory.sync_manager.SyncManager`
+keeps a :class:`JournalCursor` per source/target pair and, on the next sync,
+ships only the identifiers touched since that cursor instead of enumerating the
+whole store.
+
+Entries are hints about *which* identifiers changed rather than a replayable
+log: the sync reads the current state of every touched identifier from the
+source. Writes that are later rolled back therefore only cause redundant, but
+harmless, transfers. Adapters that restore state without going through their
+write paths (snapshot rollbacks) call :meth:`ChangeJournal.reset`, which
+invalidates all outstanding cursors and forces the next sync to enumerate the
+store again. The same happens when a cursor falls behind the retained window.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Literal
+
+JournalOp = Literal["store", "delete", "store_vector", "delete_vector"]
+
+VECTOR_OPS: frozenset[str] = frozenset({"store_vector", "delete_vector"})
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """A single journaled write."""
+
+    sequence: int
+    op: JournalOp
+    item_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class JournalCursor:
+    """Position in a specific journal generation.
+
+    ``epoch`` identifies the journal generation; a cursor from another epoch
+    (a different process, or a journal that was reset) is never trusted.
+    """
+
+    epoch: str
+    sequence: int
+
+
+class ChangeJournal:
+    """Bounded, thread-safe journal of ``(sequence, op, id)`` entries."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._entries: deque[JournalEntry] = deque(maxlen=max_entries)
+        self._lock = Lock()
+        self._epoch = uuid.uuid4().hex
+        self._sequence = 0
+
+    @property
+    def epoch(self) -> str:
+        return self._epoch
+
+    def append(self, op: JournalOp, item_id: str) -> int:
+        """Record a write and return its sequence number."""
+
+        with self._lock:
+            self._sequence += 1
+            self._entries.append(JournalEntry(self._sequence, op, item_id))
+            return self._sequence
+
+    def extend(self, op: JournalOp, item_ids: Iterable[str]) -> int:
+        """Record several writes of the same kind; return the last sequence."""
+
+        with self._lock:
+            for item_id in item_ids:
+                self._sequence += 1
+                self._entries.append(JournalEntry(self._sequence, op, item_id))
+            return self._sequence
+
+    def position(self) -> JournalCursor:
+        """Return a cursor pointing at the most recent entry."""
+
+        with self._lock:
+            return JournalCursor(self._epoch, self._sequence)
+
+    def reset(self) -> None:
+        """Drop all entries and start a new epoch, invalidating cursors."""
+
+        with self._lock:
+            self._entries.clear()
+            self._epoch = uuid.uuid4().hex
+            self._sequence = 0
+
+    def changes_since(
+        self, cursor: JournalCursor | None
+    ) -> tuple[list[JournalEntry], JournalCursor] | None:
+        """Return entries after ``cursor`` together with the new position.
+
+        Multiple writes to the same identifier are coalesced into the last one.
+        ``None`` means the journal cannot answer - the cursor is missing, from
+        another epoch, or older than the retained entries - and the caller must
+        fall back to a full synchronization.
+        """
+
+        with self._lock:
+            if cursor is None or cursor.epoch != self._epoch:
+                return None
+            if cursor.sequence > self._sequence:
+                return None
+            oldest = self._entries[0].sequence if self._entries else None
+            if oldest is not None and cursor.sequence < oldest - 1:
+                return None
+            if oldest is None and cursor.sequence < self._sequence:
+                return None
+            latest: dict[tuple[bool, str], JournalEntry] = {}
+            for entry in self._entries:
+                if entry.sequence > cursor.sequence:
+                    key = (entry.op in VECTOR_OPS, entry.item_id)
+                    latest.pop(key, None)
+                    latest[key] = entry
+            return list(latest.values()), JournalCursor(self._epoch, self._sequence)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = [
+    "ChangeJournal",
+    "DEFAULT_MAX_ENTRIES",
+    "JournalCursor",
+    "JournalEntry",
+    "JournalOp",
+    "VECTOR_OPS",
+]
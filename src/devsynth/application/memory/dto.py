@@ -254,7 +254,7 @@ def _memory_item_from_vector(vector: MemoryVector) -> MemoryItem:
         _coerce_memory_type(raw_type) if raw_type is not None else MemoryType.CONTEXT
     )
     vector_metadata["memory_type"] = memory_type.value
-    vector_metadata.setdefault("embedding", list(vector.embedding))
+    vector_metadata.setdefault("embedding", vector.embedding)
     return MemoryItem(
         id=vector.id,
         content=vector.content,
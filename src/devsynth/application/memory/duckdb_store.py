@@ -518,7 +518,7 @@ class DuckDBStore(MemoryStore, VectorStore[MemoryVector]):
         vector = MemoryVector(
             id=vector_id,
             content=content,
-            embedding=list(embedding),
+            embedding=embedding,
             metadata=metadata,
             created_at=created_at,
         )
@@ -557,10 +557,7 @@ class DuckDBStore(MemoryStore, VectorStore[MemoryVector]):
                 else datetime.now().isoformat()
             )
 
-            # Convert embedding to a list if it's a numpy array
             embedding = vector.embedding
-            if isinstance(embedding, np.ndarray):
-                embedding = embedding.tolist()
 
             # Store in DuckDB
             if self.vector_extension_available:
@@ -3,14 +3,23 @@ Enhanced Knowledge Graph with Business Intent Layer
 
 This module provides the enhanced knowledge graph implementation with business
 intent discovery, semantic linking, and multi-hop reasoning capabilities.
+
+Traversal is served from per-entity outgoing/incoming adjacency indexes that
+are maintained on insertion, optionally compacted into CSR arrays for
+read-heavy phases (:meth:`EnhancedKnowledgeGraph.compact`). Keyword matching
+uses inverted indexes so only entities sharing a keyword are scored.
 """
 
 from __future__ import annotations
 
+import heapq
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from ...domain.models.memory import MemeticUnit
 from ...logging_setup import DevSynthLogger
 
@@ -92,6 +101,33 @@ class IntentLink:
         }
 
 
+@dataclass(frozen=True)
+class CompactAdjacency:
+    """Undirected adjacency in compressed sparse row form.
+
+    Neighbours of ``node_ids[i]`` are ``node_ids[j]`` for every ``j`` in
+    ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+
+    node_ids: list[str]
+    positions: dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    def neighbours(self, position: int) -> np.ndarray:
+        return self.indices[self.indptr[position] : self.indptr[position + 1]]
+
+
+def _property_keywords(entity: Entity) -> frozenset[str]:
+    """Lower-cased words of the string properties of ``entity``."""
+
+    keywords: set[str] = set()
+    for prop_value in entity.properties.values():
+        if isinstance(prop_value, str):
+            keywords.update(prop_value.lower().split())
+    return frozenset(keywords)
+
+
 class EnhancedKnowledgeGraph:
     """Enhanced knowledge graph with business intent and semantic linking."""
 
@@ -105,18 +141,37 @@ class EnhancedKnowledgeGraph:
         self._type_index: dict[str, set[str]] = {}
         self._property_index: dict[str, dict[str, set[str]]] = {}
 
+        # Adjacency indexes: entity id -> {relationship id: relationship}
+        self._outgoing: dict[str, dict[str, Relationship]] = {}
+        self._incoming: dict[str, dict[str, Relationship]] = {}
+        self._compact: CompactAdjacency | None = None
+        # Reachable sets per (start entity, depth), dropped on any mutation
+        self._reach_cache: dict[tuple[str, int], frozenset[str]] = {}
+
+        # Inverted keyword index over string properties
+        self._entity_keywords: dict[str, frozenset[str]] = {}
+        self._keyword_index: dict[str, set[str]] = {}
+        self._entity_order: dict[str, int] = {}
+
         # Intent discovery components
         self.intent_discovery_engine = IntentDiscoveryEngine()
 
         logger.info("Enhanced knowledge graph initialized")
 
     def add_entity(self, entity: Entity) -> None:
-        """Add an entity to the knowledge graph."""
+        """Add an entity to the knowledge graph.
+
+        Keyword indexes reflect the entity's properties when it is added;
+        re-add the entity after changing them.
+        """
         self.entities[entity.id] = entity
+        self._entity_order.setdefault(entity.id, len(self._entity_order))
 
         # Update indexes
         self._update_type_index(entity)
         self._update_property_index(entity)
+        self._update_keyword_index(entity)
+        self._invalidate_traversal()
 
         logger.debug(f"Added entity {entity.id} of type {entity.type}")
 
@@ -126,11 +181,32 @@ class EnhancedKnowledgeGraph:
             f"{relationship.source_id}--{relationship.type}-->{relationship.target_id}"
         )
         self.relationships[rel_id] = relationship
+        self._index_relationship(rel_id, relationship)
+        self._invalidate_traversal()
 
         logger.debug(
             f"Added relationship {rel_id} with strength {relationship.strength}"
         )
 
+    def remove_relationship(self, rel_id: str) -> Relationship | None:
+        """Remove the relationship stored under ``rel_id``, if any."""
+        relationship = self.relationships.pop(rel_id, None)
+        if relationship is None:
+            return None
+        for index, entity_id in (
+            (self._outgoing, relationship.source_id),
+            (self._incoming, relationship.target_id),
+        ):
+            incident = index.get(entity_id)
+            if incident is not None:
+                incident.pop(rel_id, None)
+                if not incident:
+                    del index[entity_id]
+        self._invalidate_traversal()
+
+        logger.debug(f"Removed relationship {rel_id}")
+        return relationship
+
     def add_intent_link(self, intent_link: IntentLink) -> None:
         """Add an intent link between code and business requirements."""
         link_id = f"{intent_link.entity_id}--{intent_link.intent_type}-->{intent_link.requirement_id}"
@@ -159,28 +235,65 @@ class EnhancedKnowledgeGraph:
         """Get entities connected to the given entity."""
         connected = []
 
-        # Find relationships involving this entity
-        for rel_id, relationship in self.relationships.items():
-            if (
-                relationship.source_id == entity_id
-                or relationship.target_id == entity_id
-            ):
-
-                if relationship_type and relationship.type != relationship_type:
-                    continue
+        outgoing = self._outgoing.get(entity_id, {})
+        incident = list(outgoing.items())
+        incident.extend(
+            (rel_id, relationship)
+            for rel_id, relationship in self._incoming.get(entity_id, {}).items()
+            if rel_id not in outgoing
+        )
+        for _, relationship in incident:
+            if relationship_type and relationship.type != relationship_type:
+                continue
 
-                # Get the connected entity
-                connected_id = (
-                    relationship.target_id
-                    if relationship.source_id == entity_id
-                    else relationship.source_id
-                )
+            # Get the connected entity
+            connected_id = (
+                relationship.target_id
+                if relationship.source_id == entity_id
+                else relationship.source_id
+            )
 
-                if connected_id in self.entities:
-                    connected.append(self.entities[connected_id])
+            if connected_id in self.entities:
+                connected.append(self.entities[connected_id])
 
         return connected
 
+    def compact(self) -> CompactAdjacency:
+        """Freeze the adjacency into CSR arrays for read-heavy phases.
+
+        Traversals use the compact form until the next mutation discards it.
+        """
+        if self._compact is not None:
+            return self._compact
+
+        node_ids = list(self._outgoing.keys() | self._incoming.keys())
+        positions = {node_id: index for index, node_id in enumerate(node_ids)}
+        neighbour_lists: list[list[int]] = [[] for _ in node_ids]
+        for relationship in self.relationships.values():
+            source = positions[relationship.source_id]
+            target = positions[relationship.target_id]
+            neighbour_lists[source].append(target)
+            if target != source:
+                neighbour_lists[target].append(source)
+
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(neighbours) for neighbours in neighbour_lists])
+        indices = np.fromiter(
+            (index for neighbours in neighbour_lists for index in neighbours),
+            dtype=np.int64,
+            count=int(indptr[-1]),
+        )
+        self._compact = CompactAdjacency(node_ids, positions, indptr, indices)
+        return self._compact
+
+    def _index_relationship(self, rel_id: str, relationship: Relationship) -> None:
+        self._outgoing.setdefault(relationship.source_id, {})[rel_id] = relationship
+        self._incoming.setdefault(relationship.target_id, {})[rel_id] = relationship
+
+    def _invalidate_traversal(self) -> None:
+        self._compact = None
+        self._reach_cache.clear()
+
     def query_business_context(self, query: str) -> list[Entity]:
         """Query entities related to business context."""
         # This is a simplified implementation
@@ -211,33 +324,30 @@ class EnhancedKnowledgeGraph:
     ) -> list[Entity]:
         """Find entities semantically similar to the target."""
         # Simplified semantic matching based on keywords and properties
-        matches = []
-
-        target_keywords = set()
-        for prop_value in target_entity.properties.values():
-            if isinstance(prop_value, str):
-                target_keywords.update(prop_value.lower().split())
-
-        # Score other entities by keyword overlap
-        scored_entities = []
-        for entity in self.entities.values():
-            if entity.id == target_entity.id:
-                continue
-
-            entity_keywords = set()
-            for prop_value in entity.properties.values():
-                if isinstance(prop_value, str):
-                    entity_keywords.update(prop_value.lower().split())
-
-            # Calculate overlap score
-            overlap = len(target_keywords.intersection(entity_keywords))
-            if overlap > 0:
-                score = overlap / len(target_keywords.union(entity_keywords))
-                scored_entities.append((entity, score))
+        target_keywords = _property_keywords(target_entity)
+
+        # Only entities sharing at least one keyword can score above zero
+        overlaps: Counter[str] = Counter()
+        for keyword in target_keywords:
+            overlaps.update(self._keyword_index.get(keyword, ()))
+        overlaps.pop(target_entity.id, None)
+
+        # Score candidates by keyword overlap (Jaccard)
+        scored_entities = [
+            (
+                overlap
+                / (len(target_keywords) + len(self._entity_keywords[eid]) - overlap),
+                self._entity_order[eid],
+                eid,
+            )
+            for eid, overlap in overlaps.items()
+        ]
 
-        # Sort by score and return top matches
-        scored_entities.sort(key=lambda x: x[1], reverse=True)
-        return [entity for entity, _ in scored_entities[:max_results]]
+        # Highest score first; ties keep insertion order
+        top = heapq.nsmallest(
+            max_results, scored_entities, key=lambda entry: (-entry[0], entry[1])
+        )
+        return [self.entities[eid] for _, _, eid in top]
 
     def _update_type_index(self, entity: Entity) -> None:
         """Update type index for efficient querying."""
@@ -257,6 +367,19 @@ class EnhancedKnowledgeGraph:
 
             self._property_index[prop_name][prop_str].add(entity.id)
 
+    def _update_keyword_index(self, entity: Entity) -> None:
+        """Update the inverted keyword index used by semantic matching."""
+        for keyword in self._entity_keywords.get(entity.id, ()):
+            postings = self._keyword_index.get(keyword)
+            if postings is not None:
+                postings.discard(entity.id)
+                if not postings:
+                    del self._keyword_index[keyword]
+        keywords = _property_keywords(entity)
+        self._entity_keywords[entity.id] = keywords
+        for keyword in keywords:
+            self._keyword_index.setdefault(keyword, set()).add(entity.id)
+
     def discover_intent_relationships(self) -> list[IntentLink]:
         """Discover intent relationships between code and business entities."""
         intent_links = []
@@ -270,8 +393,11 @@ class EnhancedKnowledgeGraph:
             code_entities.extend(self.get_entities_by_type(entity_type))
 
         # Find intent links between requirements and code
+        candidate_index = self._intent_candidate_index(code_entities)
         for requirement in requirements:
-            for code_entity in code_entities:
+            for code_entity in self._intent_candidates(
+                requirement, code_entities, candidate_index
+            ):
                 intent_link = self.intent_discovery_engine.discover_intent(
                     code_entity, requirement
                 )
@@ -282,32 +408,62 @@ class EnhancedKnowledgeGraph:
         logger.info(f"Discovered {len(intent_links)} intent relationships")
         return intent_links
 
+    def _intent_candidate_index(
+        self, code_entities: list[Entity]
+    ) -> tuple[dict[str, list[int]], list[int], float] | None:
+        """Inverted keyword index over ``code_entities`` for intent pruning.
+
+        Pairs whose keyword overlap cannot reach the engine's
+        :meth:`IntentDiscoveryEngine.keyword_pruning_threshold` are skipped
+        without being scored. Returns ``None`` when the engine offers no such
+        bound and every pair must be evaluated.
+        """
+        engine = self.intent_discovery_engine
+        threshold = engine.keyword_pruning_threshold()
+        if threshold is None:
+            return None
+
+        postings: dict[str, list[int]] = {}
+        sizes: list[int] = []
+        for position, code_entity in enumerate(code_entities):
+            keywords = engine.extract_entity_keywords(code_entity)
+            sizes.append(len(keywords))
+            for keyword in keywords:
+                postings.setdefault(keyword, []).append(position)
+        return postings, sizes, threshold
+
+    def _intent_candidates(
+        self,
+        requirement: Entity,
+        code_entities: list[Entity],
+        index: tuple[dict[str, list[int]], list[int], float] | None,
+    ) -> list[Entity]:
+        """Code entities whose keyword overlap can reach the similarity cut-off."""
+        if index is None:
+            return code_entities
+        postings, sizes, threshold = index
+        engine = self.intent_discovery_engine
+        requirement_keywords = engine.extract_entity_keywords(requirement)
+
+        overlaps: Counter[int] = Counter()
+        for keyword in requirement_keywords:
+            overlaps.update(postings.get(keyword, ()))
+        # Same arithmetic as the engine's Jaccard check, so no pair it would
+        # accept is dropped.
+        return [
+            code_entities[position]
+            for position in sorted(overlaps)
+            if overlaps[position]
+            / (len(requirement_keywords) + sizes[position] - overlaps[position])
+            >= threshold
+        ]
+
     def calculate_blast_radius(
         self, start_entity_id: str, max_depth: int = 5
     ) -> dict[str, Any]:
         """Calculate the blast radius of changes to an entity."""
-        visited = {start_entity_id}
-        current_level = [start_entity_id]
-        all_affected = {start_entity_id}
-
         # Multi-hop traversal to find all affected entities
-        for depth in range(max_depth):
-            next_level = []
-
-            for entity_id in current_level:
-                # Find all connected entities
-                connected = self.get_connected_entities(entity_id)
-
-                for connected_entity in connected:
-                    if connected_entity.id not in visited:
-                        visited.add(connected_entity.id)
-                        next_level.append(connected_entity.id)
-                        all_affected.add(connected_entity.id)
-
-            if not next_level:
-                break  # No more connections
-
-            current_level = next_level
+        all_affected = set(self._reachable(start_entity_id, max_depth))
 
         # Calculate impact metrics
         impact_metrics = self._calculate_impact_metrics(all_affected, start_entity_id)
@@ -316,11 +472,70 @@ class EnhancedKnowledgeGraph:
             "start_entity": start_entity_id,
             "affected_entities": list(all_affected),
             "blast_radius": len(all_affected) - 1,  # Exclude starting entity
-            "max_depth": len(visited) if visited else 0,
+            "max_depth": len(all_affected) if all_affected else 0,
             "impact_metrics": impact_metrics,
-            "traversal_path": list(visited),
+            "traversal_path": list(all_affected),
         }
 
+    def _reachable(self, start_entity_id: str, max_depth: int) -> frozenset[str]:
+        """Entities within ``max_depth`` hops of the start, including it.
+
+        Only hops onto entities present in the graph are followed. Results are
+        memoized until the graph changes.
+        """
+        key = (start_entity_id, max_depth)
+        cached = self._reach_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self._compact is not None:
+            reached = self._reachable_compact(self._compact, start_entity_id, max_depth)
+        else:
+            reached = {start_entity_id}
+            frontier = deque([(start_entity_id, 0)])
+            while frontier:
+                entity_id, depth = frontier.popleft()
+                if depth >= max_depth:
+                    continue
+                for edges, endpoint in (
+                    (self._outgoing.get(entity_id, {}), "target_id"),
+                    (self._incoming.get(entity_id, {}), "source_id"),
+                ):
+                    for relationship in edges.values():
+                        neighbour = getattr(relationship, endpoint)
+                        if neighbour not in reached and neighbour in self.entities:
+                            reached.add(neighbour)
+                            frontier.append((neighbour, depth + 1))
+
+        result = frozenset(reached)
+        self._reach_cache[key] = result
+        return result
+
+    def _reachable_compact(
+        self, adjacency: CompactAdjacency, start_entity_id: str, max_depth: int
+    ) -> set[str]:
+        start = adjacency.positions.get(start_entity_id)
+        reached = {start_entity_id}
+        if start is None:
+            return reached
+        node_ids = adjacency.node_ids
+        seen = {start}
+        level = [start]
+        for _ in range(max_depth):
+            next_level = []
+            for position in level:
+                for neighbour in adjacency.neighbours(position).tolist():
+                    if neighbour in seen:
+                        continue
+                    seen.add(neighbour)
+                    if node_ids[neighbour] in self.entities:
+                        reached.add(node_ids[neighbour])
+                        next_level.append(neighbour)
+            if not next_level:
+                break
+            level = next_level
+        return reached
+
     def _calculate_impact_metrics(
         self, affected_entities: set[str], start_entity_id: str
     ) -> dict[str, Any]:
@@ -431,6 +646,11 @@ class EnhancedKnowledgeGraph:
         return datetime.now().isoformat()
 
 
+_INTENT_STOP_WORDS = frozenset(
+    {"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
+)
+
+
 class IntentDiscoveryEngine:
     """Engine for discovering intent relationships between code and business requirements."""
 
@@ -505,38 +725,24 @@ class IntentDiscoveryEngine:
             validation_method="semantic_similarity_and_pattern_analysis",
         )
 
+    def keyword_pruning_threshold(self) -> float | None:
+        """Minimum keyword similarity for :meth:`discover_intent` to link a pair.
+
+        The default engine rejects pairs whose keyword Jaccard similarity is
+        below :attr:`similarity_threshold`, so callers may skip them unscored.
+        Subclasses that score pairs differently should return ``None``.
+        """
+        if self.similarity_threshold <= 0:
+            return None
+        return self.similarity_threshold
+
     def _calculate_semantic_similarity(
         self, code_entity: Entity, requirement: Entity
     ) -> float:
         """Calculate semantic similarity between code entity and requirement."""
         # Simplified semantic similarity based on text overlap
-        code_text = " ".join(str(v) for v in code_entity.properties.values()).lower()
-        requirement_text = " ".join(
-            str(v) for v in requirement.properties.values()
-        ).lower()
-
-        # Extract meaningful words
-        def extract_keywords(text: str) -> set[str]:
-            words = text.split()
-            # Filter for meaningful words (length > 2, not common stop words)
-            stop_words = {
-                "the",
-                "and",
-                "or",
-                "but",
-                "in",
-                "on",
-                "at",
-                "to",
-                "for",
-                "of",
-                "with",
-                "by",
-            }
-            return {word for word in words if len(word) > 2 and word not in stop_words}
-
-        code_keywords = extract_keywords(code_text)
-        requirement_keywords = extract_keywords(requirement_text)
+        code_keywords = self.extract_entity_keywords(code_entity)
+        requirement_keywords = self.extract_entity_keywords(requirement)
 
         if not code_keywords or not requirement_keywords:
             return 0.0
@@ -547,6 +753,16 @@ class IntentDiscoveryEngine:
 
         return intersection / union if union > 0 else 0.0
 
+    def extract_entity_keywords(self, entity: Entity) -> set[str]:
+        """Meaningful lower-cased words across all of the entity's properties."""
+        text = " ".join(str(v) for v in entity.properties.values()).lower()
+        # Filter for meaningful words (length > 2, not common stop words)
+        return {
+            word
+            for word in text.split()
+            if len(word) > 2 and word not in _INTENT_STOP_WORDS
+        }
+
     def _analyze_naming_patterns(
         self, code_entity: Entity, requirement: Entity
     ) -> float:
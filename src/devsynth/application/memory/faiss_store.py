@@ -36,6 +36,7 @@ from devsynth.logging_setup import DevSynthLogger
 
 from ...domain.interfaces.memory import SupportsTransactions, VectorStore
 from ...domain.models.memory import MemoryItem, MemoryVector
+from .change_journal import ChangeJournal
 from .dto import MemoryMetadata, MemoryRecord, VectorStoreStats, build_memory_record
 from .metadata_serialization import from_serializable, to_serializable
 
@@ -112,6 +113,7 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
         # cloned FAISS index and metadata dictionary so that rollback can
         # restore the previous state if an error occurs.
         self._snapshots: dict[str, _Snapshot] = {}
+        self.change_journal = ChangeJournal()
 
     def _initialize_store(self) -> None:
         """Initialize the FAISS index and metadata store."""
@@ -243,6 +245,9 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
             )
         self.index = snap.index
         self.metadata = snap.metadata
+        # Restored vectors bypass store_vector, so outstanding sync cursors
+        # can no longer be trusted.
+        self.change_journal.reset()
         self._save_index()
         self._save_metadata()
         return True
@@ -283,7 +288,7 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
         vector = MemoryVector(
             id=vector_id,
             content=entry.get("content"),
-            embedding=list(entry.get("embedding", [])),
+            embedding=entry.get("embedding", []),
             metadata=metadata_payload,
             created_at=created_at,
         )
@@ -312,8 +317,8 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
             if not vector.id:
                 vector.id = str(uuid.uuid4())
 
-            # Convert embedding to numpy array
-            embedding = np.array(vector.embedding, dtype=np.float32)
+            # View the float32 embedding buffer without copying
+            embedding = np.frombuffer(vector.embedding_buffer, dtype=np.float32)
 
             # Reshape for FAISS (expects 2D array)
             embedding = embedding.reshape(1, -1)
@@ -355,6 +360,7 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
             if not self._snapshots:
                 self._save_index()
                 self._save_metadata()
+            self.change_journal.append("store_vector", vector.id)
 
             logger.info(f"Stored vector with ID {vector.id} in FAISS")
             return vector.id
@@ -363,6 +369,66 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
             logger.error(f"Failed to store vector in FAISS: {e}")
             raise MemoryStoreError(f"Failed to store vector: {e}")
 
+    def store_vectors(self, vectors: Sequence[MemoryVector]) -> list[str]:
+        """
+        Store several vectors with one index update and one save.
+
+        Args:
+            vectors: The MemoryVectors to store
+
+        Returns:
+            The IDs of the stored vectors, in order
+
+        Raises:
+            MemoryStoreError: If the vectors cannot be stored
+        """
+        vectors = list(vectors)
+        if not vectors:
+            return []
+        try:
+            for vector in vectors:
+                if not vector.id:
+                    vector.id = str(uuid.uuid4())
+
+            embeddings = np.stack(
+                [
+                    np.frombuffer(vector.embedding_buffer, dtype=np.float32)
+                    for vector in vectors
+                ]
+            )
+            if len(self.metadata) == 0:
+                self.dimension = embeddings.shape[1]
+                self.index = cast("Index", self._module.IndexFlatL2(self.dimension))
+
+            first = self.index.ntotal
+            self.index.add(embeddings)
+
+            for offset, vector in enumerate(vectors):
+                self.metadata[vector.id] = {
+                    "content": vector.content,
+                    "embedding": list(vector.embedding),
+                    "metadata": self._serialize_metadata(vector.metadata or {}),
+                    "created_at": (
+                        vector.created_at.isoformat()
+                        if vector.created_at
+                        else datetime.now().isoformat()
+                    ),
+                    "index": first + offset,
+                    "is_deleted": False,
+                }
+            if not self._snapshots:
+                self._save_index()
+                self._save_metadata()
+            for vector in vectors:
+                self.change_journal.append("store_vector", vector.id)
+
+            logger.info(f"Stored {len(vectors)} vectors in FAISS")
+            return [vector.id for vector in vectors]
+
+        except Exception as e:
+            logger.error(f"Failed to store vectors in FAISS: {e}")
+            raise MemoryStoreError(f"Failed to store vectors: {e}")
+
     def retrieve_vector(self, vector_id: str) -> MemoryRecord | None:
         """
         Retrieve a vector from the vector store by ID.
@@ -549,6 +615,7 @@ class FAISSStore(VectorStore[MemoryRecord], SupportsTransactions):
             # Save the metadata
             if not self._snapshots:
                 self._save_metadata()
+            self.change_journal.append("delete_vector", vector_id)
 
             logger.info(f"Marked vector with ID {vector_id} as deleted in FAISS")
             return True
@@ -73,6 +73,7 @@ from devsynth.exceptions import MemoryStoreError
 from devsynth.fallback import retry_with_exponential_backoff
 from devsynth.logging_setup import DevSynthLogger
 
+from .change_journal import ChangeJournal
 from .dto import MemoryRecord, build_memory_record
 
 logger = DevSynthLogger(__name__)
@@ -121,6 +122,7 @@ class KuzuStore(MemoryStore, SupportsTransactions):
         self._versions: dict[str, list[MemoryItem]] = {}
         self._token_usage = 0
         self._transactions: dict[str, dict[str, MemoryItem]] = {}
+        self.change_journal = ChangeJournal()
 
         # tokenizer for token usage
         self.tokenizer: object | None = None
@@ -241,6 +243,8 @@ class KuzuStore(MemoryStore, SupportsTransactions):
     def rollback_transaction(self, transaction_id: str) -> bool:
         """Rollback a transaction restoring its snapshot."""
         snapshot = self._transactions.pop(transaction_id, None)
+        # Restored state bypasses ``store``; invalidate outstanding sync cursors.
+        self.change_journal.reset()
         if self._use_fallback:
             if snapshot is not None:
                 self._store = snapshot
@@ -293,6 +297,7 @@ class KuzuStore(MemoryStore, SupportsTransactions):
             )
         if item.id in self._cache:
             del self._cache[item.id]
+        self.change_journal.append("store", item.id)
         return item.id
 
     def _retrieve_from_db(self, item_id: str) -> MemoryItem | None:
@@ -403,6 +408,7 @@ class KuzuStore(MemoryStore, SupportsTransactions):
             existed = item_id in self._store
             self._store.pop(item_id, None)
             self._cache.pop(item_id, None)
+            self.change_journal.append("delete", item_id)
             return existed
         if self.conn is None:  # pragma: no cover - defensive
             return False
@@ -410,6 +416,7 @@ class KuzuStore(MemoryStore, SupportsTransactions):
             self.conn.execute("DELETE FROM memory WHERE id=?", [item_id])
             self.conn.execute("DELETE FROM versions WHERE id=?", [item_id])
             self._cache.pop(item_id, None)
+            self.change_journal.append("delete", item_id)
             return True
         except Exception as e:
             logger.error(f"Kuzu delete error: {e}")
@@ -39,6 +39,7 @@ from devsynth.security.encryption import decrypt_bytes, encrypt_bytes
 
 from ...domain.interfaces.memory import MemoryStore, SupportsTransactions
 from ...domain.models.memory import MemoryItem, MemoryType
+from .change_journal import ChangeJournal, JournalOp
 from .dto import MemoryMetadata, MemoryMetadataValue, MemoryRecord, build_memory_record
 
 
@@ -155,6 +156,11 @@ class LMDBStore(MemoryStore, SupportsTransactions):
         # object.
         self._transactions: dict[str, LMDBTransactionProtocol] = {}
 
+        # Writes are journaled for SyncManager delta syncs once the LMDB
+        # transaction carrying them commits, keyed by ``id(txn)`` until then.
+        self.change_journal = ChangeJournal()
+        self._pending_changes: dict[int, list[tuple[JournalOp, str]]] = {}
+
     def close(self):
         """Close the LMDB environment."""
         env = self.env
@@ -191,11 +197,14 @@ class LMDBStore(MemoryStore, SupportsTransactions):
         if txn is None:
             logger.warning(f"No transaction {transaction_id} to commit")
             return False
+        changes = self._pending_changes.pop(id(txn), [])
         try:
             txn.commit()
         except Exception as exc:
             logger.error(f"LMDB commit failed for {transaction_id}: {exc}")
             raise
+        for op, item_id in changes:
+            self.change_journal.append(op, item_id)
         return True
 
     def rollback_transaction(self, transaction_id: str) -> bool:
@@ -205,6 +214,7 @@ class LMDBStore(MemoryStore, SupportsTransactions):
         if txn is None:
             logger.warning(f"No transaction {transaction_id} to roll back")
             return False
+        self._pending_changes.pop(id(txn), None)
         try:
             txn.abort()
         except Exception as exc:
@@ -388,6 +398,7 @@ class LMDBStore(MemoryStore, SupportsTransactions):
 
         # Store in LMDB
         txn.put(item.id.encode("utf-8"), serialized, db=self.items_db)
+        self._pending_changes.setdefault(id(txn), []).append(("store", item.id))
 
         # Store metadata for searching
         if item.metadata:
@@ -445,6 +456,39 @@ class LMDBStore(MemoryStore, SupportsTransactions):
             logger.error(f"Failed to store item in LMDB: {e}")
             raise MemoryStoreError(f"Failed to store item: {e}")
 
+    def store_many(self, items: Sequence[MemoryItem]) -> list[str]:
+        """
+        Store several items in a single LMDB transaction.
+
+        Args:
+            items: The MemoryItems to store
+
+        Returns:
+            The IDs of the stored items, in order
+
+        Raises:
+            MemoryStoreError: If the batch cannot be stored
+        """
+        try:
+            with self.transaction() as txn:
+                item_ids = [self.store_in_transaction(txn, item) for item in items]
+
+            for item in items:
+                self.token_count += self._count_tokens(str(item))
+
+            audit_event(
+                "store_memory",
+                store="LMDBStore",
+                item_ids=item_ids,
+            )
+
+            logger.info(f"Stored {len(item_ids)} items in LMDB")
+            return item_ids
+
+        except Exception as e:
+            logger.error(f"Failed to store items in LMDB: {e}")
+            raise MemoryStoreError(f"Failed to store items: {e}")
+
     def retrieve_in_transaction(
         self, txn: LMDBTransactionProtocol, item_id: str
     ) -> MemoryItem | None:
@@ -660,6 +704,9 @@ class LMDBStore(MemoryStore, SupportsTransactions):
 
                 # Delete the item itself
                 txn.delete(item_id.encode("utf-8"), db=self.items_db)
+                self._pending_changes.setdefault(id(txn), []).append(
+                    ("delete", item_id)
+                )
 
             logger.info(f"Deleted item with ID {item_id} from LMDB")
             audit_event(
@@ -7,10 +7,18 @@ structured Memetic Units with comprehensive metadata.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Dict, List
 from uuid import uuid4
 
+import numpy as np
+
 from ...domain.models.memory import (
     CognitiveType,
     MemeticMetadata,
@@ -22,20 +30,63 @@ from ...logging_setup import DevSynthLogger
 
 logger = DevSynthLogger(__name__)
 
+# Dimension of the deterministic placeholder vectors (a common embedding size).
+SEMANTIC_VECTOR_DIMENSION = 384
+DEFAULT_BATCH_SIZE = 64
+
+_LCG_MULTIPLIER = 1103515245
+_LCG_INCREMENT = 12345
+_LCG_MASK = 0x7FFFFFFF
+
 
 class MemeticUnitIngestionPipeline:
     """Pipeline for transforming raw data into Memetic Units."""
 
-    def __init__(self, embedding_provider=None, keyword_extractor=None):
-        """Initialize the ingestion pipeline."""
+    def __init__(
+        self,
+        embedding_provider=None,
+        keyword_extractor=None,
+        *,
+        max_workers: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize the ingestion pipeline.
+
+        Args:
+            embedding_provider: Optional provider exposing ``embed``; batches of
+                texts are embedded with a single call.
+            keyword_extractor: Optional callable returning keywords for data.
+            max_workers: Worker threads used by :meth:`batch_process` for
+                classification and keyword extraction.
+            batch_size: Number of raw inputs held in memory per batch.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.embedding_provider = embedding_provider
         self.keyword_extractor = keyword_extractor or self._default_keyword_extractor
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.batch_size = batch_size
         logger.info("Memetic Unit ingestion pipeline initialized")
 
     def process_raw_input(
         self, raw_data: Any, source: MemeticSource, context: dict[str, Any] = None
     ) -> MemeticUnit:
         """Convert raw input into a properly annotated Memetic Unit."""
+        content_hash = self._compute_content_hash(raw_data)
+        semantic_vector = self._generate_semantic_vector(raw_data)
+        return self._build_unit(
+            raw_data, source, context, content_hash, semantic_vector
+        )
+
+    def _build_unit(
+        self,
+        raw_data: Any,
+        source: MemeticSource,
+        context: dict[str, Any] | None,
+        content_hash: str,
+        semantic_vector: list[float],
+    ) -> MemeticUnit:
+        """Annotate ``raw_data`` given its precomputed hash and vector."""
         # Generate unique ID and timestamps
         unit_id = uuid4()
         timestamp = self._get_current_timestamp()
@@ -44,8 +95,6 @@ class MemeticUnitIngestionPipeline:
         cognitive_type = self._classify_cognitive_type(raw_data, source, context)
 
         # Generate semantic descriptors
-        content_hash = self._compute_content_hash(raw_data)
-        semantic_vector = self._generate_semantic_vector(raw_data)
         keywords = self._extract_keywords(raw_data)
         topic = self._classify_topic(raw_data, keywords)
 
@@ -106,11 +155,10 @@ class MemeticUnitIngestionPipeline:
 
     def _compute_content_hash(self, data: Any) -> str:
         """Generate consistent hash for content deduplication."""
-        import hashlib
-        import json
-
         # Normalize different data types
-        if isinstance(data, (dict, list)):
+        if isinstance(data, str):
+            normalized = data
+        elif isinstance(data, (dict, list)):
             normalized = json.dumps(data, sort_keys=True, default=str)
         elif hasattr(data, "__dict__"):
             normalized = json.dumps(data.__dict__, sort_keys=True, default=str)
@@ -121,24 +169,47 @@ class MemeticUnitIngestionPipeline:
 
     def _generate_semantic_vector(self, data: Any) -> list[float]:
         """Generate semantic embedding for content."""
-        # This would integrate with embedding providers (OpenAI, LM Studio, etc.)
-        # For now, return placeholder vector based on content hash
-        import hashlib
+        return self._embed_texts([str(data)])[0]
 
-        text_content = str(data)
-        hash_obj = hashlib.md5(text_content.encode())
-        hash_int = int(hash_obj.hexdigest(), 16)
-
-        # Generate pseudo-random vector based on content hash
-        vector = []
-        for i in range(384):  # Common embedding dimension
-            # Simple deterministic pseudo-random generation
-            seed = hash_int + i * 31
-            value = (seed * 1103515245 + 12345) & 0x7FFFFFFF
-            normalized = (value % 2000 - 1000) / 1000.0  # Scale to [-1, 1]
-            vector.append(normalized)
-
-        return vector
+    def _embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed ``texts`` with one provider call, falling back to placeholders."""
+        if self.embedding_provider is not None and texts:
+            try:
+                result = self.embedding_provider.embed(list(texts))
+                vectors = [[float(value) for value in row] for row in result]
+                if len(vectors) == len(texts):
+                    return vectors
+                logger.warning(
+                    "Embedding provider returned %d vectors for %d texts; "
+                    "using placeholder vectors",
+                    len(vectors),
+                    len(texts),
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Embedding provider failed: %s; using placeholder vectors", exc
+                )
+        return self._placeholder_vectors(texts).tolist()
+
+    @staticmethod
+    def _placeholder_vectors(texts: Sequence[str]) -> np.ndarray:
+        """Deterministic pseudo-random vectors in ``[-1, 1]`` derived from MD5.
+
+        Each component is one step of a 31-bit linear congruential generator
+        seeded from the text's digest, so only the low 31 bits of the digest
+        matter and the whole batch is computed with integer broadcasting.
+        """
+        seeds = np.array(
+            [
+                int(hashlib.md5(text.encode()).hexdigest(), 16) & _LCG_MASK
+                for text in texts
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 1)
+        offsets = np.arange(SEMANTIC_VECTOR_DIMENSION, dtype=np.int64) * 31
+        states = (seeds + offsets) & _LCG_MASK
+        values = (states * _LCG_MULTIPLIER + _LCG_INCREMENT) & _LCG_MASK
+        return (values % 2000 - 1000) / 1000.0
 
     def _default_keyword_extractor(self, data: Any) -> list[str]:
         """Extract meaningful keywords from content."""
@@ -440,20 +511,75 @@ class MemeticUnitIngestionPipeline:
 
     def batch_process(
         self,
-        raw_data_list: list[Any],
+        raw_data_list: Iterable[Any],
         source: MemeticSource,
         context: dict[str, Any] = None,
+        *,
+        deduplicate: bool = True,
     ) -> list[MemeticUnit]:
-        """Process multiple items in batch for efficiency."""
-        units = []
-        for raw_data in raw_data_list:
-            try:
-                unit = self.process_raw_input(raw_data, source, context)
-                units.append(unit)
-            except Exception as e:
-                logger.error(f"Failed to process raw data: {e}")
-                # Continue processing other items
-                continue
-
+        """Process multiple items in batch for efficiency.
+
+        See :meth:`iter_batch_process` for how inputs are batched.
+        """
+        units = list(
+            self.iter_batch_process(
+                raw_data_list, source, context, deduplicate=deduplicate
+            )
+        )
         logger.info(f"Batch processed {len(units)} Memetic Units")
         return units
+
+    def iter_batch_process(
+        self,
+        raw_data: Iterable[Any],
+        source: MemeticSource,
+        context: dict[str, Any] = None,
+        *,
+        deduplicate: bool = True,
+    ) -> Iterator[MemeticUnit]:
+        """Stream Memetic Units for ``raw_data`` in input order.
+
+        Inputs are consumed ``batch_size`` at a time so arbitrarily long
+        iterables use bounded memory. Within a batch, inputs whose content hash
+        was already seen are dropped before any further work. Survivors are
+        embedded with one provider call while classification and keyword
+        extraction run on a worker pool. Inputs that fail are logged and
+        skipped.
+        """
+        seen: set[str] = set()
+        iterator = iter(raw_data)
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="memetic-ingest"
+        ) as executor:
+            while batch := list(islice(iterator, self.batch_size)):
+                pending: list[tuple[Any, str]] = []
+                for item in batch:
+                    try:
+                        content_hash = self._compute_content_hash(item)
+                    except Exception as e:
+                        logger.error(f"Failed to process raw data: {e}")
+                        continue
+                    if deduplicate:
+                        if content_hash in seen:
+                            continue
+                        seen.add(content_hash)
+                    pending.append((item, content_hash))
+                if not pending:
+                    continue
+
+                futures = [
+                    executor.submit(
+                        self._build_unit, item, source, context, content_hash, []
+                    )
+                    for item, content_hash in pending
+                ]
+                vectors = self._embed_texts([str(item) for item, _ in pending])
+                for future, vector in zip(futures, vectors):
+                    try:
+                        unit = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process raw data: {e}")
+                        # Continue processing other items
+                        continue
+                    unit.metadata.semantic_vector = vector
+                    yield unit
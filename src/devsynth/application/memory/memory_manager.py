@@ -16,12 +16,19 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from ...config import get_settings
 from ...domain.interfaces.memory import MemoryStore
-from ...domain.models.memory import MemoryItem, MemoryItemType, MemoryType
+from ...domain.models.memory import (
+    MemoryItem,
+    MemoryItemType,
+    MemoryType,
+    MemoryVector,
+)
 from ...exceptions import CircuitBreakerOpenError, MemoryTransactionError
 from ...logging_setup import DevSynthLogger
 from .adapter_types import (
     AdapterRegistry,
     MemoryAdapter,
+    SupportsBulkStore,
+    SupportsBulkVectorStore,
     SupportsEdrrRetrieval,
     SupportsGraphQueries,
     SupportsRetrieve,
@@ -514,16 +521,7 @@ class MemoryManager:
             ValueError: If no adapters are available for storing memory items
             MemoryTransactionError: If all adapters fail to store the item
         """
-        # Define adapter preference order
-        adapter_preference = ["tinydb", "graph"]
-
-        # Add any other adapters not in the preference list
-        for adapter_name in self.adapters:
-            if adapter_name not in adapter_preference:
-                adapter_preference.append(adapter_name)
-
-        if not adapter_preference:
-            raise ValueError("No adapters available for storing memory items")
+        adapter_preference = self._store_preference()
 
         # Try adapters in order of preference
         errors: dict[str, str] = {}
@@ -579,6 +577,146 @@ class MemoryManager:
         logger.error(error_msg)
         raise MemoryTransactionError(error_msg, operation="store_item")
 
+    def _store_preference(self) -> list[str]:
+        """Return adapter names in the order writes should try them."""
+
+        # Define adapter preference order
+        adapter_preference = ["tinydb", "graph"]
+
+        # Add any other adapters not in the preference list
+        for adapter_name in self.adapters:
+            if adapter_name not in adapter_preference:
+                adapter_preference.append(adapter_name)
+
+        if not adapter_preference:
+            raise ValueError("No adapters available for storing memory items")
+        return adapter_preference
+
+    @staticmethod
+    def _store_each(adapter: MemoryStore, items: Sequence[MemoryItem]) -> list[str]:
+        return [adapter.store(item) for item in items]
+
+    def store_items(
+        self, memory_items: Sequence[MemoryItem], *, embed: bool = False
+    ) -> list[str]:
+        """
+        Store several memory items as one batch.
+
+        Adapters are tried in the same order as :meth:`store_item`. An adapter
+        implementing ``store_many`` receives the whole batch in one call;
+        other adapters store the items one by one. When a batch fails the next
+        adapter is tried with the whole batch, which is safe because items are
+        keyed by their IDs.
+
+        Args:
+            memory_items: The memory items to store
+            embed: Also write an embedding of each item to the ``vector``
+                adapter, if one is registered, in one ``store_vectors`` call
+                when the adapter supports it
+
+        Returns:
+            The IDs of the stored memory items
+
+        Raises:
+            MemoryTransactionError: If all adapters fail to store the batch
+        """
+        items = list(memory_items)
+        if not items:
+            return []
+
+        errors: dict[str, str] = {}
+        stored: list[str] | None = None
+        for adapter_name in self._store_preference():
+            adapter = self.adapters.get(adapter_name)
+            if adapter is None or not hasattr(adapter, "store"):
+                continue
+            circuit = circuit_breaker_registry.get_or_create(
+                f"memory_store_{adapter_name}", failure_threshold=3, reset_timeout=60.0
+            )
+            try:
+                if isinstance(adapter, SupportsBulkStore):
+                    stored = list(circuit.execute(adapter.store_many, items))
+                else:
+                    stored = circuit.execute(self._store_each, adapter, items)
+                break
+            except CircuitBreakerOpenError as e:
+                logger.warning(
+                    f"Circuit breaker for {adapter_name} is open, skipping: {e}"
+                )
+                errors[adapter_name] = f"Circuit breaker open: {e}"
+                memory_error_logger.log_error(
+                    operation="store_items",
+                    adapter_name=adapter_name,
+                    error=e,
+                    context={"item_count": len(items), "circuit_breaker": True},
+                )
+            except Exception as e:
+                logger.error(f"Failed to store memory items in {adapter_name}: {e}")
+                errors[adapter_name] = str(e)
+                memory_error_logger.log_error(
+                    operation="store_items",
+                    adapter_name=adapter_name,
+                    error=e,
+                    context={"item_count": len(items)},
+                )
+
+        if stored is None:
+            error_msg = f"Failed to store memory items in any adapter: {errors}"
+            logger.error(error_msg)
+            raise MemoryTransactionError(error_msg, operation="store_items")
+
+        vector_adapter = self.adapters.get("vector")
+        if embed and isinstance(vector_adapter, VectorStoreProtocol):
+            vectors = [
+                MemoryVector(
+                    id=item.id,
+                    content=item.content,
+                    embedding=self._embed_text(str(item.content)),
+                    metadata=dict(item.metadata or {}),
+                )
+                for item in items
+            ]
+            if isinstance(vector_adapter, SupportsBulkVectorStore):
+                vector_adapter.store_vectors(vectors)
+            else:
+                for vector in vectors:
+                    vector_adapter.store_vector(vector)
+        return stored
+
+    def delete_items(self, item_ids: Sequence[str]) -> int:
+        """
+        Delete memory items from every adapter that may hold them.
+
+        Items written by :meth:`store_items` can live in any adapter and may
+        also have an embedding in the ``vector`` adapter, so every adapter is
+        asked to delete every ID. Failures are logged and do not stop the
+        remaining deletions.
+
+        Args:
+            item_ids: The IDs of the memory items to delete
+
+        Returns:
+            The number of IDs deleted from at least one adapter
+        """
+        ids = list(dict.fromkeys(item_ids))
+        deleted: set[str] = set()
+        for adapter_name, adapter in self.adapters.items():
+            removers = []
+            if callable(getattr(adapter, "delete", None)):
+                removers.append(adapter.delete)
+            if isinstance(adapter, VectorStoreProtocol):
+                removers.append(adapter.delete_vector)
+            for remove in removers:
+                for item_id in ids:
+                    try:
+                        if remove(item_id):
+                            deleted.add(item_id)
+                    except Exception as e:
+                        logger.debug(
+                            f"Failed to delete {item_id} from {adapter_name}: {e}"
+                        )
+        return len(deleted)
+
     def query_by_type(self, memory_type: MemoryType) -> list[MemoryItem]:
         """
         Query memory items by type.
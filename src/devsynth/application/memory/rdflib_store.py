@@ -838,11 +838,15 @@ class RDFLibStore(MemoryStore, SupportsTransactions, VectorStore[MemoryVector]):
                 vector = self._triples_to_memory_vector(vector_uri)
                 if vector:
                     # Compute cosine similarity
-                    vector_embedding_np = np.array(vector.embedding)
+                    vector_embedding_np = np.frombuffer(
+                        vector.embedding_buffer, dtype=np.float32
+                    )
                     similarity = np.dot(query_embedding_np, vector_embedding_np) / (
                         np.linalg.norm(query_embedding_np)
                         * np.linalg.norm(vector_embedding_np)
                     )
+                    # float32 rounding can push identical vectors just past 1.
+                    similarity = min(1.0, float(similarity))
                     # Convert similarity to distance (1 - similarity)
                     distance = 1 - similarity
                     vectors_with_distances.append((vector, distance))
@@ -16,7 +16,7 @@ from contextlib import AbstractContextManager, contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
-from threading import Lock
+from threading import Lock, local
 from types import TracebackType
 from typing import TYPE_CHECKING, Protocol, TypedDict, cast
 
@@ -27,7 +27,14 @@ except Exception:  # pragma: no cover - optional dependency
 
 from ...domain.models.memory import MemoryItem, MemoryVector
 from ...logging_setup import DevSynthLogger
-from .adapter_types import AdapterRegistry, MemoryAdapter, SupportsSearch
+from .adapter_types import (
+    AdapterRegistry,
+    MemoryAdapter,
+    SupportsBulkStore,
+    SupportsChangeJournal,
+    SupportsSearch,
+)
+from .change_journal import VECTOR_OPS, ChangeJournal, JournalCursor, JournalEntry
 from .dto import (
     GroupedMemoryResults,
     MemoryQueryResults,
@@ -37,6 +44,7 @@ from .dto import (
 )
 from .tiered_cache import TieredCache
 from .transaction_context import AdapterSnapshot
+from .undo_log import RecordingAdapter, Savepoint, UndoLog
 from .vector_protocol import VectorStoreProtocol
 
 if TYPE_CHECKING:
@@ -209,6 +217,10 @@ class SyncManager:
         self.async_mode = async_mode
         # Dictionary to store active transactions
         self._active_transactions: dict[str, TransactionState] = {}
+        # Undo log of the outermost ``transaction`` open on each thread
+        self._undo_state = local()
+        # Journal position already shipped per (source, target) store pair
+        self._sync_cursors: dict[tuple[str, str], JournalCursor] = {}
 
     def _get_all_items(
         self, adapter: MemoryAdapter, *, store_name: str
@@ -318,19 +330,88 @@ class SyncManager:
         return [self._build_record(payload, source=source) for payload in payloads]
 
     # ------------------------------------------------------------------
+    def _begin_store_transaction(
+        self,
+        name: str,
+        adapter: MemoryAdapter,
+        transaction_id: str,
+        undo_log: UndoLog | None,
+        contexts: dict[str, TransactionContextManager],
+        txns: dict[str, object],
+        snapshots: dict[str, AdapterSnapshot],
+        vector_snapshots: dict[str, dict[str, MemoryVector]],
+    ) -> None:
+        """Enlist ``adapter`` using the cheapest mechanism it supports.
+
+        Native transactions are preferred. Otherwise, given an ``undo_log``,
+        ``txns[name]`` becomes a proxy that records writes made through it so
+        only touched keys are restored on rollback. Adapters that cannot
+        report before-images, or callers without an undo log, get a full
+        snapshot.
+        """
+
+        ctx = self._get_transaction_context(adapter, transaction_id)
+        if ctx is not None:
+            txns[name] = ctx.__enter__()
+            contexts[name] = ctx
+            return
+        recorder = undo_log.attach(name, adapter) if undo_log is not None else None
+        if recorder is not None:
+            txns[name] = recorder
+            logger.debug("Recording undo log for %s", name)
+            return
+
+        items = self._get_all_items(adapter, store_name=name)
+        vectors = self._get_all_vectors(adapter)
+        normalized = self._normalize_records(items, source=name)
+        snapshots[name] = {
+            "store": name,
+            "records": {record.id: record for record in normalized},
+        }
+        if vectors:
+            vector_snapshots[name] = {vec.id: deepcopy(vec) for vec in vectors}
+        logger.debug(
+            "Created snapshot for %s with %d items and %d vectors",
+            name,
+            len(snapshots[name]["records"]),
+            len(vector_snapshots.get(name, {})),
+        )
+
+    @staticmethod
+    def _writer(
+        txns: dict[str, object], name: str, adapter: MemoryAdapter
+    ) -> MemoryAdapter:
+        """Return the undo-log proxy for ``name`` if the transaction made one."""
+
+        handle = txns.get(name)
+        if isinstance(handle, RecordingAdapter):
+            return cast(MemoryAdapter, handle)
+        return adapter
+
     @contextmanager
     def transaction(self, stores: list[str]) -> Iterator[dict[str, object]]:
         """Context manager for multi-store transactions.
 
         This manager attempts to use native transaction support on each
-        adapter if available and falls back to snapshot/restore semantics
-        otherwise. All changes are rolled back if an exception occurs.
+        adapter if available. Otherwise it keeps an undo log of the
+        before-images of keys written inside the transaction, falling back to
+        snapshot/restore semantics for adapters that cannot provide them. All
+        changes are rolled back if an exception occurs.
+
+        Undo-logged stores are represented in the yielded mapping by a
+        :class:`~devsynth.application.memory.undo_log.RecordingAdapter`; only
+        writes made through it are rolled back. Writes made directly to the
+        adapter, such as those from other threads, are left untouched.
+
+        Nested calls on the same thread open a savepoint in the enclosing undo
+        log: a failure inside the nested block undoes only its own writes.
 
         Args:
             stores: List of store names to include in the transaction
 
         Yields:
-            Dictionary mapping store names to transaction objects
+            Dictionary mapping store names to transaction objects or recording
+            proxies
 
         Raises:
             Exception: If any error occurs during the transaction
@@ -343,88 +424,99 @@ class SyncManager:
         contexts: dict[str, TransactionContextManager] = {}
         txns: dict[str, object] = {}
 
-        # Track which stores are participating in the transaction
-        participating_stores: list[str] = []
-
-        # Begin transaction for each store
-        for name in stores:
-            adapter = self.memory_manager.adapters.get(name)
-            if adapter is None:
-                logger.warning(f"Store {name} not found, skipping")
-                continue
-
-            participating_stores.append(name)
-
-            try:
-                ctx = self._get_transaction_context(adapter, transaction_id)
-                if ctx is not None:
-                    txns[name] = ctx.__enter__()
-                    contexts[name] = ctx
-                else:
-                    items = self._get_all_items(adapter, store_name=name)
-                    vectors = self._get_all_vectors(adapter)
-                    normalized = self._normalize_records(items, source=name)
-                    snapshots[name] = {
-                        "store": name,
-                        "records": {record.id: record for record in normalized},
-                    }
-                    if vectors:
-                        vector_snapshots[name] = {
-                            vec.id: deepcopy(vec) for vec in vectors
-                        }
-                    logger.debug(
-                        "Created snapshot for %s with %d items and %d vectors",
-                        name,
-                        len(snapshots[name]["records"]),
-                        len(vector_snapshots.get(name, {})),
-                    )
-            except Exception as e:
-                logger.error(f"Error beginning transaction for {name}: {e}")
-                # Roll back any stores that were already set up
-                self._rollback_partial_transaction(
-                    contexts, snapshots, vector_snapshots
-                )
-                raise
+        enclosing: UndoLog | None = getattr(self._undo_state, "log", None)
+        undo_log = enclosing if enclosing is not None else UndoLog()
+        savepoint: Savepoint | None = None
+        if enclosing is None:
+            self._undo_state.log = undo_log
+        else:
+            savepoint = undo_log.savepoint()
 
         try:
-            # Yield the transaction objects to the caller
-            yield txns
+            # Begin transaction for each store
+            for name in stores:
+                adapter = self.memory_manager.adapters.get(name)
+                if adapter is None:
+                    logger.warning(f"Store {name} not found, skipping")
+                    continue
 
-            # If we get here, commit all transactions
-            for name, ctx in contexts.items():
                 try:
-                    ctx.__exit__(None, None, None)
-                    logger.debug(f"Committed transaction for {name}")
+                    self._begin_store_transaction(
+                        name,
+                        adapter,
+                        transaction_id,
+                        undo_log,
+                        contexts,
+                        txns,
+                        snapshots,
+                        vector_snapshots,
+                    )
                 except Exception as e:
-                    logger.error(f"Error committing transaction for {name}: {e}")
-                    # If a commit fails, we need to roll back all stores
+                    logger.error(f"Error beginning transaction for {name}: {e}")
+                    # Roll back any stores that were already set up
                     self._rollback_partial_transaction(
-                        contexts, snapshots, vector_snapshots
+                        contexts,
+                        snapshots,
+                        vector_snapshots,
+                        undo_log=undo_log,
+                        savepoint=savepoint,
                     )
                     raise
 
-            logger.debug(f"Transaction {transaction_id} committed successfully")
-
-            # Ensure all changes are persisted across stores
             try:
-                self.flush_queue()
-                if self.async_mode:
-                    asyncio.run(self.wait_for_async())
-                self.memory_manager.flush_updates()
-            except Exception as e:  # pragma: no cover - defensive
-                logger.error(
-                    f"Error flushing updates for transaction {transaction_id}: {e}"
-                )
-            # Cached queries may now be stale
-            self.clear_cache()
+                # Yield the transaction objects to the caller
+                yield txns
+
+                # If we get here, commit all transactions
+                for name, ctx in contexts.items():
+                    try:
+                        ctx.__exit__(None, None, None)
+                        logger.debug(f"Committed transaction for {name}")
+                    except Exception as e:
+                        logger.error(f"Error committing transaction for {name}: {e}")
+                        # If a commit fails, we need to roll back all stores
+                        self._rollback_partial_transaction(
+                            contexts,
+                            snapshots,
+                            vector_snapshots,
+                            undo_log=undo_log,
+                            savepoint=savepoint,
+                        )
+                        raise
 
-        except Exception as exc:
-            # Roll back all transactions
-            logger.error(f"Transaction {transaction_id} failed: {exc}")
-            self._rollback_partial_transaction(
-                contexts, snapshots, vector_snapshots, exc
-            )
-            raise
+                if savepoint is not None:
+                    undo_log.release(savepoint)
+                logger.debug(f"Transaction {transaction_id} committed successfully")
+
+                # Ensure all changes are persisted across stores
+                try:
+                    self.flush_queue()
+                    if self.async_mode:
+                        asyncio.run(self.wait_for_async())
+                    self.memory_manager.flush_updates()
+                except Exception as e:  # pragma: no cover - defensive
+                    logger.error(
+                        f"Error flushing updates for transaction {transaction_id}: {e}"
+                    )
+                # Cached queries may now be stale
+                self.clear_cache()
+
+            except Exception as exc:
+                # Roll back all transactions
+                logger.error(f"Transaction {transaction_id} failed: {exc}")
+                self._rollback_partial_transaction(
+                    contexts,
+                    snapshots,
+                    vector_snapshots,
+                    exc,
+                    undo_log=undo_log,
+                    savepoint=savepoint,
+                )
+                raise
+        finally:
+            if enclosing is None:
+                undo_log.detach()
+                self._undo_state.log = None
 
     def _rollback_partial_transaction(
         self,
@@ -432,6 +524,9 @@ class SyncManager:
         snapshots: dict[str, AdapterSnapshot],
         vector_snapshots: dict[str, dict[str, MemoryVector]],
         exc: Exception | None = None,
+        *,
+        undo_log: UndoLog | None = None,
+        savepoint: Savepoint | None = None,
     ) -> None:
         """
         Roll back a partially completed transaction.
@@ -441,6 +536,8 @@ class SyncManager:
             snapshots: Dictionary mapping store names to normalized snapshots
             vector_snapshots: Dictionary mapping store names to vector snapshots
             exc: Exception that caused the rollback, if any
+            undo_log: Undo log recording writes to the remaining stores
+            savepoint: Only undo writes made after this savepoint
         """
         rollback_errors = []
 
@@ -458,6 +555,13 @@ class SyncManager:
                 logger.error(error_msg)
                 rollback_errors.append(error_msg)
 
+        # Replay before-images for stores tracked by the undo log
+        if undo_log is not None:
+            if savepoint is not None:
+                rollback_errors.extend(undo_log.rollback_to(savepoint))
+            else:
+                rollback_errors.extend(undo_log.rollback())
+
         # Restore snapshots for stores without native transaction support
         for name, snap in snapshots.items():
             adapter = self.memory_manager.adapters.get(name)
@@ -514,22 +618,69 @@ class SyncManager:
         # Any cached query results are now stale
         self.clear_cache()
 
+    def _journal_for(self, adapter: MemoryAdapter) -> ChangeJournal | None:
+        if isinstance(adapter, SupportsChangeJournal) and isinstance(
+            adapter.change_journal, ChangeJournal
+        ):
+            return adapter.change_journal
+        return None
+
     def _sync_one_way(
-        self, source_adapter: MemoryAdapter, target_adapter: MemoryAdapter
+        self,
+        source_adapter: MemoryAdapter,
+        target_adapter: MemoryAdapter,
+        *,
+        route: tuple[str, str] | None = None,
+        cursors: dict[tuple[str, str], JournalCursor] | None = None,
     ) -> int:
         """Synchronize data from ``source_adapter`` to ``target_adapter``.
 
-        This helper performs a one-way sync of both memory items and vectors,
-        applying the conflict resolution strategy where necessary.
+        When the source keeps a :class:`ChangeJournal` and ``route`` names the
+        store pair, only the identifiers written since the last sync of that
+        pair are shipped. Otherwise, or when the journal cannot answer, every
+        item and vector is enumerated.
 
         Args:
             source_adapter: Adapter providing the items/vectors to copy
             target_adapter: Adapter receiving the synchronized data
+            route: ``(source, target)`` store names keying the sync cursor
+            cursors: Receives the advanced cursor instead of committing it
+                immediately, so callers can discard it if their transaction
+                rolls back
 
         Returns:
             int: Number of items/vectors synchronized
         """
 
+        journal = self._journal_for(source_adapter)
+        if route is None or journal is None:
+            return self._sync_all(source_adapter, target_adapter)
+
+        delta = journal.changes_since(self._sync_cursors.get(route))
+        if delta is None:
+            position = journal.position()
+            count = self._sync_all(source_adapter, target_adapter)
+        else:
+            entries, position = delta
+            count = self._sync_delta(source_adapter, target_adapter, entries)
+            logger.debug(
+                "Delta sync %s -> %s shipped %d of %d journaled changes",
+                route[0],
+                route[1],
+                count,
+                len(entries),
+            )
+        if cursors is None:
+            self._sync_cursors[route] = position
+        else:
+            cursors[route] = position
+        return count
+
+    def _sync_all(
+        self, source_adapter: MemoryAdapter, target_adapter: MemoryAdapter
+    ) -> int:
+        """Enumerate and synchronize every item and vector in the source."""
+
         count = 0
 
         # Synchronize memory items
@@ -572,6 +723,112 @@ class SyncManager:
 
         return count
 
+    def _sync_delta(
+        self,
+        source_adapter: MemoryAdapter,
+        target_adapter: MemoryAdapter,
+        entries: Sequence[JournalEntry],
+    ) -> int:
+        """Ship the current state of the identifiers named by ``entries``.
+
+        Journal entries only say which identifiers changed; the source is read
+        again so rolled back or superseded writes are never replayed. Items
+        already identical in the target are skipped, which keeps the reverse
+        pass of a bidirectional sync from echoing the forward pass back.
+        """
+
+        count = 0
+        source_label = self._adapter_label(source_adapter, "source")
+        outgoing: list[MemoryItem] = []
+        write_back: list[MemoryItem] = []
+        for entry in entries:
+            if entry.op in VECTOR_OPS:
+                count += self._sync_vector_change(source_adapter, target_adapter, entry)
+                continue
+            current_raw = (
+                source_adapter.retrieve(entry.item_id)
+                if hasattr(source_adapter, "retrieve")
+                else None
+            )
+            existing_raw = (
+                target_adapter.retrieve(entry.item_id)
+                if hasattr(target_adapter, "retrieve")
+                else None
+            )
+            if current_raw is None:
+                if (
+                    entry.op == "delete"
+                    and existing_raw is not None
+                    and hasattr(target_adapter, "delete")
+                ):
+                    target_adapter.delete(entry.item_id)
+                    count += 1
+                    self.stats.synchronized += 1
+                continue
+            item = self._build_record(current_raw, source=source_label).item
+            if existing_raw is None:
+                outgoing.append(item)
+                continue
+            existing = self._build_record(existing_raw, source=source_label).item
+            if not self._detect_conflict(existing, item):
+                continue
+            if self._resolve_conflict(existing, item) is item:
+                outgoing.append(item)
+            else:
+                write_back.append(existing)
+
+        if outgoing:
+            if isinstance(target_adapter, SupportsBulkStore):
+                target_adapter.store_many(outgoing)
+            elif hasattr(target_adapter, "store"):
+                for item in outgoing:
+                    target_adapter.store(item)
+            else:
+                outgoing = []
+            count += len(outgoing)
+            self.stats.synchronized += len(outgoing)
+        if write_back and hasattr(source_adapter, "store"):
+            for item in write_back:
+                source_adapter.store(item)
+        return count
+
+    def _sync_vector_change(
+        self,
+        source_adapter: MemoryAdapter,
+        target_adapter: MemoryAdapter,
+        entry: JournalEntry,
+    ) -> int:
+        vector = (
+            source_adapter.retrieve_vector(entry.item_id)
+            if hasattr(source_adapter, "retrieve_vector")
+            else None
+        )
+        existing = (
+            target_adapter.retrieve_vector(entry.item_id)
+            if hasattr(target_adapter, "retrieve_vector")
+            else None
+        )
+        if vector is None:
+            if (
+                entry.op == "delete_vector"
+                and existing is not None
+                and hasattr(target_adapter, "delete_vector")
+            ):
+                target_adapter.delete_vector(entry.item_id)
+            else:
+                return 0
+        elif existing is None and hasattr(target_adapter, "store_vector"):
+            target_adapter.store_vector(vector)
+        else:
+            return 0
+        self.stats.synchronized += 1
+        return 1
+
+    def reset_sync_cursors(self) -> None:
+        """Forget shipped journal positions so the next syncs enumerate stores."""
+
+        self._sync_cursors.clear()
+
     def synchronize(
         self, source: str, target: str, bidirectional: bool = False
     ) -> dict[str, int]:
@@ -591,14 +848,30 @@ class SyncManager:
             return {f"{source}_to_{target}": 0}
 
         result: dict[str, int] = {}
+        cursors: dict[tuple[str, str], JournalCursor] = {}
 
         # Execute synchronization inside a transaction for atomicity
-        with self.transaction([source, target]):
-            forward = self._sync_one_way(source_adapter, target_adapter)
+        with self.transaction([source, target]) as txns:
+            # Write through undo-log proxies so a failed sync is rolled back.
+            source_writer = self._writer(txns, source, source_adapter)
+            target_writer = self._writer(txns, target, target_adapter)
+            forward = self._sync_one_way(
+                source_writer,
+                target_writer,
+                route=(source, target),
+                cursors=cursors,
+            )
             result[f"{source}_to_{target}"] = forward
             if bidirectional:
-                reverse = self._sync_one_way(target_adapter, source_adapter)
+                reverse = self._sync_one_way(
+                    target_writer,
+                    source_writer,
+                    route=(target, source),
+                    cursors=cursors,
+                )
                 result[f"{target}_to_{source}"] = reverse
+        # Only advance cursors once the synchronized writes are committed
+        self._sync_cursors.update(cursors)
         try:
             self.memory_manager._notify_sync_hooks(None)
         except Exception as exc:
@@ -630,13 +903,20 @@ class SyncManager:
         if "faiss" in adapters:
             stores.append("faiss")
 
-        with self.transaction(stores):
-            if "lmdb" in adapters:
-                forward = self._sync_one_way(adapters["lmdb"], adapters["kuzu"])
-                results["lmdb_to_kuzu"] = forward
-            if "faiss" in adapters:
-                forward = self._sync_one_way(adapters["faiss"], adapters["kuzu"])
-                results["faiss_to_kuzu"] = forward
+        cursors: dict[tuple[str, str], JournalCursor] = {}
+        with self.transaction(stores) as txns:
+            writers = {
+                name: self._writer(txns, name, adapters[name]) for name in stores
+            }
+            for source in ("lmdb", "faiss"):
+                if source in adapters:
+                    results[f"{source}_to_kuzu"] = self._sync_one_way(
+                        writers[source],
+                        writers["kuzu"],
+                        route=(source, "kuzu"),
+                        cursors=cursors,
+                    )
+        self._sync_cursors.update(cursors)
 
         try:
             self.memory_manager._notify_sync_hooks(None)
@@ -930,26 +1210,22 @@ class SyncManager:
         contexts: dict[str, TransactionContextManager] = {}
         txns: dict[str, object] = {}
 
-        # Begin transaction for each store
+        # Callers write to the adapters directly rather than through handles,
+        # so stores without native transactions are snapshotted in full.
         for name in stores:
             adapter = self.memory_manager.adapters.get(name)
             if adapter is None:
                 continue
-            ctx = self._get_transaction_context(adapter, tx_id)
-            if ctx is not None:
-                txns[name] = ctx.__enter__()
-                contexts[name] = ctx
-                continue
-
-            items = self._get_all_items(adapter, store_name=name)
-            vectors = self._get_all_vectors(adapter)
-            normalized = self._normalize_records(items, source=name)
-            snapshots[name] = {
-                "store": name,
-                "records": {record.id: record for record in normalized},
-            }
-            if vectors:
-                vector_snapshots[name] = {vec.id: deepcopy(vec) for vec in vectors}
+            self._begin_store_transaction(
+                name,
+                adapter,
+                tx_id,
+                None,
+                contexts,
+                txns,
+                snapshots,
+                vector_snapshots,
+            )
 
         # Store transaction state
         self._active_transactions[tx_id] = TransactionState(
@@ -0,0 +1,305 @@
+"""Undo logs for memory transactions without native adapter support.
+
+Instead of snapshotting every item of every participating store up front,
+:class:`UndoLog` records the before-image of each key the first time it is
+written inside a transaction (or savepoint) and replays those images in
+reverse order on rollback. Overhead is therefore proportional to the write
+set rather than the size of the stores.
+
+Writes are observed through a :class:`RecordingAdapter`, a proxy scoped to
+one transaction that intercepts ``store``, ``store_many``, ``delete``,
+``store_vector``, ``store_vectors`` and ``delete_vector``. The adapter itself
+is never modified, so writes made directly to it, for example from other
+threads, are neither recorded nor undone. Before-images are read with ``retrieve``/
+``retrieve_vector``; adapters that cannot provide them are rejected by
+:meth:`UndoLog.attach` and the caller falls back to a full snapshot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Literal
+
+from ...domain.models.memory import MemoryItem, MemoryVector
+from ...logging_setup import DevSynthLogger
+from .adapter_types import MemoryAdapter
+from .dto import build_memory_record
+
+logger = DevSynthLogger(__name__)
+
+UndoKind = Literal["item", "vector"]
+
+_ITEM_WRITES = ("store", "store_many", "delete")
+_VECTOR_WRITES = ("store_vector", "store_vectors", "delete_vector")
+
+
+@dataclass(frozen=True, slots=True)
+class UndoEntry:
+    """Before-image of one key, captured on its first write in a segment.
+
+    ``before`` is ``None`` when the key did not exist, in which case undoing
+    the entry deletes it.
+    """
+
+    store: str
+    kind: UndoKind
+    key: str
+    before: MemoryItem | MemoryVector | None
+
+
+@dataclass(frozen=True, slots=True)
+class Savepoint:
+    """Marker returned by :meth:`UndoLog.savepoint`."""
+
+    depth: int
+    mark: int
+
+
+class RecordingAdapter:
+    """Transaction-scoped proxy that reports writes on one adapter to the log.
+
+    Write methods the adapter provides are intercepted; every other attribute
+    is read from the adapter itself, which is never modified. Once the owning
+    log is detached the proxy forwards writes without recording them.
+    """
+
+    def __init__(self, log: UndoLog, store: str, adapter: MemoryAdapter) -> None:
+        self._log: UndoLog | None = log
+        self._store_name = store
+        self._adapter = adapter
+        self._writers: dict[str, Callable[..., object]] = {
+            name: writer
+            for name, writer in (
+                ("store", self._store),
+                ("store_many", self._store_many),
+                ("delete", self._delete),
+                ("store_vector", self._store_vector),
+                ("store_vectors", self._store_vectors),
+                ("delete_vector", self._delete_vector),
+            )
+            if callable(getattr(adapter, name, None))
+        }
+
+    @staticmethod
+    def supports(adapter: MemoryAdapter) -> bool:
+        writes_items = any(callable(getattr(adapter, n, None)) for n in _ITEM_WRITES)
+        writes_vectors = any(
+            callable(getattr(adapter, n, None)) for n in _VECTOR_WRITES
+        )
+        if writes_items and not callable(getattr(adapter, "retrieve", None)):
+            return False
+        if writes_vectors and not callable(getattr(adapter, "retrieve_vector", None)):
+            return False
+        return writes_items or writes_vectors
+
+    @property
+    def adapter(self) -> MemoryAdapter:
+        """The wrapped adapter."""
+
+        return self._adapter
+
+    def __getattr__(self, name: str) -> object:
+        writer = self.__dict__.get("_writers", {}).get(name)
+        if writer is not None:
+            return writer
+        return getattr(self._adapter, name)
+
+    def _close(self) -> None:
+        self._log = None
+
+    # -- capture -------------------------------------------------------
+    def _before_item(self, key: str) -> MemoryItem | None:
+        raw = self._adapter.retrieve(key)
+        if raw is None:
+            return None
+        return deepcopy(build_memory_record(raw, source=self._store_name).item)
+
+    def _before_vector(self, key: str) -> MemoryVector | None:
+        raw = self._adapter.retrieve_vector(key)
+        return deepcopy(raw) if raw is not None else None
+
+    def _capture(self, kind: UndoKind, key: str) -> None:
+        log = self._log
+        if log is None or log._seen(self._store_name, kind, key):
+            return
+        before = self._before_item(key) if kind == "item" else self._before_vector(key)
+        log._append(UndoEntry(self._store_name, kind, key, before))
+
+    def _capture_new(self, kind: UndoKind, key: object) -> None:
+        # Keys generated by the adapter did not exist before the write.
+        log = self._log
+        if log is None or not isinstance(key, str) or not key:
+            return
+        if not log._seen(self._store_name, kind, key):
+            log._append(UndoEntry(self._store_name, kind, key, None))
+
+    def _store(self, item: MemoryItem, *args: object, **kwargs: object) -> object:
+        key = getattr(item, "id", None)
+        if key:
+            self._capture("item", key)
+        result = self._adapter.store(item, *args, **kwargs)
+        if not key:
+            self._capture_new("item", result)
+        return result
+
+    def _store_many(
+        self, items: Sequence[MemoryItem], *args: object, **kwargs: object
+    ) -> object:
+        items = list(items)
+        for item in items:
+            if item.id:
+                self._capture("item", item.id)
+        keyed = [bool(item.id) for item in items]
+        result = self._adapter.store_many(items, *args, **kwargs)
+        if isinstance(result, Sequence) and not isinstance(result, str):
+            for had_key, key in zip(keyed, result):
+                if not had_key:
+                    self._capture_new("item", key)
+        return result
+
+    def _delete(self, key: str, *args: object, **kwargs: object) -> object:
+        self._capture("item", key)
+        return self._adapter.delete(key, *args, **kwargs)
+
+    def _store_vector(
+        self, vector: MemoryVector, *args: object, **kwargs: object
+    ) -> object:
+        key = vector.id
+        if key:
+            self._capture("vector", key)
+        result = self._adapter.store_vector(vector, *args, **kwargs)
+        if not key:
+            self._capture_new("vector", result)
+        return result
+
+    def _store_vectors(
+        self, vectors: Sequence[MemoryVector], *args: object, **kwargs: object
+    ) -> object:
+        vectors = list(vectors)
+        for vector in vectors:
+            if vector.id:
+                self._capture("vector", vector.id)
+        keyed = [bool(vector.id) for vector in vectors]
+        result = self._adapter.store_vectors(vectors, *args, **kwargs)
+        if isinstance(result, Sequence) and not isinstance(result, str):
+            for had_key, key in zip(keyed, result):
+                if not had_key:
+                    self._capture_new("vector", key)
+        return result
+
+    def _delete_vector(self, key: str, *args: object, **kwargs: object) -> object:
+        self._capture("vector", key)
+        return self._adapter.delete_vector(key, *args, **kwargs)
+
+    # -- replay --------------------------------------------------------
+    def undo(self, entry: UndoEntry) -> None:
+        if entry.kind == "item":
+            if entry.before is None:
+                self._adapter.delete(entry.key)
+            else:
+                self._adapter.store(entry.before)
+        elif entry.before is None:
+            self._adapter.delete_vector(entry.key)
+        else:
+            self._adapter.store_vector(entry.before)
+
+
+class UndoLog:
+    """Ordered before-images for the stores attached to one transaction."""
+
+    def __init__(self) -> None:
+        self._entries: list[UndoEntry] = []
+        self._recorders: dict[str, RecordingAdapter] = {}
+        # Keys already captured, one set per open savepoint segment.
+        self._segments: list[set[tuple[str, UndoKind, str]]] = [set()]
+
+    def attach(self, store: str, adapter: MemoryAdapter) -> RecordingAdapter | None:
+        """Return a proxy recording writes to ``adapter``; ``None`` if unsupported.
+
+        Only writes made through the returned proxy are recorded. Attaching a
+        store twice returns the same proxy, so nested transactions share it.
+        """
+
+        recorder = self._recorders.get(store)
+        if recorder is not None:
+            return recorder
+        if not RecordingAdapter.supports(adapter):
+            return None
+        recorder = RecordingAdapter(self, store, adapter)
+        self._recorders[store] = recorder
+        return recorder
+
+    def is_attached(self, store: str) -> bool:
+        return store in self._recorders
+
+    def detach(self) -> None:
+        """Stop recording; the proxies keep forwarding writes unrecorded."""
+
+        for recorder in self._recorders.values():
+            recorder._close()
+        self._recorders.clear()
+
+    def savepoint(self) -> Savepoint:
+        """Open a nested segment that can be rolled back independently."""
+
+        self._segments.append(set())
+        return Savepoint(depth=len(self._segments) - 1, mark=len(self._entries))
+
+    def release(self, savepoint: Savepoint) -> None:
+        """Fold ``savepoint`` (and any inner segments) into its parent."""
+
+        while len(self._segments) > savepoint.depth:
+            inner = self._segments.pop()
+            self._segments[-1] |= inner
+
+    def rollback_to(self, savepoint: Savepoint) -> list[str]:
+        """Undo writes made since ``savepoint`` and close it.
+
+        Returns:
+            Error messages for entries that could not be restored.
+        """
+
+        errors = self._replay(savepoint.mark)
+        del self._segments[savepoint.depth :]
+        return errors
+
+    def rollback(self) -> list[str]:
+        """Undo every recorded write, newest first."""
+
+        errors = self._replay(0)
+        self._segments = [set()]
+        return errors
+
+    def stores(self) -> list[str]:
+        return list(self._recorders)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _seen(self, store: str, kind: UndoKind, key: str) -> bool:
+        return (store, kind, key) in self._segments[-1]
+
+    def _append(self, entry: UndoEntry) -> None:
+        self._segments[-1].add((entry.store, entry.kind, entry.key))
+        self._entries.append(entry)
+
+    def _replay(self, mark: int) -> list[str]:
+        errors: list[str] = []
+        while len(self._entries) > mark:
+            entry = self._entries.pop()
+            recorder = self._recorders.get(entry.store)
+            if recorder is None:  # pragma: no cover - defensive
+                continue
+            try:
+                recorder.undo(entry)
+                logger.debug("Restored %s %s in %s", entry.kind, entry.key, entry.store)
+            except Exception as exc:
+                errors.append(
+                    f"Error restoring {entry.kind} {entry.key} in {entry.store}: {exc}"
+                )
+        return errors
+
+
+__all__ = ["RecordingAdapter", "Savepoint", "UndoEntry", "UndoLog"]
@@ -22,9 +22,9 @@ logger = DevSynthLogger(__name__)
 from devsynth.exceptions import DevSynthError
 
 from ...adapters.orchestration.langgraph_adapter import (
-    FileSystemWorkflowRepository,
     LangGraphWorkflowEngine,
     NeedsHumanInterventionError,
+    SQLiteWorkflowRepository,
 )
 from ...domain.models.workflow import Workflow, WorkflowStatus, WorkflowStep
 from ...ports.orchestration_port import OrchestrationPort
@@ -43,7 +43,7 @@ class WorkflowManager:
             workflow_engine=LangGraphWorkflowEngine(
                 human_intervention_callback=self._handle_human_intervention
             ),
-            workflow_repository=FileSystemWorkflowRepository(),
+            workflow_repository=SQLiteWorkflowRepository(),
         )
 
     def _handle_human_intervention(
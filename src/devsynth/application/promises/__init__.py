@@ -30,6 +30,10 @@ from devsynth.application.promises.interface import (
     PromiseState,
     PromiseType,
 )
+from devsynth.application.promises.scheduler import (
+    TimeoutScheduler,
+    get_timeout_scheduler,
+)
 
 __all__ = [
     "IPromiseManager",
@@ -49,4 +53,6 @@ __all__ = [
     "CapabilityHandler",
     "AgentCapabilityError",
     "PromiseType",
+    "TimeoutScheduler",
+    "get_timeout_scheduler",
 ]
@@ -7,12 +7,11 @@ and track promise fulfillment.
 """
 
 import logging
-import threading
 import time
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional, Set, Type, Union
-from collections.abc import Callable
 
 from devsynth.exceptions import DevSynthError
 
@@ -24,6 +23,7 @@ from .broker import (
 )
 from .implementation import Promise
 from .interface import PromiseType
+from .scheduler import get_timeout_scheduler
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -122,8 +122,14 @@ class CapabilityHandler:
                 "execution_completed_at", datetime.now(UTC).isoformat()
             )
 
-            # Resolve the promise with the result
-            promise.resolve(result)
+            # Resolve the promise with the result unless it already timed out
+            if not promise.try_resolve(result):
+                logger.debug(
+                    "Promise %s settled before capability '%s' completed",
+                    promise_id,
+                    self.capability_name,
+                )
+                return
             logger.debug(
                 f"Capability '{self.capability_name}' executed successfully for promise {promise_id}"
             )
@@ -133,7 +139,7 @@ class CapabilityHandler:
             promise.set_metadata("error_message", str(e))
 
             # Reject the promise with the exception
-            promise.reject(e)
+            promise.try_reject(e)
             logger.error(
                 f"Capability '{self.capability_name}' execution failed for promise {promise_id}: {e}"
             )
@@ -302,23 +308,16 @@ class PromiseAgentMixin:
             promise.set_metadata("timeout", timeout)
             promise.set_metadata("requested_at", time.time())
 
-            # Start a timer to automatically reject the promise when the timeout expires
-            def _timeout_reject() -> None:
-                if promise.is_pending:
-                    error_msg = f"Capability request timed out after {timeout} seconds"
-                    promise.reject(TimeoutError(error_msg))
-
-            timer = threading.Timer(timeout, _timeout_reject)
-            timer.daemon = True
-            timer.start()
-            promise.set_metadata("_timeout_timer", timer)
-
-            # Cancel the timer when the promise is settled
-            def _cancel_timer(_: Any = None) -> None:
-                if timer.is_alive():
-                    timer.cancel()
+            # Schedule the rejection on the shared timeout scheduler instead of
+            # starting a thread per request
+            error_msg = f"Capability request timed out after {timeout} seconds"
+            handle = get_timeout_scheduler().schedule(
+                timeout, lambda: promise.try_reject(TimeoutError(error_msg))
+            )
+            promise.set_metadata("_timeout_handle", handle)
 
-            promise.then(lambda _: _cancel_timer(), lambda _: _cancel_timer())
+            # Cancel the scheduled rejection when the promise is settled
+            promise._add_callbacks(lambda _: handle.cancel(), lambda _: handle.cancel())
 
         # Otherwise no timeout timer is needed
 
@@ -352,23 +351,14 @@ class PromiseAgentMixin:
         if effective_timeout is None:
             effective_timeout = promise.get_metadata("timeout")
 
-        start_time = time.time()
-        while promise.is_pending:
-            # Check for timeout
-            if (
-                effective_timeout is not None
-                and time.time() - start_time > effective_timeout
-            ):
-                error_msg = (
-                    f"Capability request timed out after {effective_timeout} seconds"
-                )
-                promise.reject(TimeoutError(error_msg))
+        if not promise.wait(effective_timeout):
+            error_msg = (
+                f"Capability request timed out after {effective_timeout} seconds"
+            )
+            # The promise may still settle between the wait and the rejection
+            if promise.try_reject(TimeoutError(error_msg)):
                 raise TimeoutError(error_msg)
 
-            # Small sleep to avoid busy waiting; tuned for test stability
-            # Reduced from 0.1s to 0.02s to decrease flakiness in timer-based tests
-            time.sleep(0.02)
-
         # Promise is no longer pending
         if promise.is_rejected:
             # Re-raise the exception
@@ -3,11 +3,14 @@ Concrete implementation of the Promise system.
 Provides a Promise class that implements the PromiseInterface.
 """
 
+import asyncio
+import concurrent.futures
 import logging
+import threading
 import uuid
-from enum import Enum, auto
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any, Generic, TypeVar
 
 from devsynth.application.promises.interface import PromiseInterface
 from devsynth.exceptions import DevSynthError
@@ -46,23 +49,40 @@ class Promise(PromiseInterface[T], Generic[T]):
     DevSynth can analyze Promise instances to trace capability usage, dependency chains,
     and potential issues in asynchronous workflows.
 
+    Settlement and callback registration are guarded by a per-promise lock, so
+    a promise may be resolved, rejected and chained from any thread; exactly
+    one settlement wins.  Callbacks run inline on the settling thread unless
+    an executor is configured, either per promise or through
+    :meth:`set_default_executor`.  Promises can be awaited from asyncio code.
+
     Attributes:
         _state (PromiseState): Current state of the promise (pending, fulfilled, rejected)
         _value (T): Value with which the promise was fulfilled
         _reason (Exception): Reason why the promise was rejected
-        _on_fulfilled (List[Callable]): Callbacks to execute when the promise is fulfilled
-        _on_rejected (List[Callable]): Callbacks to execute when the promise is rejected
+        _callbacks (List[Tuple[Callable, Callable]]): Fulfillment and rejection
+            handlers waiting for settlement
         _id (str): Unique identifier for the promise, used for tracing and debugging
         _metadata (Dict[str, Any]): Additional metadata for DevSynth analysis
     """
 
-    def __init__(self):
-        """Initialize a new Promise in the pending state."""
+    _default_executor: Executor | None = None
+
+    def __init__(self, executor: Executor | None = None):
+        """Initialize a new Promise in the pending state.
+
+        Args:
+            executor: Executor used to run callbacks; defaults to the class-wide
+                executor, or inline dispatch when none is set.
+        """
         self._state: PromiseState = PromiseState.PENDING
         self._value: T | None = None
         self._reason: Exception | None = None
-        self._on_fulfilled: list[Callable] = []
-        self._on_rejected: list[Callable] = []
+        self._lock = threading.Lock()
+        self._callbacks: list[
+            tuple[Callable[[Any], None], Callable[[Exception], None]]
+        ] = []
+        self._settled_event: threading.Event | None = None
+        self._executor = executor
         self._id: str = str(uuid.uuid4())
         self._parent_id: str | None = None
         self._children_ids: list[str] = []
@@ -75,7 +95,15 @@ class Promise(PromiseInterface[T], Generic[T]):
             "tags": [],  # User-defined tags for filtering and grouping
         }
 
-        logger.debug(f"Promise {self._id} created in PENDING state")
+        logger.debug("Promise %s created in PENDING state", self._id)
+
+    @classmethod
+    def set_default_executor(cls, executor: Executor | None) -> None:
+        """Dispatch callbacks of promises without their own executor on ``executor``.
+
+        ``None`` restores inline dispatch on the settling thread.
+        """
+        cls._default_executor = executor
 
     @property
     def id(self) -> str:
@@ -175,7 +203,7 @@ class Promise(PromiseInterface[T], Generic[T]):
         """
         if child_id not in self._children_ids:
             self._children_ids.append(child_id)
-            logger.debug(f"Added child promise {child_id} to parent {self._id}")
+            logger.debug("Added child promise %s to parent %s", child_id, self._id)
 
     def set_metadata(self, key: str, value: Any) -> "Promise[T]":
         """
@@ -218,7 +246,7 @@ class Promise(PromiseInterface[T], Generic[T]):
         Returns:
             A new Promise resolving with the return value of the called callback.
         """
-        result_promise: Promise[S] = Promise()
+        result_promise: Promise[S] = Promise(self._executor)
 
         # Define handlers that will call the appropriate callback and resolve/reject the result promise
         def handle_fulfill(value: T) -> None:
@@ -243,20 +271,23 @@ class Promise(PromiseInterface[T], Generic[T]):
             except Exception as e:
                 result_promise.reject(e)
 
-        # If this promise is already fulfilled or rejected, call the appropriate handler immediately
-        if self._state == PromiseState.FULFILLED:
-            handle_fulfill(self._value)
-        elif self._state == PromiseState.REJECTED:
-            handle_reject(self._reason)
-        else:
-            # Otherwise, add the handlers to the callbacks to be called when this promise is settled
-            self._on_fulfilled.append(handle_fulfill)
-            self._on_rejected.append(handle_reject)
-
         # Link the result promise to this one for DevSynth tracing
         result_promise.set_metadata("parent_promise_id", self._id)
 
-        logger.debug(f"Promise {self._id} chained to new promise {result_promise.id}")
+        # If this promise is already fulfilled or rejected, call the appropriate
+        # handler now; otherwise queue both until it settles.
+        with self._lock:
+            state = self._state
+            if state == PromiseState.PENDING:
+                self._callbacks.append((handle_fulfill, handle_reject))
+        if state == PromiseState.FULFILLED:
+            self._dispatch(handle_fulfill, self._value)
+        elif state == PromiseState.REJECTED:
+            self._dispatch(handle_reject, self._reason)
+
+        logger.debug(
+            "Promise %s chained to new promise %s", self._id, result_promise.id
+        )
         return result_promise
 
     def catch(self, on_rejected: Callable[[Exception], S]) -> "Promise[S]":
@@ -276,7 +307,7 @@ class Promise(PromiseInterface[T], Generic[T]):
         Resolves the promise with a given value.
         To be used by the promise's creator.
 
-        DevSynth Tracing Hint: This transition is logged with promise ID and resolved value.
+        DevSynth Tracing Hint: This transition is logged with the promise ID.
 
         Args:
             value: The value with which to resolve the promise
@@ -284,26 +315,9 @@ class Promise(PromiseInterface[T], Generic[T]):
         Raises:
             PromiseStateError: If the promise is already fulfilled or rejected
         """
-        if self._state != PromiseState.PENDING:
+        if not self._settle(PromiseState.FULFILLED, value):
             raise PromiseStateError(f"Cannot resolve promise in state {self._state}")
 
-        self._state = PromiseState.FULFILLED
-        self._value = value
-        self._metadata["resolved_at"] = None  # Will be set by calling code
-
-        logger.debug(f"Promise {self._id} resolved with value: {value}")
-
-        # Call all the on_fulfilled callbacks with the value
-        for callback in self._on_fulfilled:
-            try:
-                callback(value)
-            except Exception as e:
-                logger.error(f"Error in promise callback: {e}")
-
-        # Clear the callback lists to avoid memory leaks
-        self._on_fulfilled = []
-        self._on_rejected = []
-
     def reject(self, reason: Exception) -> None:
         """
         Rejects the promise with a given reason (error).
@@ -317,25 +331,158 @@ class Promise(PromiseInterface[T], Generic[T]):
         Raises:
             PromiseStateError: If the promise is already fulfilled or rejected
         """
-        if self._state != PromiseState.PENDING:
+        if not self._settle(PromiseState.REJECTED, reason):
             raise PromiseStateError(f"Cannot reject promise in state {self._state}")
 
-        self._state = PromiseState.REJECTED
-        self._reason = reason
-        self._metadata["rejected_at"] = None  # Will be set by calling code
+    def try_resolve(self, value: T) -> bool:
+        """Resolve the promise unless it has already settled.
+
+        Returns:
+            True if this call settled the promise.
+        """
+        return self._settle(PromiseState.FULFILLED, value)
+
+    def try_reject(self, reason: Exception) -> bool:
+        """Reject the promise unless it has already settled.
+
+        Returns:
+            True if this call settled the promise.
+        """
+        return self._settle(PromiseState.REJECTED, reason)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the promise settles.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            True if the promise has settled, False if the timeout expired.
+        """
+        with self._lock:
+            if self._state != PromiseState.PENDING:
+                return True
+            if self._settled_event is None:
+                self._settled_event = threading.Event()
+            event = self._settled_event
+        return event.wait(timeout)
+
+    def to_asyncio(
+        self, loop: asyncio.AbstractEventLoop | None = None
+    ) -> "asyncio.Future[T]":
+        """Return an :class:`asyncio.Future` that settles with this promise.
+
+        Args:
+            loop: Event loop owning the future; defaults to the running loop.
+        """
+        loop = loop or asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+
+        def set_result(value: T) -> None:
+            if not future.done():
+                future.set_result(value)
+
+        def set_exception(reason: Exception) -> None:
+            if not future.done():
+                future.set_exception(reason)
+
+        def on_fulfilled(value: T) -> None:
+            loop.call_soon_threadsafe(set_result, value)
+
+        def on_rejected(reason: Exception) -> None:
+            loop.call_soon_threadsafe(set_exception, reason)
+
+        self._add_callbacks(on_fulfilled, on_rejected)
+        return future
+
+    def __await__(self):
+        """Allow ``await promise`` inside a running event loop."""
+        return self.to_asyncio().__await__()
+
+    @staticmethod
+    def from_future(
+        future: "asyncio.Future[Any] | concurrent.futures.Future[Any]",
+    ) -> "Promise[Any]":
+        """Create a promise that settles with an asyncio or concurrent future.
+
+        Cancellation rejects the promise with a :class:`PromiseError`.
+        """
+        promise: Promise[Any] = Promise()
 
-        logger.debug(f"Promise {self._id} rejected with reason: {reason}")
+        def done(completed: Any) -> None:
+            if completed.cancelled():
+                promise.try_reject(PromiseError("Future was cancelled"))
+                return
+            error = completed.exception()
+            if error is None:
+                promise.try_resolve(completed.result())
+            elif isinstance(error, Exception):
+                promise.try_reject(error)
+            else:  # pragma: no cover - BaseException subclasses
+                promise.try_reject(PromiseError(repr(error)))
+
+        future.add_done_callback(done)
+        return promise
 
-        # Call all the on_rejected callbacks with the reason
-        for callback in self._on_rejected:
+    def _add_callbacks(
+        self,
+        on_fulfilled: Callable[[Any], None],
+        on_rejected: Callable[[Exception], None],
+    ) -> None:
+        with self._lock:
+            state = self._state
+            if state == PromiseState.PENDING:
+                self._callbacks.append((on_fulfilled, on_rejected))
+                return
+        if state == PromiseState.FULFILLED:
+            self._dispatch(on_fulfilled, self._value)
+        else:
+            self._dispatch(on_rejected, self._reason)
+
+    def _settle(self, state: PromiseState, outcome: Any) -> bool:
+        """Atomically move out of PENDING and run the queued callbacks."""
+        with self._lock:
+            if self._state != PromiseState.PENDING:
+                return False
+            if state == PromiseState.FULFILLED:
+                self._value = outcome
+                self._metadata["resolved_at"] = None  # Will be set by calling code
+            else:
+                self._reason = outcome
+                self._metadata["rejected_at"] = None  # Will be set by calling code
+            self._state = state
+            # Detach the callback list to avoid memory leaks
+            callbacks, self._callbacks = self._callbacks, []
+            event = self._settled_event
+
+        if state == PromiseState.FULFILLED:
+            logger.debug("Promise %s resolved", self._id)
+        else:
+            logger.debug("Promise %s rejected with reason: %s", self._id, outcome)
+
+        if event is not None:
+            event.set()
+        index = 0 if state == PromiseState.FULFILLED else 1
+        for pair in callbacks:
+            self._dispatch(pair[index], outcome)
+        return True
+
+    def _dispatch(self, callback: Callable[[Any], None], outcome: Any) -> None:
+        executor = self._executor or Promise._default_executor
+        if executor is not None:
             try:
-                callback(reason)
-            except Exception as e:
-                logger.error(f"Error in promise callback: {e}")
+                executor.submit(self._invoke, callback, outcome)
+                return
+            except RuntimeError:  # pragma: no cover - executor shut down
+                pass
+        self._invoke(callback, outcome)
 
-        # Clear the callback lists to avoid memory leaks
-        self._on_fulfilled = []
-        self._on_rejected = []
+    @staticmethod
+    def _invoke(callback: Callable[[Any], None], outcome: Any) -> None:
+        try:
+            callback(outcome)
+        except Exception as e:
+            logger.error(f"Error in promise callback: {e}")
 
     @staticmethod
     def resolve_value(value: T) -> "Promise[T]":
@@ -368,7 +515,7 @@ class Promise(PromiseInterface[T], Generic[T]):
         return promise
 
     @staticmethod
-    def all(promises: list["Promise[Any]"]) -> "Promise[List[Any]]":
+    def all(promises: list["Promise[Any]"]) -> "Promise[list[Any]]":
         """
         Returns a promise that resolves when all of the promises in the iterable argument
         have resolved, or rejects with the reason of the first passed promise that rejects.
@@ -385,23 +532,23 @@ class Promise(PromiseInterface[T], Generic[T]):
         result_promise = Promise[list[Any]]()
         results = [None] * len(promises)
         pending_count = len(promises)
+        count_lock = threading.Lock()
 
         def on_fulfill(index: int) -> Callable[[Any], None]:
             def handle(value: Any) -> None:
                 nonlocal pending_count
                 results[index] = value
-                pending_count -= 1
+                with count_lock:
+                    pending_count -= 1
+                    done = pending_count == 0
 
-                if pending_count == 0:
-                    result_promise.resolve(results)
+                if done:
+                    result_promise.try_resolve(results)
 
             return handle
 
-        def on_reject(reason: Exception) -> None:
-            result_promise.reject(reason)
-
         for i, promise in enumerate(promises):
-            promise.then(on_fulfill(i), on_reject)
+            promise._add_callbacks(on_fulfill(i), result_promise.try_reject)
 
         return result_promise
 
@@ -422,13 +569,9 @@ class Promise(PromiseInterface[T], Generic[T]):
 
         result_promise = Promise[T]()
 
-        def on_fulfill(value: T) -> None:
-            result_promise.resolve(value)
-
-        def on_reject(reason: Exception) -> None:
-            result_promise.reject(reason)
-
         for promise in promises:
-            promise.then(on_fulfill, on_reject)
+            promise._add_callbacks(
+                result_promise.try_resolve, result_promise.try_reject
+            )
 
         return result_promise
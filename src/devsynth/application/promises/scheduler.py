@@ -0,0 +1,128 @@
+"""
+Shared timeout scheduler for the Promise system.
+
+A single daemon thread services every promise timeout through a deadline
+heap, so the number of threads stays constant no matter how many capability
+requests are in flight.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ScheduledCall", "TimeoutScheduler", "get_timeout_scheduler"]
+
+
+def _noop() -> None:
+    return None
+
+
+class ScheduledCall:
+    """Handle for a callback registered with :class:`TimeoutScheduler`."""
+
+    __slots__ = ("deadline", "callback", "cancelled", "fired", "_scheduler")
+
+    def __init__(
+        self,
+        deadline: float,
+        callback: Callable[[], None],
+        scheduler: TimeoutScheduler,
+    ) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+        self.fired = False
+        self._scheduler = scheduler
+
+    def cancel(self) -> None:
+        """Prevent the callback from running; safe to call repeatedly."""
+        if not (self.cancelled or self.fired):
+            self._scheduler._cancel(self)
+
+
+class TimeoutScheduler:
+    """Run callbacks after a delay on one shared worker thread.
+
+    Cancelled entries stay in the heap until they surface or until they make
+    up more than half of it, at which point the heap is rebuilt.
+    """
+
+    def __init__(self, name: str = "devsynth-promise-timeouts") -> None:
+        self._name = name
+        self._heap: list[tuple[float, int, ScheduledCall]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> ScheduledCall:
+        """Run ``callback`` after ``delay`` seconds unless cancelled first."""
+        call = ScheduledCall(time.monotonic() + max(0.0, delay), callback, self)
+        with self._condition:
+            heapq.heappush(self._heap, (call.deadline, next(self._counter), call))
+            if self._heap[0][2] is call:
+                self._condition.notify()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+        return call
+
+    def pending(self) -> int:
+        """Number of scheduled, not yet cancelled callbacks."""
+        with self._condition:
+            return len(self._heap) - self._cancelled
+
+    def _cancel(self, call: ScheduledCall) -> None:
+        with self._condition:
+            if call.cancelled or call.fired:
+                return
+            call.cancelled = True
+            call.callback = _noop  # release whatever the callback captured
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                        self._cancelled -= 1
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        _, _, call = heapq.heappop(self._heap)
+                        call.fired = True
+                        break
+                    self._condition.wait(delay)
+            try:
+                call.callback()
+            except Exception:  # pragma: no cover - defensive logging
+                logger.exception("Scheduled promise callback failed")
+
+
+_default_scheduler: TimeoutScheduler | None = None
+_default_lock = threading.Lock()
+
+
+def get_timeout_scheduler() -> TimeoutScheduler:
+    """Return the process-wide scheduler used for promise timeouts."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = TimeoutScheduler()
+        return _default_scheduler
@@ -5,12 +5,17 @@ This module provides components for dynamically adjusting LLM prompts based on f
 
 from __future__ import annotations
 
+import atexit
 import hashlib
+import math
 import random
 import re
-from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+import threading
+import weakref
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
 
@@ -21,20 +26,31 @@ else:  # pragma: no cover - simple import branch
 
 from ...logging_setup import DevSynthLogger
 from .models import (
+    SELECTION_STRATEGIES,
     PromptVariant,
     PromptVariantCollection,
     SelectionStrategyConfig,
     SelectionStrategyName,
 )
 from .persistence import (
+    DebouncedVariantWriter,
+    PromptVariantsDocument,
     PromptVariantStorageError,
     load_prompt_variants,
-    save_prompt_variants,
 )
 
 logger = DevSynthLogger(__name__)
 
 
+_tuners_pending_flush: weakref.WeakSet[PromptAutoTuner] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for tuner in list(_tuners_pending_flush):
+        tuner.flush()
+
+
 class PromptAutoTuningError(DevSynthErrorBase):
     """Error raised when prompt auto-tuning fails."""
 
@@ -48,18 +64,33 @@ class PromptAutoTuner:
     This class maintains a collection of prompt variants for different templates,
     tracks their performance, and selects the best variants based on feedback.
     It also generates new variants through mutation and recombination.
+
+    Besides the original heuristics, the ``"thompson"`` and ``"ucb"``
+    strategies treat variants as bandit arms whose statistics are updated in
+    constant time per feedback event.  New variants are bred off the request
+    path on a background worker, and saves are debounced so a burst of
+    feedback results in a single write.
     """
 
     def __init__(
         self,
         storage_path: str | Path | None = None,
         selection: SelectionStrategyConfig | None = None,
+        *,
+        background_generation: bool = True,
+        save_interval: float = 1.0,
+        max_variants: int = 8,
     ) -> None:
         """
         Initialize the prompt auto-tuner.
 
         Args:
             storage_path: Optional path to store prompt variants
+            selection: Variant selection strategy configuration
+            background_generation: Breed new variants on a worker thread
+                instead of inside :meth:`record_feedback`
+            save_interval: Minimum seconds between writes to storage
+            max_variants: Upper bound on variants kept per template
         """
         self.storage_path: Path | None = Path(storage_path) if storage_path else None
         self.prompt_variants = PromptVariantCollection()
@@ -68,11 +99,26 @@ class PromptAutoTuner:
         )
         self._selection.validate()
         self._best_variant_ids: dict[str, str] = {}
+        self._variant_positions: dict[str, dict[str, int]] = {}
+        self.background_generation = background_generation
+        self.max_variants = max(1, max_variants)
+        self._lock = threading.RLock()
+        self._generation_lock = threading.Lock()
+        self._pending_generation: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._writer: DebouncedVariantWriter | None = None
 
         logger.info("Prompt Auto-Tuner initialized")
 
         # Load variants from storage if available
         if self.storage_path:
+            self._writer = DebouncedVariantWriter(
+                self.storage_path,
+                self._snapshot,
+                interval=save_interval,
+                on_error=self._log_save_error,
+            )
+            _tuners_pending_flush.add(self)
             self._load_variants()
 
     @property
@@ -83,7 +129,7 @@ class PromptAutoTuner:
 
     @selection_strategy.setter
     def selection_strategy(self, value: SelectionStrategyName) -> None:
-        if value not in ("performance", "exploration", "random"):
+        if value not in SELECTION_STRATEGIES:
             msg = f"Unsupported selection strategy: {value}"
             raise PromptAutoTuningError(msg)
         self._selection.name = value
@@ -142,50 +188,106 @@ class PromptAutoTuner:
             return selected
 
         # Select a variant based on the current strategy
-        if self.selection_strategy == "performance":
+        strategy = self.selection_strategy
+        if strategy == "performance":
             # If exploration rate is 0, always select the best variant
             if self.exploration_rate == 0.0:
-                # Find the best variant by performance score
-                best_variant = max(variants, key=lambda v: v.performance_score)
-                selected = best_variant
-
+                selected = None
                 # If we've already identified a best variant for this template, use it
-                if template_id in self._best_variant_ids:
-                    best_id = self._best_variant_ids[template_id]
-                    for v in variants:
-                        if v.variant_id == best_id:
-                            selected = v
-                            break
-                else:
-                    # Otherwise, store the current best variant ID
-                    self._best_variant_ids[template_id] = selected.variant_id
+                best_id = self._best_variant_ids.get(template_id)
+                if best_id is not None:
+                    selected = self._find_variant(template_id, best_id)
+                if selected is None:
+                    selected = max(variants, key=lambda v: v.performance_score)
+                    if best_id is None:
+                        self._best_variant_ids[template_id] = selected.variant_id
             # Otherwise, select the best variant most of the time
             elif random.random() > self.exploration_rate:
-                # Sort by performance score (descending)
-                sorted_variants = sorted(
-                    variants, key=lambda v: v.performance_score, reverse=True
-                )
-                selected = sorted_variants[0]
+                selected = max(variants, key=lambda v: v.performance_score)
             else:
                 # Occasionally select a random variant for exploration
                 selected = random.choice(variants)
-        elif self.selection_strategy == "exploration":
+        elif strategy == "exploration":
             # Use a weighted random selection based on inverse usage count
             # This favors variants that have been used less
             weights = [1.0 / (v.usage_count + 1) for v in variants]
-            total_weight = sum(weights)
-            normalized_weights = [w / total_weight for w in weights]
-            selected = random.choices(variants, weights=normalized_weights, k=1)[0]
+            selected = random.choices(variants, weights=weights, k=1)[0]
+        elif strategy == "thompson":
+            selected = self._thompson_sample(variants)
+        elif strategy == "ucb":
+            selected = self._upper_confidence_bound(variants)
         else:  # "random"
             selected = random.choice(variants)
 
         selected.record_usage()
-        logger.info(
-            f"Selected prompt variant '{selected.variant_id}' for template '{template_id}'"
+        logger.debug(
+            "Selected prompt variant '%s' for template '%s'",
+            selected.variant_id,
+            template_id,
         )
 
         return selected
 
+    @staticmethod
+    def _thompson_sample(variants: list[PromptVariant]) -> PromptVariant:
+        """Pick the variant with the highest draw from its reward posterior."""
+
+        best: PromptVariant = variants[0]
+        best_draw = -1.0
+        for variant in variants:
+            draw = random.betavariate(*variant.reward_posterior)
+            if draw > best_draw:
+                best, best_draw = variant, draw
+        return best
+
+    def _upper_confidence_bound(self, variants: list[PromptVariant]) -> PromptVariant:
+        """Pick the variant with the highest UCB1 score.
+
+        Variants without any rewarded trial are tried first.
+        """
+
+        trials: list[float] = []
+        for variant in variants:
+            count = (
+                variant.success_count
+                + variant.failure_count
+                + len(variant.feedback_scores)
+            )
+            if count == 0:
+                return variant
+            trials.append(count)
+
+        log_total = math.log(sum(trials))
+        confidence = self._selection.ucb_confidence
+        best: PromptVariant = variants[0]
+        best_score = -math.inf
+        for variant, count in zip(variants, trials):
+            alpha, _ = variant.reward_posterior
+            mean = (alpha - 1.0) / count
+            score = mean + math.sqrt(confidence * log_total / count)
+            if score > best_score:
+                best, best_score = variant, score
+        return best
+
+    def _find_variant(self, template_id: str, variant_id: str) -> PromptVariant | None:
+        """Look up a variant by id through a position index."""
+
+        variants = self.prompt_variants[template_id]
+        positions = self._variant_positions.get(template_id)
+        if positions is not None:
+            index = positions.get(variant_id)
+            if index is not None and index < len(variants):
+                if variants[index].variant_id == variant_id:
+                    return variants[index]
+
+        # The list changed behind our back; rebuild the index.
+        positions = {}
+        for index, variant in enumerate(variants):
+            positions.setdefault(variant.variant_id, index)
+        self._variant_positions[template_id] = positions
+        index = positions.get(variant_id)
+        return variants[index] if index is not None else None
+
     def record_feedback(
         self,
         template_id: str,
@@ -203,19 +305,21 @@ class PromptAutoTuner:
             feedback_score: Optional feedback score (0.0 to 1.0)
 
         Raises:
-            PromptAutoTuningError: If the template or variant is not found
+            PromptAutoTuningError: If the template or variant is not found, or
+                the feedback score lies outside ``[0.0, 1.0]``
         """
+        if feedback_score is not None and not 0.0 <= feedback_score <= 1.0:
+            raise PromptAutoTuningError(
+                f"Feedback score must be between 0.0 and 1.0, got {feedback_score}"
+            )
+
         if template_id not in self.prompt_variants:
             raise PromptAutoTuningError(
                 f"Template '{template_id}' not registered for auto-tuning"
             )
 
         # Find the variant
-        variant = None
-        for v in self.prompt_variants[template_id]:
-            if v.variant_id == variant_id:
-                variant = v
-                break
+        variant = self._find_variant(template_id, variant_id)
 
         if variant is None:
             raise PromptAutoTuningError(
@@ -223,10 +327,14 @@ class PromptAutoTuner:
             )
 
         # Record the feedback
-        variant.record_usage(success, feedback_score)
-
-        logger.info(
-            f"Recorded feedback for prompt variant '{variant_id}': success={success}, score={feedback_score}"
+        with self._lock:
+            variant.record_usage(success, feedback_score)
+
+        logger.debug(
+            "Recorded feedback for prompt variant '%s': success=%s, score=%s",
+            variant_id,
+            success,
+            feedback_score,
         )
 
         # Save variants to storage if available
@@ -234,7 +342,66 @@ class PromptAutoTuner:
             self._save_variants()
 
         # Generate new variants if needed
-        self._generate_variants_if_needed(template_id)
+        with self._lock:
+            scheduled = template_id not in self._pending_generation
+            self._pending_generation.add(template_id)
+        if not self.background_generation:
+            self.generate_variants(template_id)
+        elif scheduled:
+            self._get_executor().submit(self._generate_in_background, template_id)
+
+    def generate_variants(self, template_id: str) -> None:
+        """Run any pending variant generation for ``template_id`` now.
+
+        Generation requested by :meth:`record_feedback` normally happens on a
+        background worker; calling this waits for, or performs, that step.
+        """
+
+        with self._generation_lock:
+            with self._lock:
+                if template_id not in self._pending_generation:
+                    return
+                self._pending_generation.discard(template_id)
+            before = len(self.prompt_variants[template_id])
+            self._generate_variants_if_needed(template_id)
+            if len(self.prompt_variants[template_id]) != before and self.storage_path:
+                self._save_variants()
+
+    def flush(self) -> None:
+        """Finish pending generation and write outstanding changes."""
+
+        with self._lock:
+            pending = list(self._pending_generation)
+        for template_id in pending:
+            self.generate_variants(template_id)
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush pending work and stop the background worker."""
+
+        self.flush()
+        _tuners_pending_flush.discard(self)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _generate_in_background(self, template_id: str) -> None:
+        try:
+            self.generate_variants(template_id)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error(
+                "Variant generation failed for template '%s': %s", template_id, exc
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="devsynth-prompt-tuning"
+                )
+            return self._executor
 
     def _generate_variants_if_needed(self, template_id: str) -> None:
         """
@@ -246,13 +413,16 @@ class PromptAutoTuner:
         variants = self.prompt_variants[template_id]
 
         # Generate new variants if we have enough usage data
-        if len(variants) < 5 and any(v.usage_count >= 5 for v in variants):
+        if len(variants) < min(5, self.max_variants) and any(
+            v.usage_count >= 5 for v in variants
+        ):
             # Find the best performing variant
             best_variant = max(variants, key=lambda v: v.performance_score)
 
             # Generate a new variant through mutation
             new_variant = self._mutate_variant(best_variant)
-            self.prompt_variants[template_id].append(new_variant)
+            with self._lock:
+                self.prompt_variants[template_id].append(new_variant)
 
             # Record initial usage to ensure the variant has usage data
             new_variant.record_usage()
@@ -262,7 +432,10 @@ class PromptAutoTuner:
             )
 
         # If we have multiple variants with enough usage data, try recombination
-        if len(variants) >= 2 and sum(1 for v in variants if v.usage_count >= 5) >= 2:
+        if (
+            2 <= len(variants) < self.max_variants
+            and sum(1 for v in variants if v.usage_count >= 5) >= 2
+        ):
             # Sort by performance score (descending)
             sorted_variants = sorted(
                 variants, key=lambda v: v.performance_score, reverse=True
@@ -273,7 +446,8 @@ class PromptAutoTuner:
                 new_variant = self._recombine_variants(
                     sorted_variants[0], sorted_variants[1]
                 )
-                self.prompt_variants[template_id].append(new_variant)
+                with self._lock:
+                    self.prompt_variants[template_id].append(new_variant)
 
                 # Record initial usage to ensure the variant has usage data
                 new_variant.record_usage()
@@ -554,26 +728,21 @@ class PromptAutoTuner:
         )
 
     def _save_variants(self) -> None:
-        """Save prompt variants to storage."""
+        """Request a debounced save of the prompt variants."""
 
-        if not self.storage_path:
-            return
+        if self._writer is not None:
+            self._writer.request()
 
-        data = {
-            template_id: [variant.to_dict() for variant in variants]
-            for template_id, variants in self.prompt_variants.items()
-        }
+    def _snapshot(self) -> PromptVariantsDocument:
+        with self._lock:
+            return {
+                template_id: [variant.to_dict() for variant in variants]
+                for template_id, variants in self.prompt_variants.items()
+            }
 
-        try:
-            save_prompt_variants(self.storage_path, data)
-        except PromptVariantStorageError as exc:
-            logger.error(f"Failed to save prompt variants to storage: {exc}")
-            return
-
-        logger.info(
-            "Saved %s prompt variants to storage",
-            self.prompt_variants.total_variants(),
-        )
+    @staticmethod
+    def _log_save_error(exc: PromptVariantStorageError) -> None:
+        logger.error(f"Failed to save prompt variants to storage: {exc}")
 
 
 class BasicPromptTuner:
@@ -646,6 +815,7 @@ def run_tuning_iteration(
         success=score > 0.5,
         feedback_score=score,
     )
+    tuner.generate_variants(template_id)
     return max(tuner.prompt_variants[template_id], key=lambda v: v.performance_score)
 
 
@@ -3,12 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterator, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, TypedDict
-from collections.abc import Iterator, MutableMapping, Sequence
-
-from typing import Literal
+from typing import Literal, Optional, TypedDict
 
 
 class StoredPromptVariant(TypedDict):
@@ -23,7 +21,17 @@ class StoredPromptVariant(TypedDict):
     last_used: str | None
 
 
-SelectionStrategyName = Literal["performance", "exploration", "random"]
+SelectionStrategyName = Literal[
+    "performance", "exploration", "random", "thompson", "ucb"
+]
+
+SELECTION_STRATEGIES: tuple[SelectionStrategyName, ...] = (
+    "performance",
+    "exploration",
+    "random",
+    "thompson",
+    "ucb",
+)
 
 
 @dataclass
@@ -32,6 +40,7 @@ class SelectionStrategyConfig:
 
     name: SelectionStrategyName = "performance"
     exploration_rate: float = 0.2
+    ucb_confidence: float = 2.0
 
     def validate(self) -> None:
         """Validate the configuration values."""
@@ -39,11 +48,18 @@ class SelectionStrategyConfig:
         if not 0.0 <= self.exploration_rate <= 1.0:
             msg = "exploration_rate must be between 0.0 and 1.0"
             raise ValueError(msg)
+        if self.ucb_confidence < 0.0:
+            msg = "ucb_confidence must be non-negative"
+            raise ValueError(msg)
 
 
 @dataclass
 class PromptVariant:
-    """Represents a variant of a prompt template with performance metrics."""
+    """Represents a variant of a prompt template with performance metrics.
+
+    ``feedback_scores`` is treated as append-only: its running total is
+    extended incrementally, so scores are never re-summed on every read.
+    """
 
     template: str
     variant_id: str | None = None
@@ -52,6 +68,8 @@ class PromptVariant:
     failure_count: int = 0
     feedback_scores: list[float] = field(default_factory=list)
     last_used: str | None = None
+    _feedback_total: float = field(default=0.0, init=False, repr=False, compare=False)
+    _feedback_counted: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.variant_id is None:
@@ -65,13 +83,44 @@ class PromptVariant:
             return 0.0
         return self.success_count / self.usage_count
 
+    @property
+    def feedback_total(self) -> float:
+        """Sum of all feedback scores, maintained incrementally."""
+
+        scores = self.feedback_scores
+        if self._feedback_counted > len(scores):
+            # The list was replaced or truncated; start over.
+            self._feedback_total = float(sum(scores))
+        elif self._feedback_counted < len(scores):
+            self._feedback_total += sum(scores[self._feedback_counted :])
+        self._feedback_counted = len(scores)
+        return self._feedback_total
+
     @property
     def average_feedback_score(self) -> float:
         """Calculate the average feedback score of this prompt variant."""
 
         if not self.feedback_scores:
             return 0.0
-        return sum(self.feedback_scores) / len(self.feedback_scores)
+        return self.feedback_total / len(self.feedback_scores)
+
+    @property
+    def reward_posterior(self) -> tuple[float, float]:
+        """Beta posterior ``(alpha, beta)`` over this variant's reward.
+
+        Each success or failure counts as one Bernoulli trial and each feedback
+        score as a fractional one, starting from a uniform ``Beta(1, 1)`` prior.
+        The feedback total is clamped to ``[0, len(feedback_scores)]`` so that
+        out-of-range scores loaded from older storage keep both parameters
+        positive.
+        """
+
+        feedback_total = min(
+            max(self.feedback_total, 0.0), float(len(self.feedback_scores))
+        )
+        alpha = 1.0 + self.success_count + feedback_total
+        beta = 1.0 + self.failure_count + (len(self.feedback_scores) - feedback_total)
+        return alpha, beta
 
     @property
     def performance_score(self) -> float:
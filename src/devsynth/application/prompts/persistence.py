@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Dict, List
 
 from .models import StoredPromptVariant
 
@@ -33,8 +36,82 @@ def save_prompt_variants(storage_dir: Path, data: PromptVariantsDocument) -> Non
     """Persist prompt variants to ``prompt_variants.json`` within ``storage_dir``."""
 
     path = storage_dir / "prompt_variants.json"
+    temp_path = path.with_suffix(".json.tmp")
     try:
-        with path.open("w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2)
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(temp_path, path)
     except OSError as exc:  # pragma: no cover - handled by caller logging
         raise PromptVariantStorageError(str(exc)) from exc
+
+
+class DebouncedVariantWriter:
+    """Coalesce bursts of save requests into at most one write per interval.
+
+    The first request after a quiet period is written immediately.  Requests
+    arriving within ``interval`` seconds of a write only mark the document
+    dirty; a timer writes the latest snapshot once the interval has elapsed.
+
+    Args:
+        storage_dir: Directory holding ``prompt_variants.json``.
+        snapshot: Callable producing the document to persist.
+        interval: Minimum number of seconds between writes.
+        on_error: Called with the storage error when a write fails.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        snapshot: Callable[[], PromptVariantsDocument],
+        interval: float = 1.0,
+        on_error: Callable[[PromptVariantStorageError], None] | None = None,
+    ) -> None:
+        self.storage_dir = storage_dir
+        self.interval = interval
+        self.writes = 0
+        self._snapshot = snapshot
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_write = float("-inf")
+        self._timer: threading.Timer | None = None
+
+    def request(self) -> None:
+        """Ask for the current state to be persisted."""
+
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            delay = self._last_write + self.interval - time.monotonic()
+            if delay > 0:
+                self._timer = threading.Timer(delay, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Write immediately if a save is pending."""
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._last_write = time.monotonic()
+            document = self._snapshot()
+            try:
+                save_prompt_variants(self.storage_dir, document)
+            except PromptVariantStorageError as exc:
+                if self._on_error is not None:
+                    self._on_error(exc)
+                return
+            self.writes += 1
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.flush()
@@ -5,19 +5,92 @@ This module defines the PromptEfficacyTracker class for tracking and optimizing
 prompt efficacy over time.
 """
 
+import bisect
 import json
+import math
 import os
-import statistics
+import threading
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any
 
 from devsynth.logging_setup import DevSynthLogger
 
 # Create a logger for this module
 logger = DevSynthLogger(__name__)
 
+DATA_FILE = "efficacy_data.json"
+EVENT_LOG_FILE = "efficacy_events.jsonl"
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(0, math.ceil(fraction * len(values)) - 1)
+    return values[rank]
+
+
+@dataclass(slots=True)
+class _MetricSeries:
+    """Running sum and sorted samples for one numeric outcome metric."""
+
+    total: float = 0.0
+    values: list[float] = field(default_factory=list)
+
+    def add(self, value: float) -> None:
+        self.total += value
+        bisect.insort(self.values, value)
+
+    def remove(self, value: float) -> None:
+        index = bisect.bisect_left(self.values, value)
+        if index < len(self.values) and self.values[index] == value:
+            del self.values[index]
+            self.total -= value
+
+    def summary(self, name: str) -> dict[str, float]:
+        values = self.values
+        return {
+            f"avg_{name}": self.total / len(values),
+            f"min_{name}": values[0],
+            f"max_{name}": values[-1],
+            f"p50_{name}": _percentile(values, 0.5),
+            f"p95_{name}": _percentile(values, 0.95),
+        }
+
+
+@dataclass(slots=True)
+class _VersionAggregate:
+    """Incrementally maintained statistics for one template version."""
+
+    total_usages: int = 0
+    usages_with_outcome: int = 0
+    successful_usages: int = 0
+    first_usage: str | None = None
+    last_usage: str | None = None
+    response_time: _MetricSeries = field(default_factory=_MetricSeries)
+    token_count: _MetricSeries = field(default_factory=_MetricSeries)
+
+    def add_usage(self, timestamp: str) -> None:
+        self.total_usages += 1
+        if self.first_usage is None:
+            self.first_usage = timestamp
+        self.last_usage = timestamp
+
+    def apply_outcome(self, outcome: dict[str, Any], sign: int) -> None:
+        """Add (``sign=1``) or retract (``sign=-1``) an outcome."""
+        self.usages_with_outcome += sign
+        if outcome.get("success", False):
+            self.successful_usages += sign
+        metrics = outcome.get("metrics") or {}
+        for name in ("response_time", "token_count"):
+            value = metrics.get(name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                series: _MetricSeries = getattr(self, name)
+                if sign > 0:
+                    series.add(value)
+                else:
+                    series.remove(value)
+
 
 class PromptEfficacyTracker:
     """
@@ -25,19 +98,32 @@ class PromptEfficacyTracker:
 
     This class provides methods for tracking prompt usage, recording outcomes,
     and generating statistics and recommendations for prompt optimization.
+
+    Usages are indexed by tracking ID and summarised per version as they
+    arrive, so recording and reporting never scan the history.  Changes are
+    appended to ``efficacy_events.jsonl``; every ``compact_every`` events the
+    log is folded into the ``efficacy_data.json`` snapshot.
     """
 
-    def __init__(self, storage_path: str | None = None):
+    def __init__(self, storage_path: str | None = None, compact_every: int = 1000):
         """
         Initialize the prompt efficacy tracker.
 
         Args:
             storage_path: Path to store efficacy data (defaults to .devsynth/prompts/efficacy)
+            compact_every: Number of logged events after which the log is
+                compacted into the snapshot
         """
         self.storage_path = storage_path or os.path.join(
             os.getcwd(), ".devsynth", "prompts", "efficacy"
         )
+        self.compact_every = max(1, compact_every)
         self.usage_data: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._usages: dict[str, tuple[str, str, dict[str, Any]]] = {}
+        self._aggregates: dict[tuple[str, str], _VersionAggregate] = {}
+        self._lock = threading.RLock()
+        self._log_handle: IO[str] | None = None
+        self._pending_events = 0
 
         # Create the storage directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
@@ -61,27 +147,25 @@ class PromptEfficacyTracker:
             A unique tracking ID for this usage
         """
         tracking_id = str(uuid.uuid4())
-
-        # Initialize data structures if needed
-        if template_name not in self.usage_data:
-            self.usage_data[template_name] = {}
-
-        if version_id not in self.usage_data[template_name]:
-            self.usage_data[template_name][version_id] = []
-
-        # Record the usage
-        usage = {
-            "tracking_id": tracking_id,
-            "timestamp": datetime.now().isoformat(),
-            "outcome": None,  # Will be set later
-            "metrics": {},
-        }
-
-        self.usage_data[template_name][version_id].append(usage)
-        self._save_data()
+        timestamp = datetime.now().isoformat()
+
+        with self._lock:
+            self._apply_usage(template_name, version_id, tracking_id, timestamp)
+            self._append_event(
+                {
+                    "event": "usage",
+                    "template": template_name,
+                    "version": version_id,
+                    "tracking_id": tracking_id,
+                    "timestamp": timestamp,
+                }
+            )
 
         logger.debug(
-            f"Tracked usage of template '{template_name}' version '{version_id}' with ID {tracking_id}"
+            "Tracked usage of template '%s' version '%s' with ID %s",
+            template_name,
+            version_id,
+            tracking_id,
         )
         return tracking_id
 
@@ -104,27 +188,24 @@ class PromptEfficacyTracker:
         Returns:
             True if the outcome was recorded, False if the tracking ID wasn't found
         """
-        # Find the usage record
-        for template_name, versions in self.usage_data.items():
-            for version_id, usages in versions.items():
-                for usage in usages:
-                    if usage["tracking_id"] == tracking_id:
-                        # Record the outcome
-                        usage["outcome"] = {
-                            "success": success,
-                            "timestamp": datetime.now().isoformat(),
-                            "metrics": metrics or {},
-                            "feedback": feedback,
-                        }
-
-                        self._save_data()
-                        logger.debug(
-                            f"Recorded outcome for tracking ID {tracking_id}: success={success}"
-                        )
-                        return True
-
-        logger.warning(f"No usage found for tracking ID {tracking_id}")
-        return False
+        outcome = {
+            "success": success,
+            "timestamp": datetime.now().isoformat(),
+            "metrics": metrics or {},
+            "feedback": feedback,
+        }
+        with self._lock:
+            if not self._apply_outcome(tracking_id, outcome):
+                logger.warning(f"No usage found for tracking ID {tracking_id}")
+                return False
+            self._append_event(
+                {"event": "outcome", "tracking_id": tracking_id, "outcome": outcome}
+            )
+
+        logger.debug(
+            "Recorded outcome for tracking ID %s: success=%s", tracking_id, success
+        )
+        return True
 
     def get_efficacy_metrics(
         self, template_name: str, version_id: str | None = None
@@ -139,34 +220,32 @@ class PromptEfficacyTracker:
         Returns:
             A dictionary of metrics
         """
-        if template_name not in self.usage_data:
-            return {"error": f"No data for template '{template_name}'"}
+        with self._lock:
+            if template_name not in self.usage_data:
+                return {"error": f"No data for template '{template_name}'"}
 
-        versions = self.usage_data[template_name]
+            versions = self.usage_data[template_name]
 
-        if version_id:
-            # Get metrics for a specific version
-            if version_id not in versions:
-                return {
-                    "error": f"No data for version '{version_id}' of template '{template_name}'"
-                }
+            if version_id:
+                # Get metrics for a specific version
+                if version_id not in versions:
+                    return {
+                        "error": f"No data for version '{version_id}' of template '{template_name}'"
+                    }
+
+                return self._calculate_metrics_for_version(template_name, version_id)
 
-            return self._calculate_metrics_for_version(
-                template_name, version_id, versions[version_id]
-            )
-        else:
             # Get metrics for all versions
-            all_metrics = {}
-            for vid, usages in versions.items():
-                all_metrics[vid] = self._calculate_metrics_for_version(
-                    template_name, vid, usages
-                )
+            all_metrics = {
+                vid: self._calculate_metrics_for_version(template_name, vid)
+                for vid in versions
+            }
 
-            # Add comparison metrics
-            if len(all_metrics) > 1:
-                all_metrics["comparison"] = self._compare_versions(all_metrics)
+        # Add comparison metrics
+        if len(all_metrics) > 1:
+            all_metrics["comparison"] = self._compare_versions(all_metrics)
 
-            return all_metrics
+        return all_metrics
 
     def get_optimization_recommendations(
         self, template_name: str
@@ -216,53 +295,32 @@ class PromptEfficacyTracker:
         return recommendations
 
     def _calculate_metrics_for_version(
-        self, template_name: str, version_id: str, usages: list[dict[str, Any]]
+        self, template_name: str, version_id: str
     ) -> dict[str, Any]:
-        """Calculate metrics for a specific version of a template."""
-        total_usages = len(usages)
-        usages_with_outcome = [u for u in usages if u.get("outcome") is not None]
-        successful_usages = [
-            u for u in usages_with_outcome if u.get("outcome", {}).get("success", False)
-        ]
-
-        metrics = {
+        """Report the running aggregate for a specific version of a template."""
+        aggregate = self._aggregates.get((template_name, version_id))
+        if aggregate is None:
+            aggregate = _VersionAggregate()
+
+        metrics: dict[str, Any] = {
             "template_name": template_name,
             "version_id": version_id,
-            "total_usages": total_usages,
-            "usages_with_outcome": len(usages_with_outcome),
-            "successful_usages": len(successful_usages),
+            "total_usages": aggregate.total_usages,
+            "usages_with_outcome": aggregate.usages_with_outcome,
+            "successful_usages": aggregate.successful_usages,
             "success_rate": (
-                len(successful_usages) / len(usages_with_outcome)
-                if usages_with_outcome
+                aggregate.successful_usages / aggregate.usages_with_outcome
+                if aggregate.usages_with_outcome
                 else 0
             ),
-            "first_usage": usages[0]["timestamp"] if usages else None,
-            "last_usage": usages[-1]["timestamp"] if usages else None,
+            "first_usage": aggregate.first_usage,
+            "last_usage": aggregate.last_usage,
         }
 
-        # Calculate additional metrics if available
-        response_times = []
-        token_counts = []
-
-        for usage in usages_with_outcome:
-            outcome = usage.get("outcome", {})
-            metrics_data = outcome.get("metrics", {})
-
-            if "response_time" in metrics_data:
-                response_times.append(metrics_data["response_time"])
-
-            if "token_count" in metrics_data:
-                token_counts.append(metrics_data["token_count"])
-
-        if response_times:
-            metrics["avg_response_time"] = statistics.mean(response_times)
-            metrics["min_response_time"] = min(response_times)
-            metrics["max_response_time"] = max(response_times)
-
-        if token_counts:
-            metrics["avg_token_count"] = statistics.mean(token_counts)
-            metrics["min_token_count"] = min(token_counts)
-            metrics["max_token_count"] = max(token_counts)
+        if aggregate.response_time.values:
+            metrics.update(aggregate.response_time.summary("response_time"))
+        if aggregate.token_count.values:
+            metrics.update(aggregate.token_count.summary("token_count"))
 
         return metrics
 
@@ -289,26 +347,142 @@ class PromptEfficacyTracker:
             "version_count": len(version_metrics),
         }
 
+    def _apply_usage(
+        self, template_name: str, version_id: str, tracking_id: str, timestamp: str
+    ) -> dict[str, Any]:
+        usage: dict[str, Any] = {
+            "tracking_id": tracking_id,
+            "timestamp": timestamp,
+            "outcome": None,  # Will be set later
+            "metrics": {},
+        }
+        versions = self.usage_data.setdefault(template_name, {})
+        versions.setdefault(version_id, []).append(usage)
+        self._index_usage(template_name, version_id, usage)
+        return usage
+
+    def _index_usage(
+        self, template_name: str, version_id: str, usage: dict[str, Any]
+    ) -> None:
+        self._usages[usage["tracking_id"]] = (template_name, version_id, usage)
+        aggregate = self._aggregates.get((template_name, version_id))
+        if aggregate is None:
+            aggregate = self._aggregates[(template_name, version_id)] = (
+                _VersionAggregate()
+            )
+        aggregate.add_usage(usage["timestamp"])
+        if usage.get("outcome") is not None:
+            aggregate.apply_outcome(usage["outcome"], 1)
+
+    def _apply_outcome(self, tracking_id: str, outcome: dict[str, Any]) -> bool:
+        entry = self._usages.get(tracking_id)
+        if entry is None:
+            return False
+        template_name, version_id, usage = entry
+        aggregate = self._aggregates[(template_name, version_id)]
+        if usage.get("outcome") is not None:
+            aggregate.apply_outcome(usage["outcome"], -1)
+        usage["outcome"] = outcome
+        aggregate.apply_outcome(outcome, 1)
+        return True
+
+    def _append_event(self, event: dict[str, Any]) -> None:
+        """Append ``event`` to the log, compacting when it grows too long."""
+        try:
+            if self._log_handle is None:
+                self._log_handle = open(
+                    os.path.join(self.storage_path, EVENT_LOG_FILE),
+                    "a",
+                    encoding="utf-8",
+                )
+            self._log_handle.write(json.dumps(event, separators=(",", ":")) + "\n")
+            self._log_handle.flush()
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Error appending efficacy event: {str(e)}")
+            return
+        self._pending_events += 1
+        if self._pending_events >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the event log into the snapshot and truncate the log."""
+        with self._lock:
+            if self._save_data():
+                if self._log_handle is not None:
+                    self._log_handle.close()
+                    self._log_handle = None
+                try:
+                    os.remove(os.path.join(self.storage_path, EVENT_LOG_FILE))
+                except FileNotFoundError:
+                    pass
+                self._pending_events = 0
+
+    def close(self) -> None:
+        """Compact pending events and release the log file."""
+        with self._lock:
+            if self._pending_events:
+                self.compact()
+            if self._log_handle is not None:
+                self._log_handle.close()
+                self._log_handle = None
+
     def _load_data(self) -> None:
-        """Load efficacy data from the storage path."""
-        data_file = os.path.join(self.storage_path, "efficacy_data.json")
+        """Load the snapshot and replay any logged events after it."""
+        data_file = os.path.join(self.storage_path, DATA_FILE)
+        self.usage_data = {}
         if os.path.exists(data_file):
             try:
-                with open(data_file) as f:
+                with open(data_file, encoding="utf-8") as f:
                     self.usage_data = json.load(f)
                 logger.debug("Loaded prompt efficacy data")
             except Exception as e:
                 logger.error(f"Error loading efficacy data: {str(e)}")
                 self.usage_data = {}
-        else:
-            self.usage_data = {}
 
-    def _save_data(self) -> None:
-        """Save efficacy data to the storage path."""
-        data_file = os.path.join(self.storage_path, "efficacy_data.json")
+        for template_name, versions in self.usage_data.items():
+            for version_id, usages in versions.items():
+                for usage in usages:
+                    self._index_usage(template_name, version_id, usage)
+
+        log_file = os.path.join(self.storage_path, EVENT_LOG_FILE)
+        if not os.path.exists(log_file):
+            return
+        try:
+            with open(log_file, encoding="utf-8") as f:
+                for line in f:
+                    self._replay(line)
+        except OSError as e:
+            logger.error(f"Error loading efficacy events: {str(e)}")
+
+    def _replay(self, line: str) -> None:
+        try:
+            event = json.loads(line)
+            if event["event"] == "usage":
+                if event["tracking_id"] not in self._usages:
+                    self._apply_usage(
+                        event["template"],
+                        event["version"],
+                        event["tracking_id"],
+                        event["timestamp"],
+                    )
+            elif event["event"] == "outcome":
+                self._apply_outcome(event["tracking_id"], event["outcome"])
+        except (ValueError, KeyError, TypeError):
+            # A torn final write from a crash; everything before it is intact.
+            logger.warning("Skipping malformed efficacy event")
+            return
+        self._pending_events += 1
+
+    def _save_data(self) -> bool:
+        """Atomically write the full snapshot to the storage path."""
+        data_file = os.path.join(self.storage_path, DATA_FILE)
+        temp_file = f"{data_file}.tmp"
         try:
-            with open(data_file, "w") as f:
-                json.dump(self.usage_data, f, indent=2)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(self.usage_data, f, separators=(",", ":"))
+            os.replace(temp_file, data_file)
             logger.debug("Saved prompt efficacy data")
+            return True
         except Exception as e:
             logger.error(f"Error saving efficacy data: {str(e)}")
+            return False
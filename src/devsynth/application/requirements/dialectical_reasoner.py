@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from collections.abc import Callable, Sequence
 from uuid import UUID, uuid4
 
 from devsynth.application.collaboration.exceptions import (
@@ -86,6 +88,73 @@ def _recommendations_to_primitives(
     return [entry.text for entry in recommendations]
 
 
+class RequirementDependencyIndex:
+    """Reverse index from a requirement to the requirements that depend on it.
+
+    Impact analysis needs the dependents of a single requirement; answering
+    that from the index avoids loading every requirement for each change.
+    The index is built once from the repository and then kept current through
+    :meth:`update` and :meth:`remove`.
+
+    The repository port has no change notifications, so the index only sees
+    writes made through :class:`RequirementService`, which forwards them to
+    the :class:`DialecticalReasonerPort` hooks implemented by
+    :meth:`DialecticalReasonerService.index_requirement` and
+    :meth:`DialecticalReasonerService.forget_requirement`. Code that writes
+    to the requirement repository directly must call those hooks or
+    :meth:`DialecticalReasonerService.rebuild_dependency_index` afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._dependents: dict[UUID, set[UUID]] = {}
+        self._dependencies: dict[UUID, tuple[UUID, ...]] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def rebuild(self, requirements: Iterable[Requirement]) -> None:
+        """Replace the index contents with ``requirements``."""
+        dependents: dict[UUID, set[UUID]] = {}
+        dependencies: dict[UUID, tuple[UUID, ...]] = {}
+        for requirement in requirements:
+            deps = tuple(requirement.dependencies)
+            dependencies[requirement.id] = deps
+            for dependency in deps:
+                dependents.setdefault(dependency, set()).add(requirement.id)
+        with self._lock:
+            self._dependents = dependents
+            self._dependencies = dependencies
+            self.loaded = True
+
+    def update(self, requirement: Requirement) -> None:
+        """Record the current dependencies of ``requirement``."""
+        deps = tuple(requirement.dependencies)
+        with self._lock:
+            previous = self._dependencies.get(requirement.id, ())
+            for dependency in set(previous) - set(deps):
+                self._discard(dependency, requirement.id)
+            for dependency in deps:
+                self._dependents.setdefault(dependency, set()).add(requirement.id)
+            self._dependencies[requirement.id] = deps
+
+    def remove(self, requirement_id: UUID) -> None:
+        """Forget ``requirement_id`` and the dependencies it declared."""
+        with self._lock:
+            for dependency in self._dependencies.pop(requirement_id, ()):
+                self._discard(dependency, requirement_id)
+
+    def dependents(self, requirement_id: UUID) -> list[UUID]:
+        """Return the requirements that depend on ``requirement_id``."""
+        with self._lock:
+            return list(self._dependents.get(requirement_id, ()))
+
+    def _discard(self, dependency: UUID, dependent: UUID) -> None:
+        entries = self._dependents.get(dependency)
+        if entries is not None:
+            entries.discard(dependent)
+            if not entries:
+                del self._dependents[dependency]
+
+
 class ConsensusError(BaseConsensusError):
     """Lightweight consensus error used by the requirement reasoner."""
 
@@ -107,6 +176,7 @@ class DialecticalReasonerService(DialecticalReasonerPort):
         notification_service: NotificationPort,
         llm_service: LLMPort,
         memory_manager: object | None = None,
+        max_concurrency: int = 4,
     ):
         """
         Initialize the dialectical reasoner service.
@@ -118,6 +188,9 @@ class DialecticalReasonerService(DialecticalReasonerPort):
             chat_repository: Repository for chat sessions and messages.
             notification_service: Service for sending notifications.
             llm_service: Service for language model interactions.
+            memory_manager: Optional memory manager for persisting results.
+            max_concurrency: Maximum number of LLM calls issued concurrently,
+                both for independent stages and for :meth:`evaluate_changes`.
         """
         self.requirement_repository = requirement_repository
         self.reasoning_repository = reasoning_repository
@@ -131,6 +204,10 @@ class DialecticalReasonerService(DialecticalReasonerPort):
         # results.  Each hook receives the ``DialecticalReasoning`` instance and
         # a boolean indicating whether consensus was reached.
         self.evaluation_hooks: list[Callable[[DialecticalReasoning, bool], None]] = []
+        self.max_concurrency = max(1, max_concurrency)
+        self.dependency_index = RequirementDependencyIndex()
+        self._stage_executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Hook registration
@@ -202,11 +279,10 @@ class DialecticalReasonerService(DialecticalReasonerPort):
             change_id=change.id, created_by=change.created_by
         )
 
-        # Generate thesis based on the change
+        # Thesis and antithesis are independent, so generate them concurrently
+        antithesis = self._submit_stage(self._generate_antithesis, change)
         reasoning.thesis = self._generate_thesis(change)
-
-        # Generate antithesis
-        reasoning.antithesis = self._generate_antithesis(change)
+        reasoning.antithesis = antithesis.result()
 
         # Generate arguments
         argument_entries = self._generate_arguments(
@@ -272,6 +348,93 @@ class DialecticalReasonerService(DialecticalReasonerPort):
         self._store_reasoning_in_memory(saved, edrr_phase=phase_to_use)
         return saved
 
+    def evaluate_changes(
+        self,
+        changes: Sequence[RequirementChange],
+        edrr_phase: EDRRPhase = EDRRPhase.REFINE,
+        *,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[DialecticalReasoning | Exception]:
+        """
+        Evaluate several requirement changes concurrently.
+
+        Each change runs through :meth:`evaluate_change`; at most
+        ``max_concurrency`` changes are in flight at once.
+
+        Args:
+            changes: The requirement changes to evaluate.
+            edrr_phase: The EDRR phase context for memory storage.
+            max_concurrency: Overrides the service-wide concurrency limit.
+            return_exceptions: Return failures (such as ``ConsensusError``) in
+                place of their results instead of raising the first one.
+
+        Returns:
+            The reasoning for each change, in the order of ``changes``.
+        """
+        if not changes:
+            return []
+        workers = max(1, max_concurrency or self.max_concurrency)
+        results: list[DialecticalReasoning | Exception] = []
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(changes)),
+            thread_name_prefix="devsynth-dialectical",
+        ) as executor:
+            futures = [
+                executor.submit(self.evaluate_change, change, edrr_phase)
+                for change in changes
+            ]
+            try:
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as exc:
+                        if not return_exceptions:
+                            raise
+                        results.append(exc)
+            finally:
+                for future in futures:
+                    future.cancel()
+        return results
+
+    def close(self) -> None:
+        """Release the worker threads used for concurrent stages."""
+        with self._executor_lock:
+            executor, self._stage_executor = self._stage_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def index_requirement(self, requirement: Requirement) -> None:
+        """Keep the reverse-dependency index in step with a saved requirement."""
+        if self.dependency_index.loaded:
+            self.dependency_index.update(requirement)
+
+    def forget_requirement(self, requirement_id: UUID) -> None:
+        """Drop a deleted requirement from the reverse-dependency index."""
+        if self.dependency_index.loaded:
+            self.dependency_index.remove(requirement_id)
+
+    def rebuild_dependency_index(self) -> None:
+        """Reload the reverse-dependency index from the repository."""
+        self.dependency_index.rebuild(
+            self.requirement_repository.get_all_requirements()
+        )
+
+    def _submit_stage(self, func: Callable[..., str], *args: object) -> Future[str]:
+        """Run an independent reasoning stage on the stage executor.
+
+        Stage tasks never submit further work, so the executor cannot deadlock
+        when :meth:`evaluate_changes` runs many evaluations at once.
+        """
+        with self._executor_lock:
+            executor = self._stage_executor
+            if executor is None:
+                executor = self._stage_executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="devsynth-dialectical-stage",
+                )
+        return executor.submit(func, *args)
+
     def process_message(
         self, session_id: UUID, message: str, user_id: str
     ) -> ChatMessage:
@@ -785,16 +948,12 @@ class DialecticalReasonerService(DialecticalReasonerPort):
         if change.requirement_id:
             affected_requirements.append(change.requirement_id)
 
-        # Get all requirements
-        all_requirements: list[Requirement] = (
-            self.requirement_repository.get_all_requirements()
-        )
-
-        # Check for dependencies
-        for req in all_requirements:
-            # If the requirement depends on the changed requirement, it's affected
-            if change.requirement_id and change.requirement_id in req.dependencies:
-                affected_requirements.append(req.id)
+            # Requirements depending on the changed requirement are affected too
+            if not self.dependency_index.loaded:
+                self.rebuild_dependency_index()
+            affected_requirements.extend(
+                self.dependency_index.dependents(change.requirement_id)
+            )
 
         # Unique and deterministic
         unique = {str(r): r for r in affected_requirements}
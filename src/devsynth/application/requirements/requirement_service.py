@@ -99,6 +99,7 @@ class RequirementService:
 
         # Save the requirement
         saved_requirement = self.requirement_repository.save_requirement(requirement)
+        self.dialectical_reasoner.index_requirement(saved_requirement)
 
         # Create a change record
         change = RequirementChange(
@@ -188,7 +189,9 @@ class RequirementService:
         self.dialectical_reasoner.assess_impact(saved_change, edrr_phase=phase)
 
         # Save the updated requirement
-        return self.requirement_repository.save_requirement(requirement)
+        saved_requirement = self.requirement_repository.save_requirement(requirement)
+        self.dialectical_reasoner.index_requirement(saved_requirement)
+        return saved_requirement
 
     def delete_requirement(
         self, requirement_id: UUID, user_id: str, reason: str
@@ -236,7 +239,10 @@ class RequirementService:
         self.dialectical_reasoner.assess_impact(saved_change, edrr_phase=phase)
 
         # Delete the requirement
-        return self.requirement_repository.delete_requirement(requirement_id)
+        deleted = self.requirement_repository.delete_requirement(requirement_id)
+        if deleted:
+            self.dialectical_reasoner.forget_requirement(requirement_id)
+        return deleted
 
     def approve_change(self, change_id: UUID, user_id: str) -> RequirementChange | None:
         """
@@ -1,10 +1,19 @@
 """
 Token tracking and optimization utilities for LLM interactions.
+
+Encodings are resolved once per process and shared by every
+:class:`TokenTracker`; token counts are memoized per encoding, or in a shared
+approximate cache without tiktoken, so that budgeting a long conversation
+before each LLM call only counts messages not seen before.
 """
 
+import hashlib
 import os
 import re
-from typing import Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional, Union
 
 # Create a logger for this module
 from devsynth.logging_setup import DevSynthLogger
@@ -31,6 +40,115 @@ _TEST_TOKEN_COUNTS = {}
 # Detect if we're in a test environment
 _IN_TEST_ENV = os.environ.get("PYTEST_DISABLE_PLUGIN_AUTOLOAD") == "1"
 
+# Cache name for counts made without a tiktoken encoding.
+_APPROXIMATE_CACHE = "approximate"
+
+# Below this many uncached texts a plain encode loop beats the thread pool that
+# ``Encoding.encode_batch`` spins up.
+_BATCH_ENCODE_THRESHOLD = 16
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+class TokenCountCache:
+    """Bounded LRU of token counts for one encoding.
+
+    Entries are keyed by a 16-byte BLAKE2b digest of the text, so memory per
+    entry stays constant however long the cached prompts are.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        if max_entries is None:
+            max_entries = int(os.environ.get("DEVSYNTH_TOKEN_CACHE_SIZE", "8192"))
+        self.max_entries = max(0, max_entries)
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> int | None:
+        key = _text_key(text)
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def put(self, text: str, count: int) -> None:
+        if not self.max_entries:
+            return
+        key = _text_key(text)
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+_registry_lock = threading.Lock()
+_encodings: dict[str, Any] = {}
+_count_caches: dict[str, TokenCountCache] = {}
+
+
+def _load_encoding(model: str) -> Any:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fall back to cl100k_base encoding if model not found
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:  # pragma: no cover - network issues
+            error = e
+    except Exception as e:  # pragma: no cover - network issues
+        error = e
+    logger.warning(
+        f"Failed to load tiktoken encoding for model '{model}': {error}. "
+        "Falling back to approximate token counting"
+    )
+    return None
+
+
+def get_encoding(model: str) -> Any:
+    """Return the process-wide tiktoken encoding for ``model``.
+
+    Failed lookups are remembered as well, so an unavailable encoding is not
+    retried by every new tracker. Returns ``None`` when tiktoken cannot be
+    used.
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    with _registry_lock:
+        if model in _encodings:
+            return _encodings[model]
+    encoding = _load_encoding(model)
+    with _registry_lock:
+        return _encodings.setdefault(model, encoding)
+
+
+def get_count_cache(encoding_name: str) -> TokenCountCache:
+    """Return the shared token count cache for ``encoding_name``."""
+    with _registry_lock:
+        cache = _count_caches.get(encoding_name)
+        if cache is None:
+            cache = _count_caches[encoding_name] = TokenCountCache()
+        return cache
+
+
+def clear_encoding_registry() -> None:
+    """Forget resolved encodings and memoized counts."""
+    with _registry_lock:
+        _encodings.clear()
+        _count_caches.clear()
+
 
 class TokenTracker:
     """Utility for tracking and optimizing token usage in LLM interactions."""
@@ -43,26 +161,23 @@ class TokenTracker:
         """
         self.model = model
         self._encoding = None
+        self._count_cache: TokenCountCache | None = None
 
-        # Initialize the tokenizer if tiktoken is available
+        # Resolve the shared tokenizer if tiktoken is available
         if TIKTOKEN_AVAILABLE and not _IN_TEST_ENV:
-            try:
-                self._encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                # Fall back to cl100k_base encoding if model not found
-                self._encoding = tiktoken.get_encoding("cl100k_base")
-            except Exception as e:  # pragma: no cover - network issues
-                logger.warning(
-                    f"Failed to load tiktoken encoding for model '{model}': {e}. "
-                    "Falling back to approximate token counting"
+            self._encoding = get_encoding(model)
+            if self._encoding is not None:
+                self._count_cache = get_count_cache(
+                    getattr(self._encoding, "name", model)
                 )
-                self._encoding = None
         elif TIKTOKEN_AVAILABLE and _IN_TEST_ENV:
             logger.warning(
                 f"Skipping tiktoken initialization in test environment for model '{model}'. "
                 "Falling back to approximate token counting"
             )
             self._encoding = None
+        if self._count_cache is None:
+            self._count_cache = get_count_cache(_APPROXIMATE_CACHE)
 
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a text.
@@ -78,11 +193,51 @@ class TokenTracker:
         if _TEST_MODE and text in _TEST_TOKEN_COUNTS:
             return _TEST_TOKEN_COUNTS[text]
 
+        cache = self._count_cache
+        if cache is not None:
+            count = cache.get(text)
+            if count is not None:
+                return count
         if TIKTOKEN_AVAILABLE and self._encoding:
-            return len(self._encoding.encode(text))
+            count = len(self._encoding.encode(text))
         else:
             # Fallback token counting (approximate)
-            return self._fallback_token_count(text)
+            count = self._fallback_token_count(text)
+        if cache is not None:
+            cache.put(text, count)
+        return count
+
+    def count_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count tokens for several texts at once.
+
+        Cached counts are reused; the remaining distinct texts are encoded
+        together with tiktoken's batch encoder.
+
+        Args:
+            texts: The texts to count tokens for
+
+        Returns:
+            The token count of each text, in order
+        """
+        if not (TIKTOKEN_AVAILABLE and self._encoding) or _TEST_MODE:
+            return [self.count_tokens(text) for text in texts]
+
+        cache = self._count_cache
+        counts: list[int | None] = [
+            cache.get(text) if cache is not None else None for text in texts
+        ]
+        missing = list(dict.fromkeys(t for t, c in zip(texts, counts) if c is None))
+        if missing:
+            if len(missing) >= _BATCH_ENCODE_THRESHOLD:
+                encoded = self._encoding.encode_batch(missing)
+                fresh = {text: len(tokens) for text, tokens in zip(missing, encoded)}
+            else:
+                fresh = {text: len(self._encoding.encode(text)) for text in missing}
+            if cache is not None:
+                for text, count in fresh.items():
+                    cache.put(text, count)
+            counts = [fresh[t] if c is None else c for t, c in zip(texts, counts)]
+        return counts  # type: ignore[return-value]
 
     def _fallback_token_count(self, text: str) -> int:
         """Fallback method for counting tokens when tiktoken is not available.
@@ -126,14 +281,37 @@ class TokenTracker:
             The number of tokens
         """
         # Count tokens for each message
-        total_tokens = 0
-        for message in messages:
-            total_tokens += self.count_message_tokens(message)
+        total_tokens = sum(self.count_message_tokens_batch(messages))
 
         # Add overhead for conversation formatting (approximation based on OpenAI's guidelines)
         # Each conversation has a ~3 token overhead
         return total_tokens + 3
 
+    def count_message_tokens_batch(
+        self, messages: Sequence[dict[str, str]]
+    ) -> list[int]:
+        """Count the tokens of several messages at once.
+
+        Conversation counting and pruning go through this method, which
+        applies the :meth:`count_message_tokens` formula to counts from
+        :meth:`count_tokens_batch`. Subclasses that count messages differently
+        override this method alongside :meth:`count_message_tokens`.
+
+        Args:
+            messages: The messages to count tokens for
+
+        Returns:
+            The token count of each message, in order
+        """
+        texts: list[str] = []
+        for message in messages:
+            texts.append(message["role"])
+            texts.append(message["content"])
+        counts = self.count_tokens_batch(texts)
+        return [
+            counts[index] + counts[index + 1] + 4 for index in range(0, len(counts), 2)
+        ]
+
     def prune_conversation(
         self, messages: list[dict[str, str]], max_tokens: int
     ) -> list[dict[str, str]]:
@@ -166,24 +344,27 @@ class TokenTracker:
                 else pruned_messages[-3:]
             )
 
-        # Keep removing the oldest messages until we're under the limit
+        # Count every message once, then drop the oldest messages until the
+        # running total fits the limit
+        head = [system_message] if system_message else []
+        counts = self.count_message_tokens_batch(head + pruned_messages)
+        total = self.count_conversation_tokens(head + pruned_messages)
+        drop = 0
+        while drop < len(pruned_messages) and total > max_tokens:
+            # Remove the oldest non-system message
+            total -= counts[len(head) + drop]
+            drop += 1
+        # The running total assumes the conversation count is the sum of its
+        # messages plus a fixed overhead; confirm with the real count
         while (
-            pruned_messages
-            and self.count_conversation_tokens(
-                [system_message] + pruned_messages
-                if system_message
-                else pruned_messages
-            )
+            drop < len(pruned_messages)
+            and self.count_conversation_tokens(head + pruned_messages[drop:])
             > max_tokens
         ):
-            # Remove the oldest non-system message
-            pruned_messages.pop(0)
-
-        # Add the system message back if it exists
-        if system_message:
-            pruned_messages.insert(0, system_message)
+            drop += 1
 
-        return pruned_messages
+        # Keep the system message in front of the remaining messages
+        return head + pruned_messages[drop:]
 
     def ensure_token_limit(self, text: str, max_tokens: int) -> None:
         """Ensure that a text is within a token limit.
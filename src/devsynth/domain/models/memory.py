@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import math
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -424,7 +426,7 @@ class MemeticUnit:
         return cls(metadata=metadata, payload=data["payload"])
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryItem:
     """A single item stored in memory."""
 
@@ -487,21 +489,91 @@ class MemoryItem:
         )
 
 
-@dataclass
+def as_embedding_buffer(values: Iterable[float] | memoryview | bytes) -> memoryview:
+    """Return ``values`` as a read-only, one-dimensional float32 ``memoryview``.
+
+    C-contiguous float32 buffers (``numpy`` arrays, ``array('f')``, another
+    embedding buffer) are wrapped without copying; ``bytes`` are read as packed
+    native float32 values. Any other iterable of numbers is copied once into a
+    float32 array.
+    """
+
+    try:
+        view = memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        return memoryview(array("f", values)).toreadonly()
+
+    if view.format in ("B", "b", "c") and view.c_contiguous:
+        view = view.cast("B").cast("f")
+    elif view.format != "f" or not view.c_contiguous:
+        flat = view.tolist()
+        while view.ndim > 1 and flat and isinstance(flat[0], list):
+            flat = [value for row in flat for value in row]
+        view = memoryview(array("f", flat))
+    elif view.ndim != 1:
+        view = view.cast("B").cast("f")
+    return view.toreadonly()
+
+
+@dataclass(slots=True, init=False)
 class MemoryVector:
-    """A vector representation of a memory item."""
+    """A vector representation of a memory item.
+
+    The embedding is held in :attr:`embedding_buffer`, a read-only float32
+    buffer using four bytes per component instead of a boxed Python float. Use
+    it for zero-copy access (``numpy.frombuffer`` or a database blob);
+    :attr:`embedding` converts it to a ``list[float]`` on access for callers
+    that expect a list.
+    """
 
     id: str
     content: Any
-    embedding: list[float]
+    embedding_buffer: memoryview = field(repr=False)
     metadata: MemoryMetadata | None = None
     created_at: datetime | None = None
 
-    def __post_init__(self) -> None:
-        if self.metadata is None:
-            self.metadata = cast(MemoryMetadata, {})
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    def __init__(
+        self,
+        id: str,
+        content: Any,
+        embedding: Iterable[float] | memoryview | bytes,
+        metadata: MemoryMetadata | None = None,
+        created_at: datetime | None = None,
+    ) -> None:
+        self.id = id
+        self.content = content
+        self.embedding_buffer = as_embedding_buffer(embedding)
+        self.metadata = cast(MemoryMetadata, {}) if metadata is None else metadata
+        self.created_at = datetime.now() if created_at is None else created_at
+
+    @property
+    def embedding(self) -> list[float]:
+        """Embedding values as a new list of Python floats."""
+
+        return self.embedding_buffer.tolist()
+
+    @embedding.setter
+    def embedding(self, values: Iterable[float] | memoryview | bytes) -> None:
+        self.embedding_buffer = as_embedding_buffer(values)
+
+    @property
+    def dimension(self) -> int:
+        """Number of components in the embedding."""
+
+        return len(self.embedding_buffer)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # memoryviews cannot be pickled; the packed bytes round-trip exactly.
+        return (
+            self.__class__,
+            (
+                self.id,
+                self.content,
+                self.embedding_buffer.tobytes(),
+                self.metadata,
+                self.created_at,
+            ),
+        )
 
 
 class SerializedMemoryItem(TypedDict):
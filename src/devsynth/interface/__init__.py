@@ -8,40 +8,62 @@ across different UI frameworks (CLI, WebUI, Agent API).
 from .cli import CLIUXBridge
 from .ux_bridge import ProgressIndicator, UXBridge, sanitize_output
 
-try:  # pragma: no cover - optional dependency import guard
-    from .textual_ui import (
-        TEXTUAL_AVAILABLE,
-        LayoutPane,
-        MultiPaneLayout,
-        TextualUXBridge,
-    )
-except Exception:  # pragma: no cover - degrade gracefully when Textual is unavailable
-    TextualUXBridge = None  # type: ignore[assignment]
-    MultiPaneLayout = None  # type: ignore[assignment]
-    LayoutPane = None  # type: ignore[assignment]
-    TEXTUAL_AVAILABLE = False
-
-# Import WebUI directly from the webui module to avoid circular imports
-try:
-    import importlib.util
-    import sys
-    from pathlib import Path
-
-    # Load the webui.py module directly
-    webui_path = Path(__file__).parent / "webui.py"
-    spec = importlib.util.spec_from_file_location(
-        "devsynth.interface.webui_module", webui_path
-    )
-    if spec and spec.loader:
-        webui_module = importlib.util.module_from_spec(spec)
-        sys.modules["devsynth.interface.webui_module"] = webui_module
-        spec.loader.exec_module(webui_module)
-        WebUI = webui_module.WebUI
-    else:
-        WebUI = None
-except (ImportError, AttributeError, Exception):
-    # Fallback if webui module has issues
-    WebUI = None
+_TEXTUAL_EXPORTS = (
+    "TEXTUAL_AVAILABLE",
+    "LayoutPane",
+    "MultiPaneLayout",
+    "TextualUXBridge",
+)
+
+
+def _load_textual() -> dict[str, object]:
+    try:  # pragma: no cover - optional dependency import guard
+        from . import textual_ui
+    except Exception:  # pragma: no cover - Textual is unavailable
+        return {
+            "TextualUXBridge": None,
+            "MultiPaneLayout": None,
+            "LayoutPane": None,
+            "TEXTUAL_AVAILABLE": False,
+        }
+    return {name: getattr(textual_ui, name) for name in _TEXTUAL_EXPORTS}
+
+
+def _load_webui() -> object:
+    # Import WebUI directly from the webui module to avoid circular imports
+    try:
+        import importlib.util
+        import sys
+        from pathlib import Path
+
+        # Load the webui.py module directly
+        webui_path = Path(__file__).parent / "webui.py"
+        spec = importlib.util.spec_from_file_location(
+            "devsynth.interface.webui_module", webui_path
+        )
+        if spec and spec.loader:
+            webui_module = importlib.util.module_from_spec(spec)
+            sys.modules["devsynth.interface.webui_module"] = webui_module
+            spec.loader.exec_module(webui_module)
+            return webui_module.WebUI
+        return None
+    except (ImportError, AttributeError, Exception):
+        # Fallback if webui module has issues
+        return None
+
+
+def __getattr__(name: str) -> object:
+    # WebUI and Textual pull in every CLI command, so they load on first use
+    # rather than whenever a lightweight bridge is imported.
+    if name == "WebUI":
+        globals()["WebUI"] = value = _load_webui()
+        return value
+    if name in _TEXTUAL_EXPORTS:
+        loaded = _load_textual()
+        globals().update(loaded)
+        return loaded[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CLIUXBridge",
@@ -49,9 +71,5 @@ __all__ = [
     "UXBridge",
     "WebUI",
     "sanitize_output",
+    *_TEXTUAL_EXPORTS,
 ]
-
-if TextualUXBridge is not None:
-    __all__.extend(
-        ["TextualUXBridge", "MultiPaneLayout", "LayoutPane", "TEXTUAL_AVAILABLE"]
-    )
@@ -6,20 +6,41 @@ forwards request data to the existing workflow functions and captures
 any output generated through the bridge. Responses contain those
 messages so API clients receive the same feedback normally shown in
 the terminal or WebUI.
+
+Long-running workflows can also be queued with ``POST /jobs/{workflow}``.
+The job runs on a bounded executor with its own bridge; clients poll
+``/jobs/{job_id}``, fetch ``/jobs/{job_id}/result`` or follow progress on the
+``/jobs/{job_id}/events`` Server-Sent Events stream.
 """
 
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from typing import Any, TypeVar, assert_never, cast
 from collections.abc import Callable, Mapping, Sequence
-
-from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Request, status
-from fastapi.responses import JSONResponse, PlainTextResponse
+from dataclasses import dataclass
+from typing import Any, TypeVar, Unpack, assert_never, cast
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Request,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 from typing_extensions import ParamSpec, TypedDict
-from typing import Unpack
 
+from devsynth.interface.agentapi_jobs import (
+    Job,
+    JobManager,
+    JobQueueFullError,
+    get_job_manager,
+)
 from devsynth.interface.agentapi_models import (
     APIMetrics,
     CodeRequest,
@@ -28,6 +49,9 @@ from devsynth.interface.agentapi_models import (
     GatherRequest,
     HealthResponse,
     InitRequest,
+    JobAcceptedResponse,
+    JobState,
+    JobStatusResponse,
     MetricsResponse,
     PriorityLevel,
     ProgressSnapshot,
@@ -56,6 +80,7 @@ R = TypeVar("R")
 
 class _RouteDecoratorKwargs(TypedDict, total=False):
     response_model: type[Any]
+    status_code: int
     responses: Mapping[int, Any]
     tags: Sequence[str]
     summary: str
@@ -84,6 +109,17 @@ def api_post(
     return decorator
 
 
+def api_delete(
+    path: str, **kwargs: Unpack[_RouteDecoratorKwargs]
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Typed wrapper around :meth:`fastapi.APIRouter.delete`."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        return router.delete(path, **kwargs)(func)
+
+    return decorator
+
+
 @dataclass(slots=True)
 class HealthEnvelope:
     """Dataclass wrapper for the health endpoint payload."""
@@ -592,79 +628,44 @@ class AgentAPI:
         return WorkflowResponse(messages=LATEST_MESSAGES)
 
 
-@api_post("/init", response_model=WorkflowResponse)
-def init_endpoint(
-    request: InitRequest, token: None = Depends(_verify_token)
-) -> WorkflowResponse:
-    """Initialize or onboard a project."""
+def _validate_init(request: InitRequest) -> None:
     if request.path is None:
         raise HTTPException(status_code=400, detail="path is required")
     if request.path == "":
         raise HTTPException(status_code=400, detail="path cannot be empty")
 
-    bridge = APIBridge()
-    try:
-        from devsynth.application.cli import init_cmd
 
-        init_cmd(
-            path=request.path,
-            project_root=request.project_root,
-            language=request.language,
-            goals=request.goals,
-            bridge=bridge,
-        )
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in init endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to initialize project: {str(e)}",
-        )
+def _run_init(request: InitRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli import init_cmd
 
+    init_cmd(
+        path=request.path,
+        project_root=request.project_root,
+        language=request.language,
+        goals=request.goals,
+        bridge=bridge,
+    )
 
-@api_post("/gather", response_model=WorkflowResponse)
-def gather_endpoint(
-    request: GatherRequest, token: None = Depends(_verify_token)
-) -> WorkflowResponse:
-    """Gather project goals and constraints via the interactive wizard."""
+
+def _validate_gather(request: GatherRequest) -> None:
     if request.goals is None:
         raise HTTPException(status_code=400, detail="goals are required")
     if request.goals == "":
         raise HTTPException(status_code=400, detail="goals cannot be empty")
 
-    try:
-        answers: tuple[str, ...] = (
-            request.goals,
-            request.constraints or "",
-            request.priority.value,
-        )
-        bridge = APIBridge(answers)
-        from devsynth.application.cli import gather_cmd
 
-        gather_cmd(bridge=bridge)
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in gather endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to gather requirements: {str(e)}",
-        )
+def _gather_answers(request: GatherRequest) -> tuple[str, ...]:
+    return (request.goals, request.constraints or "", request.priority.value)
 
 
-@api_post("/synthesize", response_model=WorkflowResponse)
-def synthesize_endpoint(
-    request: SynthesizeRequest, token: None = Depends(_verify_token)
-) -> WorkflowResponse:
-    """Execute the synthesis pipeline."""
-    if request.target is None:
-        raise HTTPException(status_code=400, detail="target is required")
-    if request.target == "":
-        raise HTTPException(status_code=400, detail="target cannot be empty")
-    valid_targets = {
+def _run_gather(request: GatherRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli import gather_cmd
+
+    gather_cmd(bridge=bridge)
+
+
+_VALID_SYNTHESIS_TARGETS = frozenset(
+    {
         "unit",
         "unit-tests",
         "integration",
@@ -673,82 +674,197 @@ def synthesize_endpoint(
         "behavior-tests",
         "all",
     }
-    if request.target not in valid_targets:
+)
+
+
+def _validate_synthesize(request: SynthesizeRequest) -> None:
+    if request.target is None:
+        raise HTTPException(status_code=400, detail="target is required")
+    if request.target == "":
+        raise HTTPException(status_code=400, detail="target cannot be empty")
+    if request.target not in _VALID_SYNTHESIS_TARGETS:
         raise HTTPException(
             status_code=400,
-            detail="target must be one of " + ", ".join(sorted(valid_targets)),
+            detail="target must be one of "
+            + ", ".join(sorted(_VALID_SYNTHESIS_TARGETS)),
         )
 
-    try:
-        bridge = APIBridge()
-        from devsynth.application.cli import run_pipeline_cmd
 
-        run_pipeline_cmd(target=request.target, bridge=bridge)
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in synthesize endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to run synthesis pipeline: {str(e)}",
-        )
+def _run_synthesize(request: SynthesizeRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli import run_pipeline_cmd
 
+    run_pipeline_cmd(target=request.target, bridge=bridge)
 
-@api_post("/spec", response_model=WorkflowResponse)
-def spec_endpoint(
-    request: SpecRequest, token: None = Depends(_verify_token)
-) -> WorkflowResponse:
-    """Generate specifications from requirements."""
+
+def _validate_spec(request: SpecRequest) -> None:
     if request.requirements_file is None:
         raise HTTPException(status_code=400, detail="requirements_file is required")
     if request.requirements_file == "":
         raise HTTPException(status_code=400, detail="requirements_file cannot be empty")
 
-    try:
-        bridge = APIBridge()
-        from devsynth.application.cli import spec_cmd
 
-        spec_cmd(requirements_file=request.requirements_file, bridge=bridge)
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in spec endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate specifications: {str(e)}",
-        )
+def _run_spec(request: SpecRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli import spec_cmd
 
+    spec_cmd(requirements_file=request.requirements_file, bridge=bridge)
 
-@api_post("/test", response_model=WorkflowResponse)
-def test_endpoint(
-    request: TestSpecRequest, token: None = Depends(_verify_token)
-) -> WorkflowResponse:
-    """Generate tests from specifications."""
+
+def _validate_test(request: TestSpecRequest) -> None:
     if request.spec_file is None:
         raise HTTPException(status_code=400, detail="spec_file is required")
     if request.spec_file == "":
         raise HTTPException(status_code=400, detail="spec_file cannot be empty")
 
-    try:
-        bridge = APIBridge()
-        from devsynth.application.cli import test_cmd
 
-        test_cmd(
-            spec_file=request.spec_file, output_dir=request.output_dir, bridge=bridge
-        )
+def _run_test(request: TestSpecRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli import test_cmd
+
+    test_cmd(spec_file=request.spec_file, output_dir=request.output_dir, bridge=bridge)
+
+
+def _run_code(request: CodeRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli import code_cmd
+
+    code_cmd(output_dir=request.output_dir, bridge=bridge)
+
+
+def _run_doctor(request: DoctorRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli.commands.doctor_cmd import doctor_cmd
+
+    doctor_cmd(path=request.path, fix=request.fix, bridge=bridge)
+
+
+def _validate_edrr_cycle(request: EDRRCycleRequest) -> None:
+    if request.prompt is None:
+        raise HTTPException(status_code=400, detail="prompt is required")
+    if request.prompt == "":
+        raise HTTPException(status_code=400, detail="prompt cannot be empty")
+    if request.max_iterations <= 0:
+        raise HTTPException(status_code=400, detail="max_iterations must be positive")
+
+
+def _run_edrr_cycle(request: EDRRCycleRequest, bridge: APIBridge) -> None:
+    from devsynth.application.cli.commands.edrr_cycle_cmd import edrr_cycle_cmd
+
+    edrr_cycle_cmd(
+        prompt=request.prompt,
+        context=request.context,
+        max_iterations=request.max_iterations,
+        bridge=bridge,
+    )
+
+
+def _no_validation(request: BaseModel) -> None:
+    del request
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowRoute:
+    """How a workflow endpoint validates, runs and reports a request."""
+
+    request_model: type[BaseModel]
+    run: Callable[[Any, APIBridge], None]
+    failure: str
+    validate: Callable[[Any], None] = _no_validation
+    answers: Callable[[Any], Sequence[str]] | None = None
+
+    def create_bridge(self, request: BaseModel) -> APIBridge:
+        return APIBridge(self.answers(request) if self.answers else None)
+
+
+WORKFLOWS: Mapping[str, WorkflowRoute] = {
+    "init": WorkflowRoute(
+        InitRequest, _run_init, "Failed to initialize project", _validate_init
+    ),
+    "gather": WorkflowRoute(
+        GatherRequest,
+        _run_gather,
+        "Failed to gather requirements",
+        _validate_gather,
+        _gather_answers,
+    ),
+    "synthesize": WorkflowRoute(
+        SynthesizeRequest,
+        _run_synthesize,
+        "Failed to run synthesis pipeline",
+        _validate_synthesize,
+    ),
+    "spec": WorkflowRoute(
+        SpecRequest, _run_spec, "Failed to generate specifications", _validate_spec
+    ),
+    "test": WorkflowRoute(
+        TestSpecRequest, _run_test, "Failed to generate tests", _validate_test
+    ),
+    "code": WorkflowRoute(CodeRequest, _run_code, "Failed to generate code"),
+    "doctor": WorkflowRoute(DoctorRequest, _run_doctor, "Failed to run diagnostics"),
+    "edrr-cycle": WorkflowRoute(
+        EDRRCycleRequest,
+        _run_edrr_cycle,
+        "Failed to run EDRR cycle",
+        _validate_edrr_cycle,
+    ),
+}
+
+
+def _run_workflow(name: str, request: BaseModel) -> WorkflowResponse:
+    """Run a workflow in the request thread and record its messages."""
+
+    workflow = WORKFLOWS[name]
+    workflow.validate(request)
+    try:
+        bridge = workflow.create_bridge(request)
+        workflow.run(request, bridge)
         global LATEST_MESSAGES
         LATEST_MESSAGES = tuple(bridge.messages)
         return WorkflowResponse(messages=LATEST_MESSAGES)
     except Exception as e:
-        logger.error(f"Error in test endpoint: {str(e)}")
+        logger.error(f"Error in {name} endpoint: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate tests: {str(e)}",
+            detail=f"{workflow.failure}: {str(e)}",
         )
 
 
+@api_post("/init", response_model=WorkflowResponse)
+def init_endpoint(
+    request: InitRequest, token: None = Depends(_verify_token)
+) -> WorkflowResponse:
+    """Initialize or onboard a project."""
+    return _run_workflow("init", request)
+
+
+@api_post("/gather", response_model=WorkflowResponse)
+def gather_endpoint(
+    request: GatherRequest, token: None = Depends(_verify_token)
+) -> WorkflowResponse:
+    """Gather project goals and constraints via the interactive wizard."""
+    return _run_workflow("gather", request)
+
+
+@api_post("/synthesize", response_model=WorkflowResponse)
+def synthesize_endpoint(
+    request: SynthesizeRequest, token: None = Depends(_verify_token)
+) -> WorkflowResponse:
+    """Execute the synthesis pipeline."""
+    return _run_workflow("synthesize", request)
+
+
+@api_post("/spec", response_model=WorkflowResponse)
+def spec_endpoint(
+    request: SpecRequest, token: None = Depends(_verify_token)
+) -> WorkflowResponse:
+    """Generate specifications from requirements."""
+    return _run_workflow("spec", request)
+
+
+@api_post("/test", response_model=WorkflowResponse)
+def test_endpoint(
+    request: TestSpecRequest, token: None = Depends(_verify_token)
+) -> WorkflowResponse:
+    """Generate tests from specifications."""
+    return _run_workflow("test", request)
+
+
 # Prevent pytest from collecting the router function as a test
 test_endpoint.__test__ = False
 
@@ -758,20 +874,7 @@ def code_endpoint(
     request: CodeRequest, token: None = Depends(_verify_token)
 ) -> WorkflowResponse:
     """Generate code from tests."""
-    try:
-        bridge = APIBridge()
-        from devsynth.application.cli import code_cmd
-
-        code_cmd(output_dir=request.output_dir, bridge=bridge)
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in code endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate code: {str(e)}",
-        )
+    return _run_workflow("code", request)
 
 
 @api_post("/doctor", response_model=WorkflowResponse)
@@ -779,20 +882,7 @@ def doctor_endpoint(
     request: DoctorRequest, token: None = Depends(_verify_token)
 ) -> WorkflowResponse:
     """Run diagnostics."""
-    try:
-        bridge = APIBridge()
-        from devsynth.application.cli.commands.doctor_cmd import doctor_cmd
-
-        doctor_cmd(path=request.path, fix=request.fix, bridge=bridge)
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in doctor endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to run diagnostics: {str(e)}",
-        )
+    return _run_workflow("doctor", request)
 
 
 @api_post("/edrr-cycle", response_model=WorkflowResponse)
@@ -800,32 +890,123 @@ def edrr_cycle_endpoint(
     request: EDRRCycleRequest, token: None = Depends(_verify_token)
 ) -> WorkflowResponse:
     """Run EDRR cycle."""
-    if request.prompt is None:
-        raise HTTPException(status_code=400, detail="prompt is required")
-    if request.prompt == "":
-        raise HTTPException(status_code=400, detail="prompt cannot be empty")
-    if request.max_iterations <= 0:
-        raise HTTPException(status_code=400, detail="max_iterations must be positive")
+    return _run_workflow("edrr-cycle", request)
+
 
+@api_post(
+    "/jobs/{workflow}",
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Jobs"],
+    summary="Queue a workflow job",
+)
+def submit_job_endpoint(
+    workflow: str,
+    payload: dict[str, Any] = Body(default_factory=dict),
+    token: None = Depends(_verify_token),
+    manager: JobManager = Depends(get_job_manager),
+) -> JobAcceptedResponse:
+    """Queue a workflow and return its job id without waiting for it.
+
+    The body is the same as the matching synchronous endpoint (for example
+    ``POST /jobs/synthesize`` takes a :class:`SynthesizeRequest`).
+    """
+    route = WORKFLOWS.get(workflow)
+    if route is None:
+        raise HTTPException(status_code=404, detail=f"Unknown workflow: {workflow}")
     try:
-        bridge = APIBridge()
-        from devsynth.application.cli.commands.edrr_cycle_cmd import edrr_cycle_cmd
+        request = route.request_model.model_validate(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+    route.validate(request)
 
-        edrr_cycle_cmd(
-            prompt=request.prompt,
-            context=request.context,
-            max_iterations=request.max_iterations,
-            bridge=bridge,
-        )
-        global LATEST_MESSAGES
-        LATEST_MESSAGES = tuple(bridge.messages)
-        return WorkflowResponse(messages=LATEST_MESSAGES)
-    except Exception as e:
-        logger.error(f"Error in edrr-cycle endpoint: {str(e)}")
+    bridge = route.create_bridge(request)
+    try:
+        job = manager.submit(workflow, bridge, lambda: route.run(request, bridge))
+    except JobQueueFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Job queue is full: {exc}",
+        ) from exc
+
+    base = f"/jobs/{job.job_id}"
+    return JobAcceptedResponse(
+        job_id=job.job_id,
+        workflow=workflow,
+        state=job.state,
+        status_url=base,
+        result_url=f"{base}/result",
+        events_url=f"{base}/events",
+    )
+
+
+def _require_job(manager: JobManager, job_id: str) -> Job:
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@api_get("/jobs/{job_id}", response_model=JobStatusResponse, tags=["Jobs"])
+def job_status_endpoint(
+    job_id: str,
+    token: None = Depends(_verify_token),
+    manager: JobManager = Depends(get_job_manager),
+) -> JobStatusResponse:
+    """Return the state and latest progress of a job."""
+    return _require_job(manager, job_id).to_status()
+
+
+@api_get("/jobs/{job_id}/result", response_model=WorkflowResponse, tags=["Jobs"])
+def job_result_endpoint(
+    job_id: str,
+    token: None = Depends(_verify_token),
+    manager: JobManager = Depends(get_job_manager),
+) -> WorkflowResponse:
+    """Return the messages and progress of a finished job."""
+    job = _require_job(manager, job_id)
+    if job.state is JobState.FAILED:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to run EDRR cycle: {str(e)}",
+            detail=f"{WORKFLOWS[job.workflow].failure}: {job.error}",
+        )
+    if job.state is not JobState.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} is {job.state.value}",
+        )
+    return job.to_response()
+
+
+@api_get("/jobs/{job_id}/events", tags=["Jobs"])
+def job_events_endpoint(
+    job_id: str,
+    token: None = Depends(_verify_token),
+    manager: JobManager = Depends(get_job_manager),
+) -> StreamingResponse:
+    """Stream a job's progress as Server-Sent Events until it finishes."""
+    job = _require_job(manager, job_id)
+    return StreamingResponse(
+        manager.stream_events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@api_delete("/jobs/{job_id}", response_model=JobStatusResponse, tags=["Jobs"])
+def cancel_job_endpoint(
+    job_id: str,
+    token: None = Depends(_verify_token),
+    manager: JobManager = Depends(get_job_manager),
+) -> JobStatusResponse:
+    """Cancel a job that has not started running."""
+    job = _require_job(manager, job_id)
+    if not manager.cancel(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} is {job.state.value} and cannot be cancelled",
         )
+    return job.to_status()
 
 
 @api_get("/status", response_model=WorkflowResponse)
@@ -1011,4 +1192,6 @@ __all__ = [
     "DoctorRequest",
     "EDRRCycleRequest",
     "WorkflowResponse",
+    "WORKFLOWS",
+    "WorkflowRoute",
 ]
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import os
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import DefaultDict
 from collections.abc import Sequence
@@ -39,6 +39,7 @@ from devsynth.interface.agentapi_models import (
 )
 from devsynth.interface.ux_bridge import sanitize_output
 from devsynth.logging_setup import DevSynthLogger
+from devsynth.observability.latency_histogram import WindowedLatencyHistogram
 
 # Configure logging
 logger = DevSynthLogger(__name__)
@@ -76,15 +77,36 @@ class RateLimiterState:
         self.buckets[client_ip].append(timestamp)
 
 
+# Raw samples kept per endpoint for ``APIMetrics`` snapshots; quantiles and
+# Prometheus buckets come from the fixed-size histograms instead.
+RECENT_LATENCY_SAMPLES = 256
+
+# Windows reported as latency quantiles on the metrics endpoint; ``None`` is
+# the lifetime of the process.
+LATENCY_WINDOWS: tuple[tuple[str, float | None], ...] = (
+    ("1m", 60.0),
+    ("5m", 300.0),
+    ("all", None),
+)
+LATENCY_QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
 @dataclass(slots=True)
 class MetricsTracker:
-    """Lightweight metrics accumulator that mirrors ``APIMetrics``."""
+    """Lightweight metrics accumulator that mirrors ``APIMetrics``.
+
+    Latencies are folded into a :class:`WindowedLatencyHistogram` per endpoint,
+    so memory stays constant however long the API runs.
+    """
 
     start_time: float = field(default_factory=time.time)
     request_count: int = 0
     error_count: int = 0
     endpoint_counts: dict[str, int] = field(default_factory=dict)
-    endpoint_latency: dict[str, list[float]] = field(default_factory=dict)
+    endpoint_latency: dict[str, deque[float]] = field(default_factory=dict)
+    latency_histograms: dict[str, WindowedLatencyHistogram] = field(
+        default_factory=dict
+    )
 
     def increment(self, endpoint: str) -> None:
         """Record a request for the provided endpoint."""
@@ -97,8 +119,16 @@ class MetricsTracker:
 
         if latency < 0:
             return
-        samples = self.endpoint_latency.setdefault(endpoint, [])
-        samples.append(latency)
+        histogram = self.latency_histograms.get(endpoint)
+        if histogram is None:
+            histogram = self.latency_histograms.setdefault(
+                endpoint, WindowedLatencyHistogram()
+            )
+            self.endpoint_latency.setdefault(
+                endpoint, deque(maxlen=RECENT_LATENCY_SAMPLES)
+            )
+        histogram.record(latency)
+        self.endpoint_latency[endpoint].append(latency)
 
     def record_error(self) -> None:
         """Increment the error counter."""
@@ -106,7 +136,10 @@ class MetricsTracker:
         self.error_count += 1
 
     def snapshot(self) -> APIMetrics:
-        """Materialize the metrics in the shared Pydantic schema."""
+        """Materialize the metrics in the shared Pydantic schema.
+
+        ``endpoint_latency`` holds the most recent samples per endpoint.
+        """
 
         return APIMetrics(
             start_time=self.start_time,
@@ -1198,26 +1231,40 @@ async def metrics_endpoint(
 
     lines.append("# HELP endpoint_latency_seconds Latency per endpoint in seconds")
     lines.append("# TYPE endpoint_latency_seconds histogram")
-    for endpoint, latencies in metrics_state.endpoint_latency.items():
-        if latencies:
-            avg_latency = sum(latencies) / len(latencies)
+    histograms = dict(get_state().metrics.latency_histograms)
+    for endpoint, histogram in histograms.items():
+        lifetime = histogram.total()
+        for bound, cumulative in lifetime.cumulative_buckets():
+            le = "+Inf" if bound == float("inf") else str(float(bound))
             lines.append(
-                f'endpoint_latency_seconds{{endpoint="{endpoint}",quantile="avg"}} {avg_latency}'
+                f'endpoint_latency_seconds_bucket{{endpoint="{endpoint}",le="{le}"}} '
+                f"{cumulative}"
             )
-            if len(latencies) >= 2:
-                sorted_latencies = sorted(latencies)
-                p50 = sorted_latencies[len(sorted_latencies) // 2]
-                p95 = sorted_latencies[int(len(sorted_latencies) * 0.95)]
-                p99 = sorted_latencies[int(len(sorted_latencies) * 0.99)]
-                lines.append(
-                    f'endpoint_latency_seconds{{endpoint="{endpoint}",quantile="0.5"}} {p50}'
-                )
-                lines.append(
-                    f'endpoint_latency_seconds{{endpoint="{endpoint}",quantile="0.95"}} {p95}'
-                )
-                lines.append(
-                    f'endpoint_latency_seconds{{endpoint="{endpoint}",quantile="0.99"}} {p99}'
-                )
+        lines.append(
+            f'endpoint_latency_seconds_sum{{endpoint="{endpoint}"}} {lifetime.total}'
+        )
+        lines.append(
+            f'endpoint_latency_seconds_count{{endpoint="{endpoint}"}} {lifetime.count}'
+        )
+
+    lines.append(
+        "# HELP endpoint_latency_window_seconds Latency quantiles per endpoint "
+        "over recent windows"
+    )
+    lines.append("# TYPE endpoint_latency_window_seconds summary")
+    for endpoint, histogram in histograms.items():
+        for window, seconds in LATENCY_WINDOWS:
+            view = histogram.total() if seconds is None else histogram.window(seconds)
+            if not view.count:
+                continue
+            labels = f'endpoint="{endpoint}",window="{window}"'
+            name = "endpoint_latency_window_seconds"
+            for quantile, value in zip(
+                LATENCY_QUANTILES, view.quantiles(LATENCY_QUANTILES)
+            ):
+                lines.append(f'{name}{{{labels},quantile="{quantile}"}} {value}')
+            lines.append(f"{name}_sum{{{labels}}} {view.total}")
+            lines.append(f"{name}_count{{{labels}}} {view.count}")
 
     metrics_payload = MetricsResponse(metrics=tuple(lines))
     return PlainTextResponse(content="\n".join(metrics_payload.metrics))
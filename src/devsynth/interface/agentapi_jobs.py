@@ -0,0 +1,289 @@
+"""Background job execution for long-running Agent API workflows.
+
+Workflow endpoints such as synthesis or EDRR cycles can run for minutes. The
+:class:`JobManager` runs them on a bounded thread pool instead of the request
+thread, gives each run its own :class:`~devsynth.interface.agentapi.APIBridge`
+so concurrent clients never share output, and exposes per-job status, results
+and a Server-Sent Events stream of the bridge's progress snapshots.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from devsynth.interface.agentapi_models import (
+    JobState,
+    JobStatusResponse,
+    WorkflowMetadata,
+    WorkflowResponse,
+)
+from devsynth.logging_setup import DevSynthLogger
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from devsynth.interface.agentapi import APIBridge
+
+logger = DevSynthLogger(__name__)
+
+TERMINAL_STATES = frozenset({JobState.SUCCEEDED, JobState.FAILED, JobState.CANCELLED})
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_MAX_PENDING = 256
+DEFAULT_MAX_RETAINED = 1024
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when no more jobs can be accepted."""
+
+
+@dataclass(slots=True)
+class Job:
+    """A workflow run tracked by :class:`JobManager`."""
+
+    job_id: str
+    workflow: str
+    bridge: APIBridge
+    state: JobState = JobState.QUEUED
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    future: Future[None] | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    def to_status(self) -> JobStatusResponse:
+        snapshots = self.bridge.progress_snapshots
+        return JobStatusResponse(
+            job_id=self.job_id,
+            workflow=self.workflow,
+            state=self.state,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            progress=snapshots[-1] if snapshots else None,
+            message_count=len(self.bridge.messages),
+            error=self.error,
+        )
+
+    def to_response(self) -> WorkflowResponse:
+        duration_ms = None
+        if self.started_at and self.finished_at:
+            duration_ms = (self.finished_at - self.started_at).total_seconds() * 1000
+        return WorkflowResponse(
+            messages=tuple(self.bridge.messages),
+            metadata=WorkflowMetadata(
+                started_at=self.started_at,
+                duration_ms=duration_ms,
+                progress=self.bridge.progress_snapshots,
+            ),
+        )
+
+
+class JobManager:
+    """Run workflow jobs on a bounded executor and keep their results.
+
+    Args:
+        max_workers: Jobs that may run at the same time.
+        max_pending: Queued plus running jobs accepted before
+            :meth:`submit` raises :class:`JobQueueFullError`.
+        max_retained: Jobs kept for status and result lookups; the oldest
+            finished jobs are forgotten first.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_retained: int = DEFAULT_MAX_RETAINED,
+    ) -> None:
+        if max_workers < 1 or max_pending < 1 or max_retained < 1:
+            raise ValueError("job limits must be positive")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="devsynth-api-job"
+        )
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def active_count(self) -> int:
+        """Number of queued or running jobs."""
+
+        return self._active
+
+    def submit(self, workflow: str, bridge: APIBridge, run: Callable[[], None]) -> Job:
+        """Queue ``run`` and return its job immediately.
+
+        Raises:
+            JobQueueFullError: If ``max_pending`` jobs are already active.
+        """
+
+        with self._lock:
+            if self._active >= self.max_pending:
+                raise JobQueueFullError(
+                    f"{self._active} jobs already queued or running"
+                )
+            job = Job(job_id=uuid.uuid4().hex, workflow=workflow, bridge=bridge)
+            self._jobs[job.job_id] = job
+            self._active += 1
+            self._evict_finished_locked()
+            job.future = self._executor.submit(self._execute, job, run)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet."""
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state is not JobState.QUEUED:
+                return False
+            if job.future is not None and not job.future.cancel():
+                return False
+            job.state = JobState.CANCELLED
+            job.finished_at = datetime.now()
+            self._active -= 1
+        return True
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _execute(self, job: Job, run: Callable[[], None]) -> None:
+        with self._lock:
+            job.state = JobState.RUNNING
+            job.started_at = datetime.now()
+        state = JobState.SUCCEEDED
+        try:
+            run()
+        except Exception as exc:
+            logger.error(f"Job {job.job_id} ({job.workflow}) failed: {exc}")
+            job.error = str(exc)
+            state = JobState.FAILED
+        finally:
+            with self._lock:
+                job.finished_at = datetime.now()
+                job.state = state
+                self._active -= 1
+
+    def _evict_finished_locked(self) -> None:
+        excess = len(self._jobs) - self.max_retained
+        if excess <= 0:
+            return
+        for job_id in [jid for jid, job in self._jobs.items() if job.done][:excess]:
+            del self._jobs[job_id]
+
+    async def stream_events(
+        self,
+        job: Job,
+        *,
+        poll_interval: float = 0.25,
+        keepalive: float = 15.0,
+    ) -> AsyncIterator[str]:
+        """Yield Server-Sent Events for ``job`` until it finishes.
+
+        ``progress`` events carry each new progress snapshot, ``message``
+        events each new bridge message, and a final ``status`` event carries
+        the terminal :class:`JobStatusResponse`.
+        """
+
+        sent_progress = 0
+        sent_messages = 0
+        loop = asyncio.get_running_loop()
+        last_event = loop.time()
+        while True:
+            # Read the state first so updates made just before completion are
+            # still flushed below.
+            finished = job.done
+            emitted = False
+            snapshots = job.bridge.progress_snapshots
+            for snapshot in snapshots[sent_progress:]:
+                yield _sse("progress", snapshot.model_dump(mode="json"))
+                emitted = True
+            sent_progress = len(snapshots)
+            messages = job.bridge.messages[sent_messages:]
+            for message in messages:
+                yield _sse("message", {"message": message})
+                emitted = True
+            sent_messages += len(messages)
+
+            if finished:
+                yield _sse("status", job.to_status().model_dump(mode="json"))
+                return
+            now = loop.time()
+            if emitted:
+                last_event = now
+            elif now - last_event >= keepalive:
+                yield ": keep-alive\n\n"
+                last_event = now
+            await asyncio.sleep(poll_interval)
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s value %r; using %d", name, raw, default)
+        return default
+
+
+_job_manager: JobManager | None = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Return the process-wide job manager, creating it on first use.
+
+    Limits come from ``DEVSYNTH_API_JOB_WORKERS``,
+    ``DEVSYNTH_API_JOB_QUEUE_SIZE`` and ``DEVSYNTH_API_JOB_RETENTION``.
+    """
+
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = JobManager(
+                    max_workers=_env_int(
+                        "DEVSYNTH_API_JOB_WORKERS", DEFAULT_MAX_WORKERS
+                    ),
+                    max_pending=_env_int(
+                        "DEVSYNTH_API_JOB_QUEUE_SIZE", DEFAULT_MAX_PENDING
+                    ),
+                    max_retained=_env_int(
+                        "DEVSYNTH_API_JOB_RETENTION", DEFAULT_MAX_RETAINED
+                    ),
+                )
+    return _job_manager
+
+
+__all__ = [
+    "Job",
+    "JobManager",
+    "JobQueueFullError",
+    "TERMINAL_STATES",
+    "get_job_manager",
+]
@@ -133,6 +133,45 @@ class WorkflowResponse(BaseModel):
     metadata: WorkflowMetadata | None = None
 
 
+class JobState(str, Enum):
+    """Lifecycle states of a background workflow job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobAcceptedResponse(BaseModel):
+    """Returned when a workflow job is queued."""
+
+    __test__ = False
+
+    job_id: str = Field(..., min_length=1)
+    workflow: str = Field(..., min_length=1)
+    state: JobState
+    status_url: str
+    result_url: str
+    events_url: str
+
+
+class JobStatusResponse(BaseModel):
+    """Current state of a workflow job and its latest progress update."""
+
+    __test__ = False
+
+    job_id: str = Field(..., min_length=1)
+    workflow: str = Field(..., min_length=1)
+    state: JobState
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    progress: ProgressSnapshot | None = None
+    message_count: int = Field(0, ge=0)
+    error: str | None = None
+
+
 class EndpointMetrics(BaseModel):
     """Metrics collected for a single API endpoint."""
 
@@ -166,13 +166,23 @@ def run() -> None:
         webui_cmd,
     )
     from devsynth.application.cli.apispec import apispec_cmd
-    from devsynth.application.cli.commands import (
-        align_cmd,
+    from devsynth.application.cli.commands.align_cmd import align_cmd
+    from devsynth.application.cli.commands.alignment_metrics_cmd import (
         alignment_metrics_cmd,
+    )
+    from devsynth.application.cli.commands.generate_docs_cmd import (
         generate_docs_cmd,
+    )
+    from devsynth.application.cli.commands.inspect_config_cmd import (
         inspect_config_cmd,
+    )
+    from devsynth.application.cli.commands.test_metrics_cmd import (
         test_metrics_cmd,
+    )
+    from devsynth.application.cli.commands.validate_manifest_cmd import (
         validate_manifest_cmd,
+    )
+    from devsynth.application.cli.commands.validate_metadata_cmd import (
         validate_metadata_cmd,
     )
 
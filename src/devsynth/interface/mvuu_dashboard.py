@@ -143,12 +143,16 @@ def _load_graph_artifact_summary(
         import rdflib
         from rdflib import RDF
         from rdflib.namespace import RDFS
+
+        from devsynth.application.memory.adapters.graph_journal import (
+            load_journaled_graph,
+        )
     except Exception:  # pragma: no cover - rdflib unavailable
         return []
 
-    graph = rdflib.Graph()
     try:
-        graph.parse(path, format="turtle")
+        # Changes since the last compaction live in the adjacent journal.
+        graph = load_journaled_graph(rdflib.Graph(), path)
     except Exception:  # pragma: no cover - invalid TTL content
         return []
 
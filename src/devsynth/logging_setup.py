@@ -6,14 +6,18 @@ This module provides a centralized logging configuration with structured logging
 capabilities, ensuring consistent error reporting across the application.
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 import sys
 import traceback
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from contextvars import ContextVar
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from threading import RLock
 from types import TracebackType
@@ -35,9 +39,13 @@ _configured_log_file: str | None = None
 _logging_configured = False
 
 # Track last effective configuration for idempotency
-_EffectiveConfig = tuple[str, str, int, bool]
+# (log dir, log file, level, file logging enabled, queued handlers)
+_EffectiveConfig = tuple[str, str, int, bool, bool]
 _last_effective_config: _EffectiveConfig | None = None
 
+# Listener draining the log queue when handlers run off the calling thread
+_queue_listener: QueueListener | None = None
+
 # Reentrant lock to make configuration thread-safe
 _config_lock: RLock = RLock()
 
@@ -57,6 +65,35 @@ _SECRET_ENV_VARS: list[str] = [
 
 
 T = TypeVar("T", bound=object)
+F = TypeVar("F", bound=logging.Filter)
+
+# LogRecord attributes that callers may not override through ``extra``
+_RESERVED_RECORD_ATTRS: frozenset[str] = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "asctime",
+    }
+)
 
 
 class RedactSecretsFilter(logging.Filter):
@@ -67,12 +104,17 @@ class RedactSecretsFilter(logging.Filter):
 
     def __init__(self) -> None:
         super().__init__()
-        # Snapshot secret values from environment at construction time
         self._secrets: dict[str, str] = {}
+        self.reload_secrets()
+
+    def reload_secrets(self) -> None:
+        """Snapshot the secret values currently set in the environment."""
+        secrets: dict[str, str] = {}
         for key in _SECRET_ENV_VARS:
             val = os.environ.get(key)
             if val and isinstance(val, str) and len(val) >= 8:
-                self._secrets[key] = val
+                secrets[key] = val
+        self._secrets = secrets
 
     @staticmethod
     def _mask(value: str) -> str:
@@ -101,9 +143,17 @@ class RedactSecretsFilter(logging.Filter):
         return redacted
 
     def filter(self, record: logging.LogRecord) -> bool:
+        if not self._secrets:
+            return True
         try:
-            if isinstance(record.msg, str):
-                record.msg = self._redact_in_text(record.msg)
+            msg = record.msg
+            if isinstance(msg, str):
+                record.msg = self._redact_in_text(msg)
+            elif isinstance(msg, LazyMessage):
+                # Stay lazy: redact once the message is actually rendered.
+                record.msg = LazyMessage(lambda: self._redact_in_text(str(msg)))
+            elif msg is not None:
+                record.msg = self._redact_in_text(str(msg))
             if hasattr(record, "args") and isinstance(record.args, tuple):
                 record.args = tuple(
                     self._redact_in_text(a) if isinstance(a, str) else a
@@ -203,6 +253,76 @@ class RequestContextFilter(logging.Filter):
         return True
 
 
+def _install_filter(target: logging.Filterer, filter_type: type[F]) -> F:
+    """Attach one ``filter_type`` instance to ``target`` and return it.
+
+    Loggers are shared per name, so installing a fresh filter for every
+    wrapper would run the same filter once per wrapper on each record.
+    """
+    for existing in target.filters:
+        if type(existing) is filter_type:
+            return cast(F, existing)
+    installed = filter_type()
+    target.addFilter(installed)
+    return installed
+
+
+class LazyMessage:
+    """Log message computed only when a handler formats the record.
+
+    ``DevSynthLogger`` wraps callables passed as the message in this class,
+    so ``logger.debug(lambda: expensive_summary())`` costs nothing when debug
+    logging is disabled.
+    """
+
+    __slots__ = ("_factory", "_text")
+
+    def __init__(self, factory: Callable[[], object]) -> None:
+        self._factory = factory
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = str(self._factory())
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"LazyMessage({self._factory!r})"
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """Queue handler for a listener in the same process.
+
+    The stdlib handler formats records and drops ``exc_info`` so they can be
+    pickled; in-process records only need their message merged (arguments may
+    be mutated after the call returns), which keeps exception details intact
+    for :class:`JSONFormatter`.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "0").lower() in ("1", "true", "yes")
+
+
+def stop_queue_listener() -> None:
+    """Flush queued log records and stop the background listener, if any."""
+    global _queue_listener
+    with _config_lock:
+        listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(stop_queue_listener)
+
+
 def set_request_context(
     request_id: str | None = None, phase: str | None = None
 ) -> None:
@@ -322,6 +442,7 @@ def configure_logging(
     log_file: str | None = None,
     log_level: int | None = None,
     create_dir: bool = True,
+    use_queue: bool | None = None,
 ) -> None:
     """
     Configure the logging system with the specified parameters.
@@ -334,8 +455,12 @@ def configure_logging(
         log_file: Name of the log file
         log_level: Logging level (e.g., logging.INFO)
         create_dir: Whether to create the log directory (default True)
+        use_queue: Hand records to a ``QueueHandler`` and run the console and
+            JSON file handlers on a background ``QueueListener`` thread.
+            Defaults to the ``DEVSYNTH_LOG_QUEUE`` environment variable.
     """
     global _configured_log_dir, _configured_log_file, _logging_configured, _last_effective_config
+    global _queue_listener
 
     # Guard the entire configuration for thread-safety
     _config_lock.acquire()
@@ -399,12 +524,14 @@ def configure_logging(
             else log_level
         )
         effective_create_dir = bool(create_dir and not no_file_logging)
+        queued = _env_flag("DEVSYNTH_LOG_QUEUE") if use_queue is None else use_queue
 
         intended_config: _EffectiveConfig = (
             configured_log_dir,
             configured_log_file,
             effective_log_level,
             effective_create_dir,
+            queued,
         )
 
         # Idempotency: if already configured with the same effective config, do nothing
@@ -430,9 +557,10 @@ def configure_logging(
         root_logger = logging.getLogger()
 
         # Attach global redaction filter (ensures secrets never hit logs)
-        root_logger.addFilter(RedactSecretsFilter())
+        _install_filter(root_logger, RedactSecretsFilter).reload_secrets()
 
         # Clear existing handlers (safe reconfiguration)
+        stop_queue_listener()
         for handler in list(root_logger.handlers):
             root_logger.removeHandler(handler)
 
@@ -465,6 +593,23 @@ def configure_logging(
         else:
             root_logger.addHandler(logging.NullHandler())
 
+        if queued:
+            # Move the console and file handlers behind a queue so formatting
+            # and I/O happen on the listener thread.
+            handlers = [
+                handler
+                for handler in root_logger.handlers
+                if not isinstance(handler, logging.NullHandler)
+            ]
+            for handler in list(root_logger.handlers):
+                root_logger.removeHandler(handler)
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            root_logger.addHandler(_InProcessQueueHandler(log_queue))
+            _queue_listener = QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            _queue_listener.start()
+
         # Mark as configured and remember the configuration
         _logging_configured = True
         _last_effective_config = (
@@ -472,6 +617,7 @@ def configure_logging(
             configured_log_file,
             effective_log_level,
             file_logging_enabled,
+            queued,
         )
 
         # Log configuration info
@@ -491,6 +637,13 @@ class DevSynthLogger:
 
     This class no longer creates directories on instantiation, supporting better test isolation.
     Directory creation is now deferred to explicit configure_logging() calls.
+
+    Calls at a disabled level return after a single cached level check. Use
+    ``%``-style arguments, or pass a zero-argument callable as the message, to
+    avoid building expensive messages that may never be emitted::
+
+        logger.debug("Parsed %s", path)
+        logger.debug(lambda: f"AST dump:\n{ast.dump(tree)}")
     """
 
     def __init__(self, name: str):
@@ -501,13 +654,17 @@ class DevSynthLogger:
             name: The name of the component (typically __name__)
         """
         self.logger: logging.Logger = logging.getLogger(name)
-        self.logger.addFilter(RequestContextFilter())
-        self.logger.addFilter(RedactSecretsFilter())
+        _install_filter(self.logger, RequestContextFilter)
+        _install_filter(self.logger, RedactSecretsFilter).reload_secrets()
 
         # Don't create log directory here - defer until explicitly configured
         # This is important for test isolation
 
-    def _log(self, level: int, msg: str, *args: object, **kwargs: Any) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """Return whether a message at ``level`` would be processed."""
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, msg: object, *args: object, **kwargs: Any) -> None:
         """Internal helper to dispatch log messages with standard kwargs.
 
         This method ensures standard logging parameters like ``exc_info``,
@@ -517,6 +674,12 @@ class DevSynthLogger:
         kwargs from higher-level APIs such as the requirements wizard.
         """
 
+        if callable(msg):
+            msg = LazyMessage(msg)
+        if not kwargs:
+            self.logger.log(level, msg, *args)
+            return
+
         exc_param = kwargs.pop("exc_info", None)
         stack_info = kwargs.pop("stack_info", None)
         stacklevel = kwargs.pop("stacklevel", None)
@@ -547,31 +710,6 @@ class DevSynthLogger:
         elif exc_param:
             exc_info_value = sys.exc_info()
 
-        reserved: set[str] = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "message",
-            "asctime",
-        }
-
         extra_mapping: Mapping[str, Any] | None = None
         if extra_param is not None:
             extra_mapping = (
@@ -590,12 +728,14 @@ class DevSynthLogger:
             extra_dict = {
                 key: value
                 for key, value in extra_mapping.items()
-                if key not in reserved
+                if key not in _RESERVED_RECORD_ATTRS
             }
 
         if kwargs:
             safe_kwargs = {
-                key: value for key, value in kwargs.items() if key not in reserved
+                key: value
+                for key, value in kwargs.items()
+                if key not in _RESERVED_RECORD_ATTRS
             }
             if extra_dict is None:
                 extra_dict = safe_kwargs
@@ -614,30 +754,36 @@ class DevSynthLogger:
 
         self.logger.log(level, msg, *args, **log_kwargs)
 
-    def debug(self, msg: str, *args: object, **kwargs: Any) -> None:
+    def debug(self, msg: object, *args: object, **kwargs: Any) -> None:
         """Log a debug message."""
-        self._log(logging.DEBUG, msg, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, *args, **kwargs)
 
-    def info(self, msg: str, *args: object, **kwargs: Any) -> None:
+    def info(self, msg: object, *args: object, **kwargs: Any) -> None:
         """Log an info message."""
-        self._log(logging.INFO, msg, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, *args, **kwargs)
 
-    def warning(self, msg: str, *args: object, **kwargs: Any) -> None:
+    def warning(self, msg: object, *args: object, **kwargs: Any) -> None:
         """Log a warning message."""
-        self._log(logging.WARNING, msg, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, *args, **kwargs)
 
-    def error(self, msg: str, *args: object, **kwargs: Any) -> None:
+    def error(self, msg: object, *args: object, **kwargs: Any) -> None:
         """Log an error message."""
-        self._log(logging.ERROR, msg, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, *args, **kwargs)
 
-    def critical(self, msg: str, *args: object, **kwargs: Any) -> None:
+    def critical(self, msg: object, *args: object, **kwargs: Any) -> None:
         """Log a critical message."""
-        self._log(logging.CRITICAL, msg, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, msg, *args, **kwargs)
 
-    def exception(self, msg: str, *args: object, **kwargs: Any) -> None:
+    def exception(self, msg: object, *args: object, **kwargs: Any) -> None:
         """Log an exception message with traceback."""
-        kwargs.setdefault("exc_info", True)
-        self._log(logging.ERROR, msg, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            kwargs.setdefault("exc_info", True)
+            self._log(logging.ERROR, msg, *args, **kwargs)
 
 
 # Don't configure logging on import - this is now explicit
@@ -0,0 +1,225 @@
+"""Fixed-memory streaming latency histograms.
+
+Latencies are counted in log-linear buckets: every power of two is split into
+``SUB_BUCKETS`` equal-width buckets, so reported quantiles stay within 1% of
+the true sample while memory is bounded by the number of occupied buckets
+rather than the number of observations.  Values are clamped to
+``[MIN_VALUE, MAX_VALUE]`` seconds, which caps a histogram at roughly two
+thousand buckets.
+
+:class:`WindowedLatencyHistogram` adds a ring of short time slots on top of a
+cumulative histogram so recent windows (for example the last minute) can be
+reported next to lifetime Prometheus buckets.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+__all__ = [
+    "DEFAULT_BUCKET_BOUNDS",
+    "LatencyHistogram",
+    "WindowedLatencyHistogram",
+]
+
+SUB_BUCKETS = 64
+MIN_VALUE = 1e-6
+MAX_VALUE = 3600.0
+
+# Prometheus client defaults, in seconds.
+DEFAULT_BUCKET_BOUNDS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+def _bucket_index(value: float) -> int:
+    mantissa, exponent = math.frexp(value)  # value == mantissa * 2**exponent
+    return exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+
+def _bucket_midpoint(index: int) -> float:
+    exponent, sub = divmod(index, SUB_BUCKETS)
+    low = 0.5 + sub / (2 * SUB_BUCKETS)
+    return math.ldexp(low + 1 / (4 * SUB_BUCKETS), exponent)
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in seconds.
+
+    Not synchronised; :class:`WindowedLatencyHistogram` guards its instances.
+
+    Args:
+        bounds: Optional ascending upper bounds for exact cumulative
+            Prometheus buckets, maintained alongside the fine buckets.
+    """
+
+    __slots__ = ("buckets", "count", "total", "min", "max", "bounds", "_bound_counts")
+
+    def __init__(self, bounds: Sequence[float] | None = None) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.bounds: tuple[float, ...] = tuple(bounds or ())
+        self._bound_counts = [0] * (len(self.bounds) + 1)
+
+    def record(self, value: float) -> None:
+        """Add one observation; negative values are ignored."""
+        if value < 0:
+            return
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        index = _bucket_index(min(max(value, MIN_VALUE), MAX_VALUE))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if self.bounds:
+            self._bound_counts[bisect_left(self.bounds, value)] += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Fold the fine buckets and totals of ``other`` into this histogram."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        buckets = self.buckets
+        for index, count in other.buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        if self.bounds and self.bounds == other.bounds:
+            for position, count in enumerate(other._bound_counts):
+                self._bound_counts[position] += count
+
+    def copy(self) -> LatencyHistogram:
+        clone = LatencyHistogram(self.bounds)
+        clone.merge(self)
+        return clone
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Return the ``q`` quantile (``0 <= q <= 1``) or ``None`` when empty."""
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Iterable[float]) -> list[float | None]:
+        """Return several quantiles with a single pass over the buckets."""
+        qs = list(qs)
+        if not self.count:
+            return [None] * len(qs)
+        order = sorted(range(len(qs)), key=lambda position: qs[position])
+        ranks = [max(1, math.ceil(qs[position] * self.count)) for position in order]
+        results: list[float | None] = [None] * len(qs)
+        cumulative = 0
+        pending = 0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            while pending < len(order) and cumulative >= ranks[pending]:
+                q = qs[order[pending]]
+                if q <= 0:
+                    value = self.min
+                elif q >= 1:
+                    value = self.max
+                else:
+                    value = min(max(_bucket_midpoint(index), self.min), self.max)
+                results[order[pending]] = value
+                pending += 1
+            if pending == len(order):
+                break
+        return results
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Return ``(upper_bound, cumulative_count)`` pairs ending with ``+Inf``."""
+        pairs: list[tuple[float, int]] = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (math.inf,), self._bound_counts):
+            cumulative += count
+            pairs.append((bound, cumulative))
+        return pairs
+
+
+class WindowedLatencyHistogram:
+    """Thread-safe cumulative histogram with a ring of recent time slots.
+
+    Args:
+        slot_seconds: Width of each time slot.
+        slots: Number of slots kept; windows longer than
+            ``slot_seconds * slots`` are truncated to that span.
+        bounds: Cumulative Prometheus bucket bounds for the lifetime view.
+        clock: Monotonic time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        slot_seconds: float = 10.0,
+        slots: int = 30,
+        bounds: Sequence[float] = DEFAULT_BUCKET_BOUNDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.slot_seconds = slot_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._total = LatencyHistogram(bounds)
+        self._slots: list[LatencyHistogram | None] = [None] * max(1, slots)
+        self._slot_ids = [-1] * len(self._slots)
+
+    @property
+    def max_window(self) -> float:
+        return self.slot_seconds * len(self._slots)
+
+    def record(self, value: float) -> None:
+        """Add one observation to the lifetime view and the current slot."""
+        if value < 0:
+            return
+        slot_id = int(self._clock() // self.slot_seconds)
+        position = slot_id % len(self._slots)
+        with self._lock:
+            self._total.record(value)
+            slot = self._slots[position]
+            if slot is None or self._slot_ids[position] != slot_id:
+                slot = self._slots[position] = LatencyHistogram()
+                self._slot_ids[position] = slot_id
+            slot.record(value)
+
+    def total(self) -> LatencyHistogram:
+        """Return a copy of the lifetime histogram."""
+        with self._lock:
+            return self._total.copy()
+
+    def window(self, seconds: float) -> LatencyHistogram:
+        """Return the observations from roughly the last ``seconds``.
+
+        The current, partially filled slot is included, so the span covered
+        lies between ``seconds - slot_seconds`` and ``seconds``.
+        """
+        current = int(self._clock() // self.slot_seconds)
+        span = min(len(self._slots), max(1, math.ceil(seconds / self.slot_seconds)))
+        merged = LatencyHistogram()
+        with self._lock:
+            for slot, slot_id in zip(self._slots, self._slot_ids):
+                if slot is not None and current - span < slot_id <= current:
+                    merged.merge(slot)
+        return merged
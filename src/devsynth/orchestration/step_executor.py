@@ -9,12 +9,14 @@ Aligned with project guidelines and docs/plan.md (architecture boundaries).
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any
 
 # Keep imports adapter-agnostic. We rely on duck typing for `state` and `step`.
-from devsynth.adapters.agents.agent_adapter import AgentAdapter
-from devsynth.application.llm.providers import SimpleLLMProviderFactory
-from devsynth.ports.llm_port import LLMPort
+from devsynth.orchestration.team_pool import (
+    AgentTeamPool,
+    TeamSpec,
+    get_default_team_pool,
+)
 
 
 class OrchestrationService:
@@ -23,73 +25,36 @@ class OrchestrationService:
     Notes:
     - This keeps adapters thin by removing LLM provider setup, agent/team
       construction, and task shaping from adapter glue code.
+    - Provider bootstrap and agent construction are paid once per team and
+      amortized across steps and workflows through an :class:`AgentTeamPool`
+      (the process-wide pool unless one is injected).
     - The service accepts `state` and `step` as dynamic objects to avoid
       circular dependencies with adapter-local types. They must provide the
       attributes used below (duck typing).
     """
 
-    def __init__(self) -> None:
-        # In the future, this can accept configuration or factories via DI.
-        self._llm_factory = SimpleLLMProviderFactory()
+    def __init__(
+        self,
+        team_pool: AgentTeamPool | None = None,
+        team_spec: TeamSpec | None = None,
+    ) -> None:
+        self._team_pool = team_pool or get_default_team_pool()
+        self._team_spec = team_spec or TeamSpec()
 
-    def process_step(
-        self, state: Any, step: Any
-    ) -> Any:  # pragma: no cover - thin wrapper
+    def process_step(self, state: Any, step: Any) -> Any:
         """Process a single workflow step and update the given state.
 
         Expected attributes:
         - state.workflow_id, state.context, state.messages, state.project_root
         - step.id, step.name, step.description, step.agent_type
         """
-        # Configure a default provider (LM Studio local) for local/offline-friendly usage.
-        # This mirrors the previous adapter behavior.
-        self._llm_factory.create_provider(
-            "lmstudio",
-            {
-                "api_base": "http://localhost:1234",
-                "model": "local_model",
-                "max_tokens": 2048,
-            },
-        )
-
-        llm_port = LLMPort(self._llm_factory)
-        llm_port.set_default_provider(
-            "lmstudio",
-            {
-                "api_base": "http://localhost:1234",
-                "model": "local_model",
-                "max_tokens": 2048,
-            },
-        )
-
-        agent_adapter = AgentAdapter(llm_port)
-
-        # Team construction (WSDE model): currently include multiple agent types.
+        # Lease a WSDE team (default LM Studio provider, all agent types) that
+        # is bound to this workflow step for the duration of the call.
         team_id = f"{state.workflow_id}_{step.id}"
-        agent_adapter.create_team(team_id)
-
-        agent_types = [
-            "planner",
-            "specification",
-            "test",
-            "code",
-            "validation",
-            "refactor",
-            "documentation",
-            "diagram",
-            "critic",
-        ]
-        for agent_type in agent_types:
-            agent = agent_adapter.create_agent(
-                agent_type,
-                {
-                    "name": f"{agent_type}_agent",
-                    "description": f"Agent for {agent_type} tasks",
-                    "capabilities": [],
-                },
-            )
-            agent_adapter.add_agent_to_team(agent)
+        with self._team_pool.lease(self._team_spec, team_id) as pooled:
+            return self._run_step(pooled.adapter, state, step)
 
+    def _run_step(self, agent_adapter: Any, state: Any, step: Any) -> Any:
         # Log step execution context into messages
         state.messages.append(
             {
@@ -0,0 +1,365 @@
+"""
+Pool of initialized agent teams reused across workflow steps.
+
+Building a team means bootstrapping an LLM provider, an ``LLMPort``, an
+``AgentAdapter`` and one agent per agent type. :class:`AgentTeamPool` keeps
+those objects around, keyed by :class:`TeamSpec`, and hands them out for one
+step at a time. Each lease installs a fresh WSDE team (named after the
+workflow step) and resets the agents' role state, so no per-step state leaks
+between uses. A team whose step raised is discarded rather than returned.
+
+The pool is bounded: idle teams beyond ``max_idle`` are evicted least
+recently used first, and ``max_active`` caps how many teams can be leased at
+once. The process-wide default pool is configured through the
+``DEVSYNTH_TEAM_POOL_MAX_IDLE``, ``DEVSYNTH_TEAM_POOL_MAX_ACTIVE``,
+``DEVSYNTH_TEAM_POOL_ACQUIRE_TIMEOUT`` and ``DEVSYNTH_TEAM_POOL_WARMUP``
+environment variables.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from devsynth.adapters.agents.agent_adapter import AgentAdapter
+from devsynth.application.llm.providers import SimpleLLMProviderFactory
+from devsynth.domain.interfaces.agent import Agent
+from devsynth.domain.models.wsde import WSDETeam
+from devsynth.exceptions import ResourceExhaustedError
+from devsynth.logging_setup import DevSynthLogger
+from devsynth.ports.llm_port import LLMPort
+
+logger = DevSynthLogger(__name__)
+
+DEFAULT_AGENT_TYPES: tuple[str, ...] = (
+    "planner",
+    "specification",
+    "test",
+    "code",
+    "validation",
+    "refactor",
+    "documentation",
+    "diagram",
+    "critic",
+)
+
+# Local LM Studio provider for local/offline-friendly usage.
+DEFAULT_PROVIDER = "lmstudio"
+DEFAULT_PROVIDER_CONFIG: Mapping[str, Any] = {
+    "api_base": "http://localhost:1234",
+    "model": "local_model",
+    "max_tokens": 2048,
+}
+
+DEFAULT_MAX_IDLE = 4
+
+
+@dataclass(frozen=True, slots=True)
+class TeamSpec:
+    """Hashable description of the team a workflow step needs."""
+
+    provider: str = DEFAULT_PROVIDER
+    provider_config: tuple[tuple[str, Any], ...] = tuple(
+        sorted(DEFAULT_PROVIDER_CONFIG.items())
+    )
+    agent_types: tuple[str, ...] = DEFAULT_AGENT_TYPES
+
+    @classmethod
+    def create(
+        cls,
+        provider: str = DEFAULT_PROVIDER,
+        provider_config: Mapping[str, Any] | None = None,
+        agent_types: Iterable[str] | None = None,
+    ) -> TeamSpec:
+        config = (
+            DEFAULT_PROVIDER_CONFIG if provider_config is None else (provider_config)
+        )
+        return cls(
+            provider=provider,
+            provider_config=tuple(sorted(config.items())),
+            agent_types=(
+                DEFAULT_AGENT_TYPES if agent_types is None else tuple(agent_types)
+            ),
+        )
+
+
+@dataclass(slots=True, eq=False)
+class PooledTeam:
+    """An ``AgentAdapter`` and its agents, reusable across workflow steps."""
+
+    spec: TeamSpec
+    adapter: AgentAdapter
+    agents: tuple[Agent, ...]
+    uses: int = 0
+    _initial_roles: tuple[object, ...] = field(default=(), repr=False)
+
+    def __post_init__(self) -> None:
+        self._initial_roles = tuple(
+            getattr(agent, "current_role", None) for agent in self.agents
+        )
+
+    @classmethod
+    def create(cls, spec: TeamSpec, adapter: AgentAdapter) -> PooledTeam:
+        """Create one agent per ``spec.agent_types`` through ``adapter``."""
+
+        agents = tuple(
+            adapter.create_agent(
+                agent_type,
+                {
+                    "name": f"{agent_type}_agent",
+                    "description": f"Agent for {agent_type} tasks",
+                    "capabilities": [],
+                },
+            )
+            for agent_type in spec.agent_types
+        )
+        return cls(spec=spec, adapter=adapter, agents=agents)
+
+    def bind(self, team_id: str) -> WSDETeam:
+        """Reset per-use state and install a fresh team named ``team_id``."""
+
+        coordinator = self.adapter.agent_coordinator
+        coordinator.teams.clear()
+        coordinator.current_team_id = None
+        for agent, role in zip(self.agents, self._initial_roles):
+            agent.current_role = role
+            if hasattr(agent, "has_been_primus"):
+                agent.has_been_primus = False
+        team = self.adapter.create_team(team_id)
+        self.adapter.add_agents_to_team(self.agents)
+        self.uses += 1
+        return team
+
+
+TeamBuilder = Callable[[TeamSpec], PooledTeam]
+
+
+def build_team(
+    spec: TeamSpec, llm_factory: SimpleLLMProviderFactory | None = None
+) -> PooledTeam:
+    """Bootstrap the provider, LLM port, adapter and agents for ``spec``."""
+
+    llm_port = LLMPort(llm_factory or SimpleLLMProviderFactory())
+    llm_port.set_default_provider(spec.provider, dict(spec.provider_config))
+    return PooledTeam.create(spec, AgentAdapter(llm_port))
+
+
+@dataclass(frozen=True, slots=True)
+class TeamPoolStats:
+    """Counters describing pool effectiveness."""
+
+    hits: int
+    misses: int
+    evictions: int
+    discarded: int
+    idle: int
+    active: int
+
+
+class AgentTeamPool:
+    """Keyed, bounded pool of :class:`PooledTeam` instances.
+
+    Args:
+        max_idle: Idle teams kept across all specs; older ones are evicted.
+        max_active: Maximum number of teams leased at the same time, or
+            ``None`` for no limit.
+        acquire_timeout: Seconds to wait for a lease when ``max_active`` is
+            reached before raising :class:`ResourceExhaustedError`; ``None``
+            waits indefinitely.
+        builder: Creates a team for a spec. Defaults to :func:`build_team`
+            with a provider factory shared by the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        max_active: int | None = None,
+        acquire_timeout: float | None = None,
+        builder: TeamBuilder | None = None,
+    ) -> None:
+        if max_idle < 0:
+            raise ValueError("max_idle must not be negative")
+        if max_active is not None and max_active < 1:
+            raise ValueError("max_active must be positive")
+        self.max_idle = max_idle
+        self.max_active = max_active
+        self.acquire_timeout = acquire_timeout
+        self._builder: TeamBuilder = builder or partial(
+            build_team, llm_factory=SimpleLLMProviderFactory()
+        )
+        self._lock = threading.Lock()
+        self._slots: threading.BoundedSemaphore | None = None
+        if max_active is not None:
+            self._slots = threading.BoundedSemaphore(max_active)
+        # Idle teams in return order; the first entry is the least recent.
+        self._idle: OrderedDict[int, PooledTeam] = OrderedDict()
+        self._active = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._discarded = 0
+
+    @contextmanager
+    def lease(self, spec: TeamSpec, team_id: str) -> Iterator[PooledTeam]:
+        """Lease a team for ``spec`` bound to a fresh WSDE team ``team_id``.
+
+        The team returns to the pool when the block exits normally and is
+        discarded when it raises.
+        """
+
+        if self._slots is not None and not self._slots.acquire(
+            timeout=self.acquire_timeout
+        ):
+            raise ResourceExhaustedError(
+                f"No agent team available within {self.acquire_timeout}s",
+                resource_type="agent_team",
+                limit=self.max_active,
+            )
+        try:
+            pooled = self._checkout(spec)
+            try:
+                pooled.bind(team_id)
+                yield pooled
+            except BaseException:
+                with self._lock:
+                    self._active -= 1
+                    self._discarded += 1
+                raise
+            self._checkin(pooled)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    def warm_up(self, spec: TeamSpec, count: int = 1) -> int:
+        """Build teams for ``spec`` until ``count`` of them are idle.
+
+        Returns:
+            The number of teams built. Failures are logged, not raised, so a
+            missing provider does not prevent start-up.
+        """
+
+        with self._lock:
+            idle = sum(1 for pooled in self._idle.values() if pooled.spec == spec)
+        wanted = min(count, self.max_idle) - idle
+        built = 0
+        for _ in range(max(wanted, 0)):
+            try:
+                pooled = self._builder(spec)
+            except Exception as exc:
+                logger.warning("Agent team warm-up failed: %s", exc)
+                break
+            with self._lock:
+                self._store_idle(pooled)
+            built += 1
+        return built
+
+    def clear(self) -> None:
+        """Drop all idle teams."""
+
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> TeamPoolStats:
+        with self._lock:
+            return TeamPoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                discarded=self._discarded,
+                idle=len(self._idle),
+                active=self._active,
+            )
+
+    def _checkout(self, spec: TeamSpec) -> PooledTeam:
+        with self._lock:
+            for key in reversed(self._idle):
+                if self._idle[key].spec == spec:
+                    pooled = self._idle.pop(key)
+                    self._hits += 1
+                    self._active += 1
+                    return pooled
+            self._misses += 1
+            self._active += 1
+        try:
+            # Build outside the lock; provider bootstrap can be slow.
+            return self._builder(spec)
+        except BaseException:
+            with self._lock:
+                self._active -= 1
+            raise
+
+    def _checkin(self, pooled: PooledTeam) -> None:
+        with self._lock:
+            self._active -= 1
+            self._store_idle(pooled)
+
+    def _store_idle(self, pooled: PooledTeam) -> None:
+        self._idle[id(pooled)] = pooled
+        while len(self._idle) > self.max_idle:
+            self._idle.popitem(last=False)
+            self._evictions += 1
+
+
+_default_pool: AgentTeamPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def _env_number(name: str, cast: Callable[[str], Any]) -> Any:
+    value = os.environ.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return None
+
+
+def get_default_team_pool() -> AgentTeamPool:
+    """Return the process-wide pool, creating it from the environment."""
+
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            max_idle = _env_number("DEVSYNTH_TEAM_POOL_MAX_IDLE", int)
+            _default_pool = AgentTeamPool(
+                max_idle=DEFAULT_MAX_IDLE if max_idle is None else max_idle,
+                max_active=_env_number("DEVSYNTH_TEAM_POOL_MAX_ACTIVE", int),
+                acquire_timeout=_env_number(
+                    "DEVSYNTH_TEAM_POOL_ACQUIRE_TIMEOUT", float
+                ),
+            )
+            warm = _env_number("DEVSYNTH_TEAM_POOL_WARMUP", int)
+            if warm:
+                _default_pool.warm_up(TeamSpec(), warm)
+        return _default_pool
+
+
+def set_default_team_pool(pool: AgentTeamPool | None) -> None:
+    """Replace the process-wide pool (``None`` recreates it lazily)."""
+
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
+
+
+__all__ = [
+    "AgentTeamPool",
+    "DEFAULT_AGENT_TYPES",
+    "DEFAULT_PROVIDER",
+    "DEFAULT_PROVIDER_CONFIG",
+    "PooledTeam",
+    "TeamBuilder",
+    "TeamPoolStats",
+    "TeamSpec",
+    "build_team",
+    "get_default_team_pool",
+    "set_default_team_pool",
+]
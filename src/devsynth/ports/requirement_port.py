@@ -220,9 +220,7 @@ class DialecticalReasoningRepositoryPort(ABC):
         return None
 
     @abstractmethod
-    def get_reasoning_for_change(
-        self, change_id: UUID
-    ) -> DialecticalReasoning | None:
+    def get_reasoning_for_change(self, change_id: UUID) -> DialecticalReasoning | None:
         """
         Get a dialectical reasoning for a change.
 
@@ -389,6 +387,28 @@ class DialecticalReasonerPort(ABC):
         """
         return ImpactAssessment(change_id=change.id)
 
+    def index_requirement(self, requirement: Requirement) -> None:
+        """
+        Record a saved requirement in any dependency index the reasoner keeps.
+
+        Reasoners without such an index can rely on this no-op default.
+
+        Args:
+            requirement: The requirement that was created or updated.
+        """
+        return None
+
+    def forget_requirement(self, requirement_id: UUID) -> None:
+        """
+        Drop a deleted requirement from any dependency index the reasoner keeps.
+
+        Reasoners without such an index can rely on this no-op default.
+
+        Args:
+            requirement_id: The ID of the deleted requirement.
+        """
+        return None
+
 
 class NotificationPort(ABC):
     """Port for notifications."""
@@ -0,0 +1,184 @@
+"""Content-hash fingerprints for the ``run_tests`` collection cache.
+
+:class:`FileManifest` remembers, per directory, the ``(mtime_ns, size,
+sha256)`` of every file that can influence pytest collection. Snapshots only
+re-hash files whose size or modification time changed, so an unchanged tree
+costs one ``stat`` per file. A :class:`TreeSnapshot` exposes the per-file
+hashes, which lets :func:`devsynth.testing.run_tests.collect_tests_with_cache`
+re-collect just the test modules that changed, and a digest of the pytest
+configuration (``pytest.ini``, ``pyproject.toml``, ancestor ``conftest.py``
+files, ...) that forces a full collection when it changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+# Files outside the test tree that change how pytest collects or marks tests.
+PYTEST_CONFIG_FILES = ("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini")
+TRACKED_SUFFIXES = (".py", ".feature")
+_SKIPPED_DIRS = frozenset({"__pycache__", ".pytest_cache", ".mypy_cache"})
+_SCHEMA_VERSION = 1
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_test_module(path: str) -> bool:
+    """Return whether ``path`` is a module pytest collects tests from."""
+
+    name = PurePosixPath(path).name
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def config_digest(test_path: str, project_root: Path | None = None) -> str:
+    """Hash the pytest configuration that applies to ``test_path``.
+
+    Covers the project-level config files plus every ``conftest.py`` between
+    the project root and ``test_path`` (conftests inside the tree are part of
+    the snapshot itself).
+    """
+
+    root = (project_root or Path.cwd()).resolve()
+    candidates = [root / name for name in PYTEST_CONFIG_FILES]
+    directory = (root / test_path).resolve().parent
+    while directory == root or root in directory.parents:
+        candidates.append(directory / "conftest.py")
+        directory = directory.parent
+
+    digest = hashlib.sha256()
+    for candidate in candidates:
+        digest.update(str(candidate).encode())
+        try:
+            digest.update(_sha256(str(candidate)).encode())
+        except OSError:
+            digest.update(b"-")
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class TreeSnapshot:
+    """Content hashes for the tracked files under a collection target."""
+
+    test_path: str
+    files: dict[str, str] = field(default_factory=dict)
+    config: str = ""
+
+    @property
+    def digest(self) -> str:
+        digest = hashlib.sha256(self.config.encode())
+        for path, sha in sorted(self.files.items()):
+            digest.update(f"{path}\0{sha}\n".encode())
+        return digest.hexdigest()
+
+
+class FileManifest:
+    """Per-directory ``(mtime_ns, size, sha256)`` records persisted as JSON."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._dirs: dict[str, dict[str, list[object]]] = {}
+        self._dirty = False
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == _SCHEMA_VERSION:
+            dirs = payload.get("dirs")
+            if isinstance(dirs, dict):
+                self._dirs = dirs
+
+    def snapshot(self, test_path: str) -> TreeSnapshot:
+        """Hash every tracked file under ``test_path``, reusing stored hashes."""
+
+        files: dict[str, str] = {}
+        if os.path.isfile(test_path):
+            directory, name = os.path.split(test_path)
+            self._scan_entries(directory, [name], files)
+        else:
+            for dirpath, dirnames, filenames in os.walk(test_path):
+                dirnames[:] = sorted(
+                    d for d in dirnames if d not in _SKIPPED_DIRS and d[0] != "."
+                )
+                self._scan_entries(dirpath, sorted(filenames), files)
+        return TreeSnapshot(
+            test_path=test_path, files=files, config=config_digest(test_path)
+        )
+
+    def _scan_entries(
+        self, directory: str, names: list[str], files: dict[str, str]
+    ) -> None:
+        key = PurePosixPath(Path(directory)).as_posix()
+        previous = self._dirs.get(key, {})
+        current: dict[str, list[object]] = {}
+        for name in names:
+            if not name.endswith(TRACKED_SUFFIXES):
+                continue
+            full_path = os.path.join(directory, name)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue
+            record = previous.get(name)
+            if (
+                record is not None
+                and record[0] == stat.st_mtime_ns
+                and record[1] == stat.st_size
+            ):
+                sha = str(record[2])
+            else:
+                try:
+                    sha = _sha256(full_path)
+                except OSError:
+                    continue
+                record = [stat.st_mtime_ns, stat.st_size, sha]
+                self._dirty = True
+            current[name] = record
+            files[PurePosixPath(Path(full_path)).as_posix()] = sha
+        if current.keys() != previous.keys():
+            self._dirty = True
+        self._dirs[key] = current
+
+    def save(self) -> None:
+        """Persist the manifest if any record changed."""
+
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        payload = {"version": _SCHEMA_VERSION, "dirs": self._dirs}
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def changed_files(previous: dict[str, str], snapshot: TreeSnapshot) -> set[str]:
+    """Files added, removed or modified since ``previous`` was recorded."""
+
+    current = snapshot.files
+    return {
+        path
+        for path in previous.keys() | current.keys()
+        if previous.get(path) != current.get(path)
+    }
+
+
+__all__ = [
+    "FileManifest",
+    "PYTEST_CONFIG_FILES",
+    "TreeSnapshot",
+    "changed_files",
+    "config_digest",
+    "is_test_module",
+]
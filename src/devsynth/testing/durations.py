@@ -0,0 +1,210 @@
+"""Historical per-test durations for balancing segmented test runs.
+
+:func:`devsynth.testing.run_tests.run_tests` loads this module into every
+segment's pytest subprocess with ``-p devsynth.testing.durations``. Acting as a
+pytest plugin it records how long each test took (setup, call and teardown)
+and writes the measurements to the JSON file named by
+``DEVSYNTH_TEST_DURATIONS_OUTPUT``. The runner folds those files into a
+:class:`DurationDatabase` so later runs can bin-pack segments by expected cost
+with :func:`plan_segments` instead of slicing node ids by position.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import statistics
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+DURATIONS_OUTPUT_ENV = "DEVSYNTH_TEST_DURATIONS_OUTPUT"
+DURATIONS_PLUGIN = "devsynth.testing.durations"
+DEFAULT_DURATIONS_PATH = Path(".test_collection_cache") / "test_durations.json"
+
+# Estimate used for every test when no history exists at all.
+DEFAULT_DURATION_SECONDS = 1.0
+# Weight of the newest measurement in the exponential moving average.
+SMOOTHING = 0.5
+
+_SCHEMA_VERSION = 1
+
+
+class DurationDatabase:
+    """Exponentially smoothed per-node durations persisted as JSON.
+
+    Args:
+        path: File the database is loaded from and saved to.
+        durations: Initial ``node_id -> seconds`` mapping.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_DURATIONS_PATH,
+        durations: Mapping[str, float] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self._durations: dict[str, float] = dict(durations or {})
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_DURATIONS_PATH) -> DurationDatabase:
+        """Load the database, treating a missing or corrupt file as empty."""
+
+        return cls(path, load_measurements(path))
+
+    def __len__(self) -> int:
+        return len(self._durations)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._durations
+
+    def get(self, node_id: str) -> float | None:
+        return self._durations.get(node_id)
+
+    def estimate(self, node_ids: Sequence[str]) -> list[float]:
+        """Return expected durations for ``node_ids``.
+
+        Tests without history are assumed to cost the median known duration,
+        which keeps new tests from clustering in a single bin.
+        """
+
+        fallback = (
+            statistics.median(self._durations.values())
+            if self._durations
+            else DEFAULT_DURATION_SECONDS
+        )
+        return [self._durations.get(node_id, fallback) for node_id in node_ids]
+
+    def record(self, measurements: Mapping[str, float]) -> None:
+        """Blend fresh ``measurements`` into the stored averages."""
+
+        for node_id, seconds in measurements.items():
+            previous = self._durations.get(node_id)
+            if previous is None:
+                self._durations[node_id] = seconds
+            else:
+                self._durations[node_id] = (
+                    SMOOTHING * seconds + (1.0 - SMOOTHING) * previous
+                )
+
+    def save(self) -> None:
+        """Atomically write the database to :attr:`path`."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        payload = {"version": _SCHEMA_VERSION, "durations": self._durations}
+        tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def load_measurements(path: Path) -> dict[str, float]:
+    """Read a ``node_id -> seconds`` mapping, ignoring malformed entries."""
+
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    raw = payload.get("durations") if isinstance(payload, dict) else None
+    if not isinstance(raw, dict):
+        return {}
+    measurements: dict[str, float] = {}
+    for node_id, seconds in raw.items():
+        if isinstance(seconds, (int, float)) and seconds >= 0:
+            measurements[str(node_id)] = float(seconds)
+    return measurements
+
+
+def plan_segments(
+    node_ids: Sequence[str],
+    durations: Sequence[float],
+    workers: int,
+    segment_size: int,
+) -> list[list[tuple[str, ...]]]:
+    """Bin-pack ``node_ids`` across ``workers`` and split each bin into segments.
+
+    Tests are assigned longest-first to the least loaded worker (the LPT
+    heuristic), which bounds the slowest worker at 4/3 of the optimum. Each
+    worker keeps its tests in their original order so module-scoped fixtures
+    stay warm, and runs them in segments of at most ``segment_size`` tests.
+
+    Returns:
+        One list of segments per worker that received tests.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if segment_size < 1:
+        raise ValueError("segment_size must be a positive integer")
+    if len(durations) != len(node_ids):
+        raise ValueError("durations must align with node_ids")
+
+    loads: list[tuple[float, int]] = [(0.0, worker) for worker in range(workers)]
+    assigned: list[list[int]] = [[] for _ in range(workers)]
+    by_cost = sorted(range(len(node_ids)), key=lambda index: -durations[index])
+    for index in by_cost:
+        load, worker = heapq.heappop(loads)
+        assigned[worker].append(index)
+        heapq.heappush(loads, (load + durations[index], worker))
+
+    plan: list[list[tuple[str, ...]]] = []
+    for indices in assigned:
+        if not indices:
+            continue
+        indices.sort()
+        ordered = [node_ids[index] for index in indices]
+        plan.append(
+            [
+                tuple(ordered[start : start + segment_size])
+                for start in range(0, len(ordered), segment_size)
+            ]
+        )
+    return plan
+
+
+def merge_measurement_files(database: DurationDatabase, paths: Iterable[Path]) -> int:
+    """Record every measurement file in ``paths`` and return the test count."""
+
+    recorded = 0
+    for path in paths:
+        measurements = load_measurements(path)
+        database.record(measurements)
+        recorded += len(measurements)
+    return recorded
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin hooks
+# ---------------------------------------------------------------------------
+
+_measurements: dict[str, float] = {}
+
+
+def pytest_runtest_logreport(report: Any) -> None:
+    _measurements[report.nodeid] = (
+        _measurements.get(report.nodeid, 0.0) + report.duration
+    )
+
+
+def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
+    output = os.environ.get(DURATIONS_OUTPUT_ENV)
+    # xdist workers relay their reports to the controller, which writes once.
+    if not output or hasattr(session.config, "workerinput"):
+        return
+    try:
+        Path(output).write_text(
+            json.dumps({"durations": _measurements}), encoding="utf-8"
+        )
+    except OSError:  # pragma: no cover - never fail a test session over timings
+        pass
+
+
+__all__ = [
+    "DEFAULT_DURATIONS_PATH",
+    "DURATIONS_OUTPUT_ENV",
+    "DURATIONS_PLUGIN",
+    "DurationDatabase",
+    "load_measurements",
+    "merge_measurement_files",
+    "plan_segments",
+]
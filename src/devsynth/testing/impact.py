@@ -0,0 +1,354 @@
+"""Change-aware test selection for ``devsynth run-tests --impact-base``.
+
+Impact mode runs pytest-cov with ``--cov-context=test`` so every covered line
+remembers which tests executed it. :func:`build_impact_map` condenses that
+coverage data into an :class:`ImpactMap` from source file to node ids, which
+is persisted next to the collection cache. On later runs
+:func:`select_impacted_tests` intersects the files reported by ``git diff``
+against a base ref with the map and returns only the affected node ids, plus
+tests whose own modules changed.
+
+Whenever the answer could be wrong the selection declines and the caller runs
+the full suite instead: no map, a map recorded on a commit that is not an
+ancestor of ``HEAD``, candidate tests the map has never seen, changed Python
+files the map does not know, changes to shared pytest configuration, or
+non-Python files under ``tests/`` (feature files, fixtures and data) whose
+consumers the map cannot see.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+
+from devsynth.logging_setup import DevSynthLogger
+
+logger = DevSynthLogger(__name__)
+
+IMPACT_MAP_FILE = Path(".test_collection_cache") / "test_impact_map.json"
+
+# Files whose changes can alter the behaviour of any test.
+GLOBAL_INVALIDATORS = frozenset(
+    {
+        "conftest.py",
+        "pytest.ini",
+        "pyproject.toml",
+        "setup.cfg",
+        "tox.ini",
+        "poetry.lock",
+        "sitecustomize.py",
+        ".coveragerc",
+    }
+)
+SOURCE_ROOT = "src/"
+TESTS_ROOT = "tests/"
+
+_SCHEMA_VERSION = 1
+_CONTEXT_PHASES = ("|setup", "|run", "|teardown")
+
+
+@dataclass(slots=True)
+class ImpactMap:
+    """Source file to node id mapping derived from per-test coverage contexts.
+
+    Attributes:
+        sources: Repository-relative source paths mapped to the node ids that
+            executed at least one of their lines.
+        tests: Every node id the map has observed, including tests that did
+            not execute any measured file.
+        commit: ``HEAD`` when the map was last refreshed.
+        built_at: ISO timestamp of the last refresh.
+    """
+
+    sources: dict[str, set[str]] = field(default_factory=dict)
+    tests: set[str] = field(default_factory=set)
+    commit: str | None = None
+    built_at: str | None = None
+
+    @classmethod
+    def load(cls, path: Path = IMPACT_MAP_FILE) -> ImpactMap | None:
+        """Return the persisted map, or ``None`` when missing or unreadable."""
+
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != _SCHEMA_VERSION:
+            return None
+        raw_sources = payload.get("sources")
+        if not isinstance(raw_sources, dict):
+            return None
+        return cls(
+            sources={
+                str(source): set(node_ids)
+                for source, node_ids in raw_sources.items()
+                if isinstance(node_ids, list)
+            },
+            tests=set(payload.get("tests") or ()),
+            commit=payload.get("commit"),
+            built_at=payload.get("built_at"),
+        )
+
+    def save(self, path: Path = IMPACT_MAP_FILE) -> None:
+        """Atomically persist the map as JSON."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": _SCHEMA_VERSION,
+            "commit": self.commit,
+            "built_at": self.built_at,
+            "tests": sorted(self.tests),
+            "sources": {
+                source: sorted(node_ids)
+                for source, node_ids in sorted(self.sources.items())
+            },
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def tests_for(self, source: str) -> set[str]:
+        return self.sources.get(source, set())
+
+    def merge(self, fresh: ImpactMap) -> None:
+        """Replace what the map knows about the tests observed by ``fresh``."""
+
+        for source in list(self.sources):
+            remaining = self.sources[source] - fresh.tests
+            if remaining:
+                self.sources[source] = remaining
+            else:
+                del self.sources[source]
+        for source, node_ids in fresh.sources.items():
+            self.sources.setdefault(source, set()).update(node_ids)
+        self.tests |= fresh.tests
+        self.commit = fresh.commit
+        self.built_at = fresh.built_at
+
+
+@dataclass(frozen=True, slots=True)
+class ImpactSelection:
+    """Outcome of :func:`select_impacted_tests`.
+
+    ``node_ids`` is ``None`` when the full suite must run; ``reason`` explains
+    the decision either way.
+    """
+
+    node_ids: tuple[str, ...] | None
+    changed_files: tuple[str, ...]
+    reason: str
+
+    @property
+    def full_suite(self) -> bool:
+        return self.node_ids is None
+
+
+def _git(args: Sequence[str], cwd: Path | None = None) -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as exc:  # pragma: no cover - git missing entirely
+        logger.debug("git unavailable for impact analysis: %s", exc)
+        return None
+    if completed.returncode != 0:
+        logger.debug("git %s failed: %s", " ".join(args), completed.stderr.strip())
+        return None
+    return completed.stdout
+
+
+def head_commit(cwd: Path | None = None) -> str | None:
+    output = _git(["rev-parse", "HEAD"], cwd)
+    return output.strip() if output else None
+
+
+def is_ancestor(commit: str, cwd: Path | None = None) -> bool:
+    """Return whether ``commit`` is reachable from ``HEAD``."""
+
+    return _git(["merge-base", "--is-ancestor", commit, "HEAD"], cwd) is not None
+
+
+def changed_files(base_ref: str, cwd: Path | None = None) -> list[str] | None:
+    """List files changed since ``base_ref``, relative to ``cwd``.
+
+    Committed, staged and unstaged edits are reported together with untracked
+    files. Returns ``None`` when git cannot answer, e.g. for an unknown ref.
+    """
+
+    diff = _git(["diff", "--name-only", "--relative", base_ref], cwd)
+    if diff is None:
+        return None
+    untracked = _git(["ls-files", "--others", "--exclude-standard"], cwd) or ""
+    paths = [line.strip() for line in (diff + untracked).splitlines()]
+    return sorted({path for path in paths if path})
+
+
+def _node_from_context(context: str) -> str | None:
+    for phase in _CONTEXT_PHASES:
+        if context.endswith(phase):
+            return context[: -len(phase)] or None
+    return None
+
+
+def build_impact_map(
+    coverage_file: Path,
+    tests: Iterable[str],
+    *,
+    root: Path | None = None,
+    commit: str | None = None,
+) -> ImpactMap:
+    """Condense per-test coverage contexts into an :class:`ImpactMap`.
+
+    Args:
+        coverage_file: Coverage data recorded with ``--cov-context=test``.
+        tests: Node ids executed by the run that produced ``coverage_file``.
+        root: Directory measured paths are made relative to (default: cwd).
+        commit: Commit the run was made on.
+    """
+
+    from coverage import CoverageData
+
+    root = (root or Path.cwd()).resolve()
+    data = CoverageData(basename=str(coverage_file))
+    data.read()
+    sources: dict[str, set[str]] = {}
+    for measured in data.measured_files():
+        try:
+            relative = Path(measured).resolve().relative_to(root)
+        except ValueError:
+            continue
+        node_ids: set[str] = set()
+        for contexts in (data.contexts_by_lineno(measured) or {}).values():
+            for context in contexts:
+                node_id = _node_from_context(context)
+                if node_id:
+                    node_ids.add(node_id)
+        if node_ids:
+            sources[PurePosixPath(relative).as_posix()] = node_ids
+    return ImpactMap(
+        sources=sources,
+        tests=set(tests),
+        commit=commit,
+        built_at=datetime.now(UTC).isoformat(),
+    )
+
+
+def _is_test_module(path: str) -> bool:
+    name = PurePosixPath(path).name
+    return name.startswith("test_") or name.endswith("_test.py")
+
+
+def select_impacted_tests(
+    candidates: Sequence[str],
+    changed: Sequence[str],
+    impact_map: ImpactMap | None,
+    *,
+    map_is_current: bool = True,
+) -> ImpactSelection:
+    """Pick the ``candidates`` affected by the ``changed`` files.
+
+    Args:
+        candidates: Node ids collected for the requested target and speeds.
+        changed: Repository-relative paths reported by :func:`changed_files`.
+        impact_map: Previously recorded map, if any.
+        map_is_current: ``False`` when the map was recorded on a commit that
+            is no longer an ancestor of ``HEAD``.
+    """
+
+    changed_tuple = tuple(changed)
+
+    def full(reason: str) -> ImpactSelection:
+        return ImpactSelection(None, changed_tuple, reason)
+
+    if impact_map is None:
+        return full("no impact map recorded yet")
+    if not map_is_current:
+        return full(f"impact map commit {impact_map.commit} is not an ancestor")
+    unknown = [node_id for node_id in candidates if node_id not in impact_map.tests]
+    if unknown:
+        return full(f"impact map has never observed {len(unknown)} selected tests")
+
+    by_module: dict[str, list[str]] = {}
+    for node_id in candidates:
+        by_module.setdefault(node_id.split("::", 1)[0], []).append(node_id)
+
+    impacted: set[str] = set()
+    for path in changed_tuple:
+        if PurePosixPath(path).name in GLOBAL_INVALIDATORS:
+            return full(f"{path} affects every test")
+        if path in by_module:
+            impacted.update(by_module[path])
+        elif path in impact_map.sources:
+            impacted.update(impact_map.tests_for(path))
+        elif path.endswith(".py"):
+            if not _is_test_module(path):
+                return full(f"{path} is not in the impact map")
+            # A test module outside the requested target or speed filters.
+        elif path.startswith(SOURCE_ROOT):
+            return full(f"{path} is package data the impact map cannot track")
+        elif path.startswith(TESTS_ROOT):
+            return full(f"{path} is test data the impact map cannot track")
+
+    selected = tuple(node_id for node_id in candidates if node_id in impacted)
+    return ImpactSelection(
+        selected,
+        changed_tuple,
+        f"{len(selected)} of {len(candidates)} tests affected by "
+        f"{len(changed_tuple)} changed files",
+    )
+
+
+def refresh_impact_map(
+    coverage_file: Path,
+    tests: Iterable[str],
+    path: Path = IMPACT_MAP_FILE,
+) -> ImpactMap | None:
+    """Merge the contexts in ``coverage_file`` into the persisted map."""
+
+    if not Path(coverage_file).exists():
+        logger.warning(
+            "Impact map not refreshed: coverage data %s is missing", coverage_file
+        )
+        return None
+    try:
+        fresh = build_impact_map(Path(coverage_file), tests, commit=head_commit())
+    except Exception as exc:  # pragma: no cover - defensive guard
+        logger.warning("Impact map not refreshed: %s", exc)
+        return None
+    impact_map = ImpactMap.load(path) or ImpactMap()
+    impact_map.merge(fresh)
+    try:
+        impact_map.save(path)
+    except OSError as exc:  # pragma: no cover - defensive guard
+        logger.warning("Unable to persist impact map %s: %s", path, exc)
+        return None
+    logger.info(
+        "Impact map refreshed: %d sources, %d tests",
+        len(impact_map.sources),
+        len(impact_map.tests),
+    )
+    return impact_map
+
+
+__all__ = [
+    "GLOBAL_INVALIDATORS",
+    "IMPACT_MAP_FILE",
+    "ImpactMap",
+    "ImpactSelection",
+    "build_impact_map",
+    "changed_files",
+    "head_commit",
+    "is_ancestor",
+    "refresh_impact_map",
+    "select_impacted_tests",
+]
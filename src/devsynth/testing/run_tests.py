@@ -17,7 +17,10 @@ import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 from collections.abc import Mapping, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass as _dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -35,6 +38,30 @@ from uuid import uuid4
 # Load sitecustomize early for Python 3.12+ compatibility patches
 import sitecustomize  # noqa: F401
 from devsynth.logging_setup import DevSynthLogger
+from devsynth.testing.collection_manifest import (
+    FileManifest,
+    TreeSnapshot,
+)
+from devsynth.testing.collection_manifest import (
+    changed_files as changed_collection_files,
+)
+from devsynth.testing.collection_manifest import is_test_module
+from devsynth.testing.durations import (
+    DURATIONS_OUTPUT_ENV,
+    DURATIONS_PLUGIN,
+    DurationDatabase,
+    merge_measurement_files,
+    plan_segments,
+)
+from devsynth.testing.impact import (
+    IMPACT_MAP_FILE,
+    ImpactMap,
+    ImpactSelection,
+    changed_files,
+    is_ancestor,
+    refresh_impact_map,
+    select_impacted_tests,
+)
 
 
 # Lazy import release functions to avoid circular imports during basic test runs
@@ -99,6 +126,8 @@ compute_file_checksum, get_release_tag, publish_manifest, write_manifest = (
 # Cache directory for test collection
 COLLECTION_CACHE_DIR = Path(".test_collection_cache")
 TEST_COLLECTION_CACHE_FILE = COLLECTION_CACHE_DIR / "collection_cache.json"
+TEST_DURATIONS_FILE = COLLECTION_CACHE_DIR / "test_durations.json"
+COLLECTION_MANIFEST_NAME = "file_manifest.json"
 # Standardized coverage outputs
 COVERAGE_TARGET = "src/devsynth"
 COVERAGE_JSON_PATH = Path("test_reports/coverage.json")
@@ -349,6 +378,9 @@ class SingleBatchRequest:
     keyword_filter: str | None
     env: dict[str, str]
     dry_run: bool = False
+    coverage_file: str | None = None
+    durations_file: str | None = None
+    coverage_contexts: bool = False
 
     def __post_init__(self) -> None:  # pragma: no cover - simple data normalization
         object.__setattr__(self, "node_ids", tuple(self.node_ids))
@@ -370,10 +402,14 @@ class SegmentedRunRequest:
     keyword_filter: str | None
     env: dict[str, str]
     dry_run: bool = False
+    workers: int = 1
+    coverage_contexts: bool = False
 
     def __post_init__(self) -> None:
         if self.segment_size <= 0:
             raise ValueError("segment_size must be a positive integer")
+        if self.workers <= 0:
+            raise ValueError("workers must be a positive integer")
         object.__setattr__(self, "speed_categories", tuple(self.speed_categories))
         object.__setattr__(self, "node_ids", tuple(self.node_ids))
 
@@ -1241,22 +1277,6 @@ def _strip_resource_markers(marker_expr: str) -> str:
     return " ".join(cleaned_parts).strip()
 
 
-def _latest_mtime(root: str) -> float:
-    """Return the most recent mtime for Python sources under ``root``."""
-
-    latest = 0.0
-    for dirpath, _dirnames, filenames in os.walk(root):
-        for fn in filenames:
-            if fn.endswith(".py"):
-                try:
-                    mtime = os.path.getmtime(os.path.join(dirpath, fn))
-                except OSError:
-                    continue
-                if mtime > latest:
-                    latest = mtime
-    return latest
-
-
 def _log_collection_cache_event(
     event: str,
     *,
@@ -1291,12 +1311,18 @@ def _log_collection_cache_event(
 def _collect_via_pytest(
     *,
     target: str,
-    test_path: str,
+    test_path: str | Sequence[str],
     category_expr: str,
     normalized_filter: str | None,
     timeout_seconds: float,
+    allow_empty: bool = False,
 ) -> list[str]:
-    """Execute ``pytest --collect-only`` and return node identifiers."""
+    """Execute ``pytest --collect-only`` and return node identifiers.
+
+    ``test_path`` may list several files for incremental re-collection, in
+    which case ``allow_empty`` treats "no tests collected" (exit code 5) as an
+    empty result rather than a failure.
+    """
 
     # Use the same Python executable that poetry is using
     # Check for poetry's active python first, then fallback to virtual env python
@@ -1308,11 +1334,12 @@ def _collect_via_pytest(
             python_exe = str(venv_python)
         else:
             python_exe = sys.executable
+    test_paths = [test_path] if isinstance(test_path, str) else list(test_path)
     collect_cmd = [
         python_exe,
         "-m",
         "pytest",
-        test_path,
+        *test_paths,
         "--collect-only",
         "-q",
         "-o",
@@ -1342,6 +1369,8 @@ def _collect_via_pytest(
         cwd=str(project_root),  # Ensure subprocess runs from project root
         env=env,  # Inherit environment but override key variables
     )
+    if allow_empty and result.returncode == 5:
+        return []
     if result.returncode != 0:
         if result.stderr:
             error_message = f"Test collection failed: {result.stderr}"
@@ -1413,6 +1442,107 @@ def _collect_dependent_targets(
     return aggregated, timed_out
 
 
+def _snapshot_test_tree(test_path: str) -> TreeSnapshot:
+    """Return content hashes for ``test_path`` via the persisted manifest."""
+
+    manifest = FileManifest(COLLECTION_CACHE_DIR / COLLECTION_MANIFEST_NAME)
+    snapshot = manifest.snapshot(test_path)
+    try:
+        manifest.save()
+    except OSError as exc:  # pragma: no cover - cache writes are best effort
+        logger.debug("Unable to persist collection manifest: %s", exc)
+    return snapshot
+
+
+def _write_collection_cache(
+    cache_file: Path,
+    node_ids: list[str],
+    *,
+    snapshot: TreeSnapshot,
+    category_expr: str,
+    normalized_filter: str | None,
+) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_data = {
+        "timestamp": datetime.now().isoformat(),
+        "tests": node_ids,
+        "fingerprint": {
+            "tree_digest": snapshot.digest,
+            "config_digest": snapshot.config,
+            "category_expr": category_expr,
+            "test_path": snapshot.test_path,
+            "keyword_filter": normalized_filter,
+        },
+        "files": snapshot.files,
+    }
+    with open(cache_file, "w") as f:
+        json.dump(cache_data, f)
+
+
+def _collect_changed_modules(
+    *,
+    target: str,
+    cached_data: Mapping[str, Any],
+    snapshot: TreeSnapshot,
+    category_expr: str,
+    normalized_filter: str | None,
+    timeout_seconds: float,
+) -> list[str] | None:
+    """Re-collect only the test modules that changed since ``cached_data``.
+
+    Returns ``None`` when an incremental update cannot be trusted: the pytest
+    configuration changed, or a changed file (``conftest.py``, a helper
+    module, a feature file) may affect modules other than itself.
+    """
+
+    previous_files = cached_data.get("files")
+    fingerprint = cached_data.get("fingerprint", {})
+    if (
+        not isinstance(previous_files, dict)
+        or fingerprint.get("config_digest") != snapshot.config
+    ):
+        return None
+    changed = changed_collection_files(previous_files, snapshot)
+    if not changed or not all(is_test_module(path) for path in changed):
+        return None
+
+    nodes_by_file: dict[str, list[str]] = {}
+    for node_id in cached_data["tests"]:
+        nodes_by_file.setdefault(node_id.split("::", 1)[0], []).append(node_id)
+    for path in changed:
+        nodes_by_file.pop(path, None)
+
+    present = sorted(path for path in changed if path in snapshot.files)
+    if present:
+        try:
+            fresh_nodes = _collect_via_pytest(
+                target=target,
+                test_path=present,
+                category_expr=category_expr,
+                normalized_filter=normalized_filter,
+                timeout_seconds=timeout_seconds,
+                allow_empty=True,
+            )
+        except (subprocess.TimeoutExpired, OSError) as exc:
+            logger.debug("Incremental collection failed; collecting fully: %s", exc)
+            return None
+        for node_id in fresh_nodes:
+            nodes_by_file.setdefault(node_id.split("::", 1)[0], []).append(node_id)
+
+    logger.info(
+        "Re-collected %d changed test modules for target=%s (%d removed)",
+        len(present),
+        target,
+        len(changed) - len(present),
+        extra={
+            "event": "test_collection_cache_incremental",
+            "target": target,
+            "changed_modules": len(changed),
+        },
+    )
+    return [node_id for nodes in nodes_by_file.values() for node_id in nodes]
+
+
 def collect_tests_with_cache(
     target: str,
     speed_category: str | None = None,
@@ -1434,21 +1564,35 @@ def collect_tests_with_cache(
     """
     test_path = TARGET_PATHS.get(target, TARGET_PATHS["all-tests"])
 
-    # Build the marker expression we'll use and compute a simple fingerprint of
-    # the test tree (latest mtime) to detect changes that should invalidate cache.
+    # Build the marker expression we'll use and fingerprint the test tree by
+    # content so edits, conftest changes and pytest configuration invalidate
+    # the cache while untouched files are never re-read.
     marker_expr = "not memory_intensive"
     category_expr = marker_expr
     if speed_category:
         category_expr = f"{speed_category} and {marker_expr}"
 
     normalized_filter = _normalize_keyword_filter(keyword_filter)
-    latest_mtime = _latest_mtime(test_path)
+    snapshot = _snapshot_test_tree(test_path)
     base_cache_key = f"{target}_{speed_category or 'all'}"
     suffix = _cache_key_suffix(normalized_filter)
     cache_key = f"{base_cache_key}_{suffix}" if suffix else base_cache_key
     cache_file = (
         COLLECTION_CACHE_DIR / f"{cache_key}_tests.json"
     )  # Use Path object for cache_file
+    collection_timeout = _timeout_override or _collection_timeout_seconds()
+
+    dependencies: tuple[str, ...] = ()
+    if (
+        target == "all-tests"
+        and _allow_all_target_decomposition
+        and ALL_TESTS_DEPENDENCIES
+    ):
+        # Skip behavior tests in smoke mode to avoid collection timeouts
+        if os.environ.get("DEVSYNTH_SMOKE_MODE") == "1":
+            dependencies = ("unit-tests", "integration-tests")
+        else:
+            dependencies = ALL_TESTS_DEPENDENCIES
 
     if cache_file.exists():
         try:
@@ -1456,14 +1600,7 @@ def collect_tests_with_cache(
                 cached_data: dict[str, Any] = json.load(f)
 
             stored_timestamp_str = cached_data.get("timestamp")
-            stored_mtime = cached_data.get("fingerprint", {}).get("latest_mtime")
-            stored_category_expr = cached_data.get("fingerprint", {}).get(
-                "category_expr"
-            )
-            stored_test_path = cached_data.get("fingerprint", {}).get("test_path")
-            stored_keyword_filter = cached_data.get("fingerprint", {}).get(
-                "keyword_filter"
-            )
+            fingerprint = cached_data.get("fingerprint", {})
 
             cache_time = (
                 datetime.fromisoformat(stored_timestamp_str)
@@ -1471,48 +1608,52 @@ def collect_tests_with_cache(
                 else None
             )
 
-            # Correct comparison of fingerprint elements
-            fingerprint_matches = (
-                (stored_mtime == latest_mtime)
-                and (stored_category_expr == category_expr)
-                and (stored_test_path == test_path)
-                and (stored_keyword_filter == normalized_filter)
+            scope_matches = (
+                (fingerprint.get("category_expr") == category_expr)
+                and (fingerprint.get("test_path") == test_path)
+                and (fingerprint.get("keyword_filter") == normalized_filter)
             )
 
             if (
                 cache_time
                 and (datetime.now() - cache_time).total_seconds()
                 < COLLECTION_CACHE_TTL_SECONDS
-                and fingerprint_matches
+                and scope_matches
             ):
-                _log_collection_cache_event(
-                    "hit",
-                    target=target,
-                    speed_category=speed_category,
-                    cache_file=cache_file,
-                    keyword_filter=normalized_filter,
-                    ttl_seconds=COLLECTION_CACHE_TTL_SECONDS,
-                )
-                return cast(list[str], cached_data["tests"])
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+                if fingerprint.get("tree_digest") == snapshot.digest:
+                    _log_collection_cache_event(
+                        "hit",
+                        target=target,
+                        speed_category=speed_category,
+                        cache_file=cache_file,
+                        keyword_filter=normalized_filter,
+                        ttl_seconds=COLLECTION_CACHE_TTL_SECONDS,
+                    )
+                    return cast(list[str], cached_data["tests"])
+                if not dependencies:
+                    node_ids = _collect_changed_modules(
+                        target=target,
+                        cached_data=cached_data,
+                        snapshot=snapshot,
+                        category_expr=category_expr,
+                        normalized_filter=normalized_filter,
+                        timeout_seconds=collection_timeout,
+                    )
+                    if node_ids is not None:
+                        _write_collection_cache(
+                            cache_file,
+                            node_ids,
+                            snapshot=snapshot,
+                            category_expr=category_expr,
+                            normalized_filter=normalized_filter,
+                        )
+                        return node_ids
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
             logger.debug("Error loading test collection cache: %s", e)
             # Fall through to regenerate
             pass
 
     COLLECTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)  # Use Path method
-    collection_timeout = _timeout_override or _collection_timeout_seconds()
-
-    dependencies: tuple[str, ...] = ()
-    if (
-        target == "all-tests"
-        and _allow_all_target_decomposition
-        and ALL_TESTS_DEPENDENCIES
-    ):
-        # Skip behavior tests in smoke mode to avoid collection timeouts
-        if os.environ.get("DEVSYNTH_SMOKE_MODE") == "1":
-            dependencies = ("unit-tests", "integration-tests")
-        else:
-            dependencies = ALL_TESTS_DEPENDENCIES
 
     node_ids: list[str] = []
     dependency_timeouts: list[str] = []
@@ -1583,18 +1724,13 @@ def collect_tests_with_cache(
             logger.warning("Test collection failed: %s", exc)
             return []
 
-    cache_data = {
-        "timestamp": datetime.now().isoformat(),
-        "tests": node_ids,
-        "fingerprint": {
-            "latest_mtime": latest_mtime,
-            "category_expr": category_expr,
-            "test_path": test_path,
-            "keyword_filter": normalized_filter,
-        },
-    }
-    with open(cache_file, "w") as f:
-        json.dump(cache_data, f)
+    _write_collection_cache(
+        cache_file,
+        node_ids,
+        snapshot=snapshot,
+        category_expr=category_expr,
+        normalized_filter=normalized_filter,
+    )
 
     logger.debug(
         "Collected %d tests for %s (%s) [cached for %ss]",
@@ -1620,6 +1756,8 @@ def run_tests(
     env: dict[str, str] | None = None,
     *,
     dry_run: bool = False,
+    segment_workers: int = 1,
+    impact_base: str | None = None,
 ) -> tuple[bool, str]:
     """Run tests using pytest with DevSynth-compatible options.
 
@@ -1635,6 +1773,12 @@ def run_tests(
         extra_marker: Additional marker expression
         keyword_filter: Keyword filter for test selection
         env: Environment variables to pass to subprocess
+        dry_run: Preview the pytest command without executing tests
+        segment_workers: Segments run concurrently when segmenting; ``0``
+            uses one worker per CPU
+        impact_base: Git ref to diff against; only tests affected by the
+            changes run, falling back to the full selection when the impact
+            map is missing or stale
 
     Returns:
         Tuple of (success: bool, output: str)
@@ -1772,6 +1916,21 @@ def run_tests(
             deduped_nodes.append(node)
     collected_node_ids = deduped_nodes
 
+    impact_selection: ImpactSelection | None = None
+    if impact_base and collected_node_ids:
+        impact_selection = _select_impacted_tests(impact_base, collected_node_ids)
+        logger.info(
+            "Impact analysis against %s: %s", impact_base, impact_selection.reason
+        )
+        if impact_selection.node_ids is not None:
+            if not impact_selection.node_ids:
+                return (
+                    True,
+                    f"Impact analysis: no tests affected by changes since "
+                    f"{impact_base}.\n",
+                )
+            collected_node_ids = list(impact_selection.node_ids)
+
     marker_fallback = False
     if not collected_node_ids:
         logger.info(
@@ -1798,6 +1957,8 @@ def run_tests(
             keyword_filter=effective_keyword_filter,
             env=env,
             dry_run=dry_run,
+            workers=segment_workers or os.cpu_count() or 1,
+            coverage_contexts=impact_selection is not None,
         )
         success, output, execution_metadata = _run_segmented_tests(segmented_request)
     else:
@@ -1812,6 +1973,7 @@ def run_tests(
             keyword_filter=effective_keyword_filter,
             env=env,
             dry_run=dry_run,
+            coverage_contexts=impact_selection is not None,
         )
         success, output, execution_metadata = _run_single_test_batch(batch_request)
         if not dry_run:
@@ -1819,6 +1981,10 @@ def run_tests(
 
     if marker_fallback:
         output = "Marker fallback executed.\n" + output
+    if impact_selection is not None:
+        output = f"Impact analysis: {impact_selection.reason}.\n" + output
+        if not dry_run and not marker_fallback:
+            refresh_impact_map(Path(".coverage"), collected_node_ids)
 
     if dry_run:
         return success, output
@@ -1837,10 +2003,38 @@ def run_tests(
     return success, output
 
 
+def _select_impacted_tests(base_ref: str, candidates: Sequence[str]) -> ImpactSelection:
+    """Select the ``candidates`` affected by changes since ``base_ref``.
+
+    Files changed since the impact map was recorded count as changed too, so
+    edits the map has not observed can only widen the selection.
+    """
+
+    changed = changed_files(base_ref)
+    if changed is None:
+        return ImpactSelection(None, (), f"git could not diff against {base_ref}")
+    impact_map = ImpactMap.load(IMPACT_MAP_FILE)
+    map_is_current = True
+    if impact_map is not None and impact_map.commit:
+        map_is_current = is_ancestor(impact_map.commit)
+        since_map = changed_files(impact_map.commit) if map_is_current else None
+        changed = sorted(set(changed).union(since_map or ()))
+    return select_impacted_tests(
+        candidates, changed, impact_map, map_is_current=map_is_current
+    )
+
+
 def _run_segmented_tests(request: SegmentedRunRequest) -> SegmentedRunResult:
-    """Run tests in segments to handle large test suites."""
+    """Run tests in segments to handle large test suites.
+
+    With ``request.workers > 1`` the segments are balanced by recorded test
+    durations and executed concurrently; see :func:`_run_concurrent_segments`.
+    """
 
     sanitized_node_ids = tuple(_sanitize_node_ids(request.node_ids))
+    if request.workers > 1 and sanitized_node_ids:
+        return _run_concurrent_segments(request, sanitized_node_ids)
+
     all_outputs: list[str] = []
     segment_metadata: list[BatchExecutionMetadata] = []
     overall_success = True
@@ -1858,56 +2052,147 @@ def _run_segmented_tests(request: SegmentedRunRequest) -> SegmentedRunResult:
         request.target,
     )
 
-    for index, segment_nodes in enumerate(segments):
-        if not segment_nodes:
-            continue
+    with tempfile.TemporaryDirectory(prefix="devsynth-durations-") as scratch:
+        for index, segment_nodes in enumerate(segments):
+            if not segment_nodes:
+                continue
 
-        logger.info(
-            "Running segment %d/%d (%d tests)",
-            index + 1,
-            len(segments),
-            len(segment_nodes),
-        )
+            logger.info(
+                "Running segment %d/%d (%d tests)",
+                index + 1,
+                len(segments),
+                len(segment_nodes),
+            )
 
-        batch_request = SingleBatchRequest(
-            node_ids=segment_nodes,
-            marker_expr=request.marker_expr,
-            verbose=request.verbose,
-            report=request.report and (index == len(segments) - 1),
-            parallel=request.parallel,
-            maxfail=request.maxfail,
-            keyword_filter=request.keyword_filter,
-            env=request.env,
-            dry_run=request.dry_run,
-        )
-        success, output, batch_metadata = _run_single_test_batch(batch_request)
+            batch_request = SingleBatchRequest(
+                node_ids=segment_nodes,
+                marker_expr=request.marker_expr,
+                verbose=request.verbose,
+                report=request.report and (index == len(segments) - 1),
+                parallel=request.parallel,
+                maxfail=request.maxfail,
+                keyword_filter=request.keyword_filter,
+                env=request.env,
+                dry_run=request.dry_run,
+                durations_file=os.path.join(scratch, f"segment-{index}.json"),
+                coverage_contexts=request.coverage_contexts,
+            )
+            success, output, batch_metadata = _run_single_test_batch(batch_request)
 
-        all_outputs.append(output)
-        segment_metadata.append(batch_metadata)
-        if not success:
-            overall_success = False
-            if request.maxfail:
-                break  # Stop on first failure if maxfail is set
+            all_outputs.append(output)
+            segment_metadata.append(batch_metadata)
+            if not success:
+                overall_success = False
+                if request.maxfail:
+                    break  # Stop on first failure if maxfail is set
+
+        if not request.dry_run:
+            _record_test_durations(sorted(Path(scratch).glob("*.json")))
 
     if not request.dry_run:
         _ensure_coverage_artifacts()
 
-    combined_metadata: SegmentedRunMetadata
-    if segment_metadata:
-        first_meta = segment_metadata[0]
-        last_meta = segment_metadata[-1]
-        commands: CommandMatrix = tuple(meta["command"] for meta in segment_metadata)
-        combined_metadata = {
-            "metadata_id": _generate_metadata_id("segmented"),
-            "commands": commands,
-            "returncode": last_meta["returncode"],
-            "started_at": first_meta["started_at"],
-            "completed_at": last_meta["completed_at"],
-            "segments": tuple(segment_metadata),
-        }
+    returncode = segment_metadata[-1]["returncode"] if segment_metadata else -1
+    return (
+        overall_success,
+        "\n".join(all_outputs),
+        _segmented_metadata(segment_metadata, returncode),
+    )
+
+
+def _run_concurrent_segments(
+    request: SegmentedRunRequest, node_ids: tuple[str, ...]
+) -> SegmentedRunResult:
+    """Bin-pack ``node_ids`` by recorded duration and run the bins concurrently.
+
+    Each worker thread drives its own sequence of pytest subprocesses. xdist is
+    disabled inside those subprocesses because the workers already occupy the
+    cores, and every segment writes an isolated ``.coverage.segment-*`` data
+    file that :func:`_ensure_coverage_artifacts` combines once all workers are
+    done. With ``maxfail`` set, workers stop picking up new segments after the
+    first failure.
+    """
+
+    database = DurationDatabase.load(TEST_DURATIONS_FILE)
+    plan = plan_segments(
+        node_ids,
+        database.estimate(node_ids),
+        request.workers,
+        request.segment_size,
+    )
+    known = sum(1 for node_id in node_ids if node_id in database)
+    logger.info(
+        "Running %d tests in %d segments across %d workers for target=%s "
+        "(%d with recorded durations)",
+        len(node_ids),
+        sum(len(segments) for segments in plan),
+        len(plan),
+        request.target,
+        known,
+    )
+
+    stop = threading.Event()
+    results: list[list[BatchExecutionResult]] = [[] for _ in plan]
+
+    with tempfile.TemporaryDirectory(prefix="devsynth-durations-") as scratch:
+
+        def run_worker(worker: int) -> None:
+            for index, segment_nodes in enumerate(plan[worker]):
+                if stop.is_set():
+                    return
+                tag = f"segment-{worker}-{index}"
+                batch_request = SingleBatchRequest(
+                    node_ids=segment_nodes,
+                    marker_expr=request.marker_expr,
+                    verbose=request.verbose,
+                    report=False,
+                    parallel=False,
+                    maxfail=request.maxfail,
+                    keyword_filter=request.keyword_filter,
+                    env=dict(request.env),
+                    dry_run=request.dry_run,
+                    coverage_file=f".coverage.{tag}",
+                    durations_file=os.path.join(scratch, f"{tag}.json"),
+                    coverage_contexts=request.coverage_contexts,
+                )
+                result = _run_single_test_batch(batch_request)
+                results[worker].append(result)
+                if not result[0] and request.maxfail:
+                    stop.set()
+
+        with ThreadPoolExecutor(
+            max_workers=len(plan), thread_name_prefix="devsynth-segment"
+        ) as executor:
+            list(executor.map(run_worker, range(len(plan))))
+
+        if not request.dry_run:
+            _record_test_durations(sorted(Path(scratch).glob("*.json")))
+
+    if not request.dry_run:
+        _ensure_coverage_artifacts()
+
+    ordered = [result for worker_results in results for result in worker_results]
+    segment_metadata = [metadata for _, _, metadata in ordered]
+    failed = [metadata for success, _, metadata in ordered if not success]
+    if failed:
+        returncode = failed[0]["returncode"]
     else:
+        returncode = segment_metadata[-1]["returncode"] if segment_metadata else -1
+    return (
+        not failed,
+        "\n".join(output for _, output, _ in ordered),
+        _segmented_metadata(segment_metadata, returncode),
+    )
+
+
+def _segmented_metadata(
+    segment_metadata: Sequence[BatchExecutionMetadata], returncode: int
+) -> SegmentedRunMetadata:
+    """Aggregate per-segment metadata into a :class:`SegmentedRunMetadata`."""
+
+    if not segment_metadata:
         now_iso = datetime.now(UTC).isoformat()
-        combined_metadata = {
+        return {
             "metadata_id": _generate_metadata_id("segmented"),
             "commands": tuple(),
             "returncode": -1,
@@ -1915,8 +2200,34 @@ def _run_segmented_tests(request: SegmentedRunRequest) -> SegmentedRunResult:
             "completed_at": now_iso,
             "segments": tuple(),
         }
+    commands: CommandMatrix = tuple(meta["command"] for meta in segment_metadata)
+    return {
+        "metadata_id": _generate_metadata_id("segmented"),
+        "commands": commands,
+        "returncode": returncode,
+        "started_at": min(meta["started_at"] for meta in segment_metadata),
+        "completed_at": max(meta["completed_at"] for meta in segment_metadata),
+        "segments": tuple(segment_metadata),
+    }
+
+
+def _record_test_durations(paths: Sequence[Path]) -> None:
+    """Fold per-segment timing files into the persisted duration database."""
 
-    return overall_success, "\n".join(all_outputs), combined_metadata
+    if not paths:
+        return
+    database = DurationDatabase.load(TEST_DURATIONS_FILE)
+    recorded = merge_measurement_files(database, paths)
+    if not recorded:
+        return
+    try:
+        database.save()
+    except OSError as exc:  # pragma: no cover - never fail a run over timings
+        logger.debug("Unable to persist test durations: %s", exc)
+    else:
+        logger.info(
+            "Recorded durations for %d tests in %s", recorded, TEST_DURATIONS_FILE
+        )
 
 
 def _run_single_test_batch(request: SingleBatchRequest) -> BatchExecutionResult:
@@ -1930,7 +2241,18 @@ def _run_single_test_batch(request: SingleBatchRequest) -> BatchExecutionResult:
         request.env
     )
     if coverage_enabled:
+        if request.coverage_file:
+            # Concurrent segments write isolated data files; reports are built
+            # once the fragments are combined by _ensure_coverage_artifacts.
+            coverage_args = [
+                arg for arg in coverage_args if not arg.startswith("--cov-report")
+            ]
+            coverage_args.append("--cov-report=")
         cmd.extend(coverage_args)
+        if request.coverage_contexts:
+            cmd.append("--cov-context=test")
+    if request.durations_file:
+        cmd.extend(["-p", DURATIONS_PLUGIN])
 
     if request.verbose:
         cmd.append("-v")
@@ -2005,6 +2327,10 @@ def _run_single_test_batch(request: SingleBatchRequest) -> BatchExecutionResult:
         current_pythonpath = env.get("PYTHONPATH", "")
         if src_path not in current_pythonpath:
             env["PYTHONPATH"] = f"{src_path}:{current_pythonpath}"
+        if request.coverage_file and coverage_enabled:
+            env["COVERAGE_FILE"] = request.coverage_file
+        if request.durations_file:
+            env[DURATIONS_OUTPUT_ENV] = request.durations_file
 
         process = subprocess.Popen(
             cmd,
@@ -0,0 +1,107 @@
+"""Cold-start guardrails for the ``devsynth`` console entry point.
+
+``scripts/benchmark_cli_startup.py`` tracks import-time budgets in CI; these
+tests keep the cheap, machine-independent part of that contract in the suite:
+top-level help must not import command implementations, and running one
+command must not import the others.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ENTRY = "from devsynth.adapters.cli.lazy_app import run_cli; run_cli()"
+
+
+@pytest.mark.medium
+@pytest.mark.no_network
+def test_top_level_help_does_not_import_command_modules():
+    probe = (
+        "import sys\n"
+        "sys.argv = ['devsynth', '--help']\n"
+        "try:\n"
+        f"    {ENTRY}\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = sorted(m for m in sys.modules if m.startswith(("
+        "'devsynth.application.cli.commands', 'devsynth.interface', "
+        "'devsynth.adapters.cli.typer_adapter', 'langgraph')))\n"
+        "print('HEAVY=' + ','.join(heavy))\n"
+    )
+    env = dict(os.environ, DEVSYNTH_NO_FILE_LOGGING="1")
+    env.pop("DEVSYNTH_CLI_MINIMAL", None)
+    proc = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert "run-tests" in proc.stdout
+    assert "HEAVY=\n" in proc.stdout, proc.stdout.splitlines()[-1]
+
+
+def _probe(code: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ, DEVSYNTH_NO_FILE_LOGGING="1")
+    env.pop("DEVSYNTH_CLI_MINIMAL", None)
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+
+
+HEAVY_FOR_COMMANDS = (
+    "'devsynth.application.cli.commands.config_cmds', "
+    "'devsynth.application.cli.commands.edrr_cycle_cmd', "
+    "'devsynth.adapters.cli.typer_adapter', 'devsynth.core', 'langgraph'"
+)
+
+
+@pytest.mark.medium
+@pytest.mark.no_network
+def test_command_help_imports_only_that_command():
+    probe = (
+        "import sys\n"
+        "sys.argv = ['devsynth', 'run-tests', '--help']\n"
+        "try:\n"
+        f"    {ENTRY}\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = 'devsynth.application.cli.commands.run_tests_cmd' in sys.modules\n"
+        f"heavy = sorted(m for m in sys.modules if m.startswith(({HEAVY_FOR_COMMANDS})))\n"
+        "print(f'LOADED={loaded}')\n"
+        "print('HEAVY=' + ','.join(heavy))\n"
+    )
+    proc = _probe(probe)
+
+    assert proc.returncode == 0, proc.stderr
+    assert "--speed" in proc.stdout
+    assert "LOADED=True" in proc.stdout
+    assert "HEAVY=\n" in proc.stdout, proc.stdout.splitlines()[-1]
+
+
+@pytest.mark.medium
+@pytest.mark.no_network
+def test_commands_package_exports_callables_lazily():
+    probe = (
+        "import sys\n"
+        "from devsynth.application.cli.commands import doctor_cmd, run_tests_cmd\n"
+        "print(callable(doctor_cmd), callable(run_tests_cmd))\n"
+        "print(type(doctor_cmd).__name__)\n"
+        f"heavy = sorted(m for m in sys.modules if m.startswith(({HEAVY_FOR_COMMANDS})))\n"
+        "print('HEAVY=' + ','.join(heavy))\n"
+    )
+    proc = _probe(probe)
+
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.splitlines()[:2] == ["True True", "function"]
+    assert "HEAVY=\n" in proc.stdout, proc.stdout.splitlines()[-1]
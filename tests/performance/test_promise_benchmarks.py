@@ -0,0 +1,41 @@
+"""Benchmarks for pending promises with timeouts. ReqID: PERF-PROMISE-01"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from devsynth.application.promises import Promise, TimeoutScheduler
+
+PENDING = 100_000
+
+
+def _schedule_pending(scheduler: TimeoutScheduler) -> list[Promise[int]]:
+    promises: list[Promise[int]] = []
+    for _ in range(PENDING):
+        promise: Promise[int] = Promise()
+        handle = scheduler.schedule(
+            60.0, lambda p=promise: p.try_reject(TimeoutError("timed out"))
+        )
+        promise._add_callbacks(lambda _, h=handle: h.cancel(), lambda _: None)
+        promises.append(promise)
+    return promises
+
+
+@pytest.mark.slow
+def test_pending_promises_use_bounded_threads(benchmark) -> None:
+    """100k pending promises with timeouts share one scheduler thread."""
+    before = threading.active_count()
+    scheduler = TimeoutScheduler(name="bench-timeouts")
+
+    promises = benchmark.pedantic(
+        _schedule_pending, args=(scheduler,), rounds=1, iterations=1
+    )
+
+    assert threading.active_count() <= before + 1
+    assert scheduler.pending() == PENDING
+
+    for value, promise in enumerate(promises):
+        promise.resolve(value)
+    assert scheduler.pending() == 0
@@ -0,0 +1,55 @@
+"""Benchmarks for prompt variant selection. ReqID: PERF-PROMPT-01"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from devsynth.application.prompts.auto_tuning import PromptAutoTuner
+from devsynth.application.prompts.models import PromptVariant, SelectionStrategyConfig
+
+
+def _tuner(strategy: str, variants: int, feedback: int) -> PromptAutoTuner:
+    tuner = PromptAutoTuner(
+        selection=SelectionStrategyConfig(name=strategy),
+        background_generation=False,
+        max_variants=variants,
+    )
+    tuner.register_template("bench", "variant 0")
+    for index in range(1, variants):
+        tuner.prompt_variants.add_variant("bench", PromptVariant(f"variant {index}"))
+    rng = random.Random(variants)
+    for variant in tuner.prompt_variants["bench"]:
+        for _ in range(feedback):
+            variant.record_usage(rng.random() < 0.5, rng.random())
+    return tuner
+
+
+def _seconds_per_selection(tuner: PromptAutoTuner, rounds: int = 2000) -> float:
+    for _ in range(50):
+        tuner.select_variant("bench")
+    started = time.perf_counter()
+    for _ in range(rounds):
+        tuner.select_variant("bench")
+    return (time.perf_counter() - started) / rounds
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["thompson", "ucb", "performance"])
+def test_select_variant_benchmark(benchmark, strategy):
+    """Benchmark selecting among 8 variants with 5000 feedback events each."""
+    tuner = _tuner(strategy, variants=8, feedback=5000)
+
+    benchmark(lambda: tuner.select_variant("bench"))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["thompson", "ucb"])
+def test_selection_cost_is_flat_in_feedback_volume(strategy):
+    """Selection time does not grow with the amount of recorded feedback."""
+    small = _seconds_per_selection(_tuner(strategy, variants=8, feedback=10))
+    large = _seconds_per_selection(_tuner(strategy, variants=8, feedback=20000))
+
+    assert large < small * 3
@@ -0,0 +1,115 @@
+"""Tests for the manifest-backed lazy CLI entry point."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from devsynth.adapters.cli.lazy_app import build_lazy_app, load_command
+from devsynth.adapters.cli.typer_adapter import build_app
+from devsynth.application.cli import registry
+from devsynth.application.cli.command_manifest import (
+    CommandManifest,
+    CommandManifestEntry,
+    ManifestParameter,
+    load_command_manifest,
+)
+
+CALLS: list[dict[str, object]] = []
+
+
+def sample_cmd(name: str = "world") -> None:
+    """Greet someone."""
+
+    CALLS.append({"name": name})
+
+
+def registry_backed_cmd() -> None:
+    """Dispatch through the command registry."""
+
+    registry.COMMAND_REGISTRY["dispatch"]()
+
+
+def _manifest(*entries: CommandManifestEntry) -> CommandManifest:
+    return CommandManifest(help="Test CLI", entries=entries)
+
+
+@pytest.mark.fast
+def test_help_lists_manifest_commands_without_importing_them():
+    """``--help`` renders names and summaries from the manifest only."""
+
+    missing = "devsynth_tests_missing_command_module"
+    manifest = _manifest(
+        CommandManifestEntry(
+            name="phantom",
+            target=f"{missing}:run",
+            help="Phantom command.",
+            short_help="Phantom command.",
+        )
+    )
+
+    result = CliRunner().invoke(build_lazy_app(manifest), ["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "phantom" in result.output
+    assert "Phantom command." in result.output
+    assert missing not in sys.modules
+
+
+@pytest.mark.fast
+def test_invoking_command_loads_its_target():
+    """Running a command imports its target and forwards options."""
+
+    CALLS.clear()
+    manifest = _manifest(
+        CommandManifestEntry(
+            name="greet",
+            target=f"{__name__}:sample_cmd",
+            help="Greet someone.",
+            params=(ManifestParameter(name="name", opts=("--name",)),),
+        )
+    )
+
+    result = CliRunner().invoke(build_lazy_app(manifest), ["greet", "--name", "ada"])
+
+    assert result.exit_code == 0, result.output
+    assert CALLS == [{"name": "ada"}]
+
+
+@pytest.mark.fast
+def test_unknown_command_is_a_usage_error():
+    result = CliRunner().invoke(build_lazy_app(_manifest()), ["nope"])
+
+    assert result.exit_code == 2
+    assert "No such command" in result.output
+
+
+@pytest.mark.fast
+def test_load_command_registers_dispatch_target(monkeypatch):
+    """Adapter wrappers find their registry entry after lazy loading."""
+
+    monkeypatch.setattr(registry, "COMMAND_REGISTRY", {})
+    entry = CommandManifestEntry(
+        name="dispatch",
+        target=f"{__name__}:registry_backed_cmd",
+        registered=f"{__name__}:sample_cmd",
+    )
+
+    command = load_command(entry)
+
+    assert registry.COMMAND_REGISTRY["dispatch"] is sample_cmd
+    assert command.name == "dispatch"
+
+
+@pytest.mark.medium
+def test_packaged_manifest_matches_eager_app():
+    """The committed manifest lists every command the eager app registers."""
+
+    app = build_app()
+    eager = {info.name for info in app.registered_commands}
+    eager |= {info.name for info in app.registered_groups}
+    manifest = load_command_manifest()
+
+    assert set(manifest.names()) == eager
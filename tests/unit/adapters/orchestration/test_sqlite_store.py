@@ -0,0 +1,227 @@
+"""SQLite checkpoint saver and workflow repository."""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from devsynth.adapters.orchestration.sqlite_store import (
+    SQLiteCheckpointSaver,
+    SQLiteWorkflowRepository,
+    flatten_state,
+    unflatten_state,
+)
+from devsynth.domain.models.workflow import Workflow, WorkflowStatus
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _rows(path: Path) -> list[tuple[int, str]]:
+    with sqlite3.connect(path) as connection:
+        return connection.execute(
+            "SELECT seq, kind FROM checkpoints ORDER BY seq"
+        ).fetchall()
+
+
+def _checkpoint(step: int) -> dict:
+    return {
+        "v": 1,
+        "channel_values": {
+            "history": list(range(200)),
+            "current_step": f"s{step}",
+            "context": {"options": {}, "step": step},
+        },
+        "pending": [] if step % 2 else None,
+    }
+
+
+@pytest.mark.fast
+def test_flatten_round_trips_nested_state() -> None:
+    state = {"a": {"b": {"c": 1}, "empty": {}}, "d": [1, 2], 3: {"x": None}}
+    assert unflatten_state(flatten_state(state)) == state
+
+
+@pytest.mark.fast
+def test_checkpoints_are_stored_as_deltas_between_snapshots(tmp_path: Path) -> None:
+    database = tmp_path / "checkpoints.sqlite3"
+    saver = SQLiteCheckpointSaver(database, snapshot_interval=4)
+
+    for step in range(6):
+        saver.put(_config("t1"), _checkpoint(step))
+        assert saver.get(_config("t1")) == _checkpoint(step)
+
+    # Steps 0 and 4 were snapshots; the chain before step 4 was pruned.
+    assert _rows(database) == [(5, "full"), (6, "delta")]
+    assert saver.get(_config("other")) is None
+    assert saver.get({}) is None
+    saver.close()
+
+    reopened = SQLiteCheckpointSaver(database, snapshot_interval=4)
+    assert reopened.get(_config("t1")) == _checkpoint(5)
+    reopened.put(_config("t1"), {"v": 2})
+    assert reopened.get(_config("t1")) == {"v": 2}
+
+
+@pytest.mark.fast
+def test_checkpoint_is_isolated_from_later_mutation(tmp_path: Path) -> None:
+    saver = SQLiteCheckpointSaver(tmp_path / "db.sqlite3")
+    checkpoint = _checkpoint(1)
+    saver.put(_config("t"), checkpoint)
+    checkpoint["channel_values"]["context"]["step"] = 99
+    saver.put(_config("t"), checkpoint)
+
+    assert saver.get(_config("t"))["channel_values"]["context"]["step"] == 99
+    saver.delete("t")
+    assert saver.get(_config("t")) is None
+
+
+@pytest.mark.fast
+def test_checkpoint_migration_imports_pickles_once(tmp_path: Path) -> None:
+    legacy = tmp_path / "checkpoints"
+    legacy.mkdir()
+    (legacy / "t1.pkl").write_bytes(pickle.dumps(_checkpoint(3)))
+    (legacy / "broken.pkl").write_bytes(b"not a pickle")
+
+    saver = SQLiteCheckpointSaver(tmp_path / "db.sqlite3", legacy_directory=legacy)
+    assert saver.get(_config("t1")) == _checkpoint(3)
+    saver.put(_config("t1"), _checkpoint(4))
+    saver.close()
+
+    reopened = SQLiteCheckpointSaver(tmp_path / "db.sqlite3", legacy_directory=legacy)
+    assert reopened.get(_config("t1")) == _checkpoint(4)
+    assert reopened.migrate_directory(legacy, remove=True) == 0
+
+
+@pytest.mark.fast
+def test_default_paths_follow_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DEVSYNTH_CHECKPOINTS_PATH", str(tmp_path / "cp"))
+    monkeypatch.setenv("DEVSYNTH_WORKFLOWS_PATH", str(tmp_path / "wf"))
+
+    assert SQLiteCheckpointSaver().database_path == str(
+        tmp_path / "cp" / "checkpoints.sqlite3"
+    )
+    assert SQLiteWorkflowRepository().database_path == str(
+        tmp_path / "wf" / "workflows.sqlite3"
+    )
+
+
+def _workflows() -> list[Workflow]:
+    start = datetime(2024, 1, 1)
+    statuses = [WorkflowStatus.COMPLETED, WorkflowStatus.RUNNING]
+    return [
+        Workflow(
+            id=f"wf-{index}",
+            name=f"workflow-{index % 3}",
+            description="owned" if index % 4 == 0 else "",
+            status=statuses[index % 2],
+            created_at=start + timedelta(minutes=index),
+        )
+        for index in range(12)
+    ]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "filters",
+    [
+        None,
+        {"status": WorkflowStatus.COMPLETED},
+        {"status": "completed"},
+        {"name": "workflow-1", "status": WorkflowStatus.RUNNING},
+        {"status": WorkflowStatus.COMPLETED, "description": "owned"},
+        {"created_at": datetime(2024, 1, 1, 0, 5)},
+        {"name": None},
+    ],
+)
+def test_list_matches_attribute_filters(tmp_path: Path, filters) -> None:
+    repo = SQLiteWorkflowRepository(tmp_path / "workflows.sqlite3")
+    workflows = _workflows()
+    for workflow in workflows:
+        repo.save(workflow)
+
+    expected = [
+        workflow.id
+        for workflow in workflows
+        if all(getattr(workflow, k, None) == v for k, v in (filters or {}).items())
+    ]
+    assert [workflow.id for workflow in repo.list(filters)] == expected
+
+
+@pytest.mark.fast
+def test_list_deserializes_only_indexed_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = SQLiteWorkflowRepository(tmp_path / "workflows.sqlite3")
+    for workflow in _workflows():
+        repo.save(workflow)
+
+    loads: list[bytes] = []
+    original = pickle.loads
+    monkeypatch.setattr(
+        pickle, "loads", lambda data: loads.append(data) or original(data)
+    )
+    running = repo.list({"status": WorkflowStatus.RUNNING, "name": "workflow-0"})
+
+    assert [workflow.id for workflow in running] == ["wf-3", "wf-9"]
+    assert len(loads) == 2
+
+
+@pytest.mark.fast
+def test_save_replaces_and_delete_removes(tmp_path: Path) -> None:
+    repo = SQLiteWorkflowRepository(tmp_path / "workflows.sqlite3")
+    workflow = Workflow(id="wf", name="build")
+    repo.save(workflow)
+    workflow.status = WorkflowStatus.FAILED
+    repo.save(workflow)
+
+    assert repo.get("wf").status is WorkflowStatus.FAILED
+    assert repo.list({"status": WorkflowStatus.PENDING}) == []
+    assert repo.delete("wf") is True
+    assert repo.get("wf") is None
+    assert repo.delete("wf") is False
+
+
+@pytest.mark.fast
+def test_workflow_migration_imports_legacy_directory(tmp_path: Path) -> None:
+    legacy = tmp_path / "workflows"
+    legacy.mkdir()
+    for workflow in _workflows()[:3]:
+        (legacy / f"{workflow.id}.pkl").write_bytes(pickle.dumps(workflow))
+    (legacy / "notes.pkl").write_bytes(pickle.dumps({"not": "a workflow"}))
+
+    repo = SQLiteWorkflowRepository(
+        tmp_path / "workflows.sqlite3", legacy_directory=legacy
+    )
+    assert [workflow.id for workflow in repo.list()] == ["wf-0", "wf-1", "wf-2"]
+
+    assert repo.migrate_directory(legacy, remove=True) == 0
+    fresh = SQLiteWorkflowRepository(tmp_path / "other.sqlite3")
+    assert fresh.migrate_directory(legacy, remove=True) == 3
+    assert sorted(path.name for path in legacy.iterdir()) == ["notes.pkl"]
+
+
+@pytest.mark.fast
+def test_engine_and_repository_plug_into_orchestration_ports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from devsynth.adapters.orchestration.langgraph_adapter import (
+        LangGraphWorkflowEngine,
+    )
+    from devsynth.domain.interfaces.orchestration import WorkflowRepository
+
+    monkeypatch.setenv("DEVSYNTH_CHECKPOINTS_PATH", str(tmp_path / "cp"))
+
+    engine = LangGraphWorkflowEngine()
+    assert isinstance(engine.checkpoint_saver, SQLiteCheckpointSaver)
+    assert engine.checkpoint_saver.database_path == str(
+        tmp_path / "cp" / "checkpoints.sqlite3"
+    )
+    assert WorkflowRepository in SQLiteWorkflowRepository.__mro__
@@ -0,0 +1,101 @@
+"""Typer CLI coverage handling for ``devsynth run-tests --impact-base``."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from tests.unit.application.cli.commands.helpers import build_minimal_cli_app
+
+
+def _impact_app(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    *,
+    output: str,
+    artifacts_ok: bool,
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYTEST_ADDOPTS", "")
+
+    app, cli_module = build_minimal_cli_app(monkeypatch)
+
+    html_dir = tmp_path / "htmlcov"
+    json_path = tmp_path / "test_reports" / "coverage.json"
+    runner_module = cli_module.run_tests_module
+    monkeypatch.setattr(runner_module, "COVERAGE_HTML_DIR", html_dir)
+    monkeypatch.setattr(runner_module, "COVERAGE_JSON_PATH", json_path)
+
+    calls: dict[str, object] = {}
+
+    def _run_tests(*_args, **kwargs):
+        calls["impact_base"] = kwargs.get("impact_base")
+        return True, output
+
+    def _enforce(exit_on_failure: bool = False) -> float:
+        raise AssertionError("impact runs must not enforce the coverage gate")
+
+    monkeypatch.setattr(runner_module, "run_tests", _run_tests)
+    monkeypatch.setattr(
+        cli_module, "_coverage_instrumentation_status", lambda: (True, None)
+    )
+    monkeypatch.setattr(
+        runner_module,
+        "coverage_artifacts_status",
+        lambda: (True, None) if artifacts_ok else (False, "coverage.json missing"),
+    )
+    monkeypatch.setattr(runner_module, "enforce_coverage_threshold", _enforce)
+    monkeypatch.setattr(
+        runner_module, "ensure_pytest_cov_plugin_env", lambda env: False
+    )
+    monkeypatch.setattr(
+        runner_module, "ensure_pytest_bdd_plugin_env", lambda env: False
+    )
+    return app, calls
+
+
+@pytest.mark.fast
+def test_cli_impact_run_without_affected_tests_succeeds(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """No affected tests means no coverage artifacts, which is not a failure."""
+
+    app, calls = _impact_app(
+        monkeypatch,
+        tmp_path,
+        output="Impact analysis: no tests affected by changes since main.\n",
+        artifacts_ok=False,
+    )
+
+    result = CliRunner().invoke(
+        app, ["--impact-base", "main", "--speed", "fast"], prog_name="run-tests"
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert calls["impact_base"] == "main"
+    stdout = " ".join(result.stdout.split())
+    assert "no tests affected" in stdout
+    assert "Coverage enforcement skipped for impact-selected runs" in stdout
+    assert "Coverage artifacts missing" not in stdout
+
+
+@pytest.mark.fast
+def test_cli_impact_run_reports_coverage_without_enforcing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A partial impact run reports artifacts but skips the suite-wide gate."""
+
+    app, _ = _impact_app(monkeypatch, tmp_path, output="3 passed", artifacts_ok=True)
+
+    result = CliRunner().invoke(
+        app, ["--impact-base", "main", "--speed", "fast"], prog_name="run-tests"
+    )
+
+    assert result.exit_code == 0, result.stdout
+    stdout = " ".join(result.stdout.split())
+    assert "coverage data collected for diagnostics" in stdout
+    assert "Coverage artifacts missing" not in stdout
+    assert "--cov-fail-under=0" in os.environ["PYTEST_ADDOPTS"]
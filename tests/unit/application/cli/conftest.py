@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
+import importlib
+import pkgutil
+
 import pytest
 from rich.console import Console
 
+import devsynth.application.cli.commands as _commands
+
+# Command modules are loaded lazily, but the autouse ``stub_devsynth_config``
+# fixture replaces ``devsynth.config`` while each test runs. Import them at
+# collection time so they bind to the real configuration package.
+for _module in pkgutil.iter_modules(_commands.__path__, _commands.__name__ + "."):
+    try:
+        importlib.import_module(_module.name)
+    except Exception:  # pragma: no cover - reported by test_module_imports
+        pass
+
 
 @pytest.fixture
 def rich_console() -> Console:
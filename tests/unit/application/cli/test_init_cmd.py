@@ -8,6 +8,7 @@ import click
 import pytest
 import typer
 
+import devsynth.application.cli.setup_wizard  # noqa: F401 - patched below
 from devsynth.adapters.cli import typer_adapter
 from devsynth.application.cli.cli_commands import init_cmd
 from devsynth.config.unified_loader import UnifiedConfigLoader
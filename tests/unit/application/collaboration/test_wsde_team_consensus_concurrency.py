@@ -0,0 +1,137 @@
+"""Tests for concurrent opinion gathering and batched conflict scoring."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from devsynth.application.collaboration.wsde_team_consensus import (
+    ConsensusBuildingMixin,
+)
+
+
+class OpinionTeam(ConsensusBuildingMixin):
+    """Consensus mixin with an in-memory message log."""
+
+    def __init__(self, names: list[str], opinions: dict[str, str] | None = None):
+        self.logger = MagicMock()
+        self.agents = [
+            SimpleNamespace(name=name, metadata={"expertise": ["general"]})
+            for name in names
+        ]
+        self.opinions = opinions or {}
+        self.messages: list[dict[str, object]] = []
+
+    def send_message(self, **kwargs):  # type: ignore[override]
+        self.messages.append(kwargs)
+
+    def get_messages(self, agent: str, filters):  # type: ignore[override]
+        return [{"content": {"opinion": self.opinions[agent], "rationale": ""}}]
+
+
+@pytest.mark.fast
+def test_identify_conflicts_orders_pairs_like_nested_loops() -> None:
+    """Conflicts are reported pairwise in agent order with stable ids."""
+
+    team = OpinionTeam(
+        ["A", "B", "C"],
+        {"A": "use redis", "B": "use postgres", "C": "use sqlite"},
+    )
+
+    conflicts = team._identify_conflicts({"id": "t1"})
+
+    assert [(c.agent_a, c.agent_b) for c in conflicts] == [
+        ("A", "B"),
+        ("A", "C"),
+        ("B", "C"),
+    ]
+    assert [c.conflict_id for c in conflicts] == [
+        "conflict_0_t1",
+        "conflict_1_t1",
+        "conflict_2_t1",
+    ]
+    assert all(c.severity_score == pytest.approx(0.6) for c in conflicts)
+
+
+@pytest.mark.fast
+def test_identify_conflicts_matches_pairwise_helpers() -> None:
+    opinions = {
+        "A": "Yes, we should use the layered design",
+        "B": "No, we should not change the design method",
+        "C": "Use the plugin approach for the implementation",
+        "D": "Yes, proceed with the layered design",
+    }
+    team = OpinionTeam(list(opinions), opinions)
+
+    conflicts = team._identify_conflicts({"id": "t"})
+
+    names = list(opinions)
+    expected = [
+        (a, b)
+        for i, a in enumerate(names)
+        for b in names[i + 1 :]
+        if team._opinions_conflict(opinions[a], opinions[b])
+    ]
+    assert [(c.agent_a, c.agent_b) for c in conflicts] == expected
+    for conflict in conflicts:
+        assert conflict.severity_score == team._calculate_conflict_severity(
+            conflict.opinion_a, conflict.opinion_b
+        )
+
+
+@pytest.mark.fast
+def test_empty_opinions_do_not_conflict() -> None:
+    team = OpinionTeam(["A", "B"])
+
+    assert not team._opinions_conflict("", "")
+    assert team._calculate_conflict_severity("", "") == 0.0
+
+
+@pytest.mark.fast
+def test_generate_agent_opinions_runs_requests_concurrently() -> None:
+    team = OpinionTeam(["A", "B", "C", "D"])
+    barrier = threading.Barrier(4, timeout=5)
+
+    def request(agent, task):
+        barrier.wait()
+        return f"opinion from {agent.name}", "rationale"
+
+    team._request_agent_opinion = request  # type: ignore[method-assign]
+
+    team._generate_agent_opinions({"id": "t1", "title": "Task"})
+
+    replies = [m for m in team.messages if m["message_type"] == "opinion"]
+    assert [m["sender"] for m in replies] == ["A", "B", "C", "D"]
+
+
+@pytest.mark.fast
+def test_generate_agent_opinions_skips_agents_past_deadline() -> None:
+    team = OpinionTeam(["fast", "slow", "broken"])
+    team.opinion_timeout = 0.1
+    release = threading.Event()
+
+    def request(agent, task):
+        if agent.name == "slow":
+            release.wait(5)
+        if agent.name == "broken":
+            raise RuntimeError("boom")
+        return "ok", "because"
+
+    team._request_agent_opinion = request  # type: ignore[method-assign]
+
+    started = time.perf_counter()
+    try:
+        team._generate_agent_opinions({"id": "t1"})
+    finally:
+        release.set()
+
+    assert time.perf_counter() - started < 2
+    replies = [m for m in team.messages if m["message_type"] == "opinion"]
+    assert [m["sender"] for m in replies] == ["fast"]
+    requests = [m for m in team.messages if m["message_type"] == "opinion_request"]
+    assert len(requests) == 3
+    assert team.logger.warning.call_count == 2
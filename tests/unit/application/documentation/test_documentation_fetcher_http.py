@@ -0,0 +1,175 @@
+"""Pooled, conditional and concurrent fetching for documentation sources."""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import responses
+
+from devsynth.application.documentation import documentation_fetcher
+from devsynth.application.documentation.documentation_fetcher import (
+    DocumentationFetcher,
+    PyPIDocumentationSource,
+    distribution_digest,
+)
+from devsynth.application.documentation.http_client import CachedHTTPClient
+from devsynth.application.documentation.version_monitor import VersionMonitor
+
+SERVER = "http://docs.test"
+
+
+class DocsServer:
+    """In-process HTTP stand-in answering with ETags and optional delays."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str | None]] = []
+
+    def __call__(self, request):
+        path = request.path_url
+        self.requests.append((path, request.headers.get("If-None-Match")))
+        if path == "/slow":
+            time.sleep(0.5)
+        if path == "/missing":
+            return 404, {}, ""
+        etag = f'"{path}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, {}, ""
+        if path.startswith("/pypi/"):
+            library = path.split("/")[2]
+            body = json.dumps({"releases": {"1.0": [], f"2.{len(library)}": []}})
+        else:
+            body = f"<h1>{path}</h1><p>content</p>"
+        return 200, {"ETag": etag}, body
+
+
+@pytest.fixture()
+def server() -> Iterator[DocsServer]:
+    handler = DocsServer()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        for host in (SERVER, "https://pypi.org"):
+            mock.add_callback(responses.GET, re.compile(f"{host}/.*"), handler)
+        yield handler
+
+
+@pytest.mark.fast
+def test_cached_responses_are_revalidated_with_etag(
+    server: DocsServer, tmp_path: Path
+) -> None:
+    client = CachedHTTPClient(str(tmp_path))
+    first = client.get(f"{SERVER}/docs")
+    second = CachedHTTPClient(str(tmp_path)).get(f"{SERVER}/docs")
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == first.content == "<h1>/docs</h1><p>content</p>"
+    assert server.requests == [("/docs", None), ("/docs", '"/docs"')]
+    assert not client.get(f"{SERVER}/missing")
+
+
+@pytest.mark.fast
+def test_probing_returns_preferred_success_without_waiting(
+    server: DocsServer, tmp_path: Path
+) -> None:
+    client = CachedHTTPClient(str(tmp_path))
+    urls = [f"{SERVER}/missing", f"{SERVER}/fast", f"{SERVER}/slow"]
+
+    started = time.perf_counter()
+    manifest = client.get_first(urls)
+
+    assert time.perf_counter() - started < 0.4
+    assert manifest is not None and manifest.url == f"{SERVER}/fast"
+    assert client.get_first([f"{SERVER}/missing"] * 2) is None
+
+    # An earlier candidate that is merely slow still takes precedence.
+    preferred = client.get_first([f"{SERVER}/slow", f"{SERVER}/fast"])
+    assert preferred is not None and preferred.url == f"{SERVER}/slow"
+    client.close()
+
+
+@pytest.mark.fast
+def test_readthedocs_candidates_go_through_the_prober(tmp_path: Path) -> None:
+    fetcher = DocumentationFetcher(CachedHTTPClient(str(tmp_path)))
+    seen: list[list[str]] = []
+    fetcher.http_client.get_first = lambda urls: seen.append(list(urls))
+    source = fetcher.sources[0]
+
+    assert source._fetch_from_readthedocs("lib", "1.0") == []
+    assert len(seen) == 1 and len(seen[0]) == 3
+
+
+@pytest.mark.fast
+def test_check_all_libraries_runs_concurrently(
+    server: DocsServer, tmp_path: Path
+) -> None:
+    client = CachedHTTPClient(str(tmp_path / "http"))
+    monitor = VersionMonitor(str(tmp_path / "versions"), http_client=client)
+    for library in ("alpha", "beta", "gamma"):
+        monitor.register_library(library, "1.0")
+
+    results = monitor.check_all_libraries()
+
+    assert [r["latest_available"] for r in results] == ["2.5", "2.4", "2.5"]
+    assert all(info["last_checked"] for info in monitor.libraries.values())
+    assert monitor.check_for_updates("alpha")["update_available"] is True
+    assert ("/pypi/alpha/json", '"/pypi/alpha/json"') in server.requests
+
+
+def _install(site: Path, version: str) -> None:
+    package = site / "fakedocs"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Fake documentation package."""\n')
+    dist_info = site / f"fakedocs-{version}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: fakedocs\nVersion: {version}\n"
+    )
+    (dist_info / "RECORD").write_text(
+        "fakedocs/__init__.py,sha256=abc,33\n"
+        f"fakedocs-{version}.dist-info/METADATA,,\n"
+        f"fakedocs-{version}.dist-info/RECORD,,\n"
+    )
+
+
+@pytest.mark.fast
+def test_docstrings_are_reused_for_identical_distributions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        documentation_fetcher.tempfile, "gettempdir", lambda: str(tmp_path)
+    )
+    runs: list[list[str]] = []
+    original_run = subprocess.run
+
+    def counting_run(args, **kwargs):
+        runs.append(list(args))
+        return original_run(args, **kwargs)
+
+    monkeypatch.setattr(documentation_fetcher.subprocess, "run", counting_run)
+    source = PyPIDocumentationSource(lambda url: None)
+
+    first_site = tmp_path / "site-1.0"
+    _install(first_site, "1.0")
+    monkeypatch.syspath_prepend(str(first_site))
+    digest = distribution_digest("fakedocs", "1.0")
+    assert digest is not None
+    assert distribution_digest("fakedocs", "9.9") is None
+
+    chunks = source._extract_docstrings("fakedocs", "1.0")
+    assert [c.content for c in chunks] == ["Fake documentation package."]
+    assert len(runs) == 1
+
+    second_site = tmp_path / "site-1.1"
+    _install(second_site, "1.1")
+    monkeypatch.syspath_prepend(str(second_site))
+    assert distribution_digest("fakedocs", "1.1") == digest
+
+    reused = source._extract_docstrings("fakedocs", "1.1")
+    assert [c.metadata["version"] for c in reused] == ["1.1"]
+    assert len(runs) == 1
+    assert source.docstring_cache.lookup("fakedocs", "1.1") == digest
@@ -0,0 +1,125 @@
+"""Batched, resumable ingestion in :class:`DocumentationRepository`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from devsynth.application.documentation.documentation_repository import (
+    DocumentationRepository,
+)
+from devsynth.application.documentation.models import DocumentationChunk
+
+
+class BatchingMemoryManager:
+    """Memory manager double exposing the batch store API."""
+
+    def __init__(self, fail_on_batch: int | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self.items: dict[str, object] = {}
+        self.triples: list[tuple[str, str, str]] = []
+        self.fail_on_batch = fail_on_batch
+
+    def store_items(self, items, *, embed=False):
+        if len(self.batches) == self.fail_on_batch:
+            raise RuntimeError("store crashed")
+        assert embed is True
+        self.batches.append([item.id for item in items])
+        self.items.update({item.id: item for item in items})
+        return [item.id for item in items]
+
+    def add_graph_triple(self, subject, predicate, object):
+        self.triples.append((subject, predicate, object))
+
+
+class SingleItemMemoryManager:
+    def __init__(self) -> None:
+        self.stored: list[str] = []
+        self.triples: list[tuple[str, str, str]] = []
+
+    def store_item(self, item):
+        self.stored.append(item.id)
+        return item.id
+
+    def add_graph_triple(self, subject, predicate, object):
+        self.triples.append((subject, predicate, object))
+
+
+def _chunks(count: int) -> list[DocumentationChunk]:
+    return [
+        DocumentationChunk(
+            title=f"Section {index}",
+            content=f"class Model{index % 3}:\n    def fit(self): ...",
+            metadata={"section": f"s{index % 2}", "source_url": "https://docs"},
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.fast
+def test_chunks_are_stored_in_batches_with_unique_triples(tmp_path: Path) -> None:
+    manager = BatchingMemoryManager()
+    repo = DocumentationRepository(manager, str(tmp_path), batch_size=4)
+
+    doc_id = repo.store_documentation("lib", "1.0", _chunks(10))
+
+    assert doc_id == "lib-1.0"
+    assert [len(batch) for batch in manager.batches] == [4, 4, 2]
+    item = manager.items["lib-1.0-chunk-7"]
+    assert item.metadata["chunk_index"] == 7
+    assert item.metadata["section"] == "s1"
+
+    triples = manager.triples
+    assert len(triples) == len(set(triples))
+    assert ("class:lib:Model2", "definedIn", "library:lib") in triples
+    assert ("function:lib:fit", "availableInVersion", "version:lib:1.0") in triples
+    assert ("doc:lib:1.0:s1", "describesLibrary", "library:lib") in triples
+
+    saved = json.loads((tmp_path / "metadata.json").read_text())
+    assert saved["lib-1.0"]["chunk_count"] == 10
+    assert saved["lib-1.0"]["chunk_ids"][-1] == "lib-1.0-chunk-9"
+    assert not list(tmp_path.glob("ingest-*"))
+
+
+@pytest.mark.fast
+def test_interrupted_ingest_resumes_after_last_batch(tmp_path: Path) -> None:
+    chunks = _chunks(10)
+    crashing = BatchingMemoryManager(fail_on_batch=2)
+    repo = DocumentationRepository(crashing, str(tmp_path), batch_size=3)
+    with pytest.raises(RuntimeError):
+        repo.store_documentation("lib", "1.0", chunks)
+    assert not repo.has_documentation("lib", "1.0")
+
+    manager = BatchingMemoryManager()
+    resumed = DocumentationRepository(manager, str(tmp_path), batch_size=3)
+    assert not resumed.has_documentation("lib", "1.0")
+    resumed.store_documentation("lib", "1.0", chunks)
+
+    assert manager.batches[0][0] == "lib-1.0-chunk-6"
+    assert len(crashing.items) + len(manager.items) == 10
+    assert resumed.get_documentation("lib", "1.0")["chunk_count"] == 10
+
+    # Different chunks for the same version start from the beginning.
+    other = BatchingMemoryManager(fail_on_batch=1)
+    with pytest.raises(RuntimeError):
+        DocumentationRepository(other, str(tmp_path), batch_size=3).store_documentation(
+            "lib", "2.0", chunks
+        )
+    fresh = BatchingMemoryManager()
+    DocumentationRepository(fresh, str(tmp_path), batch_size=3).store_documentation(
+        "lib", "2.0", chunks[:5]
+    )
+    assert fresh.batches[0][0] == "lib-2.0-chunk-0"
+
+
+@pytest.mark.fast
+def test_managers_without_batch_apis_store_item_by_item(tmp_path: Path) -> None:
+    manager = SingleItemMemoryManager()
+    repo = DocumentationRepository(manager, str(tmp_path), batch_size=2)
+
+    repo.store_documentation("lib", "1.0", _chunks(3))
+
+    assert manager.stored == [f"lib-1.0-chunk-{i}" for i in range(3)]
+    assert manager.triples.count(("library:lib", "hasVersion", "version:lib:1.0")) == 1
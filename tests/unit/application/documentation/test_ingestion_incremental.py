@@ -0,0 +1,178 @@
+"""Incremental, batched directory ingestion."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from devsynth.application.documentation.ingestion import (
+    DocumentationIngestionManager,
+)
+from devsynth.application.memory.memory_manager import MemoryManager
+from devsynth.domain.models.memory import MemoryItem
+
+
+class BulkStore:
+    """Adapter stand-in recording batched writes and deletions."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, MemoryItem] = {}
+        self.batches: list[int] = []
+        self.deleted: list[str] = []
+
+    def store(self, item: MemoryItem) -> str:
+        self.items[item.id] = item
+        return item.id
+
+    def store_many(self, items) -> list[str]:
+        self.batches.append(len(items))
+        return [self.store(item) for item in items]
+
+    def retrieve(self, item_id: str) -> MemoryItem | None:
+        return self.items.get(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        self.deleted.append(item_id)
+        return self.items.pop(item_id, None) is not None
+
+
+@pytest.fixture()
+def docs(tmp_path: Path) -> Path:
+    root = tmp_path / "docs"
+    (root / "guide").mkdir(parents=True)
+    for index in range(5):
+        (root / "guide" / f"page{index}.md").write_text(f"# Page {index}\n\nBody")
+    (root / "notes.txt").write_text("plain notes")
+    return root
+
+
+def _manager(store: BulkStore, manifest: Path) -> DocumentationIngestionManager:
+    return DocumentationIngestionManager(
+        MemoryManager(adapters={"tinydb": store}),
+        manifest_path=manifest,
+        max_workers=4,
+        batch_size=4,
+    )
+
+
+@pytest.mark.fast
+def test_unchanged_files_are_skipped_across_runs(docs: Path, tmp_path: Path) -> None:
+    store = BulkStore()
+    manifest = tmp_path / "manifest.json"
+
+    first = _manager(store, manifest).ingest_directory(docs)
+    assert len(first) == 6 and store.batches == [4, 2]
+    assert all(item.identifier in store.items for item in first)
+
+    second = _manager(store, manifest).ingest_directory(docs)
+    assert second == () and store.batches == [4, 2]
+
+    # A touched file is re-hashed but not re-stored
+    page = docs / "guide" / "page0.md"
+    os.utime(page, ns=(1, 1))
+    assert _manager(store, manifest).ingest_directory(docs) == ()
+    assert store.batches == [4, 2]
+
+
+@pytest.mark.fast
+def test_changed_and_removed_files_replace_and_prune(
+    docs: Path, tmp_path: Path
+) -> None:
+    store = BulkStore()
+    manager = _manager(store, tmp_path / "manifest.json")
+    first = {
+        m.metadata["file_name"]: m.identifier for m in manager.ingest_directory(docs)
+    }
+
+    (docs / "guide" / "page1.md").write_text("# Page 1\n\nRewritten body")
+    (docs / "notes.txt").unlink()
+    changed = manager.ingest_directory(docs)
+
+    assert [m.metadata["file_name"] for m in changed] == ["page1.md"]
+    assert first["page1.md"] not in store.items
+    assert first["notes.txt"] not in store.items
+    assert changed[0].identifier in store.items
+    assert len(store.items) == 5
+
+    # Narrower runs do not prune files outside their scope
+    assert manager.ingest_directory(docs, file_types=[".txt"]) == ()
+    assert len(store.items) == 5
+
+
+@pytest.mark.fast
+def test_metadata_changes_and_full_runs_reingest(docs: Path, tmp_path: Path) -> None:
+    store = BulkStore()
+    manager = _manager(store, tmp_path / "manifest.json")
+    manager.ingest_directory(docs)
+
+    assert len(manager.ingest_directory(docs, metadata={"project": "x"})) == 6
+    assert len(manager.ingest_directory(docs, metadata={"project": "x"})) == 0
+    full = manager.ingest_directory(docs, metadata={"project": "x"}, incremental=False)
+    assert len(full) == 6
+
+
+@pytest.mark.fast
+def test_files_missing_from_a_wiped_store_are_reingested(
+    docs: Path, tmp_path: Path
+) -> None:
+    manifest = tmp_path / "manifest.json"
+    _manager(BulkStore(), manifest).ingest_directory(docs)
+
+    fresh = BulkStore()
+    reingested = _manager(fresh, manifest).ingest_directory(docs)
+
+    assert len(reingested) == 6 and len(fresh.items) == 6
+    assert _manager(fresh, manifest).ingest_directory(docs) == ()
+
+
+class FlakyStore(BulkStore):
+    """Store whose batch writes fail and which rejects one file."""
+
+    def __init__(self, rejected: str | None) -> None:
+        super().__init__()
+        self.rejected = rejected
+
+    def store_many(self, items) -> list[str]:
+        raise RuntimeError("batch write failed")
+
+    def store(self, item: MemoryItem) -> str:
+        if item.metadata.get("file_name") == self.rejected:
+            raise RuntimeError("rejected")
+        return super().store(item)
+
+
+@pytest.mark.fast
+def test_store_failures_skip_only_the_failing_file(docs: Path, tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.json"
+    store = FlakyStore(rejected="notes.txt")
+
+    stored = _manager(store, manifest).ingest_directory(docs)
+
+    assert sorted(m.metadata["file_name"] for m in stored) == [
+        f"page{index}.md" for index in range(5)
+    ]
+    assert manifest.exists()
+
+    store.rejected = None
+    retried = _manager(store, manifest).ingest_directory(docs)
+    assert [m.metadata["file_name"] for m in retried] == ["notes.txt"]
+
+
+@pytest.mark.fast
+def test_crlf_line_endings_are_normalised(tmp_path: Path) -> None:
+    path = tmp_path / "windows.txt"
+    path.write_bytes(b"first\r\nsecond\r\n")
+
+    manifest = DocumentationIngestionManager(max_workers=1).ingest_file(path)
+
+    assert "\r" not in manifest.content
+    assert "first\nsecond" in manifest.content
+
+
+@pytest.mark.fast
+def test_without_memory_manager_every_file_is_returned(docs: Path) -> None:
+    manager = DocumentationIngestionManager(max_workers=2)
+    assert len(manager.ingest_directory(docs)) == 6
+    assert len(manager.ingest_directory(docs)) == 6
@@ -0,0 +1 @@
+"""Unit tests for the knowledge graph package."""
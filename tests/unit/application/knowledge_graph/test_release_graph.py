@@ -0,0 +1,199 @@
+"""Indexed lookups, dirty tracking and incremental sync for the release graph."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from devsynth.application.knowledge_graph.release_graph import (
+    KuzuReleaseGraphAdapter,
+    NetworkXReleaseGraphAdapter,
+    QualityGateNode,
+    ReleaseEvidenceNode,
+)
+from devsynth.application.knowledge_graph.release_graph import TestRunNode as RunNode
+
+pytestmark = pytest.mark.fast
+
+
+def _evidence(checksum: str) -> ReleaseEvidenceNode:
+    return ReleaseEvidenceNode(
+        id=f"new-{checksum}",
+        release_tag="v1.0.0",
+        artifact_path=f"artifacts/{checksum}.json",
+        artifact_type="coverage",
+        collected_at="2024-01-01T00:00:00Z",
+        checksum=checksum,
+        source_command="task release:prep",
+    )
+
+
+def _run(checksum: str) -> RunNode:
+    return RunNode(
+        id=f"run-{checksum}",
+        profile="full",
+        coverage_percent=91.0,
+        tests_collected=100,
+        exit_code=0,
+        started_at="2024-01-01T00:00:00Z",
+        completed_at="2024-01-01T00:10:00Z",
+        run_checksum=checksum,
+    )
+
+
+def _gate(status: str) -> QualityGateNode:
+    return QualityGateNode(
+        id="gate-new",
+        gate_name="coverage",
+        threshold=90.0,
+        status=status,
+        evaluated_at="2024-01-01T00:11:00Z",
+    )
+
+
+def _publish(adapter, evidence: list[str], run: str, status: str = "pass"):
+    stored = [adapter.upsert_release_evidence(_evidence(c))[0] for c in evidence]
+    test_run, _ = adapter.upsert_test_run(_run(run))
+    for node in stored:
+        adapter.link_test_run_to_evidence(test_run.id, node.id)
+    gate, _ = adapter.record_quality_gate(
+        _gate(status), test_run.id, [node.id for node in stored]
+    )
+    return stored, test_run, gate
+
+
+def test_upserts_reuse_indexed_nodes_across_reloads(tmp_path: Path) -> None:
+    path = tmp_path / "graph.json"
+    adapter = NetworkXReleaseGraphAdapter(path)
+    stored, run, gate = _publish(adapter, ["a", "b"], "r1")
+    adapter.finalize()
+
+    assert ": " not in path.read_text()  # compact persistence
+
+    reloaded = NetworkXReleaseGraphAdapter(path)
+    again, created = reloaded.upsert_release_evidence(_evidence("a"))
+    assert (again.id, created) == (stored[0].id, False)
+    same_run, created = reloaded.upsert_test_run(_run("r1"))
+    assert (same_run.id, created) == (run.id, False)
+    assert not reloaded.has_pending_changes
+
+
+def test_finalize_writes_only_when_something_changed(tmp_path: Path) -> None:
+    path = tmp_path / "graph.json"
+    adapter = NetworkXReleaseGraphAdapter(path)
+    _publish(adapter, ["a"], "r1")
+    adapter.finalize()
+    path.write_text(path.read_text() + " ")
+    before = path.read_text()
+
+    _publish(adapter, ["a"], "r1")
+    adapter.finalize()
+    assert path.read_text() == before
+
+    _publish(adapter, ["a"], "r1", status="fail")
+    adapter.finalize()
+    assert path.read_text() != before
+
+
+def test_quality_gate_edges_are_replaced(tmp_path: Path) -> None:
+    adapter = NetworkXReleaseGraphAdapter(tmp_path / "graph.json")
+    _publish(adapter, ["a", "b"], "r1")
+    adapter.finalize()
+
+    _, run, gate = _publish(adapter, ["b", "c"], "r2")
+    edges = {
+        (attrs["type"], v)
+        for _, v, attrs in adapter._graph.out_edges(gate.id, data=True)
+    }
+    evidence = {
+        adapter._find_node(
+            type_="ReleaseEvidence",
+            artifact_type="coverage",
+            checksum=c,
+            release_tag="v1.0.0",
+        )
+        for c in ("b", "c")
+    }
+    assert edges == {("HAS_EVIDENCE", e) for e in evidence} | {
+        ("EVALUATED_FROM", run.id)
+    }
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, list[object]]] = []
+
+    def execute(self, statement: str, parameters: list[object] | None = None):
+        self.statements.append((statement, parameters or []))
+
+
+def test_kuzu_sync_batches_only_changed_rows(tmp_path: Path) -> None:
+    adapter = KuzuReleaseGraphAdapter(
+        tmp_path / "graph.json", db_path=tmp_path / "kuzu"
+    )
+    connection = RecordingConnection()
+    adapter._conn = connection
+    adapter._kuzu_available = True
+    adapter.sync_batch_size = 2
+
+    _publish(adapter, ["a", "b", "c"], "r1")
+    adapter.finalize()
+    tables = [statement.split("(")[0] for statement, _ in connection.statements]
+    assert tables.count("MERGE INTO release_evidence") == 2  # 3 rows, batches of 2
+    assert "DELETE" not in " ".join(tables)
+
+    connection.statements.clear()
+    adapter.finalize()
+    assert connection.statements == []
+
+    _publish(adapter, ["a"], "r1", status="fail")
+    adapter.finalize()
+    statements = dict(connection.statements)
+    assert set(statements) == {
+        "DELETE FROM gate_has_evidence WHERE (gate_id, evidence_id) IN "
+        "((?, ?), (?, ?));",
+        "MERGE INTO quality_gate(id, gate_name, threshold, status, evaluated_at, "
+        "metadata) VALUES (?, ?, ?, ?, ?, ?);",
+    }
+    gate_row = statements[next(s for s in statements if "quality_gate" in s)]
+    assert gate_row[3] == "fail" and json.loads(gate_row[5]) == {}
+
+
+class FailingConnection(RecordingConnection):
+    def execute(self, statement: str, parameters: list[object] | None = None):
+        raise RuntimeError("database locked")
+
+
+def test_failed_kuzu_sync_is_replayed_by_the_next_adapter(tmp_path: Path) -> None:
+    def open_adapter(connection: RecordingConnection) -> KuzuReleaseGraphAdapter:
+        adapter = KuzuReleaseGraphAdapter(
+            tmp_path / "graph.json", db_path=tmp_path / "kuzu"
+        )
+        adapter._conn = connection
+        adapter._kuzu_available = True
+        return adapter
+
+    adapter = open_adapter(FailingConnection())
+    _publish(adapter, ["a"], "r1")
+    adapter.finalize()
+    marker = tmp_path / "kuzu" / "pending_sync.json"
+    assert marker.exists() and (tmp_path / "graph.json").exists()
+
+    connection = RecordingConnection()
+    reopened = open_adapter(connection)
+    assert not reopened.has_pending_changes
+    reopened.finalize()
+    tables = {statement.split("(")[0] for statement, _ in connection.statements}
+    assert {
+        "MERGE INTO release_evidence",
+        "MERGE INTO test_run",
+        "MERGE INTO quality_gate",
+        "MERGE INTO test_run_emits_evidence",
+    } <= tables
+    assert not marker.exists()
+
+    connection.statements.clear()
+    open_adapter(connection).finalize()
+    assert connection.statements == []
@@ -0,0 +1,217 @@
+"""Indexed traversal and matching in :mod:`enhanced_knowledge_graph`."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from devsynth.application.memory.enhanced_knowledge_graph import (
+    EnhancedKnowledgeGraph,
+    Entity,
+    IntentDiscoveryEngine,
+    Relationship,
+)
+
+WORDS = [
+    "user",
+    "login",
+    "payment",
+    "report",
+    "validate",
+    "store",
+    "profile",
+    "search",
+    "token",
+    "session",
+]
+
+
+def _graph(seed: int = 7, nodes: int = 60, edges: int = 150) -> EnhancedKnowledgeGraph:
+    rng = random.Random(seed)
+    graph = EnhancedKnowledgeGraph()
+    types = ["Function", "Class", "Module", "BusinessRequirement"]
+    for index in range(nodes):
+        graph.add_entity(
+            Entity(
+                id=f"e{index}",
+                type=types[index % len(types)],
+                properties={
+                    "name": f"node {index}",
+                    "description": " ".join(rng.sample(WORDS, 4)),
+                },
+            )
+        )
+    for _ in range(edges):
+        source, target = rng.randrange(nodes + 5), rng.randrange(nodes)
+        graph.add_relationship(
+            Relationship(f"e{source}", f"e{target}", rng.choice(["CALLS", "USES"]), 1)
+        )
+    return graph
+
+
+def _naive_reachable(graph: EnhancedKnowledgeGraph, start: str, depth: int) -> set[str]:
+    reached, level = {start}, [start]
+    for _ in range(depth):
+        next_level = []
+        for entity_id in level:
+            for rel in graph.relationships.values():
+                if entity_id not in (rel.source_id, rel.target_id):
+                    continue
+                other = rel.target_id if rel.source_id == entity_id else rel.source_id
+                if other in graph.entities and other not in reached:
+                    reached.add(other)
+                    next_level.append(other)
+        level = next_level
+    return reached
+
+
+@pytest.mark.fast
+def test_connected_entities_use_both_directions_and_filters() -> None:
+    graph = EnhancedKnowledgeGraph()
+    for entity_id in ("a", "b", "c"):
+        graph.add_entity(Entity(id=entity_id, type="Function", properties={}))
+    graph.add_relationship(Relationship("a", "b", "CALLS", 1.0))
+    graph.add_relationship(Relationship("c", "a", "USES", 1.0))
+    graph.add_relationship(Relationship("a", "a", "CALLS", 1.0))
+    graph.add_relationship(Relationship("a", "ghost", "CALLS", 1.0))
+
+    assert sorted(e.id for e in graph.get_connected_entities("a")) == ["a", "b", "c"]
+    assert [e.id for e in graph.get_connected_entities("a", "USES")] == ["c"]
+
+    removed = graph.remove_relationship("c--USES-->a")
+    assert removed is not None and removed.type == "USES"
+    assert graph.remove_relationship("c--USES-->a") is None
+    assert "c--USES-->a" not in graph.relationships
+    assert sorted(e.id for e in graph.get_connected_entities("a")) == ["a", "b"]
+    assert graph.get_connected_entities("c") == []
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("compact", [False, True])
+def test_removing_a_relationship_refreshes_traversals(compact: bool) -> None:
+    graph = EnhancedKnowledgeGraph()
+    for entity_id in ("a", "b", "c"):
+        graph.add_entity(Entity(id=entity_id, type="Function", properties={}))
+    graph.add_relationship(Relationship("a", "b", "CALLS", 1.0))
+    graph.add_relationship(Relationship("b", "c", "CALLS", 1.0))
+    if compact:
+        graph.compact()
+    assert graph.calculate_blast_radius("a")["blast_radius"] == 2
+
+    graph.remove_relationship("b--CALLS-->c")
+
+    assert graph.calculate_blast_radius("a")["blast_radius"] == 1
+    assert graph.calculate_blast_radius("c")["blast_radius"] == 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("compact", [False, True])
+def test_blast_radius_matches_breadth_first_reference(compact: bool) -> None:
+    graph = _graph()
+    if compact:
+        graph.compact()
+
+    for start, depth in [("e0", 1), ("e3", 2), ("e10", 5), ("missing", 3)]:
+        result = graph.calculate_blast_radius(start, max_depth=depth)
+        assert set(result["affected_entities"]) == _naive_reachable(graph, start, depth)
+        assert result["blast_radius"] == len(result["affected_entities"]) - 1
+
+
+@pytest.mark.fast
+def test_mutations_invalidate_compact_form_and_memoized_traversals() -> None:
+    graph = EnhancedKnowledgeGraph()
+    for entity_id in ("a", "b", "c"):
+        graph.add_entity(Entity(id=entity_id, type="Function", properties={}))
+    graph.add_relationship(Relationship("a", "b", "CALLS", 1.0))
+    graph.compact()
+    assert graph.calculate_blast_radius("a")["blast_radius"] == 1
+
+    graph.add_relationship(Relationship("b", "c", "CALLS", 1.0))
+    assert graph.calculate_blast_radius("a")["blast_radius"] == 2
+    assert graph.calculate_blast_radius("a", max_depth=1)["blast_radius"] == 1
+
+    graph.add_relationship(Relationship("c", "d", "CALLS", 1.0))
+    graph.add_entity(Entity(id="d", type="Class", properties={}))
+    assert graph.calculate_blast_radius("a")["blast_radius"] == 3
+
+
+@pytest.mark.fast
+def test_semantic_matches_agree_with_exhaustive_scoring() -> None:
+    graph = _graph()
+    target = graph.get_entity("e5")
+
+    def words(entity: Entity) -> set[str]:
+        return {
+            word
+            for value in entity.properties.values()
+            if isinstance(value, str)
+            for word in value.lower().split()
+        }
+
+    scored = []
+    for entity in graph.entities.values():
+        if entity.id == target.id:
+            continue
+        overlap = len(words(target) & words(entity))
+        if overlap:
+            scored.append((entity.id, overlap / len(words(target) | words(entity))))
+    scored.sort(key=lambda pair: pair[1], reverse=True)
+
+    matches = graph.find_semantic_matches(target, max_results=8)
+    assert [entity.id for entity in matches] == [eid for eid, _ in scored[:8]]
+
+    # Re-adding an entity refreshes its indexed keywords.
+    graph.add_entity(Entity(id="e5", type="Function", properties={"d": "unique"}))
+    assert graph.find_semantic_matches(graph.get_entity("e5")) == []
+
+
+@pytest.mark.fast
+def test_intent_discovery_prunes_pairs_without_changing_links() -> None:
+    graph = _graph(seed=3)
+    description = "user payment validate report search feature"
+    graph.add_entity(Entity("req", "BusinessRequirement", {"description": description}))
+    graph.add_entity(Entity("impl", "Function", {"description": description}))
+    graph.intent_discovery_engine = IntentDiscoveryEngine(similarity_threshold=0.6)
+    engine = graph.intent_discovery_engine
+    requirements = graph.get_entities_by_type("BusinessRequirement")
+    code = [
+        entity
+        for kind in ("Function", "Class", "Module")
+        for entity in graph.get_entities_by_type(kind)
+    ]
+    expected = {
+        (link.entity_id, link.requirement_id)
+        for requirement in requirements
+        for entity in code
+        if (link := engine.discover_intent(entity, requirement))
+        and link.confidence > 0.6
+    }
+    index = graph._intent_candidate_index(code)
+    assert index is not None
+    assert sum(
+        len(graph._intent_candidates(requirement, code, index))
+        for requirement in requirements
+    ) < len(requirements) * len(code)
+
+    links = graph.discover_intent_relationships()
+
+    assert ("impl", "req") in expected
+    assert {(link.entity_id, link.requirement_id) for link in links} == expected
+
+
+@pytest.mark.fast
+def test_engines_without_a_pruning_bound_score_every_pair() -> None:
+    class ExhaustiveEngine(IntentDiscoveryEngine):
+        def keyword_pruning_threshold(self) -> float | None:
+            return None
+
+    graph = _graph(seed=3)
+    graph.intent_discovery_engine = ExhaustiveEngine()
+    code = graph.get_entities_by_type("Function")
+
+    assert graph._intent_candidate_index(code) is None
+    assert (
+        IntentDiscoveryEngine(similarity_threshold=0).keyword_pruning_threshold()
+        is None
+    )
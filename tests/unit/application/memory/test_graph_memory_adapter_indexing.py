@@ -0,0 +1,165 @@
+"""Indexed search and journaled persistence for ``GraphMemoryAdapter``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("rdflib")
+
+from devsynth.application.memory.adapters.graph_journal import journal_path_for
+from devsynth.application.memory.adapters.graph_memory_adapter import (
+    GraphMemoryAdapter,
+)
+from devsynth.domain.models.memory import MemoryItem, MemoryType
+
+
+def _item(item_id: str, memory_type: MemoryType, **metadata: object) -> MemoryItem:
+    content = f"content {item_id}"
+    return MemoryItem(
+        id=item_id, content=content, memory_type=memory_type, metadata=metadata
+    )
+
+
+def _populate(adapter: GraphMemoryAdapter) -> None:
+    for index in range(30):
+        adapter.store(
+            _item(
+                f"item-{index}",
+                MemoryType.CODE if index % 2 else MemoryType.DOCUMENTATION,
+                team=f"team-{index % 3}",
+                tags=["a", str(index % 2)],
+            )
+        )
+
+
+def _ids(records) -> list[str]:
+    return [record.item.id for record in records]
+
+
+def _scan(adapter: GraphMemoryAdapter, query: dict[str, object]) -> list[str]:
+    """Reference results from a full scan of the graph."""
+
+    subjects = adapter._memory_item_subjects()
+    items = [adapter._triples_to_memory_item(subject) for subject in subjects]
+    return [item.id for item in items if adapter._matches_query(item, query)]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "query",
+    [
+        {},
+        {"type": MemoryType.CODE},
+        {"type": "documentation", "team": "team-1"},
+        {"team": "team-2", "tags": ["a", "0"]},
+        {"missing": "value"},
+    ],
+)
+def test_indexed_search_matches_full_scan(query: dict[str, object]) -> None:
+    adapter = GraphMemoryAdapter()
+    _populate(adapter)
+    adapter.search({})  # build the index before mutating
+    adapter.store(_item("item-4", MemoryType.CODE, team="team-1", tags=["a", "0"]))
+    adapter.delete("item-7")
+    adapter.add_memory_volatility()
+
+    assert _ids(adapter.search(query)) == _scan(adapter, query)
+    assert _ids(adapter.search({"confidence": 1.0})) == _scan(
+        adapter, {"confidence": 1.0}
+    )
+
+
+@pytest.mark.fast
+def test_search_materializes_only_candidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    adapter = GraphMemoryAdapter()
+    _populate(adapter)
+    adapter.search({})
+    adapter.store(_item("fresh", MemoryType.CODE, team="team-9"))
+
+    materialized: list[str] = []
+    original = adapter._triples_to_memory_item
+
+    def counting(subject):
+        item = original(subject)
+        materialized.append(item.id)
+        return item
+
+    monkeypatch.setattr(adapter, "_triples_to_memory_item", counting)
+    results = adapter.search({"team": "team-9"})
+
+    assert _ids(results) == ["fresh"]
+    # The changed item is re-indexed once and then materialized as the match.
+    assert materialized == ["fresh", "fresh"]
+
+
+@pytest.mark.fast
+def test_writes_append_to_journal_and_reload(tmp_path: Path) -> None:
+    adapter = GraphMemoryAdapter(base_path=str(tmp_path))
+    adapter.store(_item("first", MemoryType.CODE, team="core"))
+    snapshot = tmp_path / "graph_memory.ttl"
+    journal = journal_path_for(snapshot)
+    baseline = snapshot.read_text(encoding="utf-8")
+
+    adapter.store(_item("second", MemoryType.CODE, team="core", related_to="first"))
+    adapter.delete("first")
+
+    assert snapshot.read_text(encoding="utf-8") == baseline
+    lines = journal.read_text(encoding="utf-8").splitlines()
+    assert lines and all(line[:2] in ("A ", "D ") for line in lines)
+
+    reloaded = GraphMemoryAdapter(base_path=str(tmp_path))
+    assert set(reloaded.graph) == set(adapter.graph)
+    assert _ids(reloaded.search({"team": "core"})) == ["second"]
+
+
+@pytest.mark.fast
+def test_journal_is_compacted_into_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(GraphMemoryAdapter, "journal_min_compaction_entries", 20)
+    monkeypatch.setattr(GraphMemoryAdapter, "journal_compaction_ratio", 0.0)
+    adapter = GraphMemoryAdapter(base_path=str(tmp_path))
+    journal = journal_path_for(tmp_path / "graph_memory.ttl")
+
+    for index in range(10):
+        adapter.store(_item(f"item-{index}", MemoryType.CODE))
+        assert adapter._graph_journal.entries <= 20
+
+    adapter.compact_graph()
+    assert not journal.exists()
+    reloaded = GraphMemoryAdapter(base_path=str(tmp_path))
+    assert len(reloaded.search({})) == 10
+
+
+@pytest.mark.fast
+def test_rollback_rewrites_snapshot_and_refreshes_index(tmp_path: Path) -> None:
+    adapter = GraphMemoryAdapter(base_path=str(tmp_path))
+    adapter.store(_item("kept", MemoryType.CODE, team="core"))
+    assert _ids(adapter.search({"team": "core"})) == ["kept"]
+
+    adapter.begin_transaction("tx")
+    adapter.store(_item("discarded", MemoryType.CODE, team="core"))
+    assert _ids(adapter.search({"team": "core"})) == ["kept", "discarded"]
+    adapter.rollback_transaction("tx")
+
+    assert _ids(adapter.search({"team": "core"})) == ["kept"]
+    assert not journal_path_for(tmp_path / "graph_memory.ttl").exists()
+    reloaded = GraphMemoryAdapter(base_path=str(tmp_path))
+    assert _ids(reloaded.search({"team": "core"})) == ["kept"]
+
+
+@pytest.mark.fast
+def test_retrieve_with_edrr_phase_uses_first_indexed_match() -> None:
+    adapter = GraphMemoryAdapter()
+    adapter.store(_item("a", MemoryType.CODE, edrr_phase="EXPAND", team="x"))
+    adapter.store(_item("b", MemoryType.CODE, edrr_phase="REFINE", team="y"))
+    adapter.store(_item("c", MemoryType.CODE, edrr_phase="REFINE", team="y"))
+
+    assert adapter.retrieve_with_edrr_phase("code", "REFINE") == "content b"
+    assert adapter.retrieve_with_edrr_phase("code", "REFINE", {"team": "x"}) == {}
+    assert (
+        adapter.retrieve_with_edrr_phase("code", "EXPAND", {"owner": None})
+        == "content a"
+    )
@@ -0,0 +1,109 @@
+"""Tests for the Memetic Unit ingestion pipeline batch path."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from devsynth.application.memory.memetic_unit_ingestion import (
+    SEMANTIC_VECTOR_DIMENSION,
+    MemeticUnitIngestionPipeline,
+)
+from devsynth.domain.models.memory import MemeticSource
+
+
+class RecordingEmbedder:
+    """Embedding provider that records each batch it receives."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def _reference_vector(data) -> list[float]:
+    hash_int = int(hashlib.md5(str(data).encode()).hexdigest(), 16)
+    vector = []
+    for i in range(SEMANTIC_VECTOR_DIMENSION):
+        value = ((hash_int + i * 31) * 1103515245 + 12345) & 0x7FFFFFFF
+        vector.append((value % 2000 - 1000) / 1000.0)
+    return vector
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("data", ["", "hello world", {"b": 2, "a": [1, 2]}])
+def test_placeholder_vector_matches_scalar_generator(data) -> None:
+    pipeline = MemeticUnitIngestionPipeline()
+
+    assert pipeline._generate_semantic_vector(data) == _reference_vector(data)
+
+
+@pytest.mark.fast
+def test_batch_process_deduplicates_and_preserves_order() -> None:
+    pipeline = MemeticUnitIngestionPipeline(batch_size=2, max_workers=2)
+    data = ["alpha", {"k": 1}, "alpha", "beta", {"k": 1}, "gamma"]
+
+    units = pipeline.batch_process(data, MemeticSource.USER_INPUT)
+
+    assert [unit.payload for unit in units] == ["alpha", {"k": 1}, "beta", "gamma"]
+    assert len({unit.metadata.content_hash for unit in units}) == 4
+    assert all(
+        unit.metadata.semantic_vector == _reference_vector(unit.payload)
+        for unit in units
+    )
+
+
+@pytest.mark.fast
+def test_batch_process_can_keep_duplicates() -> None:
+    pipeline = MemeticUnitIngestionPipeline()
+
+    units = pipeline.batch_process(
+        ["same", "same"], MemeticSource.USER_INPUT, deduplicate=False
+    )
+
+    assert len(units) == 2
+
+
+@pytest.mark.fast
+def test_batch_process_embeds_each_batch_with_one_provider_call() -> None:
+    embedder = RecordingEmbedder()
+    pipeline = MemeticUnitIngestionPipeline(embedding_provider=embedder, batch_size=3)
+
+    units = pipeline.batch_process(
+        (f"item {i % 4}" for i in range(8)), MemeticSource.DOCUMENTATION
+    )
+
+    assert embedder.calls == [["item 0", "item 1", "item 2"], ["item 3"]]
+    assert [unit.metadata.semantic_vector for unit in units] == [[6.0, 1.0]] * 4
+
+
+@pytest.mark.fast
+def test_embedding_provider_failure_falls_back_to_placeholders() -> None:
+    class BrokenEmbedder:
+        def embed(self, texts):
+            raise RuntimeError("offline")
+
+    pipeline = MemeticUnitIngestionPipeline(embedding_provider=BrokenEmbedder())
+
+    (unit,) = pipeline.batch_process(["text"], MemeticSource.USER_INPUT)
+
+    assert unit.metadata.semantic_vector == _reference_vector("text")
+
+
+@pytest.mark.fast
+def test_batch_process_skips_items_that_fail() -> None:
+    pipeline = MemeticUnitIngestionPipeline()
+
+    def classify_topic(data, keywords):
+        if data == "bad":
+            raise ValueError("bad")
+        return "general"
+
+    pipeline._classify_topic = classify_topic  # type: ignore[method-assign]
+
+    units = pipeline.batch_process(["good", "bad"], MemeticSource.USER_INPUT)
+
+    assert [unit.payload for unit in units] == ["good"]
@@ -163,6 +163,123 @@ class TestMemoryManagerStore:
         assert vector.stored
 
 
+class BulkStore(RecordingStore):
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.batches: list[list[str]] = []
+
+    def store_many(self, items):
+        self.batches.append([item.id for item in items])
+        return [self.store(item) for item in items]
+
+
+class DeletingStore(RecordingStore):
+
+    def delete(self, item_id: str) -> bool:
+        return self.items.pop(item_id, None) is not None
+
+
+class RecordingVectorStore:
+
+    def __init__(self):
+        self.vectors = {}
+
+    def store_vector(self, vector):
+        self.vectors[vector.id] = vector
+        return vector.id
+
+    def retrieve_vector(self, vector_id):
+        return self.vectors.get(vector_id)
+
+    def similarity_search(self, query_embedding, top_k=5):
+        return []
+
+    def delete_vector(self, vector_id):
+        return self.vectors.pop(vector_id, None) is not None
+
+    def get_collection_stats(self):
+        return {}
+
+
+class BulkVectorStore(RecordingVectorStore):
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def store_vector(self, vector):  # pragma: no cover - must not be called
+        raise AssertionError("vectors should be stored in bulk")
+
+    def store_vectors(self, vectors):
+        self.batches.append([vector.id for vector in vectors])
+        self.vectors.update({vector.id: vector for vector in vectors})
+        return [vector.id for vector in vectors]
+
+
+class TestMemoryManagerStoreItems:
+
+    @staticmethod
+    def _items(count):
+        return [
+            MemoryItem(id=f"i{n}", content=f"c{n}", memory_type=MemoryType.CODE)
+            for n in range(count)
+        ]
+
+    @pytest.mark.fast
+    def test_store_items_uses_bulk_store_and_embeds(self):
+        bulk = BulkStore("tinydb")
+        vector = RecordingVectorStore()
+        manager = MemoryManager(adapters={"tinydb": bulk, "vector": vector})
+
+        assert manager.store_items(self._items(3), embed=True) == ["i0", "i1", "i2"]
+        assert bulk.batches == [["i0", "i1", "i2"]]
+        assert sorted(vector.vectors) == ["i0", "i1", "i2"]
+        assert manager.store_items([]) == []
+
+    @pytest.mark.fast
+    def test_store_items_writes_embeddings_in_one_bulk_call(self):
+        vector = BulkVectorStore()
+        manager = MemoryManager(
+            adapters={"tinydb": BulkStore("tinydb"), "vector": vector}
+        )
+
+        manager.store_items(self._items(3), embed=True)
+
+        assert vector.batches == [["i0", "i1", "i2"]]
+        assert sorted(vector.vectors) == ["i0", "i1", "i2"]
+
+    @pytest.mark.fast
+    def test_store_items_falls_back_to_next_adapter(self):
+        failing = MagicMock(spec=["store"])
+        failing.store.side_effect = RuntimeError("down")
+        fallback = RecordingStore("other")
+        manager = MemoryManager(adapters={"tinydb": failing, "other": fallback})
+
+        assert manager.store_items(self._items(2)) == ["i0", "i1"]
+        assert sorted(fallback.items) == ["i0", "i1"]
+
+        manager = MemoryManager(adapters={"tinydb": failing})
+        with pytest.raises(Exception, match="Failed to store memory items"):
+            manager.store_items(self._items(1))
+
+    @pytest.mark.fast
+    def test_delete_items_removes_ids_from_every_adapter(self):
+        first = DeletingStore("tinydb")
+        second = DeletingStore("other")
+        vector = RecordingVectorStore()
+        manager = MemoryManager(
+            adapters={"tinydb": first, "other": second, "vector": vector}
+        )
+        manager.store_items(self._items(2), embed=True)
+        second.store(self._items(3)[2])
+
+        assert manager.delete_items(["i0", "i2", "missing"]) == 2
+        assert sorted(first.items) == ["i1"]
+        assert second.items == {}
+        assert sorted(vector.vectors) == ["i1"]
+
+
 class RecordingSyncManager:
 
     def __init__(self) -> None:
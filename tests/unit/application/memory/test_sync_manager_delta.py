@@ -0,0 +1,185 @@
+"""Delta synchronization driven by adapter change journals."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from devsynth.application.memory.change_journal import ChangeJournal, JournalCursor
+from devsynth.application.memory.memory_manager import MemoryManager
+from devsynth.domain.models.memory import MemoryItem, MemoryType
+
+
+class JournaledStore:
+    """In-memory store that journals writes and counts full enumerations."""
+
+    def __init__(self, max_entries: int = 100) -> None:
+        self.items: dict[str, MemoryItem] = {}
+        self.change_journal = ChangeJournal(max_entries)
+        self.enumerations = 0
+        self.bulk_batches: list[list[str]] = []
+
+    def store(self, item: MemoryItem) -> str:
+        self.items[item.id] = item
+        self.change_journal.append("store", item.id)
+        return item.id
+
+    def store_many(self, items: list[MemoryItem]) -> list[str]:
+        self.bulk_batches.append([item.id for item in items])
+        return [self.store(item) for item in items]
+
+    def retrieve(self, item_id: str) -> MemoryItem | None:
+        return self.items.get(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        self.change_journal.append("delete", item_id)
+        return self.items.pop(item_id, None) is not None
+
+    def get_all_items(self) -> list[MemoryItem]:
+        self.enumerations += 1
+        return list(self.items.values())
+
+    # Native transactions whose rollback restores state behind the journal.
+    def begin_transaction(self, transaction_id: str | None = None) -> None:
+        self._snapshot = dict(self.items)
+
+    def commit_transaction(self, transaction_id: str | None = None) -> None:
+        self._snapshot = {}
+
+    def rollback_transaction(self, transaction_id: str | None = None) -> None:
+        self.items = self._snapshot
+        self.change_journal.reset()
+
+
+def _item(item_id: str, content: str = "content") -> MemoryItem:
+    return MemoryItem(
+        id=item_id,
+        content=content,
+        memory_type=MemoryType.SHORT_TERM,
+        metadata={},
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+def _manager(**kwargs: int) -> tuple[MemoryManager, JournaledStore, JournaledStore]:
+    alpha, beta = JournaledStore(**kwargs), JournaledStore(**kwargs)
+    return MemoryManager(adapters={"alpha": alpha, "beta": beta}), alpha, beta
+
+
+@pytest.mark.fast
+def test_change_journal_coalesces_and_rejects_stale_cursors() -> None:
+    journal = ChangeJournal(max_entries=3)
+    start = journal.position()
+    journal.append("store", "a")
+    journal.append("store", "b")
+    journal.append("delete", "a")
+
+    entries, position = journal.changes_since(start)
+    assert [(entry.op, entry.item_id) for entry in entries] == [
+        ("store", "b"),
+        ("delete", "a"),
+    ]
+    assert journal.changes_since(position) == ([], position)
+
+    journal.append("store", "c")
+    assert journal.changes_since(start) is None
+    assert journal.changes_since(None) is None
+    assert journal.changes_since(JournalCursor("other", 0)) is None
+    journal.reset()
+    assert journal.changes_since(position) is None
+
+
+@pytest.mark.fast
+def test_synchronize_ships_only_journaled_changes_in_bulk() -> None:
+    manager, alpha, beta = _manager()
+    for index in range(5):
+        alpha.store(_item(f"item-{index}"))
+
+    assert manager.synchronize("alpha", "beta") == {"alpha_to_beta": 5}
+    assert alpha.enumerations == 1
+
+    alpha.store(_item("item-1", "edited"))
+    alpha.store(_item("item-9"))
+    alpha.delete("item-3")
+    alpha.store(_item("item-4"))  # unchanged content: nothing to ship
+
+    assert manager.synchronize("alpha", "beta") == {"alpha_to_beta": 3}
+    assert alpha.enumerations == 1
+    assert beta.bulk_batches == [["item-1", "item-9"]]
+    assert beta.retrieve("item-1").content == "edited"
+    assert beta.retrieve("item-3") is None
+
+    assert manager.synchronize("alpha", "beta") == {"alpha_to_beta": 0}
+
+
+@pytest.mark.fast
+def test_bidirectional_delta_does_not_echo_forward_writes() -> None:
+    manager, alpha, beta = _manager()
+    alpha.store(_item("a"))
+    beta.store(_item("b"))
+    manager.synchronize("alpha", "beta", bidirectional=True)
+
+    alpha.store(_item("a", "newer"))
+    result = manager.synchronize("alpha", "beta", bidirectional=True)
+
+    assert result == {"alpha_to_beta": 1, "beta_to_alpha": 0}
+    assert set(alpha.items) == set(beta.items) == {"a", "b"}
+
+
+@pytest.mark.fast
+def test_truncated_journal_falls_back_to_full_enumeration() -> None:
+    manager, alpha, beta = _manager(max_entries=2)
+    alpha.store(_item("a"))
+    manager.synchronize("alpha", "beta")
+
+    for item_id in ("b", "c", "d"):
+        alpha.store(_item(item_id))
+    manager.synchronize("alpha", "beta")
+
+    assert alpha.enumerations == 2
+    assert set(beta.items) == {"a", "b", "c", "d"}
+
+
+@pytest.mark.fast
+def test_failed_sync_does_not_advance_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager, alpha, beta = _manager()
+    alpha.store(_item("a"))
+    manager.synchronize("alpha", "beta")
+    shipped = manager.sync_manager._sync_cursors[("alpha", "beta")]
+    alpha.store(_item("b"))
+
+    def failing_store_many(items: list[MemoryItem]) -> list[str]:
+        raise RuntimeError("target unavailable")
+
+    monkeypatch.setattr(beta, "store_many", failing_store_many)
+    with pytest.raises(RuntimeError):
+        manager.synchronize("alpha", "beta")
+    monkeypatch.undo()
+
+    assert manager.sync_manager._sync_cursors[("alpha", "beta")] is shipped
+    # The rollback reset both journals, so the retry enumerates the source.
+    assert manager.synchronize("alpha", "beta") == {"alpha_to_beta": 2}
+    assert set(beta.items) == {"a", "b"}
+
+
+@pytest.mark.fast
+def test_lmdb_store_journals_committed_writes(tmp_path) -> None:
+    lmdb_store = pytest.importorskip("devsynth.application.memory.lmdb_store")
+    pytest.importorskip("lmdb")
+    store = lmdb_store.LMDBStore(str(tmp_path / "lmdb"))
+    try:
+        start = store.change_journal.position()
+        store.store_many([_item("x"), _item("y")])
+        store.delete("x")
+        tx_id = store.begin_transaction()
+        store.store_in_transaction(store._transactions[tx_id], _item("z"))
+        store.rollback_transaction(tx_id)
+
+        entries, _ = store.change_journal.changes_since(start)
+        assert [(entry.op, entry.item_id) for entry in entries] == [
+            ("store", "y"),
+            ("delete", "x"),
+        ]
+    finally:
+        store.close()
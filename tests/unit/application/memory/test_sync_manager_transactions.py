@@ -85,7 +85,7 @@ def test_transaction_rollback_uses_normalized_snapshots() -> None:
     alpha_store.store(original)
 
     with pytest.raises(RuntimeError):
-        with sync_manager.transaction(["alpha"]):
+        with sync_manager.transaction(["alpha"]) as txns:
             mutated = MemoryItem(
                 id="alpha-1",
                 content="mutated",
@@ -93,7 +93,7 @@ def test_transaction_rollback_uses_normalized_snapshots() -> None:
                 metadata={"revision": 2},
                 created_at=datetime.now(),
             )
-            alpha_store.store(mutated)
+            txns["alpha"].store(mutated)
             raise RuntimeError("fail transaction")
 
     restored = alpha_store.retrieve("alpha-1")
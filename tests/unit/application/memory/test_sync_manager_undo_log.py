@@ -0,0 +1,200 @@
+"""Undo-log transactions and savepoints in ``SyncManager.transaction``."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from devsynth.application.memory.memory_manager import MemoryManager
+from devsynth.application.memory.undo_log import RecordingAdapter, UndoLog
+from devsynth.domain.models.memory import MemoryItem, MemoryType, MemoryVector
+
+
+class CountingStore:
+    """Store without native transactions that counts full enumerations."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, MemoryItem] = {}
+        self.vectors: dict[str, MemoryVector] = {}
+        self.enumerations = 0
+
+    def store(self, item: MemoryItem) -> str:
+        self.items[item.id] = item
+        return item.id
+
+    def retrieve(self, item_id: str) -> MemoryItem | None:
+        return self.items.get(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        return self.items.pop(item_id, None) is not None
+
+    def get_all_items(self) -> list[MemoryItem]:
+        self.enumerations += 1
+        return list(self.items.values())
+
+    def store_vector(self, vector: MemoryVector) -> str:
+        self.vectors[vector.id] = vector
+        return vector.id
+
+    def retrieve_vector(self, vector_id: str) -> MemoryVector | None:
+        return self.vectors.get(vector_id)
+
+    def delete_vector(self, vector_id: str) -> bool:
+        return self.vectors.pop(vector_id, None) is not None
+
+    def store_vectors(self, vectors: list[MemoryVector]) -> list[str]:
+        return [self.store_vector(vector) for vector in vectors]
+
+    def get_all_vectors(self) -> list[MemoryVector]:
+        self.enumerations += 1
+        return list(self.vectors.values())
+
+
+class WriteOnlyStore:
+    """Store that cannot report before-images and needs a full snapshot."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, MemoryItem] = {}
+
+    def store(self, item: MemoryItem) -> str:
+        self.items[item.id] = item
+        return item.id
+
+    def delete(self, item_id: str) -> bool:
+        return self.items.pop(item_id, None) is not None
+
+    def get_all_items(self) -> list[MemoryItem]:
+        return list(self.items.values())
+
+
+def _item(item_id: str, content: str = "original") -> MemoryItem:
+    return MemoryItem(
+        id=item_id,
+        content=content,
+        memory_type=MemoryType.SHORT_TERM,
+        metadata={},
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def populated() -> tuple[MemoryManager, CountingStore]:
+    store = CountingStore()
+    for index in range(100):
+        store.store(_item(f"item-{index}"))
+    store.store_vector(MemoryVector(id="vec-0", content="v", embedding=[0.1, 0.2]))
+    return MemoryManager(adapters={"alpha": store}), store
+
+
+def _contents(store: CountingStore) -> dict[str, str]:
+    return {item_id: item.content for item_id, item in store.items.items()}
+
+
+@pytest.mark.fast
+def test_rollback_restores_only_touched_keys(populated) -> None:
+    manager, store = populated
+    before = _contents(store)
+
+    with pytest.raises(RuntimeError):
+        with manager.sync_manager.transaction(["alpha"]) as txns:
+            alpha = txns["alpha"]
+            alpha.store(_item("item-1", "changed"))
+            alpha.store(_item("item-1", "changed twice"))
+            alpha.store(_item("new-item"))
+            alpha.delete("item-2")
+            alpha.delete_vector("vec-0")
+            alpha.store_vector(MemoryVector(id="vec-1", content="v", embedding=[0.3]))
+            alpha.store_vectors(
+                [MemoryVector(id="vec-2", content="v", embedding=[0.4])]
+            )
+            raise RuntimeError("abort")
+
+    assert store.enumerations == 0
+    assert _contents(store) == before
+    assert set(store.vectors) == {"vec-0"}
+
+
+@pytest.mark.fast
+def test_commit_keeps_writes_and_leaves_adapter_untouched(populated) -> None:
+    manager, store = populated
+
+    with manager.sync_manager.transaction(["alpha"]) as txns:
+        assert isinstance(txns["alpha"], RecordingAdapter)
+        assert txns["alpha"].retrieve("item-0") is store.items["item-0"]
+        txns["alpha"].store(_item("item-1", "committed"))
+        assert vars(store).keys() == {"items", "vectors", "enumerations"}
+
+    assert store.items["item-1"].content == "committed"
+    assert store.enumerations == 0
+
+
+@pytest.mark.fast
+def test_direct_writes_from_other_threads_are_not_undone(populated) -> None:
+    manager, store = populated
+
+    with pytest.raises(RuntimeError):
+        with manager.sync_manager.transaction(["alpha"]) as txns:
+            txns["alpha"].store(_item("item-1", "transactional"))
+            writer = threading.Thread(
+                target=store.store, args=(_item("item-2", "concurrent"),)
+            )
+            writer.start()
+            writer.join()
+            raise RuntimeError("abort")
+
+    assert store.items["item-1"].content == "original"
+    assert store.items["item-2"].content == "concurrent"
+
+
+@pytest.mark.fast
+def test_nested_transaction_rolls_back_to_savepoint(populated) -> None:
+    manager, store = populated
+    sync = manager.sync_manager
+
+    with sync.transaction(["alpha"]) as outer:
+        outer["alpha"].store(_item("item-1", "outer"))
+        with pytest.raises(RuntimeError):
+            with sync.transaction(["alpha"]) as inner:
+                assert inner["alpha"] is outer["alpha"]
+                inner["alpha"].store(_item("item-1", "inner"))
+                inner["alpha"].store(_item("inner-only"))
+                raise RuntimeError("inner failure")
+        assert store.items["item-1"].content == "outer"
+        assert "inner-only" not in store.items
+        outer["alpha"].store(_item("item-2", "outer"))
+
+    assert store.items["item-1"].content == "outer"
+    assert store.items["item-2"].content == "outer"
+
+
+@pytest.mark.fast
+def test_outer_rollback_undoes_released_savepoints(populated) -> None:
+    manager, store = populated
+    sync = manager.sync_manager
+    before = _contents(store)
+
+    with pytest.raises(RuntimeError):
+        with sync.transaction(["alpha"]) as outer:
+            with sync.transaction(["alpha"]) as inner:
+                inner["alpha"].store(_item("item-1", "inner"))
+            outer["alpha"].store(_item("item-1", "outer"))
+            raise RuntimeError("outer failure")
+
+    assert _contents(store) == before
+
+
+@pytest.mark.fast
+def test_adapters_without_retrieve_fall_back_to_snapshots() -> None:
+    store = WriteOnlyStore()
+    store.store(_item("kept"))
+    manager = MemoryManager(adapters={"beta": store})
+
+    assert UndoLog().attach("beta", store) is None
+    with pytest.raises(RuntimeError):
+        with manager.sync_manager.transaction(["beta"]):
+            store.store(_item("added"))
+            raise RuntimeError("abort")
+
+    assert set(store.items) == {"kept"}
@@ -92,3 +92,18 @@ def test_optional_provider_guard(monkeypatch: pytest.MonkeyPatch) -> None:
         restored = importlib.import_module(module_name)
         globals()["vector_providers"] = restored
         assert "in_memory" in restored.factory.provider_types
+
+
+@pytest.mark.medium
+def test_store_vectors_stores_a_batch_in_order():
+    adapter = VectorMemoryAdapter()
+    vectors = [
+        MemoryVector(id="a", content="a", embedding=[1.0, 0.0]),
+        MemoryVector(id="", content="b", embedding=[0.0, 1.0]),
+    ]
+
+    ids = adapter.store_vectors(vectors)
+
+    assert ids[0] == "a" and ids[1]
+    assert adapter.retrieve_vector(ids[1]).content == "b"
+    assert adapter.similarity_search([1.0, 0.0], top_k=1)[0].item.id == "a"
@@ -0,0 +1,172 @@
+"""Thread safety, executor dispatch and asyncio bridging for :class:`Promise`."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from devsynth.application.promises import (
+    Promise,
+    PromiseAgent,
+    PromiseBroker,
+    PromiseError,
+    PromiseStateError,
+    TimeoutScheduler,
+)
+
+
+@pytest.mark.fast
+def test_exactly_one_concurrent_settlement_wins() -> None:
+    for _ in range(50):
+        promise: Promise[int] = Promise()
+        seen: list[int] = []
+        promise.then(seen.append)
+        barrier = threading.Barrier(8)
+        wins: list[bool] = []
+
+        def settle(value: int) -> None:
+            barrier.wait()
+            wins.append(promise.try_resolve(value))
+
+        threads = [threading.Thread(target=settle, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert wins.count(True) == 1
+        assert seen == [promise.value]
+    with pytest.raises(PromiseStateError):
+        promise.resolve(1)
+
+
+@pytest.mark.fast
+def test_callbacks_registered_during_settlement_run_once() -> None:
+    promise: Promise[str] = Promise()
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def record(value: str) -> None:
+        with lock:
+            calls.append(value)
+
+    def register() -> None:
+        for _ in range(200):
+            promise.then(record)
+
+    worker = threading.Thread(target=register)
+    worker.start()
+    promise.resolve("done")
+    worker.join()
+
+    assert calls == ["done"] * 200
+
+
+@pytest.mark.fast
+def test_callbacks_dispatch_on_configured_executor() -> None:
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cb") as executor:
+        promise: Promise[int] = Promise(executor=executor)
+        chained = promise.then(lambda value: (value, threading.current_thread().name))
+        promise.resolve(3)
+
+        assert chained.wait(1.0)
+        value, thread_name = chained.value
+        assert value == 3 and thread_name.startswith("cb")
+
+
+@pytest.mark.fast
+def test_default_executor_applies_to_new_promises() -> None:
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="default") as executor:
+        Promise.set_default_executor(executor)
+        try:
+            promise: Promise[int] = Promise()
+            names: list[str] = []
+            done = threading.Event()
+            promise.then(
+                lambda _: (names.append(threading.current_thread().name), done.set())
+            )
+            promise.resolve(1)
+            assert done.wait(1.0)
+        finally:
+            Promise.set_default_executor(None)
+    assert names[0].startswith("default")
+
+
+@pytest.mark.fast
+def test_promises_can_be_awaited() -> None:
+    async def scenario() -> tuple[int, Exception]:
+        fulfilled: Promise[int] = Promise()
+        rejected: Promise[int] = Promise()
+        threading.Timer(0.01, fulfilled.resolve, args=(7,)).start()
+        rejected.reject(ValueError("bad"))
+        value = await fulfilled
+        try:
+            await rejected
+        except ValueError as error:
+            return value, error
+        raise AssertionError("rejected promise did not raise")
+
+    value, error = asyncio.run(scenario())
+    assert value == 7 and str(error) == "bad"
+
+
+@pytest.mark.fast
+def test_from_future_bridges_results_and_cancellation() -> None:
+    done: Future[int] = Future()
+    cancelled: Future[int] = Future()
+    resolved = Promise.from_future(done)
+    aborted = Promise.from_future(cancelled)
+
+    done.set_result(5)
+    cancelled.cancel()
+
+    assert resolved.value == 5
+    assert isinstance(aborted.reason, PromiseError)
+
+
+@pytest.mark.fast
+def test_scheduler_runs_due_calls_and_skips_cancelled_ones() -> None:
+    scheduler = TimeoutScheduler(name="test-timeouts")
+    fired: list[str] = []
+    event = threading.Event()
+
+    cancelled = scheduler.schedule(0.01, lambda: fired.append("cancelled"))
+    scheduler.schedule(0.03, lambda: (fired.append("late"), event.set()))
+    scheduler.schedule(0.02, lambda: fired.append("early"))
+    cancelled.cancel()
+
+    assert event.wait(1.0)
+    assert fired == ["early", "late"]
+    assert scheduler.pending() == 0
+
+
+@pytest.mark.fast
+def test_capability_timeouts_share_one_scheduler_thread() -> None:
+    broker = PromiseBroker()
+    provider = PromiseAgent(agent_id="provider", broker=broker)
+    provider.register_capability(
+        name="fast", handler_func=lambda: "ok", description="fast"
+    )
+    requester = PromiseAgent(agent_id="requester", broker=broker)
+
+    before = threading.active_count()
+    promises = [
+        requester.request_capability(name="fast", timeout=0.05) for _ in range(50)
+    ]
+    assert threading.active_count() <= before + 1
+
+    settled = promises[0]
+    provider.handle_pending_capabilities()
+    assert settled.is_fulfilled
+    assert settled.get_metadata("_timeout_handle").cancelled
+
+    pending = requester.request_capability(name="fast", timeout=0.05)
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        requester.wait_for_capability(pending)
+    assert time.perf_counter() - started < 0.5
+    assert pending.is_rejected
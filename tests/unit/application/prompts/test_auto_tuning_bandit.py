@@ -0,0 +1,166 @@
+"""Bandit selection, background generation and debounced saves."""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from pathlib import Path
+
+import pytest
+
+from devsynth.application.prompts import auto_tuning
+from devsynth.application.prompts.auto_tuning import (
+    PromptAutoTuner,
+    PromptAutoTuningError,
+)
+from devsynth.application.prompts.models import PromptVariant, SelectionStrategyConfig
+from devsynth.application.prompts.persistence import DebouncedVariantWriter
+
+
+def _variant(template: str, successes: int, failures: int) -> PromptVariant:
+    variant = PromptVariant(template)
+    for _ in range(successes):
+        variant.record_usage(success=True)
+    for _ in range(failures):
+        variant.record_usage(success=False)
+    return variant
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("strategy", ["thompson", "ucb"])
+def test_bandit_strategies_favour_the_better_arm(strategy: str) -> None:
+    random.seed(7)
+    tuner = PromptAutoTuner(selection=SelectionStrategyConfig(name=strategy))
+    tuner.register_template("t", "weak")
+    tuner.prompt_variants["t"][0] = _variant("weak", 2, 18)
+    tuner.prompt_variants["t"].append(_variant("strong", 18, 2))
+
+    picks = [tuner.select_variant("t").template for _ in range(200)]
+
+    assert picks.count("strong") > 180
+
+
+@pytest.mark.fast
+def test_ucb_tries_unrewarded_variants_first() -> None:
+    tuner = PromptAutoTuner(selection=SelectionStrategyConfig(name="ucb"))
+    tuner.register_template("t", "tried")
+    tuner.prompt_variants["t"][0] = _variant("tried", 5, 0)
+    tuner.prompt_variants["t"].append(PromptVariant("fresh"))
+
+    assert tuner.select_variant("t").template == "fresh"
+    tuner.selection_strategy = "random"
+    with pytest.raises(Exception):
+        tuner.selection_strategy = "greedy"  # type: ignore[assignment]
+
+
+@pytest.mark.fast
+def test_feedback_statistics_are_incremental() -> None:
+    variant = PromptVariant("t")
+    for score in (0.2, 0.4, 0.9):
+        variant.record_usage(success=True, feedback_score=score)
+        assert variant.average_feedback_score == pytest.approx(
+            sum(variant.feedback_scores) / len(variant.feedback_scores)
+        )
+    assert variant.reward_posterior == pytest.approx((1 + 3 + 1.5, 1 + 1.5))
+
+    variant.feedback_scores = [1.0]
+    assert variant.average_feedback_score == 1.0
+
+
+@pytest.mark.fast
+def test_out_of_range_feedback_is_rejected_and_posterior_stays_valid() -> None:
+    tuner = PromptAutoTuner(selection=SelectionStrategyConfig(name="thompson"))
+    tuner.register_template("t", "prompt")
+    variant = tuner.prompt_variants["t"][0]
+
+    with pytest.raises(PromptAutoTuningError):
+        tuner.record_feedback("t", variant.variant_id, feedback_score=3.0)
+    assert variant.feedback_scores == []
+
+    variant.feedback_scores = [3.0, -2.0]
+    alpha, beta = variant.reward_posterior
+    assert alpha > 0 and beta > 0
+    assert tuner.select_variant("t") is variant
+
+
+@pytest.mark.fast
+def test_closed_tuners_are_not_flushed_at_exit(tmp_path: Path) -> None:
+    tuner = PromptAutoTuner(storage_path=tmp_path)
+    assert tuner in auto_tuning._tuners_pending_flush
+
+    tuner.close()
+
+    assert tuner not in auto_tuning._tuners_pending_flush
+
+
+@pytest.mark.fast
+def test_variants_are_generated_off_the_feedback_path() -> None:
+    tuner = PromptAutoTuner(max_variants=3)
+    tuner.register_template("t", "Base prompt.\n\nDo the task.")
+    variant = tuner.prompt_variants["t"][0]
+    threads: list[str] = []
+    original = tuner._generate_variants_if_needed
+
+    def recording(template_id: str) -> None:
+        threads.append(threading.current_thread().name)
+        original(template_id)
+
+    tuner._generate_variants_if_needed = recording  # type: ignore[method-assign]
+    for _ in range(30):
+        tuner.record_feedback("t", variant.variant_id, success=True)
+        for other in list(tuner.prompt_variants["t"]):
+            other.record_usage(success=True)
+    during_feedback = list(threads)
+    tuner.close()
+
+    assert threading.current_thread().name not in during_feedback
+    assert threads
+
+    # Coalesced requests still converge on the variant bound.
+    for _ in range(5):
+        tuner.record_feedback("t", variant.variant_id, success=True)
+        tuner.generate_variants("t")
+    assert len(tuner.prompt_variants["t"]) == 3
+
+
+@pytest.mark.fast
+def test_bursts_of_feedback_are_written_once(tmp_path: Path) -> None:
+    tuner = PromptAutoTuner(storage_path=tmp_path, save_interval=60.0)
+    tuner.register_template("t", "prompt")
+    variant = tuner.prompt_variants["t"][0]
+
+    for _ in range(20):
+        tuner.record_feedback("t", variant.variant_id, success=True)
+    writer = tuner._writer
+    assert writer is not None and writer.writes == 1
+    stored = json.loads((tmp_path / "prompt_variants.json").read_text())
+    assert stored["t"][0]["success_count"] == 1
+
+    tuner.close()
+    assert writer.writes == 2
+    stored = json.loads((tmp_path / "prompt_variants.json").read_text())
+    assert stored["t"][0]["success_count"] == 20
+
+
+@pytest.mark.fast
+def test_writer_flushes_trailing_requests_after_interval(tmp_path: Path) -> None:
+    document = {"t": []}
+    written = threading.Event()
+    writer = DebouncedVariantWriter(tmp_path, lambda: document, interval=0.05)
+
+    writer.request()
+    document = {"t": [PromptVariant("late").to_dict()]}
+    original_flush = writer.flush
+
+    def flush() -> None:
+        original_flush()
+        written.set()
+
+    writer.flush = flush  # type: ignore[method-assign]
+    writer.request()
+
+    assert written.wait(2)
+    assert writer.writes == 2
+    stored = json.loads((tmp_path / "prompt_variants.json").read_text())
+    assert stored["t"][0]["template"] == "late"
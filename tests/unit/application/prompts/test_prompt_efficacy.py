@@ -0,0 +1,119 @@
+"""Indexed outcomes and append-only storage in :class:`PromptEfficacyTracker`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from devsynth.application.prompts.prompt_efficacy import PromptEfficacyTracker
+
+
+def _events(path: Path) -> list[dict]:
+    log = path / "efficacy_events.jsonl"
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+@pytest.mark.fast
+def test_metrics_are_maintained_incrementally(tmp_path: Path) -> None:
+    tracker = PromptEfficacyTracker(str(tmp_path))
+    for index in range(10):
+        tracking_id = tracker.track_usage("review", "v1")
+        tracker.record_outcome(
+            tracking_id,
+            success=index % 4 != 0,
+            metrics={"response_time": float(index), "token_count": 100 + index},
+        )
+    tracker.track_usage("review", "v1")
+
+    metrics = tracker.get_efficacy_metrics("review", "v1")
+
+    assert metrics["total_usages"] == 11
+    assert metrics["usages_with_outcome"] == 10
+    assert metrics["success_rate"] == 0.7
+    assert metrics["avg_response_time"] == 4.5
+    assert (metrics["min_response_time"], metrics["max_response_time"]) == (0, 9)
+    assert metrics["p50_response_time"] == 4.0
+    assert metrics["p95_token_count"] == 109
+    assert tracker.record_outcome("unknown", True) is False
+
+
+@pytest.mark.fast
+def test_rerecorded_outcome_replaces_previous_one(tmp_path: Path) -> None:
+    tracker = PromptEfficacyTracker(str(tmp_path))
+    tracking_id = tracker.track_usage("review", "v1")
+    tracker.record_outcome(tracking_id, False, {"response_time": 9.0})
+    tracker.record_outcome(tracking_id, True, {"response_time": 1.0})
+
+    metrics = tracker.get_efficacy_metrics("review", "v1")
+    assert metrics["usages_with_outcome"] == 1
+    assert metrics["success_rate"] == 1.0
+    assert metrics["max_response_time"] == 1.0
+
+
+@pytest.mark.fast
+def test_events_are_appended_and_replayed(tmp_path: Path) -> None:
+    tracker = PromptEfficacyTracker(str(tmp_path))
+    first = tracker.track_usage("review", "v1")
+    tracker.record_outcome(first, True, {"token_count": 50})
+    tracker.track_usage("review", "v2")
+
+    assert [event["event"] for event in _events(tmp_path)] == [
+        "usage",
+        "outcome",
+        "usage",
+    ]
+    assert not (tmp_path / "efficacy_data.json").exists()
+
+    with open(tmp_path / "efficacy_events.jsonl", "a") as log:
+        log.write('{"event": "usage", "trac')  # torn write
+
+    reloaded = PromptEfficacyTracker(str(tmp_path))
+    assert reloaded.get_efficacy_metrics("review", "v1")["successful_usages"] == 1
+    assert reloaded.get_efficacy_metrics("review", "v2")["total_usages"] == 1
+    assert reloaded.record_outcome(first, False) is True
+
+
+@pytest.mark.fast
+def test_log_is_compacted_into_snapshot(tmp_path: Path) -> None:
+    tracker = PromptEfficacyTracker(str(tmp_path), compact_every=4)
+    ids = [tracker.track_usage("review", "v1") for _ in range(3)]
+    tracker.record_outcome(ids[0], True)
+
+    assert _events(tmp_path) == []
+    snapshot = json.loads((tmp_path / "efficacy_data.json").read_text())
+    assert len(snapshot["review"]["v1"]) == 3
+
+    tracker.record_outcome(ids[1], False)
+    tracker.close()
+    assert _events(tmp_path) == []
+
+    reloaded = PromptEfficacyTracker(str(tmp_path))
+    metrics = reloaded.get_efficacy_metrics("review")
+    assert metrics["v1"]["usages_with_outcome"] == 2
+    assert metrics["v1"]["success_rate"] == 0.5
+
+
+@pytest.mark.fast
+def test_legacy_snapshot_is_indexed_on_load(tmp_path: Path) -> None:
+    legacy = {
+        "review": {
+            "v1": [
+                {
+                    "tracking_id": "abc",
+                    "timestamp": "2024-01-01T00:00:00",
+                    "outcome": {"success": True, "metrics": {"response_time": 2}},
+                    "metrics": {},
+                }
+            ]
+        }
+    }
+    (tmp_path / "efficacy_data.json").write_text(json.dumps(legacy, indent=2))
+
+    tracker = PromptEfficacyTracker(str(tmp_path))
+    assert tracker.get_efficacy_metrics("review", "v1")["avg_response_time"] == 2
+    assert tracker.record_outcome("abc", False) is True
+    assert tracker.get_efficacy_metrics("review", "v1")["success_rate"] == 0
@@ -0,0 +1,174 @@
+"""Concurrent stages, batch evaluation and the reverse-dependency index."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from devsynth.adapters.requirements.memory_repository import (
+    InMemoryChangeRepository,
+    InMemoryChatRepository,
+    InMemoryDialecticalReasoningRepository,
+    InMemoryImpactAssessmentRepository,
+    InMemoryRequirementRepository,
+)
+from devsynth.application.requirements.dialectical_reasoner import (
+    ConsensusError,
+    DialecticalReasonerService,
+    RequirementDependencyIndex,
+)
+from devsynth.application.requirements.requirement_service import (
+    RequirementService,
+)
+from devsynth.domain.models.requirement import (
+    ChangeType,
+    Requirement,
+    RequirementChange,
+)
+from devsynth.ports.requirement_port import DialecticalReasonerPort
+
+pytestmark = pytest.mark.fast
+
+
+class SlowLLM:
+    """LLM stand-in that records how many queries overlap."""
+
+    def __init__(self, delay: float = 0.05, reject: str | None = None):
+        self.delay = delay
+        self.reject = reject
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def query(self, prompt: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if prompt.startswith("Determine if the following reasoning"):
+                return "no" if "rejected thesis" in prompt else "yes"
+            if prompt.endswith("Antithesis statement:"):
+                return "antithesis"
+            if prompt.endswith("Thesis statement:"):
+                if self.reject and self.reject in prompt:
+                    return "rejected thesis"
+                return "thesis"
+            return "Conclusion: done\nRecommendation: accept"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _service(llm, requirements=None, **kwargs) -> DialecticalReasonerService:
+    return DialecticalReasonerService(
+        requirement_repository=requirements or InMemoryRequirementRepository(),
+        reasoning_repository=InMemoryDialecticalReasoningRepository(),
+        impact_repository=InMemoryImpactAssessmentRepository(),
+        chat_repository=InMemoryChatRepository(),
+        notification_service=MagicMock(),
+        llm_service=llm,
+        **kwargs,
+    )
+
+
+def _change(title: str) -> RequirementChange:
+    return RequirementChange(
+        change_type=ChangeType.ADD,
+        new_state=Requirement(title=title, description=title),
+        created_by="tester",
+    )
+
+
+def test_thesis_and_antithesis_are_generated_concurrently() -> None:
+    llm = SlowLLM()
+    reasoning = _service(llm).evaluate_change(_change("alpha"))
+
+    assert (reasoning.thesis, reasoning.antithesis) == ("thesis", "antithesis")
+    assert llm.peak == 2
+
+
+def test_evaluate_changes_keeps_order_and_concurrency_limit() -> None:
+    llm = SlowLLM(reject="beta")
+    service = _service(llm, max_concurrency=3)
+    changes = [_change(name) for name in ("alpha", "beta", "gamma", "delta")]
+
+    started = time.perf_counter()
+    results = service.evaluate_changes(changes, return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    assert isinstance(results[1], ConsensusError)
+    assert [results[i].change_id for i in (0, 2, 3)] == [
+        changes[0].id,
+        changes[2].id,
+        changes[3].id,
+    ]
+    assert llm.peak <= 6  # three changes, each with two concurrent stages
+    # Five sequential stage rounds per change, two batches of changes.
+    assert elapsed < 4 * 5 * llm.delay
+
+    with pytest.raises(ConsensusError):
+        _service(SlowLLM(delay=0, reject="beta")).evaluate_changes(changes)
+    service.close()
+
+
+def test_dependency_index_tracks_updates_and_removals() -> None:
+    base, other = uuid4(), uuid4()
+    index = RequirementDependencyIndex()
+    dependent = Requirement(dependencies=[base])
+    index.rebuild([dependent])
+    assert index.dependents(base) == [dependent.id]
+
+    dependent.dependencies = [other]
+    index.update(dependent)
+    assert index.dependents(base) == []
+    assert index.dependents(other) == [dependent.id]
+
+    index.remove(dependent.id)
+    assert index.dependents(other) == []
+
+
+def test_impact_analysis_reads_the_repository_once() -> None:
+    repository = InMemoryRequirementRepository()
+    base = repository.save_requirement(Requirement(title="base"))
+    dependent = repository.save_requirement(
+        Requirement(title="dependent", dependencies=[base.id])
+    )
+    repository.get_all_requirements = MagicMock(wraps=repository.get_all_requirements)
+    reasoner = _service(SlowLLM(delay=0), requirements=repository)
+    service = RequirementService(
+        repository, InMemoryChangeRepository(), reasoner, MagicMock()
+    )
+    change = RequirementChange(requirement_id=base.id, change_type=ChangeType.MODIFY)
+
+    assert set(reasoner._identify_affected_requirements(change)) == {
+        base.id,
+        dependent.id,
+    }
+
+    late = service.create_requirement(
+        Requirement(title="late", dependencies=[base.id]), "tester"
+    )
+    assert late.id in reasoner._identify_affected_requirements(change)
+
+    service.delete_requirement(dependent.id, "tester", "obsolete")
+    assert dependent.id not in reasoner._identify_affected_requirements(change)
+    repository.get_all_requirements.assert_called_once_with()
+
+
+def test_requirement_service_forwards_writes_to_the_reasoner_port() -> None:
+    repository = InMemoryRequirementRepository()
+    reasoner = MagicMock(spec=DialecticalReasonerPort)
+    service = RequirementService(
+        repository, InMemoryChangeRepository(), reasoner, MagicMock()
+    )
+
+    created = service.create_requirement(Requirement(title="new"), "tester")
+    service.delete_requirement(created.id, "tester", "obsolete")
+
+    reasoner.index_requirement.assert_called_once_with(created)
+    reasoner.forget_requirement.assert_called_once_with(created.id)
@@ -8,6 +8,7 @@ import pytest
 
 from devsynth.application.requirements.dialectical_reasoner import (
     DialecticalReasonerService,
+    RequirementDependencyIndex,
 )
 from devsynth.domain.models.requirement import (
     Requirement,
@@ -33,6 +34,7 @@ class _StubRequirementRepository:
 def _service_with_repo(repo: _StubRequirementRepository) -> DialecticalReasonerService:
     service = object.__new__(DialecticalReasonerService)
     service.requirement_repository = repo
+    service.dependency_index = RequirementDependencyIndex()
     return service
 
 
@@ -0,0 +1,189 @@
+"""Shared encodings, memoized counts and single-pass pruning in TokenTracker."""
+
+from __future__ import annotations
+
+import types
+from collections.abc import Iterator
+
+import pytest
+
+from devsynth.application.utils import token_tracker
+from devsynth.application.utils.token_tracker import TokenTracker
+
+
+class CountingEncoding:
+    """Word-per-token encoding that records how often it is asked to encode."""
+
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+        self.batches: list[int] = []
+
+    def encode(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return list(range(len(text.split())))
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        self.batches.append(len(texts))
+        return [list(range(len(text.split()))) for text in texts]
+
+
+@pytest.fixture()
+def encoding(monkeypatch: pytest.MonkeyPatch) -> Iterator[CountingEncoding]:
+    encoding = CountingEncoding()
+    lookups: list[str] = []
+
+    def encoding_for_model(model: str) -> CountingEncoding:
+        lookups.append(model)
+        return encoding
+
+    fake = types.SimpleNamespace(encoding_for_model=encoding_for_model)
+    monkeypatch.setattr(token_tracker, "tiktoken", fake, raising=False)
+    monkeypatch.setattr(token_tracker, "TIKTOKEN_AVAILABLE", True)
+    monkeypatch.setattr(token_tracker, "_IN_TEST_ENV", False)
+    token_tracker.clear_encoding_registry()
+    encoding.lookups = lookups
+    yield encoding
+    token_tracker.clear_encoding_registry()
+
+
+def _conversation(turns: int) -> list[dict[str, str]]:
+    messages = [{"role": "system", "content": "You are terse."}]
+    for index in range(turns):
+        messages.append({"role": "user", "content": f"question number {index}"})
+        messages.append({"role": "assistant", "content": f"answer {index}"})
+    return messages
+
+
+@pytest.mark.fast
+def test_encoding_is_resolved_once_per_process(encoding: CountingEncoding) -> None:
+    first = TokenTracker("model-a")
+    second = TokenTracker("model-a")
+
+    assert first._encoding is second._encoding is encoding
+    assert encoding.lookups == ["model-a"]
+
+    assert first.count_tokens("one two three") == 3
+    assert second.count_tokens("one two three") == 3
+    assert encoding.encoded == ["one two three"]
+
+
+@pytest.mark.fast
+def test_conversation_counts_are_batched_and_memoized(
+    encoding: CountingEncoding,
+) -> None:
+    tracker = TokenTracker()
+    messages = _conversation(10)
+
+    total = tracker.count_conversation_tokens(messages)
+    expected = sum(
+        len(m["role"].split()) + len(m["content"].split()) + 4 for m in messages
+    )
+    assert total == expected + 3
+    # roles are deduplicated before encoding
+    assert encoding.batches == [24]
+
+    messages.append({"role": "user", "content": "one more"})
+    assert tracker.count_conversation_tokens(messages) == total + 1 + 2 + 4
+    assert encoding.batches == [24]
+    assert encoding.encoded == ["one more"]
+
+
+@pytest.mark.fast
+def test_pruning_counts_each_message_once(encoding: CountingEncoding) -> None:
+    tracker = TokenTracker()
+    messages = _conversation(50)
+    limit = 60
+
+    pruned = tracker.prune_conversation(messages, max_tokens=limit)
+
+    assert pruned[0] == messages[0]
+    assert pruned[1:] == messages[len(messages) - len(pruned) + 1 :]
+    assert tracker.count_conversation_tokens(pruned) <= limit
+    longer = [messages[0]] + messages[len(messages) - len(pruned) :]
+    assert tracker.count_conversation_tokens(longer) > limit
+    assert encoding.batches == [104] and encoding.encoded == []
+
+    assert tracker.prune_conversation(messages[:1], max_tokens=1) == messages[:1]
+
+
+@pytest.mark.fast
+def test_cache_is_bounded() -> None:
+    cache = token_tracker.TokenCountCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c"), len(cache)) == (1, 3, 2)
+
+
+@pytest.mark.fast
+def test_cache_keys_are_fixed_size_digests() -> None:
+    cache = token_tracker.TokenCountCache(max_entries=4)
+    long_text = "word " * 10_000
+    cache.put(long_text, 10_000)
+
+    assert cache.get(long_text) == 10_000
+    assert cache.get(long_text + "!") is None
+    assert [len(key) for key in cache._counts] == [16]
+
+
+@pytest.mark.fast
+def test_subclass_message_counts_are_honoured(encoding: CountingEncoding) -> None:
+    class FlatTracker(TokenTracker):
+        def count_message_tokens(self, message: dict[str, str]) -> int:
+            return 10
+
+        def count_message_tokens_batch(self, messages) -> list[int]:
+            return [10] * len(messages)
+
+    tracker = FlatTracker()
+    messages = _conversation(5)
+
+    assert tracker.count_conversation_tokens(messages) == 10 * len(messages) + 3
+    pruned = tracker.prune_conversation(messages, max_tokens=43)
+    assert pruned == [messages[0]] + messages[-3:]
+
+
+@pytest.mark.fast
+def test_pruning_honours_conversation_count_overrides(
+    encoding: CountingEncoding,
+) -> None:
+    class FramedTracker(TokenTracker):
+        def count_conversation_tokens(self, messages) -> int:
+            return super().count_conversation_tokens(messages) + 20
+
+    tracker = FramedTracker()
+    messages = _conversation(10)
+    limit = 60
+
+    pruned = tracker.prune_conversation(messages, max_tokens=limit)
+
+    assert tracker.count_conversation_tokens(pruned) <= limit
+    longer = [messages[0]] + messages[len(messages) - len(pruned) :]
+    assert tracker.count_conversation_tokens(longer) > limit
+
+
+@pytest.mark.fast
+def test_approximate_counts_are_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(token_tracker, "TIKTOKEN_AVAILABLE", False)
+    token_tracker.clear_encoding_registry()
+    counted: list[str] = []
+    fallback = TokenTracker._fallback_token_count
+
+    def counting_fallback(self: TokenTracker, text: str) -> int:
+        counted.append(text)
+        return fallback(self, text)
+
+    monkeypatch.setattr(TokenTracker, "_fallback_token_count", counting_fallback)
+    messages = _conversation(3)
+
+    first = TokenTracker().count_conversation_tokens(messages)
+    assert TokenTracker().count_conversation_tokens(messages) == first
+    assert sorted(counted) == sorted(
+        {text for message in messages for text in message.values()}
+    )
+    token_tracker.clear_encoding_registry()
@@ -39,9 +39,9 @@ def test_console_scripts_declared():
     targets = _console_script_targets()
     assert "devsynth" in targets
     assert "mvuu-dashboard" in targets
-    assert targets["devsynth"].startswith(
-        "devsynth.adapters.cli.typer_adapter"
-    ), targets["devsynth"]
+    assert targets["devsynth"].startswith("devsynth.adapters.cli.lazy_app"), targets[
+        "devsynth"
+    ]
     assert targets["mvuu-dashboard"].startswith(
         "devsynth.application.cli.commands.mvuu_dashboard_cmd"
     ), targets["mvuu-dashboard"]
@@ -0,0 +1,102 @@
+"""Tests for the float32 buffer behind :class:`MemoryVector`."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+from array import array
+
+import numpy as np
+import pytest
+
+from devsynth.domain.models.memory import (
+    MemoryItem,
+    MemoryType,
+    MemoryVector,
+    as_embedding_buffer,
+)
+
+
+@pytest.mark.fast
+def test_float32_arrays_are_wrapped_without_copying() -> None:
+    source = np.arange(8, dtype=np.float32)
+
+    vector = MemoryVector(id="v", content="c", embedding=source)
+    view = np.frombuffer(vector.embedding_buffer, dtype=np.float32)
+
+    assert np.shares_memory(view, source)
+    assert vector.embedding_buffer.readonly
+    assert vector.dimension == 8
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0.5, -1.0, 2.0],
+        (0.5, -1.0, 2.0),
+        np.array([[0.5, -1.0, 2.0]], dtype=np.float64),
+        array("f", [0.5, -1.0, 2.0]).tobytes(),
+    ],
+)
+def test_embedding_inputs_normalize_to_float32(values) -> None:
+    view = as_embedding_buffer(values)
+
+    assert view.format == "f"
+    assert view.tolist() == [0.5, -1.0, 2.0]
+
+
+@pytest.mark.fast
+def test_embedding_property_returns_a_fresh_list() -> None:
+    vector = MemoryVector(id="v", content="c", embedding=[1.0, 2.0])
+
+    values = vector.embedding
+    values.append(3.0)
+
+    assert vector.embedding == [1.0, 2.0]
+    vector.embedding = [4.0]
+    assert vector.embedding == [4.0]
+
+
+@pytest.mark.fast
+def test_memory_vector_copies_and_pickles() -> None:
+    vector = MemoryVector(
+        id="v", content="c", embedding=[0.25, 0.75], metadata={"k": "v"}
+    )
+
+    assert copy.deepcopy(vector) == vector
+    assert pickle.loads(pickle.dumps(vector)) == vector
+    assert vector != MemoryVector(
+        id="v",
+        content="c",
+        embedding=[0.25, 0.5],
+        metadata={"k": "v"},
+        created_at=vector.created_at,
+    )
+
+
+@pytest.mark.fast
+def test_memory_item_uses_slots() -> None:
+    item = MemoryItem(id="i", content="c", memory_type=MemoryType.WORKING)
+
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.unexpected = True  # type: ignore[attr-defined]
+
+
+@pytest.mark.fast
+def test_memory_vector_is_a_slotted_dataclass() -> None:
+    vector = MemoryVector(id="v", content="c", embedding=[1.0, 2.0])
+
+    assert dataclasses.is_dataclass(vector)
+    assert not hasattr(vector, "__dict__")
+    assert [f.name for f in dataclasses.fields(vector)] == [
+        "id",
+        "content",
+        "embedding_buffer",
+        "metadata",
+        "created_at",
+    ]
+    assert vector.embedding_buffer.format == "f"
+    assert vector.embedding_buffer.readonly
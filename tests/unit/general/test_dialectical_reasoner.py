@@ -35,6 +35,24 @@ from devsynth.domain.models.requirement import (
 )
 
 
+def _stage_responses(thesis, antithesis, *later):
+    """Answer thesis and antithesis prompts by content, later stages in order.
+
+    Thesis and antithesis are generated concurrently, so their call order is
+    not fixed.
+    """
+    remaining = list(later)
+
+    def respond(prompt):
+        if prompt.endswith("Antithesis statement:"):
+            return antithesis
+        if prompt.endswith("Thesis statement:"):
+            return thesis
+        return remaining.pop(0)
+
+    return respond
+
+
 class TestDialecticalReasoner(unittest.TestCase):
     """Test cases for the dialectical reasoner.
 
@@ -93,7 +111,7 @@ class TestDialecticalReasoner(unittest.TestCase):
         """Test evaluating a change using dialectical reasoning.
 
         ReqID: N/A"""
-        self.llm_service.query.side_effect = [
+        self.llm_service.query.side_effect = _stage_responses(
             "This is a thesis",
             "This is an antithesis",
             """Argument 1:
@@ -108,7 +126,7 @@ Content: Argument for antithesis""",
 
 Recommendation: This is a recommendation""",
             "yes",
-        ]
+        )
         with patch(
             "devsynth.application.requirements.dialectical_reasoner.logger"
         ) as mock_logger:
@@ -142,7 +160,7 @@ Recommendation: This is a recommendation""",
 
     def test_evaluate_change_consensus_failure(self):
         """Ensure consensus failure triggers logging and memory storage."""
-        self.llm_service.query.side_effect = [
+        self.llm_service.query.side_effect = _stage_responses(
             "This is a thesis",
             "This is an antithesis",
             """Argument 1:
@@ -157,7 +175,7 @@ Content: Argument for antithesis""",
 
 Recommendation: This is a recommendation""",
             "no",
-        ]
+        )
         with patch(
             "devsynth.application.requirements.dialectical_reasoner.logger"
         ) as mock_logger:
@@ -128,6 +128,9 @@ class TestRequirementService(unittest.TestCase):
         self.notification_service.notify_change_proposed.assert_called_once()
         self.dialectical_reasoner.evaluate_change.assert_called_once()
         self.dialectical_reasoner.assess_impact.assert_called_once()
+        self.dialectical_reasoner.index_requirement.assert_called_once_with(
+            updated_requirement
+        )
 
     @pytest.mark.fast
     def test_delete_requirement_succeeds(self):
@@ -164,6 +167,9 @@ class TestRequirementService(unittest.TestCase):
         self.notification_service.notify_change_proposed.assert_called_once()
         self.dialectical_reasoner.evaluate_change.assert_called_once()
         self.dialectical_reasoner.assess_impact.assert_called_once()
+        self.dialectical_reasoner.forget_requirement.assert_called_once_with(
+            saved_requirement.id
+        )
 
     @pytest.mark.fast
     def test_approve_change_succeeds(self):
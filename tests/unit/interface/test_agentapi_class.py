@@ -6,7 +6,10 @@ from unittest.mock import MagicMock
 import pytest
 from pydantic import ValidationError
 
-from devsynth.interface import agentapi
+# Import the WebUI at collection time: the autouse ``stub_devsynth_config``
+# fixture replaces ``devsynth.config`` during tests, and the WebUI renderer
+# needs the real module when it is first imported.
+from devsynth.interface import agentapi, webui  # noqa: F401
 from devsynth.interface.agentapi_models import (
     CodeRequest,
     DoctorRequest,
@@ -0,0 +1,211 @@
+"""Tests for the Agent API background job subsystem."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from devsynth.interface import agentapi
+from devsynth.interface.agentapi import APIBridge, WorkflowRoute
+from devsynth.interface.agentapi_jobs import (
+    JobManager,
+    JobQueueFullError,
+    get_job_manager,
+)
+from devsynth.interface.agentapi_models import JobState, SynthesizeRequest
+
+
+def _wait_for(job, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not job.done and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.done, job
+
+
+def _progress_run(bridge: APIBridge, release: threading.Event | None = None):
+    def run() -> None:
+        progress = bridge.create_progress("Synthesizing", total=2)
+        progress.update()
+        if release is not None:
+            assert release.wait(5)
+        progress.update()
+        progress.complete()
+        bridge.display_result("done")
+
+    return run
+
+
+@pytest.fixture
+def manager():
+    jobs = JobManager(max_workers=4, max_pending=8, max_retained=16)
+    yield jobs
+    jobs.shutdown(wait=False)
+
+
+@pytest.fixture
+def client(manager, monkeypatch):
+    calls: list[str] = []
+
+    def run_synthesize(request, bridge):
+        calls.append(request.target.value)
+        _progress_run(bridge)()
+
+    def run_fail(request, bridge):
+        raise RuntimeError("pipeline exploded")
+
+    monkeypatch.setitem(
+        agentapi.WORKFLOWS,
+        "synthesize",
+        WorkflowRoute(
+            SynthesizeRequest,
+            run_synthesize,
+            "Failed to run synthesis pipeline",
+            agentapi._validate_synthesize,
+        ),
+    )
+    monkeypatch.setitem(
+        agentapi.WORKFLOWS,
+        "explode",
+        WorkflowRoute(SynthesizeRequest, run_fail, "Failed to explode"),
+    )
+    app = FastAPI()
+    app.include_router(agentapi.router)
+    app.dependency_overrides[agentapi._verify_token] = lambda: None
+    app.dependency_overrides[get_job_manager] = lambda: manager
+    test_client = TestClient(app)
+    test_client.calls = calls  # type: ignore[attr-defined]
+    return test_client
+
+
+@pytest.mark.fast
+def test_job_lifecycle_and_sse_stream(client, manager) -> None:
+    accepted = client.post("/jobs/synthesize", json={"target": "unit"})
+
+    assert accepted.status_code == 202
+    body = accepted.json()
+    job = manager.get(body["job_id"])
+    _wait_for(job)
+
+    status = client.get(body["status_url"]).json()
+    assert status["state"] == JobState.SUCCEEDED.value
+    assert status["progress"]["status"] == "Complete"
+
+    result = client.get(body["result_url"]).json()
+    assert "done" in result["messages"]
+    assert [p["current"] for p in result["metadata"]["progress"]] == [0, 1, 2, 2]
+
+    with client.stream("GET", body["events_url"]) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in response.iter_lines()
+            if line.startswith("event: ")
+        ]
+    assert events.count("progress") == 4
+    assert events[-1] == "status"
+    assert client.calls == ["unit"]  # type: ignore[attr-defined]
+
+
+@pytest.mark.fast
+def test_jobs_do_not_touch_latest_messages(client, manager, monkeypatch) -> None:
+    monkeypatch.setattr(agentapi, "LATEST_MESSAGES", ("previous",))
+
+    job_id = client.post("/jobs/synthesize", json={"target": "all"}).json()["job_id"]
+    _wait_for(manager.get(job_id))
+
+    assert agentapi.LATEST_MESSAGES == ("previous",)
+
+
+@pytest.mark.fast
+def test_job_submission_validates_payload(client) -> None:
+    assert client.post("/jobs/unknown", json={}).status_code == 404
+    assert client.post("/jobs/synthesize", json={"target": "bogus"}).status_code == 422
+
+
+@pytest.mark.fast
+def test_failed_job_reports_error(client, manager) -> None:
+    job_id = client.post("/jobs/explode", json={"target": "unit"}).json()["job_id"]
+    _wait_for(manager.get(job_id))
+
+    status = client.get(f"/jobs/{job_id}").json()
+    assert status["state"] == JobState.FAILED.value
+    assert status["error"] == "pipeline exploded"
+    result = client.get(f"/jobs/{job_id}/result")
+    assert result.status_code == 500
+    assert "pipeline exploded" in result.text
+
+
+@pytest.mark.fast
+def test_unfinished_result_is_a_conflict(client, manager) -> None:
+    release = threading.Event()
+    bridge = APIBridge()
+    job = manager.submit("synthesize", bridge, _progress_run(bridge, release))
+    try:
+        assert client.get(f"/jobs/{job.job_id}/result").status_code == 409
+        assert client.delete(f"/jobs/{job.job_id}").status_code == 409
+    finally:
+        release.set()
+    _wait_for(job)
+    assert client.get("/jobs/missing").status_code == 404
+
+
+@pytest.mark.fast
+def test_manager_bounds_pending_jobs_and_cancels_queued() -> None:
+    jobs = JobManager(max_workers=1, max_pending=2, max_retained=4)
+    release = threading.Event()
+    try:
+        running = jobs.submit("a", APIBridge(), lambda: release.wait(5))
+        queued = jobs.submit("b", APIBridge(), lambda: None)
+        with pytest.raises(JobQueueFullError):
+            jobs.submit("c", APIBridge(), lambda: None)
+
+        assert jobs.cancel(queued.job_id)
+        assert queued.state is JobState.CANCELLED
+        assert not jobs.cancel(running.job_id)
+        assert jobs.active_count == 1
+    finally:
+        release.set()
+        jobs.shutdown()
+    assert running.state is JobState.SUCCEEDED
+
+
+@pytest.mark.fast
+def test_manager_forgets_oldest_finished_jobs() -> None:
+    jobs = JobManager(max_workers=2, max_pending=8, max_retained=2)
+    try:
+        first = jobs.submit("a", APIBridge(), lambda: None)
+        _wait_for(first)
+        second = jobs.submit("b", APIBridge(), lambda: None)
+        _wait_for(second)
+        third = jobs.submit("c", APIBridge(), lambda: None)
+        _wait_for(third)
+    finally:
+        jobs.shutdown()
+
+    assert jobs.get(first.job_id) is None
+    assert jobs.get(second.job_id) is second
+    assert jobs.get(third.job_id) is third
+
+
+@pytest.mark.fast
+def test_sse_payloads_are_json(client, manager) -> None:
+    job_id = client.post("/jobs/synthesize", json={"target": "unit"}).json()["job_id"]
+    _wait_for(manager.get(job_id))
+
+    with client.stream("GET", f"/jobs/{job_id}/events") as response:
+        data = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.iter_lines()
+            if line.startswith("data: ")
+        ]
+
+    assert data[0]["description"] == "Synthesizing"
+    assert data[-1]["state"] == JobState.SUCCEEDED.value
@@ -2,6 +2,7 @@ import pytest
 
 pytest.importorskip("fastapi")
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -439,6 +440,38 @@ def test_enhanced_metrics_snapshot_typed(enhanced_api):
     assert snapshot.endpoint_latency["health"] == (0.5,)
 
 
+@pytest.mark.fast
+def test_enhanced_metrics_render_bounded_histograms(enhanced_api):
+    """Latency is rendered from fixed-size histograms with windowed quantiles.
+
+    ReqID: N/A"""
+
+    metrics = enhanced_api.get_state().metrics
+    for index in range(1000):
+        metrics.record_latency("health", 0.001 * (index + 1))
+
+    assert len(metrics.snapshot().endpoint_latency["health"]) == (
+        enhanced_api.RECENT_LATENCY_SAMPLES
+    )
+
+    request = SimpleNamespace(client=SimpleNamespace(host="5.6.7.8"))
+    response = asyncio.run(enhanced_api.metrics_endpoint(request))
+    lines = response.body.decode().splitlines()
+
+    assert 'endpoint_latency_seconds_bucket{endpoint="health",le="0.1"} 100' in lines
+    assert 'endpoint_latency_seconds_bucket{endpoint="health",le="+Inf"} 1000' in lines
+    assert 'endpoint_latency_seconds_count{endpoint="health"} 1000' in lines
+    p99 = next(
+        line
+        for line in lines
+        if line.startswith(
+            'endpoint_latency_window_seconds{endpoint="health",window="1m",'
+            'quantile="0.99"}'
+        )
+    )
+    assert float(p99.split()[-1]) == pytest.approx(0.99, rel=0.01)
+
+
 @pytest.mark.fast
 def test_enhanced_init_endpoint_returns_typed_error(enhanced_api, tmp_path):
     """Initialization failures surface typed error payloads.",
@@ -0,0 +1,179 @@
+"""Disabled-level fast path, lazy messages and queued handlers."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture()
+def logging_setup_module() -> Iterator[ModuleType]:
+    """Reload :mod:`devsynth.logging_setup` with a clean root logger."""
+
+    import devsynth.logging_setup as logging_setup
+
+    root_logger = logging.getLogger()
+    original_handlers = list(root_logger.handlers)
+    original_filters = list(root_logger.filters)
+    original_level = root_logger.level
+    for handler in original_handlers:
+        root_logger.removeHandler(handler)
+
+    reloaded = importlib.reload(logging_setup)
+    try:
+        yield reloaded
+    finally:
+        reloaded.stop_queue_listener()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+        root_logger.filters[:] = original_filters
+        root_logger.setLevel(original_level)
+        for handler in original_handlers:
+            root_logger.addHandler(handler)
+        importlib.reload(logging_setup)
+
+
+@pytest.mark.fast
+def test_disabled_levels_skip_message_and_kwarg_processing(
+    logging_setup_module: ModuleType,
+) -> None:
+    wrapper = logging_setup_module.DevSynthLogger("devsynth.tests.fast_path")
+    wrapper.logger.setLevel(logging.WARNING)
+    wrapper.logger.log = MagicMock()
+
+    def expensive() -> str:
+        raise AssertionError("message built for a disabled level")
+
+    try:
+        wrapper.debug(expensive, extra={"k": "v"}, exc_info=True)
+        wrapper.info("value %s", object(), custom="field")
+        assert wrapper.isEnabledFor(logging.DEBUG) is False
+        wrapper.logger.log.assert_not_called()
+    finally:
+        del wrapper.logger.log
+        wrapper.logger.setLevel(logging.NOTSET)
+
+
+@pytest.mark.fast
+def test_callable_messages_are_formatted_once_when_emitted(
+    logging_setup_module: ModuleType, caplog: pytest.LogCaptureFixture
+) -> None:
+    wrapper = logging_setup_module.DevSynthLogger("devsynth.tests.lazy")
+    calls: list[int] = []
+
+    def summary() -> str:
+        calls.append(1)
+        return "expensive summary"
+
+    with caplog.at_level(logging.DEBUG, logger="devsynth.tests.lazy"):
+        wrapper.debug(summary, extra={"detail": 1})
+
+    [record] = [r for r in caplog.records if r.name == "devsynth.tests.lazy"]
+    assert record.getMessage() == "expensive summary"
+    assert record.getMessage() == "expensive summary"
+    assert record.detail == 1
+    assert calls == [1]
+
+
+@pytest.mark.fast
+def test_wrappers_share_one_filter_of_each_kind(
+    logging_setup_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    name = "devsynth.tests.shared_filters"
+    logging_setup_module.DevSynthLogger(name)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-secret-value")
+    wrapper = logging_setup_module.DevSynthLogger(name)
+
+    kinds = [type(f).__name__ for f in wrapper.logger.filters]
+    assert sorted(kinds) == ["RedactSecretsFilter", "RequestContextFilter"]
+
+    record = logging.LogRecord(
+        name, logging.INFO, __file__, 1, "key=%s", ("sk-test-secret-value",), None
+    )
+    assert wrapper.logger.filter(record)
+    assert "sk-test-secret-value" not in record.getMessage()
+    wrapper.logger.filters.clear()
+
+
+@pytest.mark.fast
+def test_lazy_messages_are_redacted_when_rendered(
+    logging_setup_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    secret = "sk-supersecretvalue123"
+    monkeypatch.setenv("OPENAI_API_KEY", secret)
+    filt = logging_setup_module.RedactSecretsFilter()
+    calls: list[int] = []
+
+    def message() -> str:
+        calls.append(1)
+        return f"key={secret}"
+
+    lazy = logging.LogRecord(
+        "devsynth.tests.redact",
+        logging.INFO,
+        __file__,
+        1,
+        logging_setup_module.LazyMessage(message),
+        None,
+        None,
+    )
+    other = logging.LogRecord(
+        "devsynth.tests.redact", logging.INFO, __file__, 1, {"key": secret}, None, None
+    )
+
+    assert filt.filter(lazy) and filt.filter(other)
+    assert calls == []
+    assert lazy.getMessage() == "key=***REDACTED***e123"
+    assert secret not in other.getMessage()
+    assert calls == [1]
+
+
+@pytest.mark.fast
+def test_queue_mode_moves_handlers_to_listener_thread(
+    logging_setup_module: ModuleType,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("DEVSYNTH_NO_FILE_LOGGING", raising=False)
+    monkeypatch.delenv("DEVSYNTH_PROJECT_DIR", raising=False)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    log_file = log_dir / "devsynth.log"
+
+    logging_setup_module.configure_logging(
+        log_dir=str(log_dir), log_file=str(log_file), use_queue=True
+    )
+    root_handlers = logging.getLogger().handlers
+    assert [type(h).__name__ for h in root_handlers] == ["_InProcessQueueHandler"]
+    assert logging_setup_module._last_effective_config[3:] == (True, True)
+
+    wrapper = logging_setup_module.DevSynthLogger("devsynth.tests.queued")
+    values = ["before"]
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        wrapper.exception("failed with %s", values)
+    values.append("mutated after the call")
+    logging_setup_module.stop_queue_listener()
+
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    [entry] = [e for e in entries if e["logger"] == "devsynth.tests.queued"]
+    assert entry["message"] == "failed with ['before']"
+    assert entry["exception"]["type"] == "ValueError"
+
+    # Reconfiguring without the queue restores direct handlers.
+    logging_setup_module.configure_logging(
+        log_dir=str(log_dir), log_file=str(log_file), use_queue=False
+    )
+    assert "_InProcessQueueHandler" not in {
+        type(h).__name__ for h in logging.getLogger().handlers
+    }
+    assert logging_setup_module._queue_listener is None
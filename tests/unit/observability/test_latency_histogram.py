@@ -0,0 +1,95 @@
+"""Streaming latency histograms with bounded memory."""
+
+from __future__ import annotations
+
+import random
+import threading
+
+import pytest
+
+from devsynth.observability.latency_histogram import (
+    LatencyHistogram,
+    WindowedLatencyHistogram,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.fast
+def test_quantiles_stay_within_one_percent() -> None:
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-3, 1.2) for _ in range(50_000)]
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    ordered = sorted(samples)
+    for q, estimate in zip((0.5, 0.95, 0.99), histogram.quantiles((0.5, 0.95, 0.99))):
+        exact = ordered[max(0, int(q * len(ordered)) - 1)]
+        assert estimate == pytest.approx(exact, rel=0.01)
+
+    assert histogram.count == len(samples)
+    assert histogram.quantile(0.0) == min(samples)
+    assert histogram.quantile(1.0) == max(samples)
+    assert len(histogram.buckets) < 2048
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+@pytest.mark.fast
+def test_cumulative_buckets_follow_prometheus_semantics() -> None:
+    histogram = LatencyHistogram(bounds=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0, -1.0):
+        histogram.record(value)
+
+    assert histogram.cumulative_buckets() == [
+        (0.1, 2),
+        (1.0, 3),
+        (float("inf"), 4),
+    ]
+    assert histogram.total == pytest.approx(2.65)
+
+
+@pytest.mark.fast
+def test_windows_only_cover_recent_slots() -> None:
+    clock = FakeClock()
+    histogram = WindowedLatencyHistogram(slot_seconds=10, slots=30, clock=clock)
+    histogram.record(5.0)
+    clock.now += 120
+    for _ in range(3):
+        histogram.record(0.2)
+    clock.now += 30
+
+    assert histogram.window(60).count == 3
+    assert histogram.window(300).count == 4
+    assert histogram.total().count == 4
+    assert histogram.window(60).quantile(0.99) == pytest.approx(0.2, rel=0.01)
+
+    # Slots are reused once the ring wraps around
+    clock.now += histogram.max_window
+    histogram.record(1.0)
+    assert histogram.window(300).count == 1
+    assert histogram.total().count == 5
+
+
+@pytest.mark.fast
+def test_concurrent_recording_loses_no_samples() -> None:
+    histogram = WindowedLatencyHistogram()
+
+    def worker() -> None:
+        for index in range(2_000):
+            histogram.record(index / 1000)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert histogram.total().count == 16_000
+    assert histogram.total().cumulative_buckets()[-1][1] == 16_000
@@ -0,0 +1,164 @@
+"""Pooled agent teams used by :class:`OrchestrationService`."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from devsynth.adapters.agents.agent_adapter import AgentAdapter
+from devsynth.application.agents.base import BaseAgent
+from devsynth.exceptions import ResourceExhaustedError
+from devsynth.orchestration.step_executor import OrchestrationService
+from devsynth.orchestration.team_pool import AgentTeamPool, PooledTeam, TeamSpec
+
+
+class EchoAgent(BaseAgent):
+    def process(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {"result": f"{self.name}:{inputs.get('step_id')}"}
+
+    def get_capabilities(self) -> list[str]:
+        return []
+
+
+SPEC = TeamSpec.create(agent_types=("planner", "code", "critic"))
+
+
+class CountingBuilder:
+    def __init__(self) -> None:
+        self.builds = 0
+
+    def __call__(self, spec: TeamSpec) -> PooledTeam:
+        self.builds += 1
+        adapter = AgentAdapter()
+        for agent_type in spec.agent_types:
+            adapter.register_agent_type(agent_type, EchoAgent)
+        return PooledTeam.create(spec, adapter)
+
+
+def _state(workflow_id: str = "wf") -> SimpleNamespace:
+    return SimpleNamespace(
+        workflow_id=workflow_id, context={}, messages=[], project_root=""
+    )
+
+
+def _step(step_id: str) -> SimpleNamespace:
+    return SimpleNamespace(id=step_id, name=step_id, description="d", agent_type="code")
+
+
+@pytest.mark.fast
+def test_steps_and_workflows_reuse_one_team() -> None:
+    builder = CountingBuilder()
+    pool = AgentTeamPool(builder=builder)
+
+    for workflow_id in ("wf-1", "wf-2"):
+        service = OrchestrationService(team_pool=pool, team_spec=SPEC)
+        state = _state(workflow_id)
+        for step_id in ("s1", "s2", "s3"):
+            state = service.process_step(state, _step(step_id))
+        expected = "Agent result: {'result': 'planner_agent:s3'}"
+        assert state.messages[-1]["content"] == expected
+
+    assert builder.builds == 1
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.idle, stats.active) == (5, 1, 1, 0)
+
+
+@pytest.mark.fast
+def test_each_lease_gets_a_fresh_team_and_reset_agents() -> None:
+    pool = AgentTeamPool(builder=CountingBuilder())
+
+    with pool.lease(SPEC, "wf_s1") as pooled:
+        first_team = pooled.adapter.get_team("wf_s1")
+        first_team.solutions["task"] = ["leftover"]
+        pooled.agents[0].current_role = "Mutated"
+    with pool.lease(SPEC, "wf_s2") as pooled:
+        adapter = pooled.adapter
+        team = adapter.get_team("wf_s2")
+        assert adapter.get_team("wf_s1") is None
+        assert adapter.agent_coordinator.current_team_id == "wf_s2"
+        assert team is not first_team
+        assert "task" not in team.solutions
+        assert list(team.agents) == list(pooled.agents)
+        assert pooled.agents[0].current_role != "Mutated"
+        assert pooled.uses == 2
+
+
+@pytest.mark.fast
+def test_failed_steps_discard_their_team() -> None:
+    builder = CountingBuilder()
+    pool = AgentTeamPool(builder=builder)
+
+    with pytest.raises(RuntimeError):
+        with pool.lease(SPEC, "wf_s1"):
+            raise RuntimeError("agent failure")
+    with pool.lease(SPEC, "wf_s2"):
+        pass
+
+    assert builder.builds == 2
+    assert pool.stats().discarded == 1
+
+
+@pytest.mark.fast
+def test_idle_teams_are_bounded_and_keyed_by_spec() -> None:
+    builder = CountingBuilder()
+    pool = AgentTeamPool(max_idle=2, builder=builder)
+    specs = [TeamSpec.create(agent_types=(kind,)) for kind in ("a", "b", "c")]
+
+    for spec in specs:
+        with pool.lease(spec, "team"):
+            pass
+    assert pool.stats().idle == 2
+    assert pool.stats().evictions == 1
+
+    with pool.lease(specs[2], "team"):  # still pooled
+        pass
+    with pool.lease(specs[0], "team"):  # evicted first, rebuilt
+        pass
+    assert builder.builds == 4
+
+
+@pytest.mark.fast
+def test_warm_up_prebuilds_idle_teams() -> None:
+    builder = CountingBuilder()
+    pool = AgentTeamPool(max_idle=3, builder=builder)
+
+    assert pool.warm_up(SPEC, 5) == 3
+    assert pool.warm_up(SPEC, 2) == 0
+
+    def failing(spec: TeamSpec) -> PooledTeam:
+        raise RuntimeError("provider unavailable")
+
+    assert AgentTeamPool(builder=failing).warm_up(SPEC, 2) == 0
+    with pool.lease(SPEC, "team"):
+        pass
+    assert builder.builds == 3
+
+
+@pytest.mark.fast
+def test_max_active_limits_concurrent_leases() -> None:
+    pool = AgentTeamPool(max_active=1, acquire_timeout=0.01, builder=CountingBuilder())
+    leased = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with pool.lease(SPEC, "holder"):
+            leased.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    assert leased.wait(5)
+    try:
+        with pytest.raises(ResourceExhaustedError):
+            with pool.lease(SPEC, "waiter"):
+                pass
+    finally:
+        release.set()
+        holder.join(5)
+
+    with pool.lease(SPEC, "after"):
+        pass
+    assert pool.stats().active == 0
@@ -0,0 +1,106 @@
+"""Content-hash fingerprints and incremental re-collection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import devsynth.testing.collection_manifest as cm
+import devsynth.testing.run_tests as rt
+
+
+@pytest.fixture
+def suite(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    tests_dir = tmp_path / "tests" / "unit"
+    tests_dir.mkdir(parents=True)
+    (tests_dir / "test_alpha.py").write_text("def test_a():\n    pass\n")
+    (tests_dir / "test_beta.py").write_text("def test_b():\n    pass\n")
+    (tests_dir / "conftest.py").write_text("")
+    return tests_dir
+
+
+@pytest.mark.fast
+def test_unchanged_files_are_not_rehashed(
+    suite: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest = cm.FileManifest(Path("cache/manifest.json"))
+    first = manifest.snapshot("tests/unit/")
+    manifest.save()
+
+    def no_reads(path: str) -> str:
+        raise AssertionError(f"{path} should not be re-read")
+
+    monkeypatch.setattr(cm, "_sha256", no_reads)
+    monkeypatch.setattr(cm, "config_digest", lambda test_path: first.config)
+    reloaded = cm.FileManifest(Path("cache/manifest.json"))
+
+    assert reloaded.snapshot("tests/unit/").digest == first.digest
+    assert sorted(first.files) == [
+        "tests/unit/conftest.py",
+        "tests/unit/test_alpha.py",
+        "tests/unit/test_beta.py",
+    ]
+
+
+@pytest.mark.fast
+def test_digest_tracks_content_and_pytest_configuration(suite: Path) -> None:
+    manifest = cm.FileManifest(Path("cache/manifest.json"))
+    baseline = manifest.snapshot("tests/unit/")
+
+    (suite / "test_alpha.py").write_text("def test_a():\n    assert True\n")
+    edited = manifest.snapshot("tests/unit/")
+    assert edited.digest != baseline.digest
+    assert cm.changed_files(baseline.files, edited) == {"tests/unit/test_alpha.py"}
+
+    Path("pytest.ini").write_text("[pytest]\nmarkers =\n    fast: quick\n")
+    configured = manifest.snapshot("tests/unit/")
+    assert configured.config != edited.config
+    assert configured.files == edited.files
+
+
+@pytest.mark.fast
+def test_collection_reuses_cache_and_recollects_changed_modules(
+    suite: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(rt, "COLLECTION_CACHE_DIR", Path(".test_collection_cache"))
+    monkeypatch.setitem(rt.TARGET_PATHS, "unit-tests", "tests/unit/")
+    calls: list[list[str]] = []
+    outputs = {
+        "tests/unit/": "tests/unit/test_alpha.py::test_a\n"
+        "tests/unit/test_beta.py::test_b\n",
+        "tests/unit/test_beta.py": "tests/unit/test_beta.py::test_b\n"
+        "tests/unit/test_beta.py::test_c\n",
+    }
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> SimpleNamespace:
+        paths = cmd[3 : cmd.index("--collect-only")]
+        calls.append(paths)
+        return SimpleNamespace(returncode=0, stdout=outputs[" ".join(paths)], stderr="")
+
+    monkeypatch.setattr(rt.subprocess, "run", fake_run)
+
+    first = rt.collect_tests_with_cache("unit-tests", "fast")
+    again = rt.collect_tests_with_cache("unit-tests", "fast")
+    assert again == first
+    assert calls == [["tests/unit/"]]
+
+    (suite / "test_beta.py").write_text("def test_b(): ...\n\n\ndef test_c(): ...\n")
+    updated = rt.collect_tests_with_cache("unit-tests", "fast")
+
+    assert calls[-1] == ["tests/unit/test_beta.py"]
+    assert updated == [
+        "tests/unit/test_alpha.py::test_a",
+        "tests/unit/test_beta.py::test_b",
+        "tests/unit/test_beta.py::test_c",
+    ]
+
+    (suite / "conftest.py").write_text("import pytest\n")
+    outputs["tests/unit/"] = "tests/unit/test_alpha.py::test_a\n"
+    assert rt.collect_tests_with_cache("unit-tests", "fast") == [
+        "tests/unit/test_alpha.py::test_a"
+    ]
+    assert calls[-1] == ["tests/unit/"]
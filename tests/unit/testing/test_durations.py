@@ -0,0 +1,83 @@
+"""Tests for the persisted test-duration database and segment planner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from devsynth.testing import durations
+from devsynth.testing.durations import DurationDatabase, plan_segments
+
+
+@pytest.mark.fast
+def test_plan_segments_balances_load_and_keeps_order() -> None:
+    node_ids = [f"t{i}" for i in range(7)]
+    costs = [8.0, 1.0, 1.0, 1.0, 1.0, 4.0, 4.0]
+
+    plan = plan_segments(node_ids, costs, workers=2, segment_size=2)
+
+    flattened = [[node for segment in worker for node in segment] for worker in plan]
+    loads = [sum(costs[node_ids.index(node)] for node in nodes) for nodes in flattened]
+    assert sorted(loads) == [10.0, 10.0]
+    assert all(nodes == sorted(nodes) for nodes in flattened)
+    assert sorted(node for nodes in flattened for node in nodes) == node_ids
+    assert all(len(segment) <= 2 for worker in plan for segment in worker)
+
+
+@pytest.mark.fast
+def test_plan_segments_drops_idle_workers_and_validates_input() -> None:
+    assert plan_segments(["a"], [1.0], workers=4, segment_size=10) == [[("a",)]]
+    with pytest.raises(ValueError):
+        plan_segments(["a"], [], workers=1, segment_size=1)
+    with pytest.raises(ValueError):
+        plan_segments(["a"], [1.0], workers=0, segment_size=1)
+
+
+@pytest.mark.fast
+def test_database_smooths_persists_and_estimates(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "durations.json"
+    database = DurationDatabase(path)
+    database.record({"a": 2.0, "b": 4.0, "c": 10.0})
+    database.record({"a": 4.0})
+    database.save()
+
+    loaded = DurationDatabase.load(path)
+
+    assert loaded.get("a") == pytest.approx(3.0)
+    assert loaded.estimate(["b", "new"]) == [4.0, 4.0]
+    assert DurationDatabase(path).estimate(["x"]) == [
+        durations.DEFAULT_DURATION_SECONDS
+    ]
+
+
+@pytest.mark.fast
+def test_corrupt_measurements_are_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+    assert len(DurationDatabase.load(path)) == 0
+
+    path.write_text(json.dumps({"durations": {"ok": 1.5, "bad": "x", "neg": -1}}))
+    assert durations.load_measurements(path) == {"ok": 1.5}
+
+
+@pytest.mark.fast
+def test_plugin_hooks_write_controller_measurements(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    output = tmp_path / "timings.json"
+    monkeypatch.setenv(durations.DURATIONS_OUTPUT_ENV, str(output))
+    monkeypatch.setattr(durations, "_measurements", {})
+
+    for phase_duration in (0.25, 1.0, 0.25):
+        durations.pytest_runtest_logreport(
+            SimpleNamespace(nodeid="tests/test_a.py::test_a", duration=phase_duration)
+        )
+    worker = SimpleNamespace(config=SimpleNamespace(workerinput={}))
+    durations.pytest_sessionfinish(worker, 0)
+    assert not output.exists()
+
+    durations.pytest_sessionfinish(SimpleNamespace(config=SimpleNamespace()), 0)
+    assert durations.load_measurements(output) == {"tests/test_a.py::test_a": 1.5}
@@ -0,0 +1,218 @@
+"""Tests for change-aware test impact selection."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import devsynth.testing.run_tests as rt
+from devsynth.testing.impact import (
+    ImpactMap,
+    ImpactSelection,
+    build_impact_map,
+    changed_files,
+    select_impacted_tests,
+)
+
+from .run_tests_test_utils import build_batch_metadata
+
+CANDIDATES = (
+    "tests/unit/test_alpha.py::test_one",
+    "tests/unit/test_alpha.py::test_two",
+    "tests/unit/test_beta.py::test_three",
+    "tests/unit/test_gamma.py::test_four",
+)
+
+
+@pytest.fixture
+def impact_map() -> ImpactMap:
+    return ImpactMap(
+        sources={
+            "src/devsynth/alpha.py": {CANDIDATES[0], "tests/other.py::test_x"},
+            "src/devsynth/beta.py": {CANDIDATES[2]},
+        },
+        tests=set(CANDIDATES),
+        commit="abc",
+    )
+
+
+@pytest.mark.fast
+def test_selects_tests_that_executed_changed_sources(impact_map) -> None:
+    selection = select_impacted_tests(
+        CANDIDATES,
+        ["src/devsynth/alpha.py", "tests/unit/test_gamma.py", "docs/readme.md"],
+        impact_map,
+    )
+
+    assert selection.node_ids == (CANDIDATES[0], CANDIDATES[3])
+    assert not selection.full_suite
+
+
+@pytest.mark.fast
+def test_unrelated_changes_select_nothing(impact_map) -> None:
+    selection = select_impacted_tests(
+        CANDIDATES, ["docs/guide.md", "tests/integration/test_z.py"], impact_map
+    )
+
+    assert selection.node_ids == ()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "changed, current",
+    [
+        (["tests/conftest.py"], True),
+        (["src/devsynth/new_module.py"], True),
+        (["src/devsynth/templates/prompt.txt"], True),
+        (["tests/unit/helpers.py"], True),
+        (["tests/behavior/features/general/alpha.feature"], True),
+        (["tests/fixtures/sample_project/data.json"], True),
+        (["src/devsynth/alpha.py"], False),
+    ],
+)
+def test_falls_back_to_full_suite_when_map_cannot_answer(
+    impact_map, changed, current
+) -> None:
+    selection = select_impacted_tests(
+        CANDIDATES, changed, impact_map, map_is_current=current
+    )
+
+    assert selection.full_suite
+
+
+@pytest.mark.fast
+def test_missing_map_or_unseen_tests_fall_back(impact_map) -> None:
+    assert select_impacted_tests(CANDIDATES, [], None).full_suite
+    assert select_impacted_tests(
+        (*CANDIDATES, "tests/unit/test_new.py::test_new"), [], impact_map
+    ).full_suite
+
+
+@pytest.mark.fast
+def test_build_map_from_coverage_contexts_and_merge(tmp_path: Path) -> None:
+    from coverage import CoverageData
+
+    source = tmp_path / "src" / "mod.py"
+    source.parent.mkdir()
+    source.write_text("a = 1\nb = 2\n")
+    data_file = tmp_path / ".coverage"
+    data = CoverageData(basename=str(data_file))
+    data.set_context("tests/test_mod.py::test_a|run")
+    data.add_lines({str(source): [1]})
+    data.set_context("tests/test_mod.py::test_b|setup")
+    data.add_lines({str(source): [2]})
+    data.set_context("")
+    data.add_lines({str(tmp_path.parent / "elsewhere.py"): [1]})
+    data.write()
+
+    fresh = build_impact_map(
+        data_file,
+        ["tests/test_mod.py::test_a", "tests/test_mod.py::test_b"],
+        root=tmp_path,
+        commit="def",
+    )
+    assert fresh.sources == {
+        "src/mod.py": {"tests/test_mod.py::test_a", "tests/test_mod.py::test_b"}
+    }
+
+    stored = ImpactMap(
+        sources={
+            "src/mod.py": {"tests/test_mod.py::test_a"},
+            "src/old.py": {"tests/test_mod.py::test_b"},
+        },
+        tests={"tests/test_mod.py::test_a", "tests/test_mod.py::test_b"},
+    )
+    stored.merge(fresh)
+    stored.save(tmp_path / "map.json")
+
+    loaded = ImpactMap.load(tmp_path / "map.json")
+    assert loaded is not None
+    assert loaded.sources == fresh.sources
+    assert loaded.commit == "def"
+
+
+@pytest.mark.fast
+def test_changed_files_includes_worktree_and_untracked(tmp_path: Path) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "Dev")
+    (tmp_path / "kept.py").write_text("x = 1\n")
+    (tmp_path / "edited.py").write_text("y = 1\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "base")
+    (tmp_path / "edited.py").write_text("y = 2\n")
+    (tmp_path / "new.py").write_text("z = 1\n")
+
+    assert changed_files("HEAD", cwd=tmp_path) == ["edited.py", "new.py"]
+    assert changed_files("no-such-ref", cwd=tmp_path) is None
+
+
+@pytest.mark.fast
+def test_run_tests_runs_only_impacted_nodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches: list[rt.SingleBatchRequest] = []
+    refreshed: list[list[str]] = []
+
+    monkeypatch.setattr(
+        rt, "collect_tests_with_cache", lambda *a, **k: list(CANDIDATES)
+    )
+    monkeypatch.setattr(rt, "_reset_coverage_artifacts", lambda: None)
+    monkeypatch.setattr(rt, "_ensure_coverage_artifacts", lambda: None)
+    monkeypatch.setattr(rt, "_maybe_publish_coverage_evidence", lambda **_: None)
+    monkeypatch.setattr(
+        rt, "refresh_impact_map", lambda path, tests: refreshed.append(list(tests))
+    )
+    monkeypatch.setattr(
+        rt,
+        "_select_impacted_tests",
+        lambda base, candidates: ImpactSelection(
+            (CANDIDATES[1],), ("src/devsynth/alpha.py",), "1 of 4 tests affected"
+        ),
+    )
+
+    def fake_batch(config: rt.SingleBatchRequest) -> rt.BatchExecutionResult:
+        batches.append(config)
+        return True, "ok", build_batch_metadata("batch")
+
+    monkeypatch.setattr(rt, "_run_single_test_batch", fake_batch)
+
+    success, output = rt.run_tests(
+        "unit-tests", ["fast"], env={}, impact_base="origin/main"
+    )
+
+    assert success is True
+    assert output.startswith("Impact analysis: 1 of 4 tests affected")
+    assert batches[0].node_ids == (CANDIDATES[1],)
+    assert batches[0].coverage_contexts is True
+    assert refreshed == [[CANDIDATES[1]]]
+
+
+@pytest.mark.fast
+def test_run_tests_skips_execution_when_nothing_is_impacted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        rt, "collect_tests_with_cache", lambda *a, **k: list(CANDIDATES)
+    )
+    monkeypatch.setattr(rt, "_reset_coverage_artifacts", lambda: None)
+    monkeypatch.setattr(
+        rt,
+        "_select_impacted_tests",
+        lambda base, candidates: ImpactSelection((), ("docs/x.md",), "none"),
+    )
+    monkeypatch.setattr(
+        rt,
+        "_run_single_test_batch",
+        lambda config: pytest.fail("no batch should run"),
+    )
+
+    success, output = rt.run_tests(
+        "unit-tests", ["fast"], env={}, impact_base="origin/main"
+    )
+
+    assert success is True
+    assert "no tests affected" in output
@@ -0,0 +1,181 @@
+"""Concurrent, duration-balanced segmented execution."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+import devsynth.testing.run_tests as rt
+from devsynth.testing.durations import DURATIONS_PLUGIN, DurationDatabase
+
+from .run_tests_test_utils import build_batch_metadata
+
+NODE_IDS = tuple(f"tests/unit/test_mod.py::test_{i}" for i in range(6))
+
+
+def _request(**overrides) -> rt.SegmentedRunRequest:
+    values = dict(
+        target="unit-tests",
+        speed_categories=("fast",),
+        marker_expr="fast and not memory_intensive",
+        node_ids=NODE_IDS,
+        verbose=False,
+        report=True,
+        parallel=True,
+        segment_size=2,
+        maxfail=None,
+        keyword_filter=None,
+        env={"BASE": "1"},
+        workers=2,
+    )
+    values.update(overrides)
+    return rt.SegmentedRunRequest(**values)
+
+
+@pytest.fixture
+def durations_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "test_durations.json"
+    monkeypatch.setattr(rt, "TEST_DURATIONS_FILE", path)
+    monkeypatch.setattr(rt, "_ensure_coverage_artifacts", lambda: None)
+    return path
+
+
+@pytest.mark.fast
+def test_segments_run_concurrently_and_record_durations(
+    durations_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    DurationDatabase(
+        durations_file, {NODE_IDS[0]: 5.0, NODE_IDS[1]: 0.5, NODE_IDS[2]: 0.5}
+    ).save()
+    barrier = threading.Barrier(2, timeout=5)
+    requests: list[rt.SingleBatchRequest] = []
+    lock = threading.Lock()
+
+    def fake_batch(config: rt.SingleBatchRequest) -> rt.BatchExecutionResult:
+        with lock:
+            requests.append(config)
+            first = len(requests) <= 2
+        if first:
+            barrier.wait()
+        Path(config.durations_file).write_text(
+            json.dumps({"durations": {node: 0.5 for node in config.node_ids}})
+        )
+        return (
+            True,
+            f"ran {len(config.node_ids)}",
+            build_batch_metadata(config.coverage_file, command=config.node_ids),
+        )
+
+    monkeypatch.setattr(rt, "_run_single_test_batch", fake_batch)
+
+    success, output, metadata = rt._run_segmented_tests(_request())
+
+    assert success is True
+    assert all(not config.parallel for config in requests)
+    assert len({id(config.env) for config in requests}) == len(requests)
+    assert {config.coverage_file for config in requests} >= {
+        ".coverage.segment-0-0",
+        ".coverage.segment-1-0",
+    }
+    # The known slow test is isolated on one worker; the rest fill the other.
+    assert metadata["commands"][0] == (NODE_IDS[0],)
+    assert sorted(node for command in metadata["commands"] for node in command) == (
+        sorted(NODE_IDS)
+    )
+    assert output.count("ran") == len(requests)
+    database = DurationDatabase.load(durations_file)
+    assert database.get(NODE_IDS[0]) == pytest.approx(2.75)
+    assert database.get(NODE_IDS[5]) == pytest.approx(0.5)
+
+
+@pytest.mark.fast
+def test_maxfail_stops_scheduling_new_segments(
+    durations_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[tuple[str, ...]] = []
+
+    def fake_batch(config: rt.SingleBatchRequest) -> rt.BatchExecutionResult:
+        calls.append(config.node_ids)
+        return (
+            False,
+            "failed",
+            build_batch_metadata("batch", command=config.node_ids, returncode=3),
+        )
+
+    monkeypatch.setattr(rt, "_run_single_test_batch", fake_batch)
+
+    success, _, metadata = rt._run_segmented_tests(
+        _request(workers=2, segment_size=1, maxfail=1)
+    )
+
+    assert success is False
+    assert len(calls) < len(NODE_IDS)
+    assert metadata["returncode"] == 3
+    assert not durations_file.exists()
+
+
+@pytest.mark.fast
+def test_isolated_coverage_batch_defers_reports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    captured: dict[str, object] = {}
+
+    class FakePopen:
+        def __init__(self, cmd, stdout=None, stderr=None, text=False, env=None):
+            captured["cmd"] = cmd
+            captured["env"] = env
+            self.returncode = 0
+
+        def communicate(self):
+            return ("", "")
+
+    monkeypatch.setattr(
+        rt,
+        "_resolve_coverage_configuration",
+        lambda env: (
+            [
+                "--cov=src/devsynth",
+                "--cov-report=json:test_reports/coverage.json",
+                "--cov-report=html:htmlcov",
+                "--cov-append",
+            ],
+            True,
+            None,
+        ),
+    )
+    monkeypatch.setattr(rt.subprocess, "Popen", FakePopen)
+    timings = str(tmp_path / "timings.json")
+
+    success, _, _ = rt._run_single_test_batch(
+        rt.SingleBatchRequest(
+            node_ids=("tests/unit/test_mod.py::test_0",),
+            marker_expr="fast",
+            verbose=False,
+            report=False,
+            parallel=False,
+            maxfail=None,
+            keyword_filter=None,
+            env={},
+            coverage_file=".coverage.segment-0-0",
+            durations_file=timings,
+        )
+    )
+
+    cmd = captured["cmd"]
+    env = captured["env"]
+    assert success is True
+    assert "--cov=src/devsynth" in cmd
+    assert "--cov-report=" in cmd
+    assert not any(arg.startswith("--cov-report=json") for arg in cmd)
+    assert cmd[cmd.index("-p") + 1] == DURATIONS_PLUGIN
+    assert env["COVERAGE_FILE"] == ".coverage.segment-0-0"
+    assert env[rt.DURATIONS_OUTPUT_ENV] == timings
+
+
+@pytest.mark.fast
+def test_segmented_request_rejects_non_positive_workers() -> None:
+    with pytest.raises(ValueError):
+        _request(workers=0)
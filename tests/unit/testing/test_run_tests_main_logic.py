@@ -104,11 +104,12 @@ def test_collect_tests_with_cache_from_existing_cache(
         "cached_module.py::cached_func_a",
         "cached_module.py::cached_func_b",
     ]
+    snapshot = rt.TreeSnapshot(test_path=str(tmp_path), files={}, config="cfg")
     cached_data = {
         "timestamp": datetime.now().isoformat(),
         "tests": cached_tests,
         "fingerprint": {
-            "latest_mtime": 12345.0,  # Dummy mtime
+            "tree_digest": snapshot.digest,  # Matches the mocked tree snapshot
             "category_expr": "not memory_intensive",  # Default category_expr
             "test_path": str(tmp_path),  # Mocked test_path
         },
@@ -121,11 +122,8 @@ def test_collect_tests_with_cache_from_existing_cache(
 
     monkeypatch.setattr(rt.subprocess, "run", fake_run_should_not_be_called)
     monkeypatch.setattr(
-        rt, "_latest_mtime", lambda root: 12345.0
-    )  # Mock _latest_mtime to match cached value
-    monkeypatch.setattr(
-        rt, "_latest_mtime", lambda root: 12345.0
-    )  # Mock _latest_mtime to match cached value
+        rt, "_snapshot_test_tree", lambda root: snapshot
+    )  # Mock the content fingerprint to match the cached value
 
     monkeypatch.setitem(rt.TARGET_PATHS, "unit-tests", str(tmp_path))
     tests = rt.collect_tests_with_cache(target="unit-tests", speed_category=None)